@@ -0,0 +1,96 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.authentication import TokenAuthentication
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL = 60
+
+
+class TokenCache:
+    """
+    토큰 키 → (사용자, 토큰) LRU 캐시 (프로세스 내, TTL 적용)
+
+    무효화는 현재 프로세스에만 적용되므로, 다른 워커에서는 최대 TTL 동안
+    이전 값이 유지될 수 있습니다.
+    """
+
+    def __init__(self, max_entries=None, ttl=None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self):
+        if self._max_entries is not None:
+            return self._max_entries
+        return getattr(settings, 'TOKEN_AUTH_CACHE', {}).get('MAX_ENTRIES', DEFAULT_MAX_ENTRIES)
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'TOKEN_AUTH_CACHE', {}).get('TTL', DEFAULT_TTL)
+
+    def get(self, key):
+        """캐시 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, token, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # 요청마다 별도 인스턴스를 넘겨 요청 간 속성 변경이 섞이지 않도록 함
+        return copy.copy(user), token
+
+    def set(self, key, user, token):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (user, token, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """토큰 키 항목 삭제"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id):
+        """사용자의 모든 토큰 항목 삭제"""
+        with self._lock:
+            for key in [k for k, (user, _, _) in self._entries.items() if user.pk == user_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    토큰 → 사용자 조회 결과를 짧은 TTL 동안 캐시하는 TokenAuthentication
+
+    토큰 삭제(로그아웃), 사용자 저장(비밀번호 변경, 프로필 수정) 시
+    accounts.signals 에서 캐시 항목을 무효화합니다.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(key, user, token)
+        return user, token
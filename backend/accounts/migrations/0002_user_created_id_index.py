@@ -0,0 +1,19 @@
+# Generated by Django 4.2.11 on 2026-10-19 17:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="idx_user_created_id"
+            ),
+        ),
+    ]
@@ -37,6 +37,10 @@ class User(AbstractUser):
         verbose_name = '사용자'
         verbose_name_plural = '사용자 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 사용자 목록 keyset 페이지네이션 정렬 키
+            models.Index(fields=['-created_at', '-id'], name='idx_user_created_id'),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.get_user_type_display()})"
@@ -0,0 +1,8 @@
+from rest_framework import permissions
+
+
+class IsSystemAdmin(permissions.BasePermission):
+    """시스템 관리자(user_type='admin') 또는 superuser 만 허용"""
+
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_authenticated and request.user.is_admin)
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache
+from .models import User
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """토큰 삭제 시 (LogoutView 등) 캐시 항목 삭제"""
+    token_cache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_saved_user(sender, instance, created, **kwargs):
+    """사용자 저장 시 (ChangePasswordView, 프로필 수정, 비활성화 등) 캐시 항목 삭제"""
+    if not created:
+        token_cache.invalidate_user(instance.pk)
@@ -0,0 +1,70 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .authentication import token_cache
+from .models import User
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user('user', 'user@example.com', 'old-password-1')
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_repeated_requests_skip_token_lookup(self):
+        self.client.get(reverse('accounts:profile'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('accounts:profile'))
+
+        self.assertEqual(response.json()['username'], 'user')
+
+    def test_logout_invalidates_cached_token(self):
+        self.client.get(reverse('accounts:profile'))
+
+        self.client.post(reverse('accounts:logout'))
+        response = self.client.get(reverse('accounts:profile'))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_password_change_invalidates_cached_user(self):
+        self.client.get(reverse('accounts:profile'))
+        self.assertIsNotNone(token_cache.get(self.token.key))
+
+        self.client.post(reverse('accounts:change_password'), {
+            'old_password': 'old-password-1',
+            'new_password': 'new-password-1',
+            'new_password_confirm': 'new-password-1',
+        })
+
+        self.assertIsNone(token_cache.get(self.token.key))
+
+
+class UserListPaginationTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', 'admin@example.com', 'password-1', is_staff=True)
+        for i in range(4):
+            User.objects.create_user(f'user{i}', f'user{i}@example.com', 'password-1')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_cursor_walks_all_users_without_count(self):
+        expected = list(User.objects.order_by('-created_at', '-id').values_list('username', flat=True))
+
+        seen = []
+        url = reverse('accounts:user_list') + '?page_size=2'
+        while url:
+            with self.assertNumQueries(1):
+                body = self.client.get(url).json()
+            seen += [user['username'] for user in body['results']]
+            url = body['next']
+
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse('accounts:user_list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
@@ -107,7 +107,8 @@ class ChangePasswordView(APIView):
 
 
 class UserListView(generics.ListAPIView):
-    """사용자 목록 조회 API (관리자 전용)"""
+    """사용자 목록 조회 API (관리자 전용, 가입일 역순 keyset 페이지네이션)"""
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
+    keyset_ordering = ('-created_at', '-id')
@@ -0,0 +1,53 @@
+"""
+Async Fan-out
+
+Django 의 async ORM 은 요청당 하나의 스레드/DB 연결에서 순차 실행되므로,
+여러 조회를 실제로 동시에 실행하려면 각 조회를 별도 스레드(별도 DB 연결)에서 실행해야 합니다.
+fan_out() 은 동시 실행 수를 settings.ASYNC_FANOUT['CONCURRENCY'] 로 제한하고,
+각 스레드에서 연 DB 연결은 작업이 끝나면 닫습니다.
+"""
+import asyncio
+import functools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+DEFAULT_CONCURRENCY = 8
+
+
+def _fanout_setting(key, default):
+    return getattr(settings, 'ASYNC_FANOUT', {}).get(key, default)
+
+
+def _with_own_connections(func):
+    @functools.wraps(func)
+    def wrapper(*args):
+        try:
+            return func(*args)
+        finally:
+            # 작업 스레드의 연결은 request_finished 시그널로 정리되지 않으므로 직접 닫음
+            connections.close_all()
+    return wrapper
+
+
+async def fan_out(func, items, concurrency=None):
+    """
+    func(item) 을 items 각각에 대해 동시에 실행하고 결과를 items 순서대로 반환
+
+    Args:
+        func: DB 조회를 포함한 동기 함수
+        items: 인자 목록
+        concurrency: 최대 동시 실행 수 (기본: settings.ASYNC_FANOUT['CONCURRENCY'])
+
+    Returns:
+        list: 결과 목록
+    """
+    semaphore = asyncio.Semaphore(concurrency or _fanout_setting('CONCURRENCY', DEFAULT_CONCURRENCY))
+    task = sync_to_async(_with_own_connections(func), thread_sensitive=False)
+
+    async def run(item):
+        async with semaphore:
+            return await task(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
@@ -0,0 +1,141 @@
+"""
+Primary / Replica Database Router
+
+- institutions 앱 조회는 읽기 전용 복제본(replica) 으로 보냅니다.
+- 쓰기, 인증(accounts/auth/sessions) 등 나머지 조회는 primary(default) 를 사용합니다.
+- 쓰기가 발생한 뒤에는 복제 지연으로 방금 쓴 데이터가 안 보이지 않도록
+  같은 요청 동안, 그리고 STICKY_SECONDS 동안(쿠키) primary 에서 읽습니다. (read-your-writes)
+
+replica 별칭이 DATABASES 에 없으면 모든 조회가 default 로 갑니다.
+"""
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+DEFAULT_ALIAS = 'default'
+DEFAULT_REPLICA_ALIAS = 'replica'
+DEFAULT_REPLICA_APPS = ('institutions',)
+DEFAULT_STICKY_SECONDS = 5
+DEFAULT_COOKIE_NAME = 'caremap_primary_until'
+
+# 현재 요청(또는 스크립트)에서 primary 로 고정되었는지 여부
+_pinned = ContextVar('caremap_db_pinned', default=False)
+# 현재 요청에서 쓰기가 발생했는지 여부 (미들웨어가 쿠키 설정에 사용)
+_wrote = ContextVar('caremap_db_wrote', default=False)
+
+
+def _replica_setting(key, default):
+    return getattr(settings, 'DATABASE_REPLICA', {}).get(key, default)
+
+
+def replica_alias():
+    """사용 가능한 replica 별칭 (설정되지 않았으면 None)"""
+    alias = _replica_setting('ALIAS', DEFAULT_REPLICA_ALIAS)
+    return alias if alias in settings.DATABASES else None
+
+
+def pin_to_primary():
+    """이후 조회를 primary 로 고정"""
+    _pinned.set(True)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+class PrimaryReplicaRouter:
+    """institutions 조회 → replica, 그 외 조회/모든 쓰기 → default"""
+
+    def db_for_read(self, model, **hints):
+        if _pinned.get():
+            return DEFAULT_ALIAS
+        if model._meta.app_label not in _replica_setting('APPS', DEFAULT_REPLICA_APPS):
+            return DEFAULT_ALIAS
+        return replica_alias() or DEFAULT_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        _wrote.set(True)
+        return DEFAULT_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 default 의 복제본이므로 두 별칭 간 관계는 허용
+        aliases = {DEFAULT_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 마이그레이션은 primary 에만 적용 (replica 는 복제로 반영)
+        return db == DEFAULT_ALIAS
+
+
+class ReplicaStickinessMiddleware:
+    """
+    요청 단위 primary 고정 상태 관리
+
+    - POST/PUT/PATCH/DELETE 요청은 처음부터 primary 사용
+    - 쓰기가 발생한 응답에는 STICKY_SECONDS 동안 유효한 쿠키를 설정하여
+      다음 요청들도 primary 에서 읽도록 합니다.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _start(self, request):
+        """요청 시작 시 고정 상태 설정, reset 용 토큰 반환"""
+        cookie_name = _replica_setting('COOKIE_NAME', DEFAULT_COOKIE_NAME)
+        pinned_until = request.COOKIES.get(cookie_name)
+        try:
+            sticky = pinned_until is not None and float(pinned_until) > time.time()
+        except ValueError:
+            sticky = False
+        return (
+            _pinned.set(sticky or request.method not in self.SAFE_METHODS),
+            _wrote.set(False),
+        )
+
+    @staticmethod
+    def _finish(response, wrote):
+        sticky_seconds = _replica_setting('STICKY_SECONDS', DEFAULT_STICKY_SECONDS)
+        if wrote and sticky_seconds > 0:
+            response.set_cookie(
+                _replica_setting('COOKIE_NAME', DEFAULT_COOKIE_NAME),
+                f'{time.time() + sticky_seconds:.3f}',
+                max_age=sticky_seconds,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        pinned_token, wrote_token = self._start(request)
+        try:
+            response = self.get_response(request)
+            wrote = _wrote.get()
+        finally:
+            _pinned.reset(pinned_token)
+            _wrote.reset(wrote_token)
+        return self._finish(response, wrote)
+
+    async def __acall__(self, request):
+        # sync_to_async 로 실행된 ORM 쓰기의 ContextVar 변경은 호출한 쪽으로 반영됨
+        pinned_token, wrote_token = self._start(request)
+        try:
+            response = await self.get_response(request)
+            wrote = _wrote.get()
+        finally:
+            _pinned.reset(pinned_token)
+            _wrote.reset(wrote_token)
+        return self._finish(response, wrote)
@@ -0,0 +1,143 @@
+"""
+Keyset (Cursor) Pagination
+
+COUNT(*) 와 OFFSET 없이, 정렬 키의 마지막 값 이후만 조회하는 페이지네이션.
+뷰의 keyset_ordering (예: ('-created_at', '-id')) 순서로 정렬하며, 마지막 필드는
+유일해야 하고 모든 정렬 필드는 NULL 이 아니어야 합니다.
+페이지 깊이와 관계없이 같은 인덱스 범위 조회로 처리됩니다.
+
+응답 형식:
+    {"next": "<다음 페이지 URL 또는 null>", "results": [...]}
+
+DRF 뷰에서는 DEFAULT_PAGINATION_CLASS 로, 일반 Django (async) 뷰에서는
+KeysetPagination(ordering=...) 를 직접 생성하여 apaginate_queryset() 으로 사용합니다.
+"""
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+DEFAULT_ORDERING = ('-id',)
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    invalid_cursor_message = '잘못된 cursor 값입니다.'
+
+    def __init__(self, ordering=None):
+        self.default_ordering = tuple(ordering or DEFAULT_ORDERING)
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, 'keyset_ordering', self.default_ordering))
+
+    def get_page_size(self, request):
+        page_size = api_settings.PAGE_SIZE or 100
+        try:
+            requested = int(request.GET[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return page_size
+        return max(1, min(requested, self.max_page_size))
+
+    @staticmethod
+    def _field_name(ordering_field):
+        return ordering_field.lstrip('-')
+
+    def encode_cursor(self, instance):
+        values = [
+            getattr(instance, self._field_name(field)) for field in self.ordering
+        ]
+        payload = json.dumps(
+            [v.isoformat() if hasattr(v, 'isoformat') else v for v in values],
+            separators=(',', ':')
+        )
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, cursor, model):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(self._field_name(field)).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, UnicodeDecodeError, ValidationError):
+            raise Http404(self.invalid_cursor_message)
+
+    def keyset_filter(self, values):
+        """
+        (f1, f2, ...) 가 커서 값보다 뒤에 오는 행 조건
+
+        f1 범위 조건을 먼저 두어 선두 인덱스 컬럼으로 범위 조회가 되도록 합니다:
+            f1 <= v1 AND (f1 < v1 OR (f1 = v1 AND f2 < v2) OR ...)
+        """
+        after = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = self._field_name(field)
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            after |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        first = self.ordering[0]
+        bound = 'lte' if first.startswith('-') else 'gte'
+        return Q(**{f'{self._field_name(first)}__{bound}': values[0]}) & after
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """정렬, 커서 조건, LIMIT (page_size + 1) 이 적용된 QuerySet"""
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.GET.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.keyset_filter(self.decode_cursor(cursor, queryset.model)))
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """async ORM 으로 조회하는 paginate_queryset"""
+        return self.set_page([row async for row in self.get_page_queryset(queryset, request, view)])
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_data(self, data):
+        return OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ])
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,192 @@
+"""
+SQL Query Profiling
+
+요청별 SQL 실행 수, 총 SQL 시간, 가장 느린 SQL 을 기록하는 미들웨어.
+settings.QUERY_PROFILING['SAMPLE_RATE'] 비율의 요청만 측정하므로 운영 환경에서도 켜 둘 수 있습니다.
+
+측정된 요청에는 Server-Timing 헤더가 추가되고, 엔드포인트별 집계는
+/api/admin/query-profile/ (관리자 전용) 에서 확인할 수 있습니다.
+집계는 프로세스(워커)별로 유지됩니다.
+
+ASGI 에서는 요청의 async ORM 스레드 연결을 측정합니다.
+(caremap.concurrency.fan_out 의 작업 스레드 SQL 은 측정되지 않음)
+"""
+import heapq
+import random
+import threading
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_SLOWEST_LIMIT = 5
+SQL_PREVIEW_LENGTH = 500
+
+
+def _profiling_setting(key, default):
+    return getattr(settings, 'QUERY_PROFILING', {}).get(key, default)
+
+
+class QueryProfile:
+    """요청 1건의 SQL 측정값 (connection.execute_wrapper 로 사용)"""
+
+    __slots__ = ('count', 'duration', 'slowest', 'limit')
+
+    def __init__(self, limit=DEFAULT_SLOWEST_LIMIT):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest = []
+        self.limit = limit
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            entry = (elapsed, sql)
+            if len(self.slowest) < self.limit:
+                heapq.heappush(self.slowest, entry)
+            elif elapsed > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def slowest_statements(self):
+        """느린 순서로 정렬된 [(초, SQL)]"""
+        return sorted(self.slowest, reverse=True)
+
+
+class ProfileStore:
+    """엔드포인트별 SQL 측정 집계 (프로세스 내, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, profile, response_time):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {
+                    'requests': 0,
+                    'queries': 0,
+                    'db_time': 0.0,
+                    'max_db_time': 0.0,
+                    'response_time': 0.0,
+                    'slowest': [],
+                }
+            stats['requests'] += 1
+            stats['queries'] += profile.count
+            stats['db_time'] += profile.duration
+            stats['max_db_time'] = max(stats['max_db_time'], profile.duration)
+            stats['response_time'] += response_time
+            for entry in profile.slowest:
+                if len(stats['slowest']) < profile.limit:
+                    heapq.heappush(stats['slowest'], entry)
+                elif entry[0] > stats['slowest'][0][0]:
+                    heapq.heapreplace(stats['slowest'], entry)
+
+    def top(self, limit=20):
+        """DB 시간 합계가 큰 순서의 엔드포인트 집계 목록"""
+        with self._lock:
+            items = sorted(
+                self._endpoints.items(), key=lambda item: item[1]['db_time'], reverse=True
+            )[:limit]
+            return [
+                {
+                    'endpoint': endpoint,
+                    'requests': stats['requests'],
+                    'avg_queries': round(stats['queries'] / stats['requests'], 2),
+                    'total_db_ms': round(stats['db_time'] * 1000, 2),
+                    'avg_db_ms': round(stats['db_time'] * 1000 / stats['requests'], 3),
+                    'max_db_ms': round(stats['max_db_time'] * 1000, 3),
+                    'avg_response_ms': round(stats['response_time'] * 1000 / stats['requests'], 3),
+                    'slowest': [
+                        {'ms': round(elapsed * 1000, 3), 'sql': sql[:SQL_PREVIEW_LENGTH]}
+                        for elapsed, sql in sorted(stats['slowest'], reverse=True)
+                    ],
+                }
+                for endpoint, stats in items
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+profile_store = ProfileStore()
+
+
+def endpoint_name(request):
+    """집계 키: 'METHOD URL 패턴' (경로 변수별로 나뉘지 않도록 route 사용)"""
+    match = getattr(request, 'resolver_match', None)
+    route = match.route if match and match.route else 'unresolved'
+    return f"{request.method} /{route}"
+
+
+class QueryProfilingMiddleware:
+    """표본 요청의 SQL 실행 수/시간을 측정하여 Server-Timing 헤더와 집계에 기록"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _sample():
+        """측정 대상이면 새 QueryProfile, 아니면 None"""
+        sample_rate = _profiling_setting('SAMPLE_RATE', DEFAULT_SAMPLE_RATE)
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            return None
+        return QueryProfile(_profiling_setting('SLOWEST_LIMIT', DEFAULT_SLOWEST_LIMIT))
+
+    @staticmethod
+    def _wrap_connections(stack, profile):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(profile))
+
+    @staticmethod
+    def _finish(request, response, profile, start):
+        response_time = time.perf_counter() - start
+        profile_store.record(endpoint_name(request), profile, response_time)
+        response['Server-Timing'] = (
+            f'db;dur={profile.duration * 1000:.2f};desc="{profile.count} queries", '
+            f'app;dur={response_time * 1000:.2f}'
+        )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profile = self._sample()
+        if profile is None:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            self._wrap_connections(stack, profile)
+            response = self.get_response(request)
+        return self._finish(request, response, profile, start)
+
+    async def __acall__(self, request):
+        profile = self._sample()
+        if profile is None:
+            return await self.get_response(request)
+
+        # DB 연결은 스레드별이므로 async ORM 이 실행되는 요청 스레드에서 래퍼 등록/해제
+        start = time.perf_counter()
+        stack = ExitStack()
+        await sync_to_async(self._wrap_connections)(stack, profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, profile, start)
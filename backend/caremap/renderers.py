@@ -0,0 +1,89 @@
+"""
+JSON Rendering
+
+Django JsonResponse(DjangoJSONEncoder) 와 DRF JSONRenderer 는 표준 json 모듈로 직렬화하며,
+Decimal 좌표는 문자열로 바뀌고 값마다 Python default() 호출을 거칩니다.
+여기서는 orjson 으로 직렬화합니다. (미설치 시 표준 json 으로 대체)
+
+- float/int/str/date/datetime/UUID: orjson 이 직접 직렬화 (datetime 은 UTC 이면 'Z')
+- Decimal: JSON 숫자(float)로 직렬화 (좌표 DECIMAL(10,8) 은 float 정밀도 안에 들어감)
+- 지연 번역 문자열(gettext_lazy): 문자열
+"""
+import datetime
+import decimal
+import json
+import uuid
+
+from django.http import HttpResponse
+from django.utils.functional import Promise
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def _default(value):
+    """orjson/json 이 직접 처리하지 못하는 값 변환"""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, Promise):
+        return str(value)
+    if orjson is None:
+        if isinstance(value, datetime.datetime):
+            text = value.isoformat()
+            return text[:-6] + 'Z' if text.endswith('+00:00') else text
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data, indent=False) -> bytes:
+    """
+    JSON 직렬화 (UTF-8 bytes)
+
+    Args:
+        data: 직렬화할 값
+        indent: True 이면 2칸 들여쓰기
+
+    Returns:
+        bytes: JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+    return json.dumps(
+        data, default=_default, ensure_ascii=False,
+        indent=2 if indent else None, separators=None if indent else (',', ':'),
+    ).encode('utf-8')
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    django.http.JsonResponse 대체 (같은 인자, orjson 직렬화)
+
+    safe=True 이면 dict 만 허용합니다. (JsonResponse 와 동일)
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the safe parameter to False."
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """DRF JSONRenderer 대체 (orjson 직렬화, indent 요청 시 2칸 들여쓰기)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        return dumps(data, indent=bool(self.get_indent(accepted_media_type, renderer_context)))
@@ -0,0 +1,147 @@
+import contextvars
+import datetime
+import json
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import User
+from institutions.models import Institution
+
+from . import renderers
+from .db_routers import PrimaryReplicaRouter, ReplicaStickinessMiddleware, is_pinned
+from .profiling import profile_store
+
+
+@override_settings(QUERY_PROFILING={'SAMPLE_RATE': 1.0, 'SLOWEST_LIMIT': 3})
+class QueryProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        profile_store.reset()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw-12345678')
+        self.client.force_login(self.admin)
+
+    def test_sampled_request_has_server_timing_header(self):
+        response = self.client.get(reverse('accounts:user_list'))
+
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", app;dur=')
+
+    async def test_async_request_counts_queries(self):
+        self.async_client.cookies = self.client.cookies
+
+        response = await self.async_client.get(reverse('accounts:user_list'))
+
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+    @override_settings(QUERY_PROFILING={'SAMPLE_RATE': 0})
+    def test_unsampled_request_is_not_profiled(self):
+        response = self.client.get(reverse('accounts:user_list'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(profile_store.top(), [])
+
+    def test_profile_endpoint_aggregates_by_route(self):
+        self.client.get(reverse('accounts:user_list'))
+        self.client.get(reverse('accounts:user_list'))
+
+        response = self.client.get(reverse('query_profile'))
+
+        endpoints = {e['endpoint']: e for e in response.json()['endpoints']}
+        stats = endpoints['GET /api/accounts/users/']
+        self.assertEqual(stats['requests'], 2)
+        self.assertGreater(stats['avg_queries'], 0)
+        self.assertLessEqual(len(stats['slowest']), 3)
+
+    def test_profile_endpoint_is_admin_only(self):
+        user = User.objects.create_user('user', 'user@example.com', 'pw-12345678')
+        self.client.force_login(user)
+
+        response = self.client.get(reverse('query_profile'))
+
+        self.assertEqual(response.status_code, 403)
+
+
+@mock.patch('caremap.db_routers.replica_alias', return_value='replica')
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def run_isolated(self, func):
+        return contextvars.Context().run(func)
+
+    def test_institution_reads_use_replica(self, _):
+        self.assertEqual(self.run_isolated(lambda: self.router.db_for_read(Institution)), 'replica')
+        self.assertEqual(self.run_isolated(lambda: self.router.db_for_read(User)), 'default')
+
+    def test_reads_after_write_stick_to_primary(self, _):
+        def write_then_read():
+            self.router.db_for_write(User)
+            return self.router.db_for_read(Institution)
+
+        self.assertEqual(self.run_isolated(write_then_read), 'default')
+
+    def test_write_response_sets_sticky_cookie(self, _):
+        def view(request):
+            self.router.db_for_write(User)
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(view)
+        response = self.run_isolated(lambda: middleware(RequestFactory().post('/')))
+
+        self.assertIn('caremap_primary_until', response.cookies)
+
+    def test_sticky_cookie_pins_following_reads(self, _):
+        pinned = []
+
+        def view(request):
+            pinned.append(is_pinned())
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(view)
+        request = RequestFactory().get('/')
+        request.COOKIES['caremap_primary_until'] = str(time.time() + 5)
+        self.run_isolated(lambda: middleware(request))
+        self.run_isolated(lambda: middleware(RequestFactory().get('/')))
+
+        self.assertEqual(pinned, [True, False])
+
+
+class JSONRenderingTests(SimpleTestCase):
+    payload = {
+        'latitude': Decimal('37.50880000'),
+        'date': datetime.date(2024, 5, 1),
+        'updated_at': datetime.datetime(2024, 5, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        'name': '행복요양원',
+    }
+    expected = {
+        'latitude': 37.5088,
+        'date': '2024-05-01',
+        'updated_at': '2024-05-01T09:30:00Z',
+        'name': '행복요양원',
+    }
+
+    def test_dumps_converts_decimal_to_number(self):
+        self.assertEqual(json.loads(renderers.dumps(self.payload)), self.expected)
+
+    def test_stdlib_fallback_matches(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(json.loads(renderers.dumps(self.payload)), self.expected)
+
+    def test_fast_json_response_requires_dict_unless_unsafe(self):
+        with self.assertRaises(TypeError):
+            renderers.FastJsonResponse([1, 2])
+
+        response = renderers.FastJsonResponse([Decimal('1.5')], safe=False, status=201)
+
+        self.assertEqual((response.status_code, response['Content-Type']), (201, 'application/json'))
+        self.assertEqual(response.content, b'[1.5]')
+
+    def test_drf_renderer_indents_on_request(self):
+        renderer = renderers.JSONRenderer()
+
+        self.assertEqual(renderer.render({'a': 1}), b'{"a":1}')
+        self.assertEqual(renderer.render({'a': 1}, 'application/json; indent=4'), b'{\n  "a": 1\n}')
+        self.assertEqual(renderer.render(None), b'')
@@ -4,8 +4,12 @@ URL configuration for caremap project.
 from django.contrib import admin
 from django.urls import path, include
 
+from .views import QueryProfileView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/accounts/", include('accounts.urls')),
     path("api/", include('institutions.urls')),
+    path("api/", include('crawls.urls')),
+    path("api/admin/query-profile/", QueryProfileView.as_view(), name='query_profile'),
 ]
@@ -0,0 +1,21 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .profiling import profile_store
+
+
+class QueryProfileView(APIView):
+    """엔드포인트별 SQL 측정 집계 조회/초기화 API (관리자 전용)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            limit = 20
+        return Response({'endpoints': profile_store.top(limit)})
+
+    def delete(self, request):
+        profile_store.reset()
+        return Response({'message': '집계가 초기화되었습니다.'})
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import CrawlJob
+
+
+@admin.register(CrawlJob)
+class CrawlJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'mode', 'status', 'stage', 'records', 'requested_by', 'created_at', 'finished_at')
+    list_filter = ('mode', 'status')
+    readonly_fields = [field.name for field in CrawlJob._meta.fields]
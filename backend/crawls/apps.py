@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class CrawlsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "crawls"
+    verbose_name = "크롤링 작업"
@@ -0,0 +1,147 @@
+# Generated by Django 4.2.11 on 2026-10-19 19:24
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawlJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "mode",
+                    models.CharField(
+                        choices=[
+                            ("crawl", "전체 수집"),
+                            ("refresh", "변경 우선 재수집"),
+                            ("full_refresh", "전체 수집 (그림자 테이블 교체)"),
+                            ("geocode_retry", "Geocoding 재시도"),
+                            ("forecast", "예상 여석 계산"),
+                        ],
+                        default="crawl",
+                        max_length=20,
+                        verbose_name="실행 방식",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "대기"),
+                            ("running", "실행 중"),
+                            ("succeeded", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="대기/실행 중"),
+                ),
+                (
+                    "stage",
+                    models.CharField(
+                        blank=True, max_length=50, verbose_name="현재 단계"
+                    ),
+                ),
+                (
+                    "records",
+                    models.PositiveIntegerField(default=0, verbose_name="처리 건수"),
+                ),
+                (
+                    "total",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="전체 건수"
+                    ),
+                ),
+                (
+                    "rate",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="초당 처리 건수"
+                    ),
+                ),
+                (
+                    "stages",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="완료 단계"
+                    ),
+                ),
+                (
+                    "seq",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="진행 이벤트 번호"
+                    ),
+                ),
+                (
+                    "exit_code",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="종료 코드"
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="요청일"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="시작일"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="종료일"),
+                ),
+                (
+                    "heartbeat_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="마지막 응답"
+                    ),
+                ),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="crawl_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="요청자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "크롤링 작업",
+                "verbose_name_plural": "크롤링 작업 목록",
+                "ordering": ["-created_at", "-id"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="crawljob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_active", True)),
+                fields=("is_active",),
+                name="uniq_crawl_job_active",
+            ),
+        ),
+    ]
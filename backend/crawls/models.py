@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+
+class CrawlJob(models.Model):
+    """
+    크롤러 실행 작업 (crawls/runner.py 가 백그라운드에서 crawler/main.py 실행)
+
+    실행 중인 작업(is_active=True)은 항상 하나뿐이며, DB 부분 유니크 제약으로 보장합니다.
+    """
+    MODE_CHOICES = (
+        ('crawl', '전체 수집'),
+        ('refresh', '변경 우선 재수집'),
+        ('full_refresh', '전체 수집 (그림자 테이블 교체)'),
+        ('geocode_retry', 'Geocoding 재시도'),
+        ('forecast', '예상 여석 계산'),
+    )
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_QUEUED, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_SUCCEEDED, '완료'),
+        (STATUS_FAILED, '실패'),
+    )
+
+    mode = models.CharField(max_length=20, choices=MODE_CHOICES, default='crawl', verbose_name='실행 방식')
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED, verbose_name='상태'
+    )
+    is_active = models.BooleanField(default=True, verbose_name='대기/실행 중')
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='crawl_jobs',
+        verbose_name='요청자'
+    )
+    # 진행 상황 (크롤러 JSON 로그의 단계/진행 이벤트)
+    stage = models.CharField(max_length=50, blank=True, verbose_name='현재 단계')
+    records = models.PositiveIntegerField(default=0, verbose_name='처리 건수')
+    total = models.PositiveIntegerField(null=True, blank=True, verbose_name='전체 건수')
+    rate = models.FloatField(null=True, blank=True, verbose_name='초당 처리 건수')
+    stages = models.JSONField(default=dict, blank=True, verbose_name='완료 단계')
+    seq = models.PositiveIntegerField(default=0, verbose_name='진행 이벤트 번호')
+    exit_code = models.IntegerField(null=True, blank=True, verbose_name='종료 코드')
+    error = models.TextField(blank=True, verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='요청일')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작일')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료일')
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 응답')
+
+    class Meta:
+        verbose_name = '크롤링 작업'
+        verbose_name_plural = '크롤링 작업 목록'
+        ordering = ['-created_at', '-id']
+        constraints = [
+            # 동시에 들어온 시작 요청 중 하나만 작업을 만듦
+            models.UniqueConstraint(
+                fields=['is_active'], condition=Q(is_active=True), name='uniq_crawl_job_active'
+            ),
+        ]
+
+    def __str__(self):
+        return f"#{self.pk} {self.get_mode_display()} ({self.get_status_display()})"
@@ -0,0 +1,277 @@
+"""
+Crawl Job Runner
+
+관리 화면의 크롤링 시작 요청을 백그라운드 스레드 풀에서 실행합니다.
+요청은 작업(CrawlJob)만 만들고 바로 응답하며, 워커 스레드가 crawler/main.py 를 하위 프로세스로 실행합니다.
+
+- 중복 실행 방지: 대기/실행 중 작업은 DB 부분 유니크 제약(uniq_crawl_job_active)으로 하나만 존재하며,
+  동시에 들어온 시작 요청은 이미 있는 작업을 돌려받습니다. (여러 서버 프로세스 간에도 동일)
+- 진행 상황: 크롤러를 LOG_CONSOLE_FORMAT=json 으로 실행하고 표준 출력의 JSON lines 중
+  단계 시작/종료(stage_start/stage_done), 진행 요약(ProgressLog progress/done), ERROR 로그를 읽어
+  작업 행(stage/records/total/rate/stages)에 반영합니다. 반영할 때마다 seq 가 1 증가하며,
+  SSE 스트림(views.stream_job_events)은 seq 가 바뀐 상태만 전송합니다.
+- 비정상 종료: 출력 여부와 관계없이 HEARTBEAT_SECONDS 마다 heartbeat_at 을 갱신하고, 서버 재시작 등으로
+  STALE_SECONDS 동안 갱신되지 않은 작업은 다음 시작 요청 때 실패 처리합니다. 실행 중인 작업이 그렇게
+  실패 처리되면 실행기는 다음 갱신 때 이를 알아채고 크롤러 프로세스를 종료합니다. (두 크롤러 동시 실행 방지)
+"""
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CrawlJob
+
+logger = logging.getLogger(__name__)
+
+# 실행 방식별 crawler/main.py 인자
+MODE_ARGS = {
+    'crawl': [],
+    'refresh': ['--refresh'],
+    'full_refresh': ['--full-refresh'],
+    'geocode_retry': ['--geocode-retry'],
+    'forecast': ['--forecast-only'],
+}
+MAX_ERROR_LENGTH = 2000
+# 만료된 작업의 크롤러에 SIGTERM 후 SIGKILL 까지 기다리는 시간(초)
+TERMINATE_TIMEOUT = 10
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _setting(key):
+    return settings.CRAWL_JOBS[key]
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """작업 실행 스레드 풀 (프로세스당 1개, 첫 요청 시 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_setting('WORKERS'), thread_name_prefix='crawl-job')
+        return _executor
+
+
+def expire_stale_jobs() -> int:
+    """heartbeat 가 STALE_SECONDS 동안 없는 대기/실행 중 작업 실패 처리, 처리 건수 반환"""
+    now = timezone.now()
+    return CrawlJob.objects.filter(
+        is_active=True, heartbeat_at__lt=now - timedelta(seconds=_setting('STALE_SECONDS'))
+    ).update(
+        status=CrawlJob.STATUS_FAILED, is_active=False, finished_at=now,
+        error='작업 실행기 응답 없음 (서버 재시작 등)'
+    )
+
+
+def start_job(mode: str, user=None):
+    """
+    크롤링 작업 등록 (이미 대기/실행 중인 작업이 있으면 그 작업 반환)
+
+    Args:
+        mode: 실행 방식 (CrawlJob.MODE_CHOICES)
+        user: 요청한 사용자
+
+    Returns:
+        tuple: (CrawlJob, 새로 등록했는지 여부)
+    """
+    expire_stale_jobs()
+    for _ in range(3):
+        try:
+            with transaction.atomic():
+                job = CrawlJob.objects.create(mode=mode, requested_by=user, heartbeat_at=timezone.now())
+        except IntegrityError:
+            active = CrawlJob.objects.select_related('requested_by').filter(is_active=True).first()
+            if active is not None:
+                return active, False
+            # 그 사이 작업이 끝났으면 다시 등록
+            continue
+        transaction.on_commit(lambda: get_executor().submit(_run_in_worker, job.pk))
+        return job, True
+    raise IntegrityError('Crawl job registration kept conflicting with finishing jobs')
+
+
+def _run_in_worker(job_id: int):
+    try:
+        run_job(job_id)
+    except Exception:
+        logger.exception(f"Crawl job {job_id} runner failed")
+        _finish(job_id, CrawlJob.STATUS_FAILED, None, '작업 실행기 오류')
+    finally:
+        # 워커 스레드의 연결은 request_finished 시그널로 정리되지 않으므로 직접 닫음
+        connections.close_all()
+
+
+def crawler_command(mode: str) -> list:
+    """crawler/main.py 실행 명령"""
+    return [_setting('PYTHON'), 'main.py', *MODE_ARGS[mode]]
+
+
+def crawler_env() -> dict:
+    """하위 프로세스 환경 변수 (콘솔 JSON lines, 진행 요약 간격, 버퍼링 없음)"""
+    env = os.environ.copy()
+    env.update({
+        'LOG_CONSOLE_FORMAT': 'json',
+        'LOG_PROGRESS_SECONDS': str(_setting('PROGRESS_SECONDS')),
+        'PYTHONUNBUFFERED': '1',
+        'PYTHONIOENCODING': 'utf-8',
+    })
+    return env
+
+
+def run_job(job_id: int):
+    """
+    작업 실행: crawler/main.py 하위 프로세스 실행, 출력 이벤트를 작업 행에 반영, 종료 코드로 결과 기록
+
+    Args:
+        job_id: CrawlJob id
+    """
+    now = timezone.now()
+    # 대기 중 실패 처리(expire_stale_jobs)된 작업은 실행하지 않음
+    if not CrawlJob.objects.filter(pk=job_id, is_active=True).update(
+        status=CrawlJob.STATUS_RUNNING, started_at=now, heartbeat_at=now
+    ):
+        logger.warning(f"Crawl job {job_id} expired before it started")
+        return
+    job = CrawlJob.objects.get(pk=job_id)
+
+    try:
+        process = subprocess.Popen(
+            crawler_command(job.mode), cwd=_setting('CRAWLER_DIR'), env=crawler_env(),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='replace'
+        )
+    except OSError as e:
+        logger.error(f"Crawl job {job_id} could not start crawler: {e}")
+        _finish(job_id, CrawlJob.STATUS_FAILED, None, f'크롤러 실행 실패: {e}')
+        return
+
+    # 출력이 없는 동안에도 heartbeat 를 남기기 위해 읽기는 별도 스레드에서
+    lines = queue.Queue()
+    reader = threading.Thread(target=_read_lines, args=(process.stdout, lines), daemon=True)
+    reader.start()
+
+    # 진행 이벤트가 아닌 출력만 계속되어도 HEARTBEAT_SECONDS 마다 갱신
+    heartbeat = _setting('HEARTBEAT_SECONDS')
+    beat_at = time.monotonic()
+    alive = True
+    while alive:
+        try:
+            line = lines.get(timeout=heartbeat)
+        except queue.Empty:
+            line = ''
+        if line is None:
+            break
+        if line and apply_event(job, line):
+            job.seq += 1
+            alive = _save_progress(job)
+            beat_at = time.monotonic()
+        elif time.monotonic() - beat_at >= heartbeat:
+            alive = CrawlJob.objects.filter(pk=job_id, is_active=True).update(heartbeat_at=timezone.now()) > 0
+            beat_at = time.monotonic()
+
+    if not alive:
+        logger.warning(f"Crawl job {job_id} was expired while running; terminating crawler (pid {process.pid})")
+        _terminate(process)
+        reader.join()
+        return
+
+    exit_code = process.wait()
+    reader.join()
+    status = CrawlJob.STATUS_SUCCEEDED if exit_code == 0 else CrawlJob.STATUS_FAILED
+    if not _finish(job_id, status, exit_code, None):
+        logger.warning(f"Crawl job {job_id} was expired before the crawler exited (exit code {exit_code})")
+        return
+    logger.info(f"Crawl job {job_id} finished: {status} (exit code {exit_code})")
+
+
+def _save_progress(job: CrawlJob) -> bool:
+    """진행 상황과 heartbeat 저장 (이미 실패 처리된 작업이면 저장하지 않고 False)"""
+    job.heartbeat_at = timezone.now()
+    return CrawlJob.objects.filter(pk=job.pk, is_active=True).update(
+        stage=job.stage, records=job.records, total=job.total, rate=job.rate, stages=job.stages,
+        error=job.error, seq=job.seq, heartbeat_at=job.heartbeat_at
+    ) > 0
+
+
+def _terminate(process: subprocess.Popen):
+    """크롤러 프로세스 종료 (SIGTERM, TERMINATE_TIMEOUT 안에 끝나지 않으면 SIGKILL)"""
+    process.terminate()
+    try:
+        process.wait(timeout=TERMINATE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _read_lines(stream, lines: queue.Queue):
+    for line in stream:
+        lines.put(line)
+    stream.close()
+    lines.put(None)
+
+
+def apply_event(job: CrawlJob, line: str) -> bool:
+    """
+    크롤러 JSON 로그 한 줄을 작업 진행 상황에 반영
+
+    Args:
+        job: CrawlJob (저장하지 않음)
+        line: 표준 출력 한 줄
+
+    Returns:
+        bool: 작업 상태가 바뀌었는지 여부 (JSON 이 아니거나 관련 없는 로그는 False)
+    """
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return False
+    if not isinstance(entry, dict):
+        return False
+
+    event = entry.get('event')
+    if event == 'stage_start':
+        job.stage = entry['stage']
+        job.records = 0
+        job.total = None
+        job.rate = None
+        return True
+    if event == 'stage_done':
+        seconds = entry.get('seconds') or 0
+        job.records = entry.get('records') or 0
+        job.rate = round(job.records / seconds, 1) if seconds else None
+        job.stages = {**job.stages, entry['stage']: {'seconds': seconds, 'records': job.records}}
+        return True
+    if event in ('progress', 'done') and 'task' in entry:
+        job.records = entry.get('done') or 0
+        job.total = entry.get('total')
+        job.rate = entry.get('rate')
+        return True
+    if entry.get('level') in ('ERROR', 'CRITICAL'):
+        job.error = entry.get('msg', '').strip()[:MAX_ERROR_LENGTH]
+        return True
+    return False
+
+
+def _finish(job_id: int, status: str, exit_code, error) -> bool:
+    """
+    종료 상태 기록 (is_active 해제로 다음 작업 등록 허용), 마지막 진행 이벤트 번호 증가
+
+    그 사이 expire_stale_jobs 로 실패 처리된 작업은 덮어쓰지 않습니다.
+
+    Returns:
+        bool: 기록했는지 여부
+    """
+    fields = {'status': status, 'exit_code': exit_code, 'is_active': False, 'finished_at': timezone.now()}
+    if error:
+        fields['error'] = error
+    return CrawlJob.objects.filter(pk=job_id, is_active=True).update(**fields, seq=F('seq') + 1) > 0
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from .models import CrawlJob
+
+
+class CrawlJobSerializer(serializers.ModelSerializer):
+    """크롤링 작업 상태 Serializer (REST 응답, SSE 이벤트 공용)"""
+    requested_by = serializers.CharField(source='requested_by.username', default=None, read_only=True)
+
+    class Meta:
+        model = CrawlJob
+        fields = ('id', 'mode', 'status', 'stage', 'records', 'total', 'rate', 'stages',
+                  'exit_code', 'error', 'requested_by', 'created_at', 'started_at', 'finished_at')
+        read_only_fields = fields
@@ -0,0 +1,354 @@
+import asyncio
+import json
+import tempfile
+import textwrap
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core import signing
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+from . import runner, views
+from .models import CrawlJob
+
+# crawler/main.py 대신 실행할 스크립트 (JSON lines 출력, --forecast-only 이면 실패 종료)
+FAKE_CRAWLER = textwrap.dedent('''
+    import json, os, sys
+    def log(**entry):
+        print(json.dumps(entry))
+    print('plain text line')
+    log(level='INFO', msg="Stage 'sync' started", event='stage_start', stage='sync')
+    log(level='INFO', msg='sync progress', event='progress', task='sync', done=2, total=4, rate=2.0)
+    log(level='INFO', msg='sync done', event='stage_done', stage='sync', seconds=2.0, records=4)
+    log(level='INFO', msg=os.environ['LOG_CONSOLE_FORMAT'])
+    if '--forecast-only' in sys.argv:
+        log(level='ERROR', msg='Database connection failed. Exiting...')
+        sys.exit(1)
+''')
+
+# 진행 이벤트 없이 일반 출력만 계속하는 크롤러 (10초 후 스스로 종료)
+CHATTY_CRAWLER = textwrap.dedent('''
+    import time
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        print('fetching page', flush=True)
+        time.sleep(0.01)
+''')
+
+
+def _crawl_settings(**overrides):
+    return {**settings.CRAWL_JOBS, **overrides}
+
+
+def _events_url(job_id, age=0):
+    with mock.patch('django.core.signing.time.time', return_value=time.time() - age):
+        token = signing.dumps(job_id, salt=views.STREAM_TOKEN_SALT)
+    return f"{reverse('crawls:job_events', args=[job_id])}?token={token}"
+
+
+class CrawlJobApiTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', 'admin@example.com', 'pw-12345678', user_type='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        submit = mock.patch.object(runner, 'get_executor')
+        self.executor = submit.start()
+        self.addCleanup(submit.stop)
+
+    def test_start_returns_job_id_without_running_crawler(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('crawls:jobs'), {'mode': 'refresh'}, format='json')
+
+        self.assertEqual(response.status_code, 202)
+        body = response.json()
+        self.assertTrue(body['created'])
+        self.assertEqual(body['status'], 'queued')
+        self.assertTrue(body['events_url'].startswith(f"/api/v1/crawler/jobs/{body['id']}/events/?token="))
+        self.assertEqual(body['requested_by'], 'admin')
+        self.executor.return_value.submit.assert_called_once_with(runner._run_in_worker, body['id'])
+
+    def test_events_url_uses_public_backend_url(self):
+        job = CrawlJob.objects.create()
+
+        with override_settings(CRAWL_JOBS=_crawl_settings(PUBLIC_URL='https://api.example.com')):
+            body = self.client.get(reverse('crawls:job', args=[job.pk])).json()
+
+        self.assertTrue(body['events_url'].startswith(f"https://api.example.com/api/v1/crawler/jobs/{job.pk}/events/"))
+
+    def test_concurrent_start_returns_active_job(self):
+        first = self.client.post(reverse('crawls:jobs')).json()
+
+        response = self.client.post(reverse('crawls:jobs'), {'mode': 'forecast'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], first['id'])
+        self.assertFalse(response.json()['created'])
+        self.assertEqual(CrawlJob.objects.count(), 1)
+
+    def test_stale_job_is_failed_and_replaced(self):
+        stale = CrawlJob.objects.create(
+            status=CrawlJob.STATUS_RUNNING, heartbeat_at=timezone.now() - timedelta(hours=1)
+        )
+
+        response = self.client.post(reverse('crawls:jobs'))
+
+        self.assertEqual(response.status_code, 202)
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, CrawlJob.STATUS_FAILED)
+        self.assertFalse(stale.is_active)
+
+    def test_finished_job_allows_new_start(self):
+        CrawlJob.objects.create(status=CrawlJob.STATUS_SUCCEEDED, is_active=False)
+
+        response = self.client.post(reverse('crawls:jobs'))
+
+        self.assertEqual(response.status_code, 202)
+
+    def test_invalid_mode_is_rejected(self):
+        response = self.client.post(reverse('crawls:jobs'), {'mode': 'everything'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(CrawlJob.objects.exists())
+
+    @override_settings(CRAWL_JOBS=_crawl_settings(SERVICE_USERNAME='frontend'))
+    def test_service_account_starts_job_for_acting_admin(self):
+        service = User.objects.create_user('frontend', 'frontend@example.com', 'pw-12345678', user_type='admin')
+        self.client.force_authenticate(service)
+
+        response = self.client.post(reverse('crawls:jobs'), HTTP_X_ACTING_USER_ID=str(self.admin.pk))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(CrawlJob.objects.get().requested_by, self.admin)
+
+    @override_settings(CRAWL_JOBS=_crawl_settings(SERVICE_USERNAME='frontend'))
+    def test_service_account_rejects_non_admin_acting_user(self):
+        service = User.objects.create_user('frontend', 'frontend@example.com', 'pw-12345678', user_type='admin')
+        user = User.objects.create_user('user', 'user@example.com', 'pw-12345678')
+        self.client.force_authenticate(service)
+
+        for acting_id in (str(user.pk), 'admin', '999999'):
+            response = self.client.post(reverse('crawls:jobs'), HTTP_X_ACTING_USER_ID=acting_id)
+            self.assertEqual(response.status_code, 403)
+        self.assertFalse(CrawlJob.objects.exists())
+
+    @override_settings(CRAWL_JOBS=_crawl_settings(SERVICE_USERNAME='frontend'))
+    def test_acting_user_header_is_ignored_from_other_accounts(self):
+        other = User.objects.create_user('other', 'other@example.com', 'pw-12345678', user_type='admin')
+
+        self.client.post(reverse('crawls:jobs'), HTTP_X_ACTING_USER_ID=str(other.pk))
+
+        self.assertEqual(CrawlJob.objects.get().requested_by, self.admin)
+
+    def test_non_admin_cannot_start(self):
+        user = User.objects.create_user('user', 'user@example.com', 'pw-12345678', is_staff=True)
+        self.client.force_authenticate(user)
+
+        response = self.client.post(reverse('crawls:jobs'))
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(CrawlJob.objects.exists())
+
+
+@override_settings(CRAWL_JOBS=_crawl_settings(STREAM_POLL_SECONDS=0.01))
+class CrawlJobEventStreamTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', 'admin@example.com', 'pw-12345678', user_type='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    async def _events(self, url, **headers):
+        response = await self.async_client.get(url, **headers)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        return [
+            dict(line.split(': ', 1) for line in message.splitlines())
+            for message in body.strip().split('\n\n')
+        ]
+
+    async def test_finished_job_streams_done_event(self):
+        job = await CrawlJob.objects.acreate(
+            status=CrawlJob.STATUS_SUCCEEDED, is_active=False, stage='snapshot', records=8, seq=5
+        )
+        url = _events_url(job.pk)
+
+        events = await self._events(url)
+
+        self.assertEqual(events[0], {'retry': '3000'})
+        self.assertEqual(events[1]['event'], 'done')
+        self.assertEqual(events[1]['id'], '5')
+        self.assertEqual(json.loads(events[1]['data'])['records'], 8)
+
+    async def test_progress_events_follow_job_updates(self):
+        job = await CrawlJob.objects.acreate(status=CrawlJob.STATUS_RUNNING, stage='sync', seq=1)
+        url = _events_url(job.pk)
+
+        async def finish():
+            # 스트림이 실행 중 상태를 먼저 한 번 읽도록 (첫 응답 준비가 느린 환경 고려)
+            await asyncio.sleep(0.5)
+            await CrawlJob.objects.filter(pk=job.pk).aupdate(
+                status=CrawlJob.STATUS_SUCCEEDED, is_active=False, seq=2
+            )
+
+        finishing = asyncio.ensure_future(finish())
+        events = await self._events(url)
+        await finishing
+
+        self.assertEqual([e.get('event') for e in events[1:]], ['progress', 'done'])
+        self.assertEqual(json.loads(events[1]['data'])['stage'], 'sync')
+        self.assertEqual(json.loads(events[2]['data'])['status'], 'succeeded')
+
+    async def test_token_outlives_max_age_while_job_runs(self):
+        job = await CrawlJob.objects.acreate(status=CrawlJob.STATUS_RUNNING, stage='sync', seq=1)
+        url = _events_url(job.pk, age=settings.CRAWL_JOBS['STREAM_TOKEN_MAX_AGE'] * 3)
+
+        async def finish():
+            await asyncio.sleep(0.5)
+            await CrawlJob.objects.filter(pk=job.pk).aupdate(
+                status=CrawlJob.STATUS_SUCCEEDED, is_active=False, finished_at=timezone.now(), seq=2
+            )
+
+        finishing = asyncio.ensure_future(finish())
+        events = await self._events(url)
+        await finishing
+
+        self.assertEqual([e.get('event') for e in events[1:]], ['progress', 'done'])
+
+    def test_token_expires_after_job_finishes(self):
+        max_age = settings.CRAWL_JOBS['STREAM_TOKEN_MAX_AGE']
+        recent = CrawlJob.objects.create(is_active=False, finished_at=timezone.now() - timedelta(minutes=1))
+        old = CrawlJob.objects.create(
+            is_active=False, finished_at=timezone.now() - timedelta(seconds=max_age + 60)
+        )
+
+        self.assertEqual(self.client.get(_events_url(recent.pk, age=max_age * 2)).status_code, 200)
+        self.assertEqual(self.client.get(_events_url(old.pk, age=max_age * 2)).status_code, 403)
+
+    def test_invalid_token_is_forbidden(self):
+        job = CrawlJob.objects.create()
+
+        response = self.client.get(reverse('crawls:job_events', args=[job.pk]), {'token': 'forged'})
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_token_for_other_job_is_forbidden(self):
+        job = CrawlJob.objects.create(is_active=False)
+        other = CrawlJob.objects.create()
+        url = self.client.get(reverse('crawls:job', args=[job.pk])).json()['events_url']
+
+        response = self.client.get(url.replace(f'/jobs/{job.pk}/', f'/jobs/{other.pk}/'))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class CrawlJobRunnerTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        Path(directory.name, 'main.py').write_text(FAKE_CRAWLER)
+        patcher = override_settings(CRAWL_JOBS=_crawl_settings(CRAWLER_DIR=directory.name))
+        patcher.enable()
+        self.addCleanup(patcher.disable)
+
+    def test_run_records_stage_progress_and_success(self):
+        job = CrawlJob.objects.create(mode='crawl')
+
+        runner.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_SUCCEEDED)
+        self.assertFalse(job.is_active)
+        self.assertEqual(job.exit_code, 0)
+        self.assertEqual(job.stage, 'sync')
+        self.assertEqual(job.records, 4)
+        self.assertEqual(job.rate, 2.0)
+        self.assertEqual(job.stages, {'sync': {'seconds': 2.0, 'records': 4}})
+        self.assertEqual(job.seq, 4)  # stage_start, progress, stage_done, 종료
+
+    def test_failed_run_keeps_last_error(self):
+        job = CrawlJob.objects.create(mode='forecast')
+
+        runner.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_FAILED)
+        self.assertEqual(job.exit_code, 1)
+        self.assertEqual(job.error, 'Database connection failed. Exiting...')
+
+    def test_missing_interpreter_fails_job(self):
+        job = CrawlJob.objects.create()
+
+        with override_settings(CRAWL_JOBS=_crawl_settings(PYTHON='/nonexistent/python')), \
+                self.assertLogs('crawls.runner', 'ERROR'):
+            runner.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_FAILED)
+        self.assertFalse(job.is_active)
+        self.assertIn('크롤러 실행 실패', job.error)
+
+    def test_heartbeat_continues_under_non_event_output_and_expiry_stops_crawler(self):
+        Path(settings.CRAWL_JOBS['CRAWLER_DIR'], 'main.py').write_text(CHATTY_CRAWLER)
+        job = CrawlJob.objects.create(mode='crawl', heartbeat_at=timezone.now())
+        started = timezone.now()
+        beats = []
+        apply_event = runner.apply_event
+
+        def watch(job, line):
+            # 실행 스레드와 같은 연결에서 heartbeat 관찰, 갱신이 확인되면 만료 처리
+            beats.append(CrawlJob.objects.get(pk=job.pk).heartbeat_at)
+            if beats[-1] > started + timedelta(seconds=0.1):
+                CrawlJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+                runner.expire_stale_jobs()
+            return apply_event(job, line)
+
+        with override_settings(CRAWL_JOBS=_crawl_settings(HEARTBEAT_SECONDS=0.05)), \
+                mock.patch.object(runner, 'apply_event', side_effect=watch), \
+                mock.patch.object(runner, '_terminate', wraps=runner._terminate) as terminate, \
+                self.assertLogs('crawls.runner', 'WARNING'):
+            runner.run_job(job.pk)
+
+        process = terminate.call_args.args[0]
+        self.assertIsNotNone(process.poll())
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_FAILED)
+        self.assertFalse(job.is_active)
+        self.assertIsNone(job.exit_code)
+        self.assertIn('응답 없음', job.error)
+
+    def test_finish_does_not_overwrite_expired_job(self):
+        job = CrawlJob.objects.create(mode='crawl', heartbeat_at=timezone.now() - timedelta(hours=1))
+        runner.expire_stale_jobs()
+
+        self.assertFalse(runner._finish(job.pk, CrawlJob.STATUS_SUCCEEDED, 0, None))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_FAILED)
+        self.assertIsNone(job.exit_code)
+
+    def test_expired_job_is_not_started(self):
+        job = CrawlJob.objects.create(mode='crawl', heartbeat_at=timezone.now() - timedelta(hours=1))
+        runner.expire_stale_jobs()
+
+        with mock.patch('crawls.runner.subprocess.Popen') as popen, self.assertLogs('crawls.runner', 'WARNING'):
+            runner.run_job(job.pk)
+
+        popen.assert_not_called()
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_FAILED)
+        self.assertIsNone(job.started_at)
+
+    def test_apply_event_ignores_unrelated_lines(self):
+        job = CrawlJob(stage='sync')
+
+        self.assertFalse(runner.apply_event(job, 'Traceback (most recent call last):\n'))
+        self.assertFalse(runner.apply_event(job, json.dumps({'level': 'INFO', 'msg': 'hello'})))
+        self.assertFalse(runner.apply_event(job, '[1, 2]'))
+        self.assertEqual(job.stage, 'sync')
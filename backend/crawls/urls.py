@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = 'crawls'
+
+urlpatterns = [
+    path('v1/crawler/jobs/', views.CrawlJobListView.as_view(), name='jobs'),
+    path('v1/crawler/jobs/<int:job_id>/', views.CrawlJobDetailView.as_view(), name='job'),
+    path('v1/crawler/jobs/<int:job_id>/events/', views.stream_job_events, name='job_events'),
+]
@@ -0,0 +1,173 @@
+import asyncio
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core import signing
+from django.http import HttpResponseForbidden, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.models import User
+from accounts.permissions import IsSystemAdmin
+from caremap.renderers import dumps
+from . import runner
+from .models import CrawlJob
+from .serializers import CrawlJobSerializer
+
+# 최근 작업 목록 수
+RECENT_JOBS = 20
+STREAM_TOKEN_SALT = 'crawls.events'
+
+
+def _job_payload(job):
+    """
+    작업 상태 + SSE 스트림 URL (EventSource 는 헤더를 보낼 수 없으므로 서명된 토큰을 쿼리로 전달)
+
+    요청은 프론트엔드 서버를 거쳐 들어오므로 요청 주소 대신 PUBLIC_URL 기준 (없으면 상대 경로)
+    """
+    token = signing.dumps(job.pk, salt=STREAM_TOKEN_SALT)
+    events_url = reverse('crawls:job_events', args=[job.pk])
+    return {
+        **CrawlJobSerializer(job).data,
+        'events_url': f"{settings.CRAWL_JOBS['PUBLIC_URL']}{events_url}?{urlencode({'token': token})}",
+    }
+
+
+def _acting_user(request):
+    """
+    작업 요청자
+
+    서비스 계정(SERVICE_USERNAME, 프론트엔드 서버)의 요청이면 X-Acting-User-Id 헤더의 사용자,
+    그 외에는 인증된 사용자 (다른 계정이 보낸 헤더는 무시)
+
+    Returns:
+        User (헤더의 사용자가 없거나 시스템 관리자가 아니면 None)
+    """
+    service = settings.CRAWL_JOBS['SERVICE_USERNAME']
+    acting_id = request.headers.get('X-Acting-User-Id')
+    if not service or request.user.username != service or acting_id is None:
+        return request.user
+    if not acting_id.isdigit():
+        return None
+    acting = User.objects.filter(pk=int(acting_id), is_active=True).first()
+    return acting if acting is not None and acting.is_admin else None
+
+
+class CrawlJobListView(APIView):
+    """
+    크롤링 작업 목록 조회 / 시작 API (시스템 관리자 전용)
+    API Endpoint: /api/v1/crawler/jobs/
+
+    POST 는 작업을 등록하고 바로 응답합니다. (202, 실행은 백그라운드 스레드 풀)
+    이미 대기/실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려줍니다. (200)
+    """
+    permission_classes = [IsSystemAdmin]
+
+    def get(self, request):
+        jobs = CrawlJob.objects.select_related('requested_by')[:RECENT_JOBS]
+        return Response({'results': CrawlJobSerializer(jobs, many=True).data})
+
+    def post(self, request):
+        mode = request.data.get('mode', 'crawl')
+        if mode not in dict(CrawlJob.MODE_CHOICES):
+            return Response(
+                {'error': f"mode 는 {', '.join(dict(CrawlJob.MODE_CHOICES))} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        user = _acting_user(request)
+        if user is None:
+            return Response(
+                {'error': '요청한 사용자가 시스템 관리자가 아닙니다.'}, status=status.HTTP_403_FORBIDDEN
+            )
+        job, created = runner.start_job(mode, user)
+        return Response(
+            {**_job_payload(job), 'created': created},
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK
+        )
+
+
+class CrawlJobDetailView(APIView):
+    """
+    크롤링 작업 상태 조회 API (시스템 관리자 전용)
+    API Endpoint: /api/v1/crawler/jobs/<job_id>/
+    """
+    permission_classes = [IsSystemAdmin]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(CrawlJob.objects.select_related('requested_by'), pk=job_id)
+        return Response(_job_payload(job))
+
+
+def _sse(event, data, event_id=None) -> bytes:
+    """Server-Sent Events 메시지 한 개"""
+    head = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{head}event: {event}\n".encode() + b"data: " + dumps(data) + b"\n\n"
+
+
+async def _job_events(job_id, last_seq):
+    """
+    작업 상태가 바뀔 때마다(seq 증가) progress 이벤트, 끝나면 done 이벤트 후 종료
+
+    상태는 작업 행에서 읽으므로 작업을 실행하는 서버 프로세스와 다른 프로세스에서도 같은 스트림을 받습니다.
+    """
+    config = settings.CRAWL_JOBS
+    poll = config['STREAM_POLL_SECONDS']
+    keepalive = config['STREAM_KEEPALIVE_SECONDS']
+    idle = 0.0
+    # 연결이 끊기면 브라우저가 3초 후 Last-Event-ID 와 함께 다시 연결
+    yield b"retry: 3000\n\n"
+    while True:
+        job = await CrawlJob.objects.select_related('requested_by').filter(pk=job_id).afirst()
+        if job is None:
+            return
+        data = CrawlJobSerializer(job).data
+        if not job.is_active:
+            yield _sse('done', data, job.seq)
+            return
+        if job.seq != last_seq:
+            last_seq = job.seq
+            idle = 0.0
+            yield _sse('progress', data, job.seq)
+        elif idle >= keepalive:
+            idle = 0.0
+            yield b": keepalive\n\n"
+        await asyncio.sleep(poll)
+        idle += poll
+
+
+async def stream_job_events(request, job_id):
+    """
+    크롤링 작업 진행 상황 스트림 (Server-Sent Events, text/event-stream)
+    API Endpoint: /api/v1/crawler/jobs/<job_id>/events/?token=
+
+    token 은 작업 시작/조회 API 응답의 events_url 에 포함된 서명 값입니다.
+    작업이 실행 중인 동안에는 계속 유효하고, 끝난 뒤에는 STREAM_TOKEN_MAX_AGE 동안 유효합니다.
+    (크롤링이 토큰 유효 시간보다 오래 걸려도 재연결이 거부되지 않도록)
+    이벤트: progress (단계, 처리 건수, 전체 건수, 초당 처리 건수, 완료 단계), done (최종 상태)
+    ASGI 서버에서 실행해야 합니다. (WSGI 는 스트림이 끝날 때까지 응답을 모아 보냄)
+    """
+    try:
+        signed_id = signing.loads(request.GET.get('token', ''), salt=STREAM_TOKEN_SALT)
+    except signing.BadSignature:
+        return HttpResponseForbidden('유효하지 않은 스트림 토큰입니다.')
+    job = await CrawlJob.objects.filter(pk=job_id).afirst()
+    if signed_id != job_id or job is None:
+        return HttpResponseForbidden('유효하지 않은 스트림 토큰입니다.')
+    expires = timezone.now() - timedelta(seconds=settings.CRAWL_JOBS['STREAM_TOKEN_MAX_AGE'])
+    if not job.is_active and job.finished_at is not None and job.finished_at < expires:
+        return HttpResponseForbidden('만료된 스트림 토큰입니다.')
+
+    try:
+        last_seq = int(request.headers.get('Last-Event-ID', ''))
+    except ValueError:
+        last_seq = None
+
+    response = StreamingHttpResponse(_job_events(job_id, last_seq), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 응답 버퍼링 해제
+    return response
@@ -0,0 +1,120 @@
+"""
+Catchment Heatmap - 크롤러가 계산한 전국 격자 공급(정원)/여석 밀도
+
+크롤러(crawler/heatmap.py)가 동기화 후 작성한 격자 파일을 읽기 전용 mmap 으로 열고
+요청한 영역(bbox)의 칸 값을 반환합니다. 칸 수가 MAX_CELLS 를 넘으면 인접 칸을 묶어
+(stride x stride) 해상도를 낮춥니다.
+
+- capacity: 반경 내 정원 가중 합
+- vacancy: 반경 내 여석(정원 - 현원) 가중 합
+- occupancy: 1 - 여석/정원 (1 에 가까울수록 여석 부족)
+"""
+import math
+import mmap
+import struct
+
+from .store import ReloadingFile
+
+MAGIC = b'CMAPGRD1'
+HEADER = struct.Struct('<8sIIiII6d6Q')
+KERNELS = {0: 'uniform', 1: 'linear'}
+METRICS = ('capacity', 'vacancy', 'occupancy')
+
+
+class HeatmapGrid:
+    """읽기 전용 mmap 격자"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, self.rows, self.cols, generation, self.institution_count, kernel,
+         self.cell_km, self.radius_km, self.min_lat, self.min_lng, self.lat_step, self.lng_step,
+         capacity_offset, vacancy_offset, *_) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f'{path}: 히트맵 파일이 아닙니다.')
+        self.generation = generation if generation >= 0 else None
+        self.kernel = KERNELS.get(kernel, 'linear')
+
+        view = memoryview(self._mmap)
+        size = self.rows * self.cols * 4
+        self.capacity = view[capacity_offset:capacity_offset + size].cast('f')
+        self.vacancy = view[vacancy_offset:vacancy_offset + size].cast('f')
+        if len(self.capacity) != self.rows * self.cols or len(self.vacancy) != self.rows * self.cols:
+            raise ValueError(f'{path}: 격자 구역이 잘렸습니다.')
+
+    def _block_sums(self, values, top, bottom, left, right, stride):
+        """[top, bottom) x [left, right) 범위를 stride x stride 로 묶은 합계 (행 묶음 목록)"""
+        blocks = []
+        for band in range(top, bottom, stride):
+            sums = [0.0] * math.ceil((right - left) / stride)
+            for row in range(band, min(band + stride, bottom)):
+                start = row * self.cols
+                line = values[start + left:start + right].tolist()
+                for i in range(len(sums)):
+                    sums[i] += sum(line[i * stride:(i + 1) * stride])
+            blocks.append(sums)
+        return blocks
+
+    def cells(self, metric, bbox=None, max_cells=20000):
+        """
+        영역 내 칸 목록
+
+        Args:
+            metric: 'capacity' / 'vacancy' / 'occupancy'
+            bbox: (서쪽 경도, 남쪽 위도, 동쪽 경도, 북쪽 위도), 없으면 전국
+            max_cells: 반환할 최대 칸 수 (넘으면 칸을 묶어 해상도를 낮춤)
+
+        Returns:
+            dict: {'stride': 묶은 칸 수, 'cells': [[위도, 경도, 값], ...]} (값이 있는 칸만)
+        """
+        if bbox is None:
+            top, bottom, left, right = 0, self.rows, 0, self.cols
+        else:
+            west, south, east, north = bbox
+            top = max(0, math.floor((south - self.min_lat) / self.lat_step))
+            bottom = min(self.rows, math.floor((north - self.min_lat) / self.lat_step) + 1)
+            left = max(0, math.floor((west - self.min_lng) / self.lng_step))
+            right = min(self.cols, math.floor((east - self.min_lng) / self.lng_step) + 1)
+        if top >= bottom or left >= right:
+            return {'stride': 1, 'cells': []}
+
+        stride = max(1, math.ceil(math.sqrt((bottom - top) * (right - left) / max_cells)))
+        if metric == 'occupancy':
+            capacity = self._block_sums(self.capacity, top, bottom, left, right, stride)
+            vacancy = self._block_sums(self.vacancy, top, bottom, left, right, stride)
+            grid = [
+                [1 - v / c if c > 0 else 0.0 for c, v in zip(cap_row, vac_row)]
+                for cap_row, vac_row in zip(capacity, vacancy)
+            ]
+            present = capacity
+        else:
+            values = self.capacity if metric == 'capacity' else self.vacancy
+            # 묶은 칸은 평균 (해상도와 무관하게 같은 단위)
+            grid = [
+                [total / (stride * stride) for total in row]
+                for row in self._block_sums(values, top, bottom, left, right, stride)
+            ]
+            present = grid
+
+        cells = []
+        for b, (row, present_row) in enumerate(zip(grid, present)):
+            lat = self.min_lat + (top + b * stride + stride / 2) * self.lat_step
+            for i, (value, weight) in enumerate(zip(row, present_row)):
+                if weight > 0:
+                    lng = self.min_lng + (left + i * stride + stride / 2) * self.lng_step
+                    cells.append([round(lat, 5), round(lng, 5), round(value, 3)])
+        return {'stride': stride, 'cells': cells}
+
+
+_heatmap_file = ReloadingFile('HEATMAP', HeatmapGrid)
+
+
+def get_heatmap():
+    """현재 히트맵 격자 (파일이 없으면 None)"""
+    return _heatmap_file.get()
+
+
+def reset_heatmap():
+    """캐시된 격자 제거 (설정 변경 시, 테스트용)"""
+    _heatmap_file.reset()
@@ -0,0 +1,139 @@
+# Generated by Django 4.2.11 on 2026-10-19 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Institution",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "institution_code",
+                    models.CharField(
+                        max_length=20, unique=True, verbose_name="기관 코드"
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="기관명")),
+                (
+                    "service_type",
+                    models.CharField(
+                        blank=True, max_length=100, null=True, verbose_name="급여종류"
+                    ),
+                ),
+                (
+                    "capacity",
+                    models.IntegerField(blank=True, null=True, verbose_name="정원"),
+                ),
+                (
+                    "current_headcount",
+                    models.IntegerField(blank=True, null=True, verbose_name="현원"),
+                ),
+                (
+                    "address",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="주소"
+                    ),
+                ),
+                (
+                    "operating_hours",
+                    models.TextField(blank=True, null=True, verbose_name="운영시간"),
+                ),
+                (
+                    "latitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=8,
+                        max_digits=10,
+                        null=True,
+                        verbose_name="위도",
+                    ),
+                ),
+                (
+                    "longitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=8,
+                        max_digits=11,
+                        null=True,
+                        verbose_name="경도",
+                    ),
+                ),
+                (
+                    "last_updated_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="최종 업데이트 일시"
+                    ),
+                ),
+                (
+                    "crawl_generation",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="최종 수집 회차"
+                    ),
+                ),
+                (
+                    "closed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="폐업 감지 일시"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "장기요양기관",
+                "verbose_name_plural": "장기요양기관 목록",
+                "db_table": "institutions",
+                "ordering": ["id"],
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="InstitutionHistory",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("recorded_date", models.DateField(verbose_name="기록일")),
+                (
+                    "name",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="변경 당시 기관명",
+                    ),
+                ),
+                (
+                    "address",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="변경 당시 주소",
+                    ),
+                ),
+                (
+                    "capacity",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="변경 당시 정원"
+                    ),
+                ),
+                (
+                    "current_headcount",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="변경 당시 현원"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "기관 변경 이력",
+                "verbose_name_plural": "기관 변경 이력 목록",
+                "db_table": "institution_history",
+                "ordering": ["recorded_date"],
+                "managed": False,
+            },
+        ),
+    ]
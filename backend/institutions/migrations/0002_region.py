@@ -0,0 +1,33 @@
+# Generated by Django 4.2.11 on 2026-10-19 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("institutions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Region",
+            fields=[
+                (
+                    "code",
+                    models.IntegerField(
+                        primary_key=True, serialize=False, verbose_name="시군구 코드"
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="시군구 이름")),
+                ("sido_code", models.IntegerField(verbose_name="시/도 코드")),
+            ],
+            options={
+                "verbose_name": "행정구역",
+                "verbose_name_plural": "행정구역 목록",
+                "db_table": "regions",
+                "ordering": ["code"],
+                "managed": False,
+            },
+        ),
+    ]
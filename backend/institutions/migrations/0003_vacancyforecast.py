@@ -0,0 +1,47 @@
+# Generated by Django 4.2.11 on 2026-10-19 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("institutions", "0002_region"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VacancyForecast",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("forecast_month", models.DateField(verbose_name="예측 월")),
+                ("expected_vacancy", models.FloatField(verbose_name="예상 여석")),
+                ("model", models.CharField(max_length=20, verbose_name="예측 모델")),
+                (
+                    "backtest_mae",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="최근 예측 오차"
+                    ),
+                ),
+                (
+                    "generation",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="계산 회차"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="계산 일시"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "예상 여석",
+                "verbose_name_plural": "예상 여석 목록",
+                "db_table": "vacancy_forecasts",
+                "ordering": ["institution", "forecast_month"],
+                "managed": False,
+            },
+        ),
+    ]
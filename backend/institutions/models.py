@@ -1,3 +1,167 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class CoordinateField(models.DecimalField):
+    """
+    위경도 필드 (DB 컬럼은 DECIMAL)
+
+    settings.FLOAT_COORDINATES 가 True 이면 SELECT 에서 double precision 으로 변환해
+    Decimal 객체 생성 없이 float 로 읽습니다.
+    """
+
+    def select_format(self, compiler, sql, params):
+        sql, params = super().select_format(compiler, sql, params)
+        if settings.FLOAT_COORDINATES:
+            sql = f"CAST({sql} AS {models.FloatField().db_type(compiler.connection)})"
+        return sql, params
+
+    def from_db_value(self, value, expression, connection):
+        if value is None or not settings.FLOAT_COORDINATES:
+            return value
+        return float(value)
+
+
+class InstitutionQuerySet(models.QuerySet):
+    """장기요양기관 QuerySet"""
+
+    def open(self):
+        """운영 중인 기관만 조회 (idx_open_location 부분 인덱스 사용)"""
+        return self.filter(closed_at__isnull=True)
+
+    def in_region(self, code):
+        """
+        행정구역 필터 (idx_open_region 정수 비교)
+
+        2자리 코드는 시/도(예: 11 → 11000~11999 시군구), 그 외는 시군구 코드와 일치하는 기관
+        """
+        if code < 100:
+            return self.filter(region_code__gte=code * 1000, region_code__lt=(code + 1) * 1000)
+        return self.filter(region_code=code)
+
+
+class Institution(models.Model):
+    """
+    장기요양기관 모델
+
+    테이블은 크롤러(crawler/db_manager.py)가 생성/관리합니다.
+    """
+    id = models.AutoField(primary_key=True)
+    institution_code = models.CharField(max_length=20, unique=True, verbose_name='기관 코드')
+    name = models.CharField(max_length=255, verbose_name='기관명')
+    service_type = models.CharField(max_length=100, blank=True, null=True, verbose_name='급여종류')
+    capacity = models.IntegerField(blank=True, null=True, verbose_name='정원')
+    current_headcount = models.IntegerField(blank=True, null=True, verbose_name='현원')
+    address = models.CharField(max_length=255, blank=True, null=True, verbose_name='주소')
+    operating_hours = models.TextField(blank=True, null=True, verbose_name='운영시간')
+    latitude = CoordinateField(
+        max_digits=10, decimal_places=8, blank=True, null=True, verbose_name='위도'
+    )
+    longitude = CoordinateField(
+        max_digits=11, decimal_places=8, blank=True, null=True, verbose_name='경도'
+    )
+    last_updated_at = models.DateTimeField(blank=True, null=True, verbose_name='최종 업데이트 일시')
+    crawl_generation = models.IntegerField(blank=True, null=True, verbose_name='최종 수집 회차')
+    closed_at = models.DateTimeField(blank=True, null=True, verbose_name='폐업 감지 일시')
+    region_code = models.IntegerField(blank=True, null=True, verbose_name='행정구역 코드')
+
+    objects = InstitutionQuerySet.as_manager()
+
+    class Meta:
+        managed = False
+        db_table = 'institutions'
+        ordering = ['id']
+        verbose_name = '장기요양기관'
+        verbose_name_plural = '장기요양기관 목록'
+
+    def __str__(self):
+        return f"{self.name} ({self.institution_code})"
+
+    @property
+    def is_closed(self):
+        return self.closed_at is not None
+
+
+class Region(models.Model):
+    """
+    행정구역(시군구) 모델
+
+    테이블은 크롤러(crawler/regions.py 경계 파일 적재)가 생성/관리합니다.
+    """
+    code = models.IntegerField(primary_key=True, verbose_name='시군구 코드')
+    name = models.CharField(max_length=100, verbose_name='시군구 이름')
+    sido_code = models.IntegerField(verbose_name='시/도 코드')
+
+    class Meta:
+        managed = False
+        db_table = 'regions'
+        ordering = ['code']
+        verbose_name = '행정구역'
+        verbose_name_plural = '행정구역 목록'
+
+    def __str__(self):
+        return f"{self.name} ({self.code})"
+
+
+class InstitutionHistory(models.Model):
+    """
+    장기요양기관 변경 이력 모델
+
+    테이블은 크롤러(crawler/db_manager.py)가 생성/관리합니다.
+    """
+    id = models.AutoField(primary_key=True)
+    institution = models.ForeignKey(
+        Institution,
+        on_delete=models.CASCADE,
+        related_name='history',
+        blank=True,
+        null=True,
+        verbose_name='기관'
+    )
+    recorded_date = models.DateField(verbose_name='기록일')
+    name = models.CharField(max_length=255, blank=True, null=True, verbose_name='변경 당시 기관명')
+    address = models.CharField(max_length=255, blank=True, null=True, verbose_name='변경 당시 주소')
+    capacity = models.IntegerField(blank=True, null=True, verbose_name='변경 당시 정원')
+    current_headcount = models.IntegerField(blank=True, null=True, verbose_name='변경 당시 현원')
+
+    class Meta:
+        managed = False
+        db_table = 'institution_history'
+        ordering = ['recorded_date']
+        verbose_name = '기관 변경 이력'
+        verbose_name_plural = '기관 변경 이력 목록'
+
+    def __str__(self):
+        return f"{self.institution_id} @ {self.recorded_date}"
+
+
+class VacancyForecast(models.Model):
+    """
+    기관별 월별 예상 여석 모델
+
+    테이블은 크롤러(crawler/forecast.py)가 회차마다 교체합니다.
+    """
+    id = models.BigAutoField(primary_key=True)
+    institution = models.ForeignKey(
+        Institution,
+        on_delete=models.CASCADE,
+        related_name='forecasts',
+        verbose_name='기관'
+    )
+    forecast_month = models.DateField(verbose_name='예측 월')
+    expected_vacancy = models.FloatField(verbose_name='예상 여석')
+    model = models.CharField(max_length=20, verbose_name='예측 모델')
+    backtest_mae = models.FloatField(blank=True, null=True, verbose_name='최근 예측 오차')
+    generation = models.IntegerField(blank=True, null=True, verbose_name='계산 회차')
+    created_at = models.DateTimeField(blank=True, null=True, verbose_name='계산 일시')
+
+    class Meta:
+        managed = False
+        db_table = 'vacancy_forecasts'
+        ordering = ['institution', 'forecast_month']
+        unique_together = [('institution', 'forecast_month')]
+        verbose_name = '예상 여석'
+        verbose_name_plural = '예상 여석 목록'
+
+    def __str__(self):
+        return f"{self.institution_id} @ {self.forecast_month}"
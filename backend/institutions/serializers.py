@@ -0,0 +1,15 @@
+from rest_framework import serializers
+from .models import Institution
+
+
+class InstitutionSerializer(serializers.ModelSerializer):
+    """장기요양기관 목록 Serializer"""
+    latitude = serializers.FloatField(read_only=True)
+    longitude = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Institution
+        fields = ('id', 'institution_code', 'name', 'service_type', 'capacity',
+                  'current_headcount', 'address', 'operating_hours',
+                  'latitude', 'longitude', 'region_code', 'last_updated_at')
+        read_only_fields = fields
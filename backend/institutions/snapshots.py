@@ -0,0 +1,135 @@
+"""
+Map Snapshot 응답
+
+크롤러(crawler/snapshot.py)가 동기화 후 작성한 지도 데이터셋 스냅샷 파일을
+DB 조회 없이 응답합니다. settings.MAP_SNAPSHOT['DIR'] 에 map-manifest.json 이 없으면
+None 을 반환하여 호출한 뷰가 DB 조회로 응답하도록 합니다.
+
+ACCEL_REDIRECT_PREFIX 가 설정되어 있으면 파일 본문 대신 X-Accel-Redirect 헤더만 보내고
+nginx 가 파일을 전송합니다.
+"""
+import json
+import os
+import threading
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+
+MANIFEST_NAME = 'map-manifest.json'
+# 선호 순서 (brotli > gzip > 무압축)
+ENCODINGS = ('br', 'gzip')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+_lock = threading.Lock()
+_manifest_cache = {'mtime_ns': None, 'manifest': None}
+
+
+def _snapshot_setting(key, default=None):
+    return getattr(settings, 'MAP_SNAPSHOT', {}).get(key, default)
+
+
+def current_manifest():
+    """
+    현재 manifest (없으면 None)
+
+    파일 수정 시각이 바뀐 경우에만 다시 읽습니다. (크롤러가 원자적으로 교체)
+    """
+    directory = _snapshot_setting('DIR')
+    if not directory:
+        return None
+    path = os.path.join(directory, MANIFEST_NAME)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    with _lock:
+        if _manifest_cache['mtime_ns'] != mtime_ns:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                return None
+            _manifest_cache.update(mtime_ns=mtime_ns, manifest=manifest)
+        return _manifest_cache['manifest']
+
+
+def manifest_for_version(version):
+    """
+    특정 버전의 파일 목록 (현재 버전이 아니면 디렉토리에 남아 있는 이전 버전 파일로 구성)
+
+    파일이 없으면 None 을 반환합니다.
+    """
+    manifest = current_manifest()
+    if manifest is not None and manifest['version'] == version:
+        return manifest
+    if not version.isalnum():
+        return None
+
+    directory = _snapshot_setting('DIR')
+    files = {}
+    for encoding, suffix in (('identity', ''), ('gzip', '.gz'), ('br', '.br')):
+        name = f'map-{version}.json{suffix}'
+        if directory and os.path.exists(os.path.join(directory, name)):
+            files[encoding] = {'name': name}
+    if 'identity' not in files:
+        return None
+    return {'version': version, 'files': files}
+
+
+def _accepted_encodings(request):
+    """Accept-Encoding 에서 q=0 이 아닌 코딩 목록"""
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = part.partition(';')
+        params = params.strip().replace(' ', '')
+        try:
+            quality = float(params[2:]) if params.startswith('q=') else 1.0
+        except ValueError:
+            quality = 0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag(manifest, encoding):
+    return f'"{manifest["version"]}-{encoding}"'
+
+
+def snapshot_response(request, manifest, cache_control):
+    """
+    스냅샷 파일 응답 (Accept-Encoding 에 맞는 사전 압축 파일, If-None-Match 시 304)
+
+    파일이 없으면 (정리된 이전 버전 등) None 을 반환합니다.
+    """
+    accepted = _accepted_encodings(request)
+    encoding = next(
+        (enc for enc in ENCODINGS if enc in accepted and enc in manifest['files']), 'identity'
+    )
+    etag = _etag(manifest, encoding)
+
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        accel_prefix = _snapshot_setting('ACCEL_REDIRECT_PREFIX')
+        if accel_prefix:
+            # nginx 가 gzip_static / brotli_static 으로 압축 파일을 선택
+            response = HttpResponse(content_type='application/json')
+            response['X-Accel-Redirect'] = accel_prefix + manifest['files']['identity']['name']
+        else:
+            path = os.path.join(_snapshot_setting('DIR'), manifest['files'][encoding]['name'])
+            try:
+                with open(path, 'rb') as f:
+                    body = f.read()
+            except OSError:
+                return None
+            response = HttpResponse(body, content_type='application/json')
+            if encoding != 'identity':
+                response['Content-Encoding'] = encoding
+
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    response['Vary'] = 'Accept-Encoding'
+    response['X-Snapshot-Version'] = manifest['version']
+    return response
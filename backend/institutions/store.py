@@ -0,0 +1,203 @@
+"""
+Institution Store - 크롤러가 작성한 기관 바이너리 스냅샷 (mmap 공유)
+
+크롤러(crawler/columnar.py)가 동기화 후 작성한 고정 폭 열 배열 파일을 읽기 전용 mmap 으로 엽니다.
+배열은 memoryview 로 파일 페이지를 그대로 참조하므로 파이썬 객체로 복사되지 않고,
+모든 워커 프로세스가 같은 페이지 캐시를 공유합니다. (워커 수가 늘어도 워커별 RSS 증가 없음)
+
+크롤러는 파일을 os.replace 로 교체하므로, 이미 열어 둔 mmap 은 이전 파일(inode)을 계속 읽고
+get_store() 가 CHECK_INTERVAL 마다 파일을 확인하여 바뀐 경우 새로 엽니다. (ReloadingFile)
+"""
+import heapq
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left, bisect_right
+
+from django.conf import settings
+
+MAGIC = b'CMAPCOL1'
+HEADER = struct.Struct('<8sIiII10Q')
+SECTIONS = (
+    'latitude', 'longitude', 'id', 'capacity', 'current',
+    'service_type', 'name', 'address', 'string_offsets', 'string_blob',
+)
+TYPECODES = {
+    'latitude': 'd', 'longitude': 'd',
+    'id': 'i', 'capacity': 'i', 'current': 'i',
+    'service_type': 'I', 'name': 'I', 'address': 'I', 'string_offsets': 'I',
+}
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+class StoreFormatError(ValueError):
+    pass
+
+
+class InstitutionStore:
+    """읽기 전용 mmap 기관 배열"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, generation, self.string_count, _, *offsets = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise StoreFormatError(f'{path}: 기관 스냅샷 파일이 아닙니다.')
+        self.generation = generation if generation >= 0 else None
+
+        view = memoryview(self._mmap)
+        lengths = dict.fromkeys(TYPECODES, self.count)
+        lengths['string_offsets'] = self.string_count + 1
+        for name, offset in zip(SECTIONS, offsets):
+            if name == 'string_blob':
+                self.string_blob = view[offset:]
+                continue
+            size = struct.calcsize(TYPECODES[name])
+            section = view[offset:offset + lengths[name] * size]
+            if len(section) != lengths[name] * size:
+                raise StoreFormatError(f'{path}: {name} 구역이 잘렸습니다.')
+            setattr(self, name, section.cast(TYPECODES[name]))
+
+        # 급여종류 문자열 → 번호 (기관 배열에 쓰인 번호만, 종류 수가 적어 로드 시 한 번 구성)
+        self.service_types = {self.string(number): number for number in set(self.service_type)}
+
+    def string(self, number):
+        start, end = self.string_offsets[number], self.string_offsets[number + 1]
+        return str(self.string_blob[start:end], 'utf-8')
+
+    @staticmethod
+    def _nullable(value):
+        return None if value < 0 else value
+
+    def record(self, index):
+        """배열 위치 → 기관 dict (지도 API 와 같은 필드)"""
+        return {
+            'id': self.id[index],
+            'name': self.string(self.name[index]),
+            'service_type': self.string(self.service_type[index]),
+            'address': self.string(self.address[index]),
+            'capacity': self._nullable(self.capacity[index]),
+            'current_headcount': self._nullable(self.current[index]),
+            'latitude': self.latitude[index],
+            'longitude': self.longitude[index],
+        }
+
+    def nearby(self, lat, lng, radius_km, limit, service_type=None, has_vacancy=False):
+        """
+        반경 내 기관을 가까운 순으로 반환
+
+        위도 오름차순 배열에서 위도 범위를 이분 탐색한 뒤 경도 범위, 조건, 거리 순으로 거릅니다.
+
+        Args:
+            lat, lng: 기준 좌표
+            radius_km: 반경 (km)
+            limit: 최대 개수
+            service_type: 급여종류 (없으면 전체)
+            has_vacancy: True 면 정원 > 현원 인 기관만
+
+        Returns:
+            list: 기관 dict (distance_km 포함)
+        """
+        lat_delta = radius_km / KM_PER_DEGREE
+        lng_delta = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        start = bisect_left(self.latitude, lat - lat_delta)
+        end = bisect_right(self.latitude, lat + lat_delta, lo=start)
+
+        type_number = None
+        if service_type:
+            type_number = self.service_types.get(service_type)
+            if type_number is None:
+                return []
+
+        lat_rad, cos_lat = math.radians(lat), math.cos(math.radians(lat))
+        candidates = []
+        for index in range(start, end):
+            other_lng = self.longitude[index]
+            if abs(other_lng - lng) > lng_delta:
+                continue
+            if type_number is not None and self.service_type[index] != type_number:
+                continue
+            if has_vacancy and not (0 <= self.current[index] < self.capacity[index]):
+                continue
+            other_lat = math.radians(self.latitude[index])
+            a = (math.sin((other_lat - lat_rad) / 2) ** 2
+                 + cos_lat * math.cos(other_lat) * math.sin(math.radians(other_lng - lng) / 2) ** 2)
+            distance = 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+            if distance <= radius_km:
+                candidates.append((distance, index))
+
+        results = []
+        for distance, index in heapq.nsmallest(limit, candidates):
+            row = self.record(index)
+            row['distance_km'] = round(distance, 3)
+            results.append(row)
+        return results
+
+
+class ReloadingFile:
+    """
+    settings.<setting>['PATH'] 파일을 loader 로 열어 두고 교체되면 다시 여는 캐시
+
+    CHECK_INTERVAL 초마다 파일(inode, 수정 시각)을 확인합니다.
+    이전 객체는 진행 중인 요청이 참조하고 있을 수 있으므로 닫지 않고 참조가 사라지면 해제됩니다.
+    """
+
+    def __init__(self, setting, loader):
+        self.setting = setting
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._state = {'value': None, 'identity': None, 'checked_at': 0.0}
+
+    def _setting(self, key, default=None):
+        return getattr(settings, self.setting, {}).get(key, default)
+
+    def get(self):
+        """현재 객체 (파일이 없으면 None)"""
+        path = self._setting('PATH')
+        if not path:
+            return None
+
+        now = time.monotonic()
+        state = self._state
+        if state['value'] is not None and now - state['checked_at'] < self._setting('CHECK_INTERVAL', 1.0):
+            return state['value']
+
+        with self._lock:
+            state['checked_at'] = now
+            try:
+                stat = os.stat(path)
+            except OSError:
+                state.update(value=None, identity=None)
+                return None
+            identity = (path, stat.st_ino, stat.st_mtime_ns)
+            if state['value'] is None or state['identity'] != identity:
+                try:
+                    value = self.loader(path)
+                except (OSError, ValueError):
+                    # 잘린 파일 등은 이전 객체를 계속 사용
+                    return state['value']
+                state.update(value=value, identity=identity)
+            return state['value']
+
+    def reset(self):
+        """캐시된 객체 제거 (설정 변경 시, 테스트용)"""
+        with self._lock:
+            self._state.update(value=None, identity=None, checked_at=0.0)
+
+
+_store_file = ReloadingFile('INSTITUTION_STORE', InstitutionStore)
+
+
+def get_store():
+    """현재 기관 스냅샷 (파일이 없으면 None)"""
+    return _store_file.get()
+
+
+def reset_store():
+    """캐시된 스냅샷 제거 (설정 변경 시, 테스트용)"""
+    _store_file.reset()
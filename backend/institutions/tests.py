@@ -1,3 +1,402 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+import numpy as np
+
+from . import heatmap, store
+from .models import Institution, InstitutionHistory, Region, VacancyForecast
+
+# 바이너리 파일 픽스처는 crawler 의 작성 코드로 만듦 (파일 형식 정의를 한 곳에서만 관리)
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'crawler')
+sys.path.append(CRAWLER_DIR)
+
+import columnar  # noqa: E402
+import heatmap as crawler_heatmap  # noqa: E402
+
+
+class CrawlerTablesMixin:
+    """크롤러가 관리하는(managed = False) 테이블을 테스트 DB에 생성"""
+
+    crawler_models = (Region, Institution, InstitutionHistory, VacancyForecast)
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            for model in cls.crawler_models:
+                editor.create_model(model)
+        super().setUpClass()
+        # replica(default 의 TEST MIRROR) 연결은 테스트 트랜잭션 안의 데이터를 볼 수 없으므로
+        # 조회도 primary 에서 수행 (라우팅 자체는 caremap.tests 에서 검증)
+        primary_reads = override_settings(DATABASE_REPLICA={'APPS': []})
+        primary_reads.enable()
+        cls.addClassCleanup(primary_reads.disable)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(cls.crawler_models):
+                editor.delete_model(model)
+
+
+def make_institution(code, **fields):
+    fields.setdefault('name', f'기관 {code}')
+    fields.setdefault('service_type', '방문요양')
+    fields.setdefault('capacity', 50)
+    fields.setdefault('current_headcount', 40)
+    fields.setdefault('address', '서울특별시 강남구 테헤란로 123')
+    fields.setdefault('latitude', '37.50880000')
+    fields.setdefault('longitude', '127.04540000')
+    fields.setdefault('last_updated_at', timezone.now())
+    return Institution.objects.create(institution_code=code, **fields)
+
+
+@override_settings(MAP_SNAPSHOT={'DIR': ''})
+class InstitutionMapTests(CrawlerTablesMixin, TestCase):
+    def test_closed_institutions_are_excluded(self):
+        open_inst = make_institution('A0001')
+        make_institution('A0002', closed_at=timezone.now())
+
+        response = self.client.get(reverse('institutions:map'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['id'] for row in response.json()], [open_inst.id])
+
+    def test_region_filter_uses_region_code(self):
+        gangnam = make_institution('A0001', region_code=11680)
+        make_institution('A0002', region_code=26350)
+
+        response = self.client.get(reverse('institutions:map'), {'region': '11'})
+
+        self.assertEqual([row['id'] for row in response.json()], [gangnam.id])
+        self.assertEqual(
+            self.client.get(reverse('institutions:map'), {'region': 'gangnam'}).status_code, 400
+        )
+
+    def test_coordinates_are_json_numbers(self):
+        make_institution('A0001')
+
+        for float_coordinates in (True, False):
+            with self.subTest(float_coordinates=float_coordinates), \
+                    self.settings(FLOAT_COORDINATES=float_coordinates):
+                row = self.client.get(reverse('institutions:map')).json()[0]
+                self.assertEqual((row['latitude'], row['longitude']), (37.5088, 127.0454))
+
+    def test_float_coordinates_setting_controls_model_type(self):
+        make_institution('A0001')
+
+        with self.settings(FLOAT_COORDINATES=True):
+            self.assertIsInstance(Institution.objects.values_list('latitude', flat=True).get(), float)
+            self.assertEqual(Institution.objects.get().longitude, 127.0454)
+        with self.settings(FLOAT_COORDINATES=False):
+            self.assertEqual(Institution.objects.get().latitude, Decimal('37.50880000'))
+
+
+class InstitutionHistoryTests(CrawlerTablesMixin, TestCase):
+    def test_history_ends_with_latest_record(self):
+        inst = make_institution('A0001', current_headcount=45)
+        InstitutionHistory.objects.create(
+            institution=inst, recorded_date=date(2025, 1, 1), capacity=50, current_headcount=30
+        )
+
+        response = self.client.get(reverse('institutions:history', args=[inst.id]))
+
+        history = response.json()['history']
+        self.assertEqual([h['current'] for h in history], [30, 45])
+
+    def test_includes_upcoming_forecast_months(self):
+        inst = make_institution('A0001')
+        this_month = timezone.localdate().replace(day=1)
+        last_month = (this_month - timedelta(days=1)).replace(day=1)
+        next_month = (this_month + timedelta(days=31)).replace(day=1)
+        for month, vacancy in ((next_month, 4.5), (last_month, 1.0), (this_month, 3.0)):
+            VacancyForecast.objects.create(
+                institution=inst, forecast_month=month, expected_vacancy=vacancy, model='naive'
+            )
+
+        response = self.client.get(reverse('institutions:history', args=[inst.id]))
+
+        self.assertEqual(response.json()['forecast'], [
+            {'month': this_month.isoformat(), 'expected_vacancy': 3.0, 'backtest_mae': None},
+            {'month': next_month.isoformat(), 'expected_vacancy': 4.5, 'backtest_mae': None},
+        ])
+
+    def test_unknown_institution_returns_404(self):
+        response = self.client.get(reverse('institutions:history', args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+
+class InstitutionSearchTests(CrawlerTablesMixin, TestCase):
+    def test_cursor_pages_follow_last_updated_order(self):
+        now = timezone.now()
+        # 같은 last_updated_at 은 id 로 순서가 정해져야 함
+        for i in range(5):
+            make_institution(f'A000{i}', last_updated_at=now - timedelta(minutes=i // 2))
+        make_institution('A0009', closed_at=now)
+
+        seen = []
+        url = reverse('institutions:search') + '?page_size=2'
+        while url:
+            body = self.client.get(url).json()
+            seen += [row['institution_code'] for row in body['results']]
+            url = body['next']
+
+        self.assertEqual(seen, ['A0001', 'A0000', 'A0003', 'A0002', 'A0004'])
+
+    def test_filters_by_name(self):
+        make_institution('A0001', name='행복요양원')
+        make_institution('A0002', name='사랑주간보호')
+
+        response = self.client.get(reverse('institutions:search'), {'q': '행복'})
+
+        self.assertEqual([row['institution_code'] for row in response.json()['results']], ['A0001'])
+
+    def test_filters_by_region_code(self):
+        # 주소 문자열이 아니라 좌표로 계산된 region_code 로 필터링
+        make_institution('A0001', address='서울 강남구 테헤란로 1', region_code=11680)
+        make_institution('A0002', address='서울특별시 서초구 강남대로 1', region_code=11650)
+        make_institution('A0003', address='부산 해운대구 중앙로 1', region_code=26350)
+
+        def codes(region):
+            body = self.client.get(reverse('institutions:search'), {'region': region}).json()
+            return sorted(row['institution_code'] for row in body['results'])
+
+        self.assertEqual(codes('11680'), ['A0001'])
+        self.assertEqual(codes('11'), ['A0001', 'A0002'])
+
+
+class RegionListTests(CrawlerTablesMixin, TestCase):
+    def test_lists_regions_of_sido(self):
+        Region.objects.create(code=11680, name='강남구', sido_code=11)
+        Region.objects.create(code=26350, name='해운대구', sido_code=26)
+
+        response = self.client.get(reverse('institutions:regions'), {'sido': '11'})
+
+        self.assertEqual(response.json(), [{'code': 11680, 'name': '강남구', 'sido_code': 11}])
+
+
+class InstitutionBatchHistoryTests(CrawlerTablesMixin, TransactionTestCase):
+    # 기관별 조회가 별도 스레드/DB 연결에서 실행되므로 커밋된 데이터가 필요함
+
+    def test_returns_each_history_in_request_order(self):
+        first = make_institution('A0001', current_headcount=41)
+        second = make_institution('A0002', current_headcount=42)
+        InstitutionHistory.objects.create(
+            institution=second, recorded_date=date(2025, 1, 1), capacity=50, current_headcount=30
+        )
+
+        response = self.client.get(
+            reverse('institutions:histories'), {'ids': f'{second.id},{first.id},999'}
+        )
+
+        body = response.json()
+        self.assertEqual(list(body), [str(second.id), str(first.id), '999'])
+        self.assertEqual([h['current'] for h in body[str(second.id)]['history']], [30, 42])
+        self.assertEqual([h['current'] for h in body[str(first.id)]['history']], [41])
+        self.assertIsNone(body['999'])
+
+    def test_rejects_invalid_ids(self):
+        response = self.client.get(reverse('institutions:histories'), {'ids': '1,abc'})
+        self.assertEqual(response.status_code, 400)
+
+
+class MapSnapshotTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.body = json.dumps([{'id': 1, 'name': '행복요양원'}]).encode('utf-8')
+        for name, content in (('map-abc123.json', self.body),
+                              ('map-abc123.json.gz', gzip.compress(self.body))):
+            with open(f'{self.directory.name}/{name}', 'wb') as f:
+                f.write(content)
+        manifest = {
+            'version': 'abc123', 'generation': 7, 'count': 1,
+            'files': {'identity': {'name': 'map-abc123.json'}, 'gzip': {'name': 'map-abc123.json.gz'}},
+        }
+        with open(f'{self.directory.name}/map-manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        settings = override_settings(MAP_SNAPSHOT={'DIR': self.directory.name})
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_map_serves_precompressed_snapshot_without_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('institutions:map'), HTTP_ACCEPT_ENCODING='br, gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=0, must-revalidate')
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get(reverse('institutions:map'))['ETag']
+
+        response = self.client.get(reverse('institutions:map'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_versioned_snapshot_is_immutable(self):
+        manifest = self.client.get(reverse('institutions:snapshot_manifest')).json()
+
+        response = self.client.get(manifest['url'])
+
+        self.assertEqual(response.content, self.body)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(
+            self.client.get(reverse('institutions:snapshot', args=['missing'])).status_code, 404
+        )
+
+    def test_accel_redirect_leaves_body_to_nginx(self):
+        with override_settings(MAP_SNAPSHOT={'DIR': self.directory.name, 'ACCEL_REDIRECT_PREFIX': '/_snapshots/'}):
+            response = self.client.get(reverse('institutions:map'))
+
+        self.assertEqual(response['X-Accel-Redirect'], '/_snapshots/map-abc123.json')
+        self.assertEqual(response.content, b'')
+
+
+def write_store(path, rows, generation=1):
+    """crawler/columnar.py 로 기관 바이너리 스냅샷 작성 (없는 값은 방문요양, 정원 50, 현원 40)"""
+    columnar.write_columnar_store([
+        {
+            'id': row['id'], 'latitude': row['latitude'], 'longitude': row['longitude'],
+            'name': row.get('name', ''), 'address': row.get('address', ''),
+            'service_type': row.get('service_type', '방문요양'),
+            'capacity': row.get('capacity', 50), 'current_headcount': row.get('current', 40),
+        }
+        for row in rows
+    ], path, generation=generation)
+
+
+class NearbyInstitutionTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'institutions.cmap')
+        settings = override_settings(INSTITUTION_STORE={'PATH': self.path, 'CHECK_INTERVAL': 0})
+        settings.enable()
+        self.addCleanup(settings.disable)
+        store.reset_store()
+        self.addCleanup(store.reset_store)
+
+    def nearby(self, **params):
+        params = {'lat': 37.5, 'lng': 127.0, **params}
+        return self.client.get(reverse('institutions:nearby'), params)
+
+    def test_returns_institutions_within_radius_by_distance(self):
+        write_store(self.path, [
+            {'id': 1, 'latitude': 37.52, 'longitude': 127.0, 'name': '먼 기관'},
+            {'id': 2, 'latitude': 37.501, 'longitude': 127.001, 'name': '가까운 기관'},
+            {'id': 3, 'latitude': 37.9, 'longitude': 127.0},
+            {'id': 4, 'latitude': 37.5, 'longitude': 127.5},
+            {'id': 5, 'latitude': 37.5, 'longitude': 127.002, 'capacity': 30, 'current': 30},
+            {'id': 6, 'latitude': 37.5, 'longitude': 127.003, 'service_type': '주야간보호'},
+        ])
+
+        body = self.nearby(radius_km=5).json()
+
+        self.assertEqual([row['id'] for row in body['results']], [2, 5, 6, 1])
+        self.assertEqual(body['results'][0]['name'], '가까운 기관')
+        self.assertEqual(body['generation'], 1)
+        filtered = self.nearby(radius_km=5, has_vacancy='1', service_type='방문요양').json()
+        self.assertEqual([row['id'] for row in filtered['results']], [2, 1])
+
+    def test_unknown_service_type_matches_nothing_without_growing_map(self):
+        write_store(self.path, [
+            {'id': 1, 'latitude': 37.5, 'longitude': 127.0},
+            {'id': 2, 'latitude': 37.5, 'longitude': 127.001, 'service_type': '주야간보호', 'name': '단기보호'},
+        ])
+
+        for value in ('단기보호', '방문목욕', '주야간보호x'):
+            self.assertEqual(self.nearby(service_type=value).json()['results'], [])
+
+        self.assertEqual(store.get_store().service_types.keys(), {'방문요양', '주야간보호'})
+
+    def test_reloads_after_atomic_swap(self):
+        write_store(self.path, [{'id': 1, 'latitude': 37.5, 'longitude': 127.0}], generation=1)
+        first = self.nearby().json()
+
+        write_store(self.path, [{'id': 2, 'latitude': 37.5, 'longitude': 127.0}], generation=2)
+        second = self.nearby().json()
+
+        self.assertEqual([row['id'] for row in first['results']], [1])
+        self.assertEqual((second['generation'], [row['id'] for row in second['results']]), (2, [2]))
+
+    def test_reader_matches_crawler_format(self):
+        self.assertEqual(
+            (store.MAGIC, store.HEADER.format, store.SECTIONS, store.TYPECODES),
+            (columnar.MAGIC, columnar.HEADER.format, columnar.SECTIONS, columnar.TYPECODES)
+        )
+
+    def test_missing_store_and_invalid_params(self):
+        self.assertEqual(self.nearby().status_code, 503)
+        self.assertEqual(self.nearby(lat='abc').status_code, 400)
+        self.assertEqual(self.nearby(radius_km=500).status_code, 400)
+
+
+def write_heatmap(path, capacity, vacancy, generation=1, min_lat=37.0, min_lng=127.0, step=0.01):
+    """crawler/heatmap.py 로 격자 파일 작성 (기관별 입력 구역은 비움)"""
+    spec = {
+        'rows': len(capacity), 'cols': len(capacity[0]),
+        'min_lat': min_lat, 'min_lng': min_lng, 'lat_step': step, 'lng_step': step,
+    }
+    params = {'cell_km': 1.0, 'radius_km': 5.0, 'kernel': 'linear'}
+    grids = {'capacity': np.array(capacity), 'vacancy': np.array(vacancy)}
+    inputs = {name: np.array([]) for name in crawler_heatmap.SECTIONS[2:]}
+    crawler_heatmap.write_heatmap(path, spec, params, grids, inputs, generation=generation)
+
+
+class HeatmapTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'heatmap.cgrid')
+        settings = override_settings(HEATMAP={'PATH': self.path, 'CHECK_INTERVAL': 0, 'MAX_CELLS': 100})
+        settings.enable()
+        self.addCleanup(settings.disable)
+        heatmap.reset_heatmap()
+        self.addCleanup(heatmap.reset_heatmap)
+
+    def test_returns_cells_inside_bbox(self):
+        write_heatmap(self.path, capacity=[[0, 100], [50, 0]], vacancy=[[0, 20], [50, 0]])
+
+        body = self.client.get(
+            reverse('institutions:heatmap'), {'metric': 'occupancy', 'bbox': '127.0,37.0,127.02,37.02'}
+        ).json()
+
+        self.assertEqual(body['generation'], 1)
+        self.assertEqual(body['cells'], [[37.005, 127.015, 0.8], [37.015, 127.005, 0.0]])
+        south_only = self.client.get(
+            reverse('institutions:heatmap'), {'metric': 'capacity', 'bbox': '127.0,37.0,127.02,37.005'}
+        ).json()
+        self.assertEqual(south_only['cells'], [[37.005, 127.015, 100.0]])
+
+    def test_large_area_is_downsampled(self):
+        write_heatmap(self.path, capacity=[[1] * 40 for _ in range(40)], vacancy=[[1] * 40 for _ in range(40)])
+
+        body = self.client.get(reverse('institutions:heatmap')).json()
+
+        self.assertEqual(len(body['cells']), 100)
+        self.assertEqual(body['cell_km'], 4.0)
+        self.assertEqual({cell[2] for cell in body['cells']}, {1.0})
+
+    def test_reader_matches_crawler_format(self):
+        self.assertEqual(
+            (heatmap.MAGIC, heatmap.HEADER.format), (crawler_heatmap.MAGIC, crawler_heatmap.HEADER.format)
+        )
+
+    def test_missing_grid_and_invalid_params(self):
+        self.assertEqual(self.client.get(reverse('institutions:heatmap')).status_code, 503)
+        self.assertEqual(
+            self.client.get(reverse('institutions:heatmap'), {'metric': 'beds'}).status_code, 400
+        )
+        self.assertEqual(
+            self.client.get(reverse('institutions:heatmap'), {'bbox': '1,2,3'}).status_code, 400
+        )
@@ -1,7 +1,24 @@
 from django.urls import path
+from . import views
 
 app_name = 'institutions'
 
 urlpatterns = [
-    # 나중에 institutions API 엔드포인트 추가
+    path('v1/institutions/', views.get_institutions_for_map, name='map'),
+    path('v1/institutions/snapshot/', views.get_map_snapshot_manifest, name='snapshot_manifest'),
+    path(
+        'v1/institutions/snapshot/<slug:version>.json',
+        views.get_map_snapshot,
+        name='snapshot'
+    ),
+    path('v1/regions/', views.get_regions, name='regions'),
+    path('v1/institutions/heatmap/', views.get_heatmap, name='heatmap'),
+    path('v1/institutions/nearby/', views.get_nearby_institutions, name='nearby'),
+    path('v1/institutions/search/', views.search_institutions, name='search'),
+    path('v1/institutions/history/', views.get_institution_histories, name='histories'),
+    path(
+        'v1/institutions/<int:institution_id>/history/',
+        views.get_institution_history,
+        name='history'
+    ),
 ]
@@ -1,3 +1,313 @@
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponseBadRequest
+from django.urls import reverse
+from django.utils import timezone
 
-# Create your views here.
+from caremap.concurrency import fan_out
+from caremap.pagination import KeysetPagination
+from caremap.renderers import FastJsonResponse
+from . import heatmap, snapshots
+from .store import get_store
+from .models import Institution, InstitutionHistory, Region, VacancyForecast
+from .serializers import InstitutionSerializer
+
+# 이력 일괄 조회 API 의 최대 기관 수
+MAX_BATCH_HISTORY = 50
+# 주변 기관 검색 API 의 최대 반경(km) / 개수
+MAX_NEARBY_RADIUS_KM = 50
+MAX_NEARBY_LIMIT = 200
+
+
+def _region_param(request):
+    """region 쿼리 파라미터 (시/도 2자리 또는 시군구 코드), 없으면 None"""
+    value = request.GET.get("region")
+    if not value:
+        return None
+    code = int(value)
+    if code <= 0:
+        raise ValueError(value)
+    return code
+
+
+async def get_institutions_for_map(request):
+    """
+    지도에 표시할 최신 기관 정보 목록을 반환하는 API
+    API Endpoint: /api/v1/institutions/?region=
+
+    크롤러가 작성한 스냅샷 파일이 있으면 DB 조회 없이 파일로 응답합니다. (ETag 재검증)
+    region(시/도 또는 시군구 코드) 필터가 있으면 DB 에서 조회합니다.
+    """
+    try:
+        region = _region_param(request)
+    except ValueError:
+        return HttpResponseBadRequest("region 은 행정구역 코드(숫자)여야 합니다.")
+
+    manifest = snapshots.current_manifest() if region is None else None
+    if manifest is not None:
+        response = await sync_to_async(snapshots.snapshot_response, thread_sensitive=False)(
+            request, manifest, snapshots.REVALIDATE_CACHE_CONTROL
+        )
+        if response is not None:
+            return response
+
+    # 폐업 기관은 제외 (idx_open_location 부분 인덱스)
+    queryset = Institution.objects.open()
+    if region is not None:
+        queryset = queryset.in_region(region)
+    institutions = queryset.values(
+        "id",
+        "name",
+        "service_type",
+        "address",
+        "capacity",
+        "current_headcount",
+        "latitude",
+        "longitude",
+    )
+    return FastJsonResponse([row async for row in institutions], safe=False)
+
+
+async def get_map_snapshot_manifest(request):
+    """
+    현재 지도 스냅샷 정보 (버전 고정 URL 포함)
+    API Endpoint: /api/v1/institutions/snapshot/
+    """
+    manifest = snapshots.current_manifest()
+    if manifest is None:
+        raise Http404("지도 스냅샷이 없습니다.")
+
+    response = FastJsonResponse({
+        "version": manifest["version"],
+        "generation": manifest.get("generation"),
+        "created_at": manifest.get("created_at"),
+        "count": manifest.get("count"),
+        "url": request.build_absolute_uri(
+            reverse("institutions:snapshot", args=[manifest["version"]])
+        ),
+    })
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+async def get_map_snapshot(request, version):
+    """
+    버전 고정 지도 스냅샷 파일 (내용이 바뀌지 않으므로 1년 캐시)
+    API Endpoint: /api/v1/institutions/snapshot/<version>.json
+    """
+    manifest = await sync_to_async(snapshots.manifest_for_version, thread_sensitive=False)(version)
+    response = None
+    if manifest is not None:
+        response = await sync_to_async(snapshots.snapshot_response, thread_sensitive=False)(
+            request, manifest, snapshots.IMMUTABLE_CACHE_CONTROL
+        )
+    if response is None:
+        raise Http404("지도 스냅샷을 찾을 수 없습니다.")
+    return response
+
+
+def _forecasts(institution_id):
+    """이번 달부터의 예상 여석 (크롤러 예측 작업 결과, 월 순)"""
+    return VacancyForecast.objects.filter(
+        institution_id=institution_id,
+        forecast_month__gte=timezone.localdate().replace(day=1),
+    ).order_by("forecast_month").values("forecast_month", "expected_vacancy", "backtest_mae")
+
+
+def _history_response(institution, history_records, forecasts):
+    """이력 + 최신 정보 + 예상 여석으로 시계열 그래프용 응답 데이터 생성"""
+    return {
+        "institution_name": institution.name,
+        "history": [
+            {
+                "date": r.recorded_date,
+                "capacity": r.capacity,
+                "current": r.current_headcount,
+            }
+            for r in history_records
+        ]
+        + [
+            {
+                "date": institution.last_updated_at.date(),
+                "capacity": institution.capacity,
+                "current": institution.current_headcount,
+            }
+        ],
+        "forecast": [
+            {
+                "month": f["forecast_month"],
+                "expected_vacancy": f["expected_vacancy"],
+                "backtest_mae": f["backtest_mae"],
+            }
+            for f in forecasts
+        ],
+    }
+
+
+async def get_institution_history(request, institution_id):
+    """
+    특정 기관의 변동 이력 전체와 향후 월별 예상 여석을 시계열 그래프용으로 반환하는 API
+    API Endpoint: /api/v1/institutions/<int:institution_id>/history/
+    """
+    history_records = InstitutionHistory.objects.filter(
+        institution_id=institution_id
+    ).order_by("recorded_date")
+
+    # 최신 정보도 포함하여 전달
+    try:
+        latest_record = await Institution.objects.aget(id=institution_id)
+    except Institution.DoesNotExist:
+        raise Http404("기관을 찾을 수 없습니다.")
+
+    return FastJsonResponse(
+        _history_response(
+            latest_record,
+            [r async for r in history_records],
+            [f async for f in _forecasts(institution_id)],
+        )
+    )
+
+
+def _load_history(institution_id):
+    """기관 1곳의 이력 응답 데이터 (없는 기관이면 None)"""
+    institution = Institution.objects.filter(id=institution_id).first()
+    if institution is None:
+        return None
+    history_records = InstitutionHistory.objects.filter(
+        institution_id=institution_id
+    ).order_by("recorded_date")
+    return _history_response(institution, list(history_records), list(_forecasts(institution_id)))
+
+
+async def get_institution_histories(request):
+    """
+    여러 기관의 변동 이력을 한 번에 반환하는 API (기관별 조회를 동시에 실행)
+    API Endpoint: /api/v1/institutions/history/?ids=1,2,3
+
+    없는 기관은 null 로 반환합니다.
+    """
+    try:
+        ids = list(dict.fromkeys(
+            int(value) for value in request.GET.get("ids", "").split(",") if value
+        ))
+    except ValueError:
+        return HttpResponseBadRequest("ids 는 쉼표로 구분한 기관 ID 목록이어야 합니다.")
+    if not ids or len(ids) > MAX_BATCH_HISTORY:
+        return HttpResponseBadRequest(f"ids 는 1~{MAX_BATCH_HISTORY}개여야 합니다.")
+
+    results = await fan_out(_load_history, ids)
+    return FastJsonResponse({str(i): result for i, result in zip(ids, results)})
+
+
+async def search_institutions(request):
+    """
+    기관 목록 검색 API (최종 업데이트 역순 keyset 페이지네이션)
+    API Endpoint: /api/v1/institutions/search/?q=&service_type=&region=&cursor=
+
+    last_updated_at 이 없는 행은 정렬 키가 NULL 이므로 제외합니다.
+    (크롤러는 저장 시 항상 last_updated_at 을 기록)
+    """
+    queryset = Institution.objects.open().filter(last_updated_at__isnull=False)
+
+    query = request.GET.get("q")
+    if query:
+        queryset = queryset.filter(name__icontains=query)
+
+    service_type = request.GET.get("service_type")
+    if service_type:
+        queryset = queryset.filter(service_type=service_type)
+
+    try:
+        region = _region_param(request)
+    except ValueError:
+        return HttpResponseBadRequest("region 은 행정구역 코드(숫자)여야 합니다.")
+    if region is not None:
+        queryset = queryset.in_region(region)
+
+    paginator = KeysetPagination(ordering=("-last_updated_at", "-id"))
+    page = await paginator.apaginate_queryset(queryset, request)
+    data = InstitutionSerializer(page, many=True).data
+    return FastJsonResponse(paginator.get_paginated_data(data))
+
+
+async def get_regions(request):
+    """
+    행정구역(시군구) 목록 API (지역 필터 선택용)
+    API Endpoint: /api/v1/regions/?sido=
+    """
+    queryset = Region.objects.all()
+    sido = request.GET.get("sido")
+    if sido:
+        if not sido.isdigit():
+            return HttpResponseBadRequest("sido 는 시/도 코드(숫자)여야 합니다.")
+        queryset = queryset.filter(sido_code=int(sido))
+    regions = queryset.values("code", "name", "sido_code")
+    return FastJsonResponse([row async for row in regions], safe=False)
+
+
+def get_nearby_institutions(request):
+    """
+    주변 기관 검색 API (가까운 순)
+    API Endpoint: /api/v1/institutions/nearby/?lat=&lng=&radius_km=&limit=&service_type=&has_vacancy=
+
+    DB 대신 크롤러가 작성한 기관 바이너리 스냅샷(store.py, 워커 간 mmap 공유)에서 조회합니다.
+    조회가 메모리 안에서 끝나므로 동기 뷰로 둡니다.
+    """
+    try:
+        lat = float(request.GET["lat"])
+        lng = float(request.GET["lng"])
+        radius_km = float(request.GET.get("radius_km", 3))
+        limit = int(request.GET.get("limit", 50))
+    except (KeyError, ValueError):
+        return HttpResponseBadRequest("lat, lng 는 필수이며 lat, lng, radius_km, limit 는 숫자여야 합니다.")
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return HttpResponseBadRequest("좌표 범위가 올바르지 않습니다.")
+    if not (0 < radius_km <= MAX_NEARBY_RADIUS_KM and 0 < limit <= MAX_NEARBY_LIMIT):
+        return HttpResponseBadRequest(
+            f"radius_km 는 0~{MAX_NEARBY_RADIUS_KM}, limit 는 1~{MAX_NEARBY_LIMIT} 이어야 합니다."
+        )
+
+    store = get_store()
+    if store is None:
+        return FastJsonResponse({"detail": "기관 스냅샷이 아직 준비되지 않았습니다."}, status=503)
+
+    results = store.nearby(
+        lat, lng, radius_km, limit,
+        service_type=request.GET.get("service_type") or None,
+        has_vacancy=request.GET.get("has_vacancy") in ("1", "true"),
+    )
+    return FastJsonResponse({"generation": store.generation, "results": results})
+
+
+def get_heatmap(request):
+    """
+    공급/여석 히트맵 API (크롤러가 계산한 전국 격자)
+    API Endpoint: /api/v1/institutions/heatmap/?metric=vacancy&bbox=서경,남위,동경,북위
+
+    metric: capacity(반경 내 정원) / vacancy(반경 내 여석) / occupancy(1 - 여석/정원)
+    """
+    metric = request.GET.get("metric", "vacancy")
+    if metric not in heatmap.METRICS:
+        return HttpResponseBadRequest(f"metric 은 {', '.join(heatmap.METRICS)} 중 하나여야 합니다.")
+    bbox = None
+    if request.GET.get("bbox"):
+        try:
+            bbox = [float(value) for value in request.GET["bbox"].split(",")]
+        except ValueError:
+            bbox = []
+        if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+            return HttpResponseBadRequest("bbox 는 서경,남위,동경,북위 순서의 숫자 4개여야 합니다.")
+
+    grid = heatmap.get_heatmap()
+    if grid is None:
+        return FastJsonResponse({"detail": "히트맵이 아직 준비되지 않았습니다."}, status=503)
+
+    result = grid.cells(metric, bbox, max_cells=settings.HEATMAP.get("MAX_CELLS", 20000))
+    return FastJsonResponse({
+        "generation": grid.generation,
+        "metric": metric,
+        "kernel": grid.kernel,
+        "radius_km": grid.radius_km,
+        "cell_km": round(grid.cell_km * result["stride"], 3),
+        "cells": result["cells"],
+    })
@@ -0,0 +1,196 @@
+"""
+Backend Benchmarks - get_institutions_for_map, get_institution_history, JSON 직렬화
+
+임시 SQLite 파일(DATABASE_URL 이 설정되어 있으면 해당 DB)에 가상 데이터를 적재하고
+Django 뷰를 RequestFactory 로 직접 호출합니다.
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'caremap.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+_db_file = None
+if not os.environ.get('DATABASE_URL'):
+    _db_file = tempfile.NamedTemporaryFile(prefix='caremap-bench-', suffix='.sqlite3', delete=False)
+    settings.DATABASES['default']['NAME'] = _db_file.name
+settings.DEBUG = False
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from django.db import connection, models  # noqa: E402
+from django.db.models import Q  # noqa: E402
+from django.http import JsonResponse  # noqa: E402
+from django.test import RequestFactory, override_settings  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer  # noqa: E402
+
+from caremap.renderers import FastJsonResponse, JSONRenderer  # noqa: E402
+from institutions.models import Institution, InstitutionHistory, VacancyForecast  # noqa: E402
+from institutions.views import get_institution_history, get_institutions_for_map  # noqa: E402
+
+from synthetic import generate_history  # noqa: E402
+
+MODELS = (Institution, InstitutionHistory, VacancyForecast)
+CRAWLER_INDEXES = (
+    (InstitutionHistory, models.Index(fields=['institution'], name='idx_institution_history_id')),
+    (InstitutionHistory, models.Index(fields=['recorded_date'], name='idx_recorded_date')),
+    (Institution, models.Index(
+        fields=['-last_updated_at', '-id'], condition=Q(closed_at__isnull=True), name='idx_open_updated'
+    )),
+)
+
+
+def load_fixture(institutions: list) -> int:
+    """가상 데이터를 테이블에 적재 (기존 테이블은 재생성)"""
+    with connection.schema_editor() as editor:
+        for model in reversed(MODELS):
+            if model._meta.db_table in connection.introspection.table_names():
+                editor.delete_model(model)
+        for model in MODELS:
+            editor.create_model(model)
+        # managed = False 모델은 인덱스가 생성되지 않으므로 크롤러 DDL 의 인덱스를 직접 생성
+        for model, index in CRAWLER_INDEXES:
+            editor.add_index(model, index)
+
+    now = timezone.now()
+    Institution.objects.bulk_create((
+        Institution(
+            id=i + 1,
+            institution_code=inst['code'],
+            name=inst['name'],
+            service_type=inst['type'],
+            capacity=inst['capacity'],
+            current_headcount=inst['current'],
+            address=inst['address'],
+            operating_hours=inst['hours'],
+            latitude=inst['lat'],
+            longitude=inst['lng'],
+            last_updated_at=now,
+        )
+        for i, inst in enumerate(institutions)
+    ), batch_size=2000)
+
+    history = [
+        InstitutionHistory(
+            institution_id=index + 1,
+            recorded_date=recorded,
+            name=name,
+            address=address,
+            capacity=capacity,
+            current_headcount=current,
+        )
+        for index, recorded, name, address, capacity, current in generate_history(institutions)
+    ]
+    InstitutionHistory.objects.bulk_create(history, batch_size=2000)
+    return len(history)
+
+
+def bench_map(scale: int, repeat: int = 5) -> list:
+    """지도 목록 API 1회 호출 시간 (repeat 회 중앙값)"""
+    factory = RequestFactory()
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        request = factory.get('/api/v1/institutions/')
+        start = time.perf_counter()
+        response = async_to_sync(get_institutions_for_map)(request)
+        timings.append(time.perf_counter() - start)
+        size = len(response.content)
+
+    seconds = statistics.median(timings)
+    return [{
+        'name': 'get_institutions_for_map',
+        'scale': scale,
+        'seconds': round(seconds, 4),
+        'ops_per_sec': round(scale / seconds, 1),
+        'response_bytes': size,
+    }]
+
+
+def bench_history(scale: int, samples: int = 500, seed: int = 0) -> list:
+    """기관 이력 API 호출당 평균 시간 (무작위 기관 samples 개)"""
+    factory = RequestFactory()
+    rng = random.Random(seed)
+    ids = [rng.randint(1, scale) for _ in range(samples)]
+
+    start = time.perf_counter()
+    for institution_id in ids:
+        request = factory.get(f'/api/v1/institutions/{institution_id}/history/')
+        async_to_sync(get_institution_history)(request, institution_id)
+    seconds = time.perf_counter() - start
+
+    return [{
+        'name': 'get_institution_history',
+        'scale': scale,
+        'seconds': round(seconds / samples, 6),
+        'ops_per_sec': round(samples / seconds, 1),
+    }]
+
+
+MAP_FIELDS = (
+    'id', 'name', 'service_type', 'address', 'capacity', 'current_headcount', 'latitude', 'longitude',
+)
+
+
+def _median_seconds(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_json(scale: int, repeat: int = 5) -> list:
+    """
+    지도 목록 행 조회/직렬화 시간 (10k 행당, repeat 회 중앙값)
+
+    - fetch.decimal / fetch.float: .values() 조회 (FLOAT_COORDINATES False / True)
+    - django_encoder: JsonResponse (DjangoJSONEncoder, Decimal 은 문자열)
+    - drf_renderer: rest_framework JSONRenderer (표준 json)
+    - fast_response / fast_renderer: caremap.renderers (orjson)
+    """
+    rows = {}
+    results = []
+
+    def row(name, seconds):
+        results.append({
+            'name': f'json.{name}',
+            'scale': scale,
+            'seconds': round(seconds * 10000 / scale, 5),
+            'ops_per_sec': round(scale / seconds, 1),
+        })
+
+    for coordinates, float_coordinates in (('decimal', False), ('float', True)):
+        with override_settings(FLOAT_COORDINATES=float_coordinates):
+            def fetch():
+                rows[coordinates] = list(Institution.objects.open().values(*MAP_FIELDS))
+            row(f'fetch.{coordinates}', _median_seconds(fetch, repeat))
+
+    drf_renderer, fast_renderer = DRFJSONRenderer(), JSONRenderer()
+    for coordinates, data in rows.items():
+        for name, func in (
+            ('django_encoder', lambda: JsonResponse(data, safe=False)),
+            ('drf_renderer', lambda: drf_renderer.render(data)),
+            ('fast_response', lambda: FastJsonResponse(data, safe=False)),
+            ('fast_renderer', lambda: fast_renderer.render(data)),
+        ):
+            row(f'{name}.{coordinates}', _median_seconds(func, repeat))
+    return results
+
+
+def cleanup():
+    """임시 SQLite 파일 삭제"""
+    connection.close()
+    if _db_file is not None:
+        os.unlink(_db_file.name)
@@ -0,0 +1,112 @@
+"""
+Crawler Benchmarks - DatabaseManager 동기화, geocode_batch, 중복 기관 탐지, 행정구역 지정
+
+run.py 에서 환경 변수(DB_NAME, KAKAO_*)를 설정한 뒤 import 합니다.
+"""
+import os
+import sys
+import time
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+from db_manager import DatabaseManager  # noqa: E402
+from dedup import find_duplicates  # noqa: E402
+from geocoding import geocode_batch  # noqa: E402
+from regions import RegionIndex, assign_regions  # noqa: E402
+
+from synthetic import generate_region_boundaries, mutate  # noqa: E402
+
+
+def _result(name: str, scale: int, seconds: float, ops: int) -> dict:
+    return {
+        'name': name,
+        'scale': scale,
+        'seconds': round(seconds, 4),
+        'ops_per_sec': round(ops / seconds, 1) if seconds else None,
+    }
+
+
+def _timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def _fresh_database() -> DatabaseManager:
+    """벤치마크 DB 테이블 초기화 후 연결 반환"""
+    db = DatabaseManager()
+    if not db.connect():
+        raise RuntimeError("Benchmark database connection failed")
+    db.cursor.execute("DROP TABLE IF EXISTS institution_history, institutions, crawl_runs CASCADE")
+    db.conn.commit()
+    if not db.create_tables():
+        raise RuntimeError("Benchmark table creation failed")
+    return db
+
+
+def bench_sync(institutions: list) -> list:
+    """
+    sync_institutions / sync_institutions_batched 측정
+
+    - insert: 빈 테이블에 전체 적재
+    - update: 10% 기관의 현원이 바뀐 데이터로 재동기화 (이력 기록 포함)
+    """
+    scale = len(institutions)
+    changed = mutate(institutions)
+    results = []
+
+    for name, sync in (
+        ('sync_institutions', lambda db, data: db.sync_institutions(data)),
+        ('sync_institutions_batched', lambda db, data: db.sync_institutions_batched(data)),
+    ):
+        db = _fresh_database()
+        try:
+            db.begin_run()
+            results.append(_result(f"{name}.insert", scale, _timed(sync, db, institutions), scale))
+            db.begin_run()
+            results.append(_result(f"{name}.update", scale, _timed(sync, db, changed), scale))
+        finally:
+            db.disconnect()
+
+    return results
+
+
+def bench_geocode(institutions: list) -> list:
+    """geocode_batch 측정 (로컬 스텁 서버 대상, 호출 간 딜레이 없음)"""
+    addresses = [inst['address'] for inst in institutions]
+    seconds = _timed(geocode_batch, addresses, delay=0)
+    return [_result('geocode_batch', len(addresses), seconds, len(addresses))]
+
+
+def bench_dedup(institutions: list) -> list:
+    """find_duplicates 측정 (주소 정규화 + 블록 단위 비교, DB 없음)"""
+    rows = [
+        {'id': i, 'institution_code': inst['code'], 'name': inst['name'],
+         'service_type': inst['type'], 'address': inst['address']}
+        for i, inst in enumerate(institutions, start=1)
+    ]
+    seconds = _timed(find_duplicates, rows)
+    return [_result('find_duplicates', len(rows), seconds, len(rows))]
+
+
+def bench_region(institutions: list) -> list:
+    """
+    assign_regions 측정 (가상 격자 경계 256개, 변마다 정점 200개)
+
+    - index: 경계 파일 → STR-tree 색인 생성
+    - assign: 기관 좌표 → 행정구역 코드
+    """
+    features = generate_region_boundaries()['features']
+    start = time.perf_counter()
+    index = RegionIndex(features, 'SIG_CD', 'SIG_KOR_NM')
+    index_seconds = time.perf_counter() - start
+
+    rows = [
+        {'id': i, 'latitude': inst['lat'], 'longitude': inst['lng'], 'region_code': None}
+        for i, inst in enumerate(institutions, start=1)
+    ]
+    return [
+        _result('region_index', len(rows), index_seconds, len(features)),
+        _result('assign_regions', len(rows), _timed(assign_regions, index, rows), len(rows)),
+    ]
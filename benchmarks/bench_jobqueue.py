@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Job Queue - 워커 프로세스 수에 따른 처리량과 장애 복구 확인 (crawler/jobqueue.py, worker.py)
+
+로컬 PostgreSQL 하나에 가상 작업을 등록하고 워커 프로세스 여러 개로 처리합니다.
+작업은 네트워크 요청 대신 정해진 시간만큼 대기합니다.
+
+- throughput: 워커 수별 처리 시간/처리량, 모든 작업이 한 번씩만 처리되었는지 (시도 횟수 1)
+- faults: 일부 작업은 무작위로 실패(재시도), 일부는 항상 실패(dead-letter),
+          처리 도중 워커 1개를 SIGKILL 로 종료 → 임대 만료 후 다른 워커가 회수
+
+사용법:
+    python benchmarks/bench_jobqueue.py --db-name caremap_bench --jobs 2000 --processes 1 2 4 8
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import sys
+import time
+from datetime import datetime
+
+from run import RESULTS_DIR, git_revision
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+LEASE_SECONDS = 3
+
+
+def handle_sleep(db, payload, fetcher):
+    time.sleep(payload['ms'] / 1000)
+    if payload.get('poison') or random.random() < payload.get('fail_rate', 0):
+        raise RuntimeError('simulated failure')
+    return 1
+
+
+def start_workers(count: int) -> list:
+    from worker import run_worker
+
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            kwargs={'handlers': {'sleep': handle_sleep}, 'exit_when_idle': True},
+        )
+        for _ in range(count)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def reset_queue(db):
+    db.cursor.execute("TRUNCATE crawl_jobs, crawl_workers")
+    db.conn.commit()
+
+
+def job_summary(db) -> dict:
+    db.cursor.execute(
+        """
+        SELECT status, COUNT(*) AS jobs, SUM(attempts) AS attempts,
+               COUNT(*) FILTER (WHERE attempts > 1) AS retried
+        FROM crawl_jobs GROUP BY status
+        """
+    )
+    return {row['status']: {k: int(v) for k, v in row.items() if k != 'status'} for row in db.cursor.fetchall()}
+
+
+def bench_throughput(db, queue, jobs: int, processes: int, ms: int) -> dict:
+    reset_queue(db)
+    queue.enqueue('sleep', [{'ms': ms}] * jobs)
+    start = time.perf_counter()
+    for process in start_workers(processes):
+        process.join()
+    seconds = time.perf_counter() - start
+    summary = job_summary(db)
+    done = summary.get('done', {})
+    return {
+        'scenario': 'throughput',
+        'processes': processes,
+        'jobs': jobs,
+        'seconds': round(seconds, 2),
+        'jobs_per_sec': round(jobs / seconds, 1),
+        'done': done.get('jobs', 0),
+        'processed_once': done.get('jobs', 0) == jobs and done.get('attempts', 0) == jobs,
+        'workers': [
+            {key: w[key] for key in ('worker_id', 'jobs_done', 'jobs_per_sec')}
+            for w in queue.stats()['workers']
+        ],
+    }
+
+
+def bench_faults(db, queue, jobs: int, processes: int, ms: int, fail_rate: float, poison: int) -> dict:
+    reset_queue(db)
+    payloads = [{'ms': ms, 'fail_rate': fail_rate} for _ in range(jobs - poison)]
+    payloads += [{'ms': ms, 'poison': True} for _ in range(poison)]
+    queue.enqueue('sleep', payloads)
+
+    start = time.perf_counter()
+    workers = start_workers(processes)
+    time.sleep(1.0)
+    os.kill(workers[0].pid, signal.SIGKILL)
+    # 죽은 워커가 잡고 있던 작업 (임대 만료 후 다른 워커가 처리해야 함)
+    db.cursor.execute(
+        "SELECT id FROM crawl_jobs WHERE status = 'running' AND locked_by = %s",
+        (f"{socket.gethostname()}-{workers[0].pid}",)
+    )
+    orphaned = [row['id'] for row in db.cursor.fetchall()]
+    db.conn.commit()
+    for process in workers:
+        process.join()
+    seconds = time.perf_counter() - start
+
+    summary = job_summary(db)
+    db.cursor.execute(
+        "SELECT COUNT(*) AS count FROM crawl_jobs WHERE id = ANY(%s) AND status IN ('done', 'dead')",
+        (orphaned,)
+    )
+    reclaimed = db.cursor.fetchone()['count']
+    return {
+        'scenario': 'faults',
+        'processes': processes,
+        'jobs': jobs,
+        'seconds': round(seconds, 2),
+        'done': summary.get('done', {}).get('jobs', 0),
+        'dead': summary.get('dead', {}).get('jobs', 0),
+        'retried': sum(s['retried'] for s in summary.values()),
+        'orphaned': len(orphaned),
+        'lease_reclaimed': reclaimed,
+        'unfinished': sum(s['jobs'] for status, s in summary.items() if status not in ('done', 'dead')),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap job queue benchmark')
+    parser.add_argument('--db-name', default='caremap_bench', help='PostgreSQL DB 이름')
+    parser.add_argument('--jobs', type=int, default=2000, help='작업 수')
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8], help='워커 프로세스 수')
+    parser.add_argument('--ms', type=int, default=20, help='작업당 대기 시간 (ms)')
+    parser.add_argument('--fail-rate', type=float, default=0.05, help='faults: 무작위 실패 비율')
+    parser.add_argument('--poison', type=int, default=10, help='faults: 항상 실패하는 작업 수')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+    if 'bench' not in args.db_name:
+        parser.error("--db-name must contain 'bench' (queue tables are truncated)")
+
+    # 무작위 실패 작업마다 남는 경고 로그 생략 (dead-letter 는 ERROR)
+    logging.basicConfig(level=logging.ERROR, format='%(processName)s - %(levelname)s - %(message)s')
+
+    # 크롤러 모듈 import 전에 설정 (config.py 는 import 시점에 환경 변수를 읽음)
+    os.environ.update({
+        'DB_NAME': args.db_name, 'JOB_LEASE_SECONDS': str(LEASE_SECONDS), 'JOB_MAX_ATTEMPTS': '3',
+        'JOB_BACKOFF_SECONDS': '0', 'JOB_POLL_SECONDS': '0.1',
+    })
+    from db_manager import DatabaseManager
+    from jobqueue import JobQueue
+
+    db = DatabaseManager()
+    if not db.connect() or not db.create_tables():
+        return 1
+    queue = JobQueue(db, lease_seconds=LEASE_SECONDS, max_attempts=3, backoff_seconds=0)
+
+    results = []
+    try:
+        for processes in args.processes:
+            results.append(bench_throughput(db, queue, args.jobs, processes, args.ms))
+        results.append(bench_faults(
+            db, queue, args.jobs, max(args.processes), args.ms, args.fail_rate, args.poison
+        ))
+    finally:
+        reset_queue(db)
+        db.disconnect()
+
+    print(f"\n{args.jobs:,} jobs x {args.ms} ms")
+    print(f"{'processes':<10}{'seconds':>9}{'jobs/s':>9}  processed once")
+    for r in results[:-1]:
+        print(f"{r['processes']:<10}{r['seconds']:>9.2f}{r['jobs_per_sec']:>9.1f}  {r['processed_once']}")
+    faults = results[-1]
+    print(
+        f"faults ({faults['processes']} processes, 1 killed): {faults['done']} done, {faults['dead']} dead, "
+        f"{faults['retried']} retried, {faults['lease_reclaimed']}/{faults['orphaned']} orphaned jobs "
+        f"finished after lease expiry, "
+        f"{faults['unfinished']} unfinished, {faults['seconds']:.2f}s"
+    )
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'jobs': args.jobs,
+            'ms': args.ms,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"jobqueue-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Page Parser Benchmark - 저장된 HTML 픽스처로 파싱 속도/할당량 측정
+
+사용법:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --pages 2000 --processes 4
+
+출력:
+    - pages/sec (단일 프로세스, 프로세스 풀)
+    - 페이지당 Python 힙 최대 사용량 / 결과 블록 수
+      (tracemalloc 기준, Lexbor 내부 C 할당은 제외)
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+from page_parser import PARSERS, parse_pages  # noqa: E402
+
+FIXTURES = {
+    'list': os.path.join(CRAWLER_DIR, 'fixtures', 'list_page.html'),
+    'detail': os.path.join(CRAWLER_DIR, 'fixtures', 'detail_page.html'),
+}
+
+
+def measure_throughput(html: str, kind: str, pages: int, processes: int) -> float:
+    """pages/sec 측정"""
+    batch = [html] * pages
+    start = time.perf_counter()
+    parse_pages(batch, kind=kind, processes=processes)
+    return pages / (time.perf_counter() - start)
+
+
+def measure_allocations(html: str, kind: str, pages: int = 200) -> dict:
+    """
+    페이지당 할당량 측정
+
+    Returns:
+        {'peak_bytes': 페이지 하나 파싱 중 최대 Python 힙 증가량 (평균),
+         'result_blocks': 파싱 결과가 유지하는 메모리 블록 수 (평균)}
+    """
+    parse = PARSERS[kind]
+    parse(html)  # 워밍업 (모듈 캐시, 정규식 컴파일)
+
+    peak_total = 0
+    blocks_total = 0
+    tracemalloc.start()
+    for _ in range(pages):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start_blocks = sys.getallocatedblocks()
+        result = parse(html)
+        blocks_total += sys.getallocatedblocks() - start_blocks
+        peak_total += tracemalloc.get_traced_memory()[1] - baseline
+        del result
+    tracemalloc.stop()
+
+    return {
+        'peak_bytes': peak_total / pages,
+        'result_blocks': blocks_total / pages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Page parser benchmark')
+    parser.add_argument('--pages', type=int, default=1000, help='측정할 페이지 수')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='프로세스 풀 크기')
+    args = parser.parse_args()
+
+    print(f"{'kind':<8}{'records':>9}{'1 proc p/s':>13}{f'{args.processes} proc p/s':>14}"
+          f"{'peak KiB/pg':>14}{'blocks/pg':>14}")
+    for kind, path in FIXTURES.items():
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+
+        records = len(parse_pages([html], kind=kind, processes=1))
+        single = measure_throughput(html, kind, args.pages, processes=1)
+        pooled = measure_throughput(html, kind, args.pages, processes=args.processes)
+        alloc = measure_allocations(html, kind)
+
+        print(f"{kind:<8}{records:>9}{single:>13,.0f}{pooled:>14,.0f}"
+              f"{alloc['peak_bytes'] / 1024:>14.1f}{alloc['result_blocks']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
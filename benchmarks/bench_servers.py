@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+WSGI vs ASGI Load Test - 느린 요청과 빠른 요청이 섞인 부하에서 처리량/지연 시간 비교
+
+같은 워커 수로 gunicorn(sync 워커, caremap.wsgi) 과 gunicorn + uvicorn 워커(caremap.asgi) 를
+차례로 띄우고, 동시 클라이언트가 다음 요청을 섞어 보냅니다.
+
+- slow: 기관명 부분 검색 (/api/v1/institutions/search/?q=..., 인덱스 없이 전체 스캔)
+- fast: 기관 1곳 이력 (/api/v1/institutions/<id>/history/)
+
+사용법:
+    pip install gunicorn uvicorn
+    python benchmarks/bench_servers.py --database-url postgresql://user@localhost/caremap_bench
+    python benchmarks/bench_servers.py --scale 100000 --workers 2 --clients 64 --duration 20
+
+주의:
+    --database-url 의 institutions/institution_history 테이블을 삭제 후 재생성합니다.
+    (DB 이름에 'bench' 가 포함되어야 실행됩니다)
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from urllib.parse import quote, urlparse
+
+from run import RESULTS_DIR, git_revision
+from synthetic import generate_institutions
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+SERVERS = {
+    'wsgi': ['caremap.wsgi:application'],
+    'asgi': ['caremap.asgi:application', '-k', 'uvicorn.workers.UvicornWorker'],
+}
+# ASGI 는 요청마다 async ORM 스레드가 달라 연결 유지 시 연결이 누적되므로 0 으로 비교
+CONN_MAX_AGE = {'wsgi': '60', 'asgi': '0'}
+# 가상 데이터 기관명에 없는 검색어 (전체 행을 스캔하게 함)
+SLOW_QUERY = '없는기관명'
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(mode: str, workers: int, env: dict):
+    """gunicorn 실행 후 응답할 때까지 대기, (프로세스, 포트) 반환"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', *SERVERS[mode],
+         '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            conn.request('GET', '/api/v1/institutions/1/history/')
+            conn.getresponse().read()
+            conn.close()
+            return process, port
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{mode} server did not start on port {port}")
+
+
+def client_loop(port: int, scale: int, slow_ratio: float, deadline: float, seed: int, samples: list):
+    """deadline 까지 요청을 반복하며 (종류, 지연 시간, 상태 코드) 기록"""
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    while time.monotonic() < deadline:
+        if rng.random() < slow_ratio:
+            kind, path = 'slow', f'/api/v1/institutions/search/?q={quote(SLOW_QUERY)}'
+        else:
+            kind, path = 'fast', f'/api/v1/institutions/{rng.randint(1, scale)}/history/'
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+            status = 0
+        samples.append((kind, time.perf_counter() - start, status))
+    conn.close()
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run_load(port: int, scale: int, clients: int, duration: float, slow_ratio: float) -> dict:
+    samples = []
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=client_loop, args=(port, scale, slow_ratio, deadline, i, samples))
+        for i in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    result = {
+        'requests': len(samples),
+        'requests_per_sec': round(len(samples) / duration, 1),
+        'errors': sum(1 for _, _, status in samples if status != 200),
+    }
+    for kind in ('fast', 'slow'):
+        latencies = [latency * 1000 for k, latency, status in samples if k == kind and status == 200]
+        result[kind] = {
+            'requests': len(latencies),
+            'p50_ms': round(percentile(latencies, 0.5), 1) if latencies else None,
+            'p95_ms': round(percentile(latencies, 0.95), 1) if latencies else None,
+            'p99_ms': round(percentile(latencies, 0.99), 1) if latencies else None,
+            'mean_ms': round(statistics.mean(latencies), 1) if latencies else None,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap WSGI vs ASGI load test')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                        help='PostgreSQL URL (기본: DATABASE_URL 환경 변수)')
+    parser.add_argument('--scale', type=int, default=100000, help='기관 수')
+    parser.add_argument('--workers', type=int, default=2, help='서버 워커 프로세스 수')
+    parser.add_argument('--clients', type=int, default=32, help='동시 클라이언트 수')
+    parser.add_argument('--duration', type=float, default=15, help='서버별 측정 시간 (초)')
+    parser.add_argument('--slow-ratio', type=float, default=0.2, help='느린 요청 비율')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    if not args.database_url or 'bench' not in urlparse(args.database_url).path:
+        parser.error("--database-url must point to a database whose name contains 'bench'")
+
+    env = dict(os.environ, DATABASE_URL=args.database_url)
+    os.environ['DATABASE_URL'] = args.database_url
+    import bench_backend
+
+    print(f"Loading {args.scale:,} institutions ...")
+    bench_backend.load_fixture(generate_institutions(args.scale))
+    bench_backend.cleanup()
+
+    results = {}
+    for mode in SERVERS:
+        process, port = start_server(mode, args.workers, dict(env, DB_CONN_MAX_AGE=CONN_MAX_AGE[mode]))
+        try:
+            results[mode] = run_load(port, args.scale, args.clients, args.duration, args.slow_ratio)
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"\n{'server':<8}{'req/s':>10}{'errors':>8}{'fast p50':>10}{'fast p95':>10}"
+          f"{'slow p50':>10}{'slow p95':>10}  (ms)")
+    for mode, r in results.items():
+        print(f"{mode:<8}{r['requests_per_sec']:>10,.1f}{r['errors']:>8}"
+              f"{r['fast']['p50_ms'] or 0:>10}{r['fast']['p95_ms'] or 0:>10}"
+              f"{r['slow']['p50_ms'] or 0:>10}{r['slow']['p95_ms'] or 0:>10}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'scale': args.scale,
+            'workers': args.workers,
+            'clients': args.clients,
+            'duration': args.duration,
+            'slow_ratio': args.slow_ratio,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"servers-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
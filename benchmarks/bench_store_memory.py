@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Institution Store Memory - 워커 수에 따른 워커별 메모리 측정 (mmap 기관 스냅샷)
+
+가상 기관 데이터로 기관 바이너리 스냅샷(crawler/columnar.py)을 작성하고,
+gunicorn 워커 수를 바꿔 가며 주변 기관 검색(/api/v1/institutions/nearby/)으로 모든 워커가
+스냅샷을 열게 한 뒤 /proc/<pid>/smaps_rollup 으로 워커별 메모리를 측정합니다.
+
+- rss_kb: 워커 RSS (공유 페이지 포함)
+- pss_kb: 공유 페이지를 공유 프로세스 수로 나눈 값
+- private_kb: 워커 전용 페이지 (워커 수가 늘어도 일정해야 함)
+- store_rss_kb: 워커 RSS 중 스냅샷 파일 매핑 부분 (페이지 캐시, 워커 간 공유)
+
+사용법 (Linux 전용):
+    pip install gunicorn
+    python benchmarks/bench_store_memory.py --scale 100000 --workers 1 2 4
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from bench_servers import free_port
+from run import RESULTS_DIR, git_revision
+from synthetic import generate_institutions
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+from columnar import write_columnar_store  # noqa: E402
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+def store_rows(institutions: list) -> list:
+    """가상 데이터 → get_map_rows() 형식"""
+    return [
+        {
+            'id': i, 'name': inst['name'], 'service_type': inst['type'], 'address': inst['address'],
+            'capacity': inst['capacity'], 'current_headcount': inst['current'],
+            'latitude': inst['lat'], 'longitude': inst['lng'],
+        }
+        for i, inst in enumerate(institutions, start=1)
+    ]
+
+
+def worker_pids(master_pid: int) -> list:
+    with open(f'/proc/{master_pid}/task/{master_pid}/children') as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def smaps_rollup(pid: int) -> dict:
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if rest.strip().endswith('kB'):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def mapped_rss(pid: int, path: str) -> int:
+    """특정 파일 매핑의 RSS 합계 (kB), 매핑이 없으면 None"""
+    total, current = None, False
+    with open(f'/proc/{pid}/smaps') as f:
+        for line in f:
+            fields = line.split()
+            if '-' in fields[0] and len(fields) >= 5:
+                current = len(fields) >= 6 and fields[5] == path
+            elif current and fields[0] == 'Rss:':
+                total = (total or 0) + int(fields[1])
+    return total
+
+
+def touch_workers(port: int, workers: int, requests_per_worker: int = 200):
+    """여러 클라이언트로 주변 기관 검색을 보내 모든 워커가 스냅샷을 열게 함"""
+    def client(seed):
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        for _ in range(requests_per_worker):
+            lat, lng = 33.2 + rng.random() * 5, 126.3 + rng.random() * 3
+            conn.request('GET', f'/api/v1/institutions/nearby/?lat={lat}&lng={lng}&radius_km=5')
+            conn.getresponse().read()
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(workers * 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def measure(store_path: str, workers: int) -> dict:
+    port = free_port()
+    env = dict(
+        os.environ,
+        INSTITUTION_STORE_PATH=store_path,
+        DATABASE_URL=f"sqlite:///{os.path.join(os.path.dirname(store_path), 'unused.sqlite3')}",
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'caremap.wsgi:application',
+         '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                conn.request('GET', '/api/v1/institutions/nearby/?lat=37.5&lng=127.0')
+                conn.getresponse().read()
+                conn.close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"gunicorn did not start on port {port}")
+                time.sleep(0.2)
+
+        touch_workers(port, workers)
+        real_path = os.path.realpath(store_path)
+        per_worker = []
+        for pid in worker_pids(process.pid):
+            rollup = smaps_rollup(pid)
+            per_worker.append({
+                'rss_kb': rollup['Rss'],
+                'pss_kb': rollup['Pss'],
+                'private_kb': rollup['Private_Clean'] + rollup['Private_Dirty'],
+                'store_rss_kb': mapped_rss(pid, real_path),
+            })
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        'workers': workers,
+        'per_worker': per_worker,
+        'mean_rss_kb': round(sum(w['rss_kb'] for w in per_worker) / len(per_worker)),
+        'mean_private_kb': round(sum(w['private_kb'] for w in per_worker) / len(per_worker)),
+        'total_pss_kb': sum(w['pss_kb'] for w in per_worker),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap institution store per-worker memory')
+    parser.add_argument('--scale', type=int, default=100000, help='기관 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='측정할 워커 수')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    if not sys.platform.startswith('linux'):
+        parser.error('/proc/<pid>/smaps_rollup 이 필요합니다 (Linux 전용)')
+
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, 'institutions.cmap')
+        print(f"Writing store for {args.scale:,} institutions ...")
+        store = write_columnar_store(store_rows(generate_institutions(args.scale)), store_path)
+        results = [measure(store_path, workers) for workers in args.workers]
+
+    print(f"\nstore: {store['bytes'] / 1024:,.0f} kB")
+    print(f"{'workers':<8}{'rss/worker':>12}{'private/worker':>16}{'store rss':>12}{'total pss':>12}  (kB)")
+    for r in results:
+        store_rss = max((w['store_rss_kb'] or 0) for w in r['per_worker'])
+        print(f"{r['workers']:<8}{r['mean_rss_kb']:>12,}{r['mean_private_kb']:>16,}"
+              f"{store_rss:>12,}{r['total_pss_kb']:>12,}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'scale': args.scale,
+            'store_bytes': store['bytes'],
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"store-memory-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
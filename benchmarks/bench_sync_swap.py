@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Sync Swap - 전체 동기화 중 지도/이력 조회 지연 시간 (기존 방식 vs 그림자 테이블 교체)
+
+가상 기관을 적재한 DB 에서 조회 스레드가 지도 영역 조회와 기관 이력 조회를 계속 보내는 동안
+10% 기관이 바뀐 전체 데이터를 다시 동기화합니다.
+
+- in_place: DatabaseManager.sync_institutions (기관마다 조회/이력/UPSERT, 한 트랜잭션)
+- shadow: DatabaseManager.sync_institutions_shadow (그림자 테이블 적재 → 이름 교체)
+
+동기화 전(idle)과 동기화 중 조회 지연 시간 p50/p95/p99/max, 가장 긴 조회,
+그림자 교체 트랜잭션의 잠금 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_sync_swap.py --db-name caremap_bench --scale 100000 --readers 4
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+from bench_servers import percentile
+from run import RESULTS_DIR, git_revision
+from synthetic import generate_institutions, mutate
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+MAP_QUERY = """
+    SELECT id, name, service_type, capacity, current_headcount, latitude, longitude
+    FROM institutions
+    WHERE closed_at IS NULL AND latitude BETWEEN %s AND %s AND longitude BETWEEN %s AND %s
+"""
+HISTORY_QUERY = """
+    SELECT i.id, i.name, h.recorded_date, h.capacity, h.current_headcount
+    FROM institutions i LEFT JOIN institution_history h ON h.institution_id = i.id
+    WHERE i.id = %s
+    ORDER BY h.recorded_date DESC
+"""
+
+
+def reader_loop(connect, scale: int, stop: threading.Event, samples: list, seed: int):
+    """지도 영역(약 0.1도) 조회와 기관 이력 조회를 번갈아 실행, (시각, 종류, 초) 기록"""
+    rng = random.Random(seed)
+    conn = connect()
+    conn.autocommit = True
+    cursor = conn.cursor()
+    while not stop.is_set():
+        if rng.random() < 0.7:
+            kind = 'map'
+            lat, lng = rng.uniform(35.0, 37.6), rng.uniform(126.8, 129.2)
+            args = (lat, lat + 0.1, lng, lng + 0.1)
+            query = MAP_QUERY
+        else:
+            kind = 'history'
+            args = (rng.randint(1, scale),)
+            query = HISTORY_QUERY
+        start = time.perf_counter()
+        cursor.execute(query, args)
+        cursor.fetchall()
+        samples.append((time.monotonic(), kind, time.perf_counter() - start))
+    conn.close()
+
+
+def summarize(samples: list) -> dict:
+    summary = {}
+    for kind in ('map', 'history'):
+        values = [seconds for _, k, seconds in samples if k == kind]
+        summary[kind] = {
+            'requests': len(values),
+            **{
+                name: round(percentile(values, q) * 1000, 2) if values else None
+                for name, q in (('p50_ms', 0.5), ('p95_ms', 0.95), ('p99_ms', 0.99))
+            },
+            'max_ms': round(max(values) * 1000, 2) if values else None,
+        }
+    return summary
+
+
+def prepare(db, institutions: list):
+    """테이블 초기화 후 기관 적재"""
+    db.cursor.execute(
+        "DROP TABLE IF EXISTS institution_history, institutions, institutions_shadow, institutions_old, "
+        "crawl_runs CASCADE"
+    )
+    db.conn.commit()
+    if not db.create_tables():
+        raise RuntimeError("Benchmark table creation failed")
+    db.begin_run()
+    db.sync_institutions_batched(institutions, batch_size=5000)
+    db.cursor.execute("ANALYZE institutions")
+    db.conn.commit()
+
+
+def run_mode(mode: str, db, connect, institutions: list, changed: list, readers: int, idle: float) -> dict:
+    prepare(db, institutions)
+    db.begin_run()
+
+    samples = []
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=reader_loop, args=(connect, len(institutions), stop, samples, seed))
+        for seed in range(readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(idle)
+
+    sync_start = time.monotonic()
+    if mode == 'in_place':
+        result = db.sync_institutions(changed)
+    else:
+        result = db.sync_institutions_shadow(changed, batch_size=5000)
+    sync_end = time.monotonic()
+    time.sleep(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    db.cursor.execute("SELECT COUNT(*) AS count FROM institution_history")
+    history_rows = db.cursor.fetchone()['count']
+    db.conn.commit()
+    return {
+        'mode': mode,
+        'scale': len(institutions),
+        'sync_seconds': round(sync_end - sync_start, 2),
+        'success': result['success'],
+        'history_rows': history_rows,
+        'swap_ms': round(result['swap_ms'], 2) if result.get('swap_ms') is not None else None,
+        'idle': summarize([s for s in samples if s[0] < sync_start]),
+        'during_sync': summarize([s for s in samples if sync_start <= s[0] <= sync_end]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap full sync read latency benchmark')
+    parser.add_argument('--db-name', default='caremap_bench', help='PostgreSQL DB 이름')
+    parser.add_argument('--scale', type=int, default=100000, help='기관 수')
+    parser.add_argument('--readers', type=int, default=4, help='조회 스레드 수')
+    parser.add_argument('--idle', type=float, default=3.0, help='동기화 전 조회 시간 (초)')
+    parser.add_argument('--modes', nargs='+', default=['in_place', 'shadow'], choices=('in_place', 'shadow'))
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+    if 'bench' not in args.db_name:
+        parser.error("--db-name must contain 'bench' (institution tables are dropped)")
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+    os.environ['DB_NAME'] = args.db_name
+    import psycopg2
+    from config import DB_CONFIG
+    from db_manager import DatabaseManager
+
+    db = DatabaseManager()
+    if not db.connect():
+        return 1
+
+    institutions = generate_institutions(args.scale)
+    changed = mutate(institutions)
+    results = []
+    try:
+        for mode in args.modes:
+            results.append(run_mode(
+                mode, db, lambda: psycopg2.connect(**DB_CONFIG), institutions, changed, args.readers, args.idle
+            ))
+    finally:
+        db.disconnect()
+
+    print(f"\n{args.scale:,} institutions, 10% changed, {args.readers} readers")
+    print(f"{'mode':<10}{'sync s':>8}{'swap ms':>9}  {'phase':<12}{'map p50':>9}{'p99':>9}{'max':>9}"
+          f"{'history p50':>13}{'p99':>9}{'max':>9}")
+    for r in results:
+        for phase in ('idle', 'during_sync'):
+            m, h = r[phase]['map'], r[phase]['history']
+            print(
+                f"{r['mode']:<10}{r['sync_seconds']:>8}{str(r['swap_ms']):>9}  {phase:<12}"
+                f"{m['p50_ms']:>9}{m['p99_ms']:>9}{m['max_ms']:>9}{h['p50_ms']:>13}{h['p99_ms']:>9}{h['max_ms']:>9}"
+            )
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'scale': args.scale,
+            'readers': args.readers,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"syncswap-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Load Test - 지도/상세/검색/로그인 트래픽을 섞어 백엔드 용량 측정
+
+가상 데이터로 DB(기본: 임시 SQLite, --database-url 로 PostgreSQL)와 크롤러 산출물
+(지도 스냅샷, 기관 바이너리 스냅샷, 히트맵)을 만들고 gunicorn 으로 백엔드를 띄운 뒤,
+동시 클라이언트가 사용자 세션처럼 다음 요청을 비율대로 섞어 보냅니다. 외부 서비스는 필요 없습니다.
+
+- map: 지도 전체 목록 (/api/v1/institutions/, 스냅샷 파일 응답)
+- pan: 지도 이동 후 주변 기관 (/api/v1/institutions/nearby/, 직전 위치에서 조금씩 이동)
+- heatmap: 화면 영역 히트맵 (/api/v1/institutions/heatmap/?bbox=)
+- detail: 기관 상세 (/api/v1/institutions/<id>/history/)
+- history: 여러 기관 이력 비교 (/api/v1/institutions/history/?ids=)
+- search: 기관명/급여종류 검색 (/api/v1/institutions/search/)
+- login: 로그인 (/api/accounts/login/, 받은 토큰을 세션에 보관)
+- profile: 토큰 인증 프로필 조회 (/api/accounts/profile/, 토큰이 없으면 로그인)
+
+클라이언트 수별로 엔드포인트마다 처리량, p50/p95/p99 지연 시간, 오류율을 출력하고 저장합니다.
+
+사용법:
+    pip install gunicorn uvicorn
+    python benchmarks/loadtest.py --scale 20000 --workers 2 --clients 8 32 --duration 20
+    python benchmarks/loadtest.py --mix map=1,pan=40,detail=30,search=20,login=9 --think-ms 200
+    python benchmarks/loadtest.py --database-url postgresql://user@localhost/caremap_bench --server asgi
+
+주의:
+    --database-url 을 지정하면 해당 DB 의 institutions/institution_history 테이블을 삭제 후 재생성합니다.
+    (DB 이름에 'bench' 가 포함되어야 실행됩니다)
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from urllib.parse import quote, urlparse
+
+from bench_servers import CONN_MAX_AGE, SERVERS, percentile, start_server
+from bench_store_memory import store_rows
+from run import RESULTS_DIR, git_revision
+from synthetic import NAME_PREFIXES, SERVICE_TYPES, generate_institutions
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+from columnar import write_columnar_store  # noqa: E402
+from heatmap import build_heatmap  # noqa: E402
+from snapshot import publish_map_snapshot  # noqa: E402
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+DEFAULT_MIX = 'map=3,pan=30,heatmap=10,detail=25,history=5,search=15,login=4,profile=8'
+PASSWORD = 'loadtest-pw-1234'
+# 지도 이동 한 번의 최대 이동량 (도), 화면 영역 반폭 (도)
+PAN_STEP = 0.02
+VIEWPORT = (0.05, 0.04)
+
+
+def parse_mix(value: str) -> dict:
+    """'map=3,pan=30' → {'map': 3.0, 'pan': 30.0}"""
+    mix = {}
+    for item in value.split(','):
+        kind, _, weight = item.partition('=')
+        if kind not in ACTIONS:
+            raise ValueError(f"Unknown request kind: {kind}")
+        mix[kind] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError('mix weights must not all be zero')
+    return mix
+
+
+def prepare_fixture(directory: str, database_url: str, scale: int, users: int, seed: int) -> list:
+    """
+    DB 마이그레이션, 가상 기관/이력/사용자 적재, 크롤러 산출물 작성
+
+    Returns:
+        list: 기관 좌표 [(lat, lng)] (id 순, 지도 이동 시작점)
+    """
+    env = dict(os.environ, DATABASE_URL=database_url)
+    subprocess.run(
+        [sys.executable, 'manage.py', 'migrate', '--verbosity', '0'], cwd=BACKEND_DIR, env=env, check=True
+    )
+
+    os.environ['DATABASE_URL'] = database_url
+    import bench_backend
+    from django.contrib.auth.hashers import make_password
+    from accounts.models import User
+
+    institutions = generate_institutions(scale, seed=seed)
+    print(f"Loading {scale:,} institutions and {users:,} users ...")
+    bench_backend.load_fixture(institutions)
+    User.objects.filter(username__startswith='loadtest-').delete()
+    password = make_password(PASSWORD)
+    User.objects.bulk_create(
+        User(username=f'loadtest-{i}', email=f'loadtest-{i}@example.com', password=password)
+        for i in range(users)
+    )
+    bench_backend.cleanup()
+
+    rows = store_rows(institutions)
+    print("Writing map snapshot, institution store and heatmap ...")
+    publish_map_snapshot(rows, os.path.join(directory, 'snapshots'), generation=1, brotli_quality=5)
+    write_columnar_store(rows, os.path.join(directory, 'institutions.cmap'), generation=1)
+    build_heatmap(rows, os.path.join(directory, 'heatmap.cgrid'), generation=1)
+    return [(float(inst['lat']), float(inst['lng'])) for inst in institutions]
+
+
+class Session:
+    """클라이언트 1개의 사용자 세션 (지도 위치, 로그인 토큰)"""
+
+    def __init__(self, rng: random.Random, coordinates: list, users: int):
+        self.rng = rng
+        self.coordinates = coordinates
+        self.users = users
+        self.center = rng.choice(coordinates)
+        self.token = None
+
+    def institution_id(self) -> int:
+        return self.rng.randint(1, len(self.coordinates))
+
+    def move(self):
+        # 가끔 다른 지역으로 이동, 대부분은 직전 화면에서 조금 이동
+        if self.rng.random() < 0.1:
+            self.center = self.rng.choice(self.coordinates)
+        else:
+            lat, lng = self.center
+            self.center = (lat + self.rng.uniform(-PAN_STEP, PAN_STEP),
+                           lng + self.rng.uniform(-PAN_STEP, PAN_STEP))
+        return self.center
+
+
+def action_map(session):
+    return 'GET', '/api/v1/institutions/', None
+
+
+def action_pan(session):
+    lat, lng = session.move()
+    return 'GET', f'/api/v1/institutions/nearby/?lat={lat:.6f}&lng={lng:.6f}&radius_km=3', None
+
+
+def action_heatmap(session):
+    lat, lng = session.center
+    half_lat, half_lng = VIEWPORT
+    bbox = f'{lng - half_lng:.5f},{lat - half_lat:.5f},{lng + half_lng:.5f},{lat + half_lat:.5f}'
+    return 'GET', f'/api/v1/institutions/heatmap/?metric=vacancy&bbox={bbox}', None
+
+
+def action_detail(session):
+    return 'GET', f'/api/v1/institutions/{session.institution_id()}/history/', None
+
+
+def action_history(session):
+    ids = ','.join(str(session.institution_id()) for _ in range(session.rng.randint(2, 5)))
+    return 'GET', f'/api/v1/institutions/history/?ids={ids}', None
+
+
+def action_search(session):
+    query = f'q={quote(session.rng.choice(NAME_PREFIXES))}'
+    if session.rng.random() < 0.5:
+        query += f'&service_type={quote(session.rng.choice(list(SERVICE_TYPES)))}'
+    return 'GET', f'/api/v1/institutions/search/?{query}', None
+
+
+def action_login(session):
+    body = {'username': f'loadtest-{session.rng.randrange(session.users)}', 'password': PASSWORD}
+    return 'POST', '/api/accounts/login/', body
+
+
+def action_profile(session):
+    if session.token is None:
+        return action_login(session)
+    return 'GET', '/api/accounts/profile/', None
+
+
+ACTIONS = {
+    'map': action_map,
+    'pan': action_pan,
+    'heatmap': action_heatmap,
+    'detail': action_detail,
+    'history': action_history,
+    'search': action_search,
+    'login': action_login,
+    'profile': action_profile,
+}
+
+
+def client_loop(port: int, mix: dict, session: Session, think: float, warmup_until: float,
+                deadline: float, samples: list):
+    """deadline 까지 요청을 반복하며 (종류, 지연 시간, 상태 코드) 기록 (warmup 구간은 제외)"""
+    kinds, weights = list(mix), list(mix.values())
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    while time.monotonic() < deadline:
+        kind = session.rng.choices(kinds, weights)[0]
+        method, path, body = ACTIONS[kind](session)
+        if path == '/api/accounts/login/':
+            kind = 'login'
+        headers = {}
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+        if session.token and kind == 'profile':
+            headers['Authorization'] = f'Token {session.token}'
+
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+            response = conn.getresponse()
+            content = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+            content, status = b'', 0
+        latency = time.perf_counter() - start
+
+        if kind == 'login' and status == 200:
+            session.token = json.loads(content)['token']
+        if time.monotonic() >= warmup_until:
+            samples.append((kind, latency, status))
+        if think:
+            time.sleep(session.rng.expovariate(1 / think))
+    conn.close()
+
+
+def summarize(samples: list, duration: float) -> dict:
+    """엔드포인트별 처리량/지연 시간/오류율 (상태 코드 400 이상 또는 연결 오류는 오류)"""
+    def stats(items):
+        latencies = [latency * 1000 for _, latency, status in items if 0 < status < 400]
+        errors = sum(1 for _, _, status in items if not 0 < status < 400)
+        return {
+            'requests': len(items),
+            'requests_per_sec': round(len(items) / duration, 1),
+            'errors': errors,
+            'error_rate': round(errors / len(items), 4) if items else None,
+            'p50_ms': round(percentile(latencies, 0.5), 1) if latencies else None,
+            'p95_ms': round(percentile(latencies, 0.95), 1) if latencies else None,
+            'p99_ms': round(percentile(latencies, 0.99), 1) if latencies else None,
+            'mean_ms': round(statistics.mean(latencies), 1) if latencies else None,
+        }
+
+    endpoints = {}
+    for kind in ACTIONS:
+        items = [sample for sample in samples if sample[0] == kind]
+        if items:
+            endpoints[kind] = stats(items)
+    return {'total': stats(samples), 'endpoints': endpoints}
+
+
+def run_stage(port: int, mix: dict, clients: int, coordinates: list, users: int, think: float,
+              warmup: float, duration: float, seed: int) -> dict:
+    samples = []
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=client_loop, args=(
+            port, mix, Session(random.Random(seed * 1000 + i), coordinates, users), think,
+            start + warmup, start + warmup + duration, samples,
+        ))
+        for i in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {'clients': clients, **summarize(samples, duration)}
+
+
+def print_stage(result: dict):
+    total = result['total']
+    print(f"\n[{result['clients']} clients] {total['requests_per_sec']:,.1f} req/s, "
+          f"error rate {total['error_rate'] or 0:.2%}, p50 {total['p50_ms']} ms, p99 {total['p99_ms']} ms")
+    print(f"  {'endpoint':<10}{'req/s':>9}{'errors':>8}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for kind, r in result['endpoints'].items():
+        print(f"  {kind:<10}{r['requests_per_sec']:>9,.1f}{r['error_rate']:>8.1%}"
+              f"{r['p50_ms'] or 0:>9}{r['p95_ms'] or 0:>9}{r['p99_ms'] or 0:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap backend load test')
+    parser.add_argument('--database-url', help='PostgreSQL URL (기본: 임시 SQLite 파일)')
+    parser.add_argument('--scale', type=int, default=20000, help='기관 수')
+    parser.add_argument('--users', type=int, default=200, help='가상 사용자 수')
+    parser.add_argument('--server', choices=list(SERVERS), default='wsgi', help='gunicorn 워커 종류')
+    parser.add_argument('--workers', type=int, default=2, help='서버 워커 프로세스 수')
+    parser.add_argument('--clients', type=int, nargs='+', default=[8, 32], help='동시 클라이언트 수 (단계별)')
+    parser.add_argument('--duration', type=float, default=20, help='단계별 측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=3, help='단계별 측정 전 예열 시간 (초)')
+    parser.add_argument('--think-ms', type=float, default=0, help='요청 간 평균 대기 시간 (ms, 지수 분포)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'요청 종류별 비율 (기본: {DEFAULT_MIX})')
+    parser.add_argument('--seed', type=int, default=0, help='가상 데이터/트래픽 seed')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.database_url and 'bench' not in urlparse(args.database_url).path:
+        parser.error("--database-url must point to a database whose name contains 'bench'")
+
+    with tempfile.TemporaryDirectory(prefix='caremap-loadtest-') as directory:
+        database_url = args.database_url or f"sqlite:///{os.path.join(directory, 'loadtest.sqlite3')}"
+        coordinates = prepare_fixture(directory, database_url, args.scale, args.users, args.seed)
+
+        env = dict(
+            os.environ,
+            DATABASE_URL=database_url,
+            DB_CONN_MAX_AGE=CONN_MAX_AGE[args.server],
+            DEBUG='False',
+            ALLOWED_HOSTS='127.0.0.1',
+            MAP_SNAPSHOT_DIR=os.path.join(directory, 'snapshots'),
+            INSTITUTION_STORE_PATH=os.path.join(directory, 'institutions.cmap'),
+            HEATMAP_PATH=os.path.join(directory, 'heatmap.cgrid'),
+        )
+        process, port = start_server(args.server, args.workers, env)
+        try:
+            results = []
+            for clients in args.clients:
+                results.append(run_stage(
+                    port, mix, clients, coordinates, args.users, args.think_ms / 1000,
+                    args.warmup, args.duration, args.seed,
+                ))
+                print_stage(results[-1])
+        finally:
+            process.terminate()
+            process.wait()
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'database': urlparse(database_url).scheme,
+            'server': args.server,
+            'scale': args.scale,
+            'users': args.users,
+            'workers': args.workers,
+            'duration': args.duration,
+            'think_ms': args.think_ms,
+            'mix': mix,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"loadtest-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
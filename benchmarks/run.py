@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+CareMap Benchmark Suite - 크롤러/백엔드 주요 경로 성능 측정
+
+가상 데이터(synthetic.py)를 규모별로 생성하여 측정하고, 결과를 JSON 파일로 저장합니다.
+이전 결과 파일을 --baseline 으로 넘기면 항목별 변화율을 출력합니다.
+
+사용법:
+    python benchmarks/run.py
+    python benchmarks/run.py --scales 1000,10000 --only sync,map
+    python benchmarks/run.py --baseline benchmarks/results/<이전 결과>.json
+
+주의:
+    sync 벤치마크는 --db-name 데이터베이스의 테이블을 삭제 후 재생성합니다.
+    (DB 이름에 'bench' 가 포함되어야 실행됩니다)
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+from stubs import GeocodeStub
+from synthetic import generate_institutions
+
+BENCHMARKS = ('sync', 'geocode', 'dedup', 'region', 'map', 'history', 'json')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results: list, baseline_path: str):
+    """기준 결과 대비 변화율 출력 (seconds 기준, + 는 느려짐)"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {
+            (r['name'], r['scale']): r for r in json.load(f)['results']
+        }
+
+    print(f"\n{'benchmark':<36}{'scale':>9}{'baseline':>12}{'current':>12}{'change':>9}")
+    for r in results:
+        base = baseline.get((r['name'], r['scale']))
+        if not base or not base['seconds']:
+            continue
+        change = (r['seconds'] - base['seconds']) / base['seconds']
+        flag = '  <-- regression' if change > 0.1 else ''
+        print(f"{r['name']:<36}{r['scale']:>9,}{base['seconds']:>12.4f}"
+              f"{r['seconds']:>12.4f}{change:>+9.1%}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap benchmark suite')
+    parser.add_argument('--scales', default='1000,10000,100000', help='기관 수 (쉼표 구분)')
+    parser.add_argument('--only', default=','.join(BENCHMARKS), help='실행할 벤치마크 (쉼표 구분)')
+    parser.add_argument('--db-name', default='caremap_bench', help='sync 벤치마크용 PostgreSQL DB 이름')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--seed', type=int, default=0, help='가상 데이터 seed')
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',')]
+    selected = set(args.only.split(','))
+    unknown = selected - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {sorted(unknown)}")
+    if 'sync' in selected and 'bench' not in args.db_name:
+        parser.error("--db-name must contain 'bench' (tables are dropped)")
+
+    # 크롤러 모듈 import 전에 설정 (config.py 는 import 시점에 환경 변수를 읽음)
+    stub = GeocodeStub().start()
+    os.environ['DB_NAME'] = args.db_name
+    os.environ['KAKAO_REST_API_KEY'] = 'benchmark'
+    os.environ['KAKAO_GEOCODE_URL'] = stub.url
+
+    results = []
+    try:
+        if selected & {'sync', 'geocode', 'dedup', 'region'}:
+            import bench_crawler
+        if selected & {'map', 'history', 'json'}:
+            import bench_backend
+
+        for scale in scales:
+            institutions = generate_institutions(scale, seed=args.seed)
+            print(f"[{scale:,} institutions]")
+
+            if 'sync' in selected:
+                results += bench_crawler.bench_sync(institutions)
+            if 'geocode' in selected:
+                results += bench_crawler.bench_geocode(institutions)
+            if 'dedup' in selected:
+                results += bench_crawler.bench_dedup(institutions)
+            if 'region' in selected:
+                results += bench_crawler.bench_region(institutions)
+            if selected & {'map', 'history', 'json'}:
+                bench_backend.load_fixture(institutions)
+                if 'map' in selected:
+                    results += bench_backend.bench_map(scale)
+                if 'history' in selected:
+                    results += bench_backend.bench_history(scale)
+                if 'json' in selected:
+                    results += bench_backend.bench_json(scale)
+
+            for r in results:
+                if r['scale'] == scale:
+                    print(f"  {r['name']:<34}{r['seconds']:>10.4f} s{r['ops_per_sec'] or 0:>14,.1f} ops/s")
+    finally:
+        stub.stop()
+        if selected & {'map', 'history', 'json'}:
+            bench_backend.cleanup()
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
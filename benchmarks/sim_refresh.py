@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Refresh Simulation - 재수집 정책별 신선도 대비 요청 수 (crawler/scheduler.py)
+
+기관마다 실제 변경률(하루당)을 정해 두고 매일 변경을 포아송 과정으로 발생시키면서,
+같은 회차 예산으로 다음 정책을 비교합니다.
+
+- uniform: 모든 기관을 차례대로 예산만큼 재수집 (순환)
+- adaptive: plan_refresh 로 변경 이력 기반 주기/우선순위에 따라 재수집
+            (시작 시 history-days 동안의 변경 횟수, 이후 재수집에서 발견한 변경을 이력으로 누적)
+- full: 매일 모든 기관 재수집 (요청 수 상한 참고값)
+
+측정값:
+- freshness: 매일 회차가 끝난 뒤 수집본이 실제 값과 같은 기관 비율의 평균
+- requests: 전체 기간 요청 수
+- changes_found: 재수집으로 발견한 변경 기관 수 (requests_per_change: 변경 1건 발견당 요청 수)
+
+사용법:
+    python benchmarks/sim_refresh.py --scale 20000 --budget 1000 --days 90
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from run import RESULTS_DIR, git_revision
+
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawler')
+sys.path.insert(0, CRAWLER_DIR)
+
+from scheduler import plan_refresh  # noqa: E402
+
+# (비율, 평균 변경 간격 일수): 대부분 거의 바뀌지 않고 일부가 매월 현원이 바뀜
+RATE_MIX = ((0.7, 365.0), (0.2, 90.0), (0.1, 30.0))
+
+
+def true_rates(scale: int, rng: np.random.Generator) -> np.ndarray:
+    groups = rng.choice(len(RATE_MIX), size=scale, p=[share for share, _ in RATE_MIX])
+    return np.array([1.0 / RATE_MIX[g][1] for g in groups])
+
+
+def simulate(policy: str, rates: np.ndarray, budget: int, days: int, history_days: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    scale = len(rates)
+    stale = np.zeros(scale, dtype=bool)
+    last_crawled = np.zeros(scale)
+    changes = rng.poisson(rates * history_days).astype(np.int64)
+    cursor = 0
+    requests = found = 0
+    freshness = []
+
+    for day in range(1, days + 1):
+        stale |= rng.random(scale) < -np.expm1(-rates)
+
+        if policy == 'full':
+            selected = np.arange(scale)
+        elif policy == 'uniform':
+            selected = (cursor + np.arange(min(budget, scale))) % scale
+            cursor = (cursor + len(selected)) % scale
+        else:
+            rows = [
+                {'id': i, 'institution_code': i, 'changes': int(changes[i]),
+                 'observed_days': history_days + day, 'age_days': day - last_crawled[i]}
+                for i in range(scale)
+            ]
+            plan = plan_refresh(rows, budget)
+            selected = np.array([row['id'] for row in plan['work']], dtype=np.int64)
+
+        if len(selected):
+            detected = stale[selected]
+            changes[selected] += detected
+            found += int(detected.sum())
+            stale[selected] = False
+            last_crawled[selected] = day
+            requests += len(selected)
+        freshness.append(1.0 - stale.mean())
+
+    return {
+        'policy': policy,
+        'requests': requests,
+        'freshness': round(float(np.mean(freshness)), 4),
+        'changes_found': found,
+        'requests_per_change': round(requests / found, 2) if found else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CareMap refresh scheduling simulation')
+    parser.add_argument('--scale', type=int, default=20000, help='기관 수')
+    parser.add_argument('--budget', type=int, default=1000, help='회차(하루)당 요청 수')
+    parser.add_argument('--days', type=int, default=90, help='시뮬레이션 일수')
+    parser.add_argument('--history-days', type=int, default=180, help='시작 시점까지 쌓인 변경 이력 일수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    rates = true_rates(args.scale, np.random.default_rng(args.seed))
+    results = [
+        simulate(policy, rates, args.budget, args.days, args.history_days, args.seed + 1)
+        for policy in ('uniform', 'adaptive', 'full')
+    ]
+
+    print(f"{args.scale:,} institutions, budget {args.budget:,}/day, {args.days} days")
+    print(f"{'policy':<10}{'requests':>12}{'freshness':>11}{'changes':>10}{'req/change':>12}")
+    for r in results:
+        print(f"{r['policy']:<10}{r['requests']:>12,}{r['freshness']:>11.1%}"
+              f"{r['changes_found']:>10,}{r['requests_per_change'] or 0:>12.2f}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'scale': args.scale,
+            'budget': args.budget,
+            'days': args.days,
+            'history_days': args.history_days,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"refresh-sim-{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Stub Servers - 외부 API 대신 사용하는 로컬 HTTP 스텁 서버
+
+GeocodeStub: Kakao 주소 검색 API 응답 형식을 흉내 냅니다.
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class _GeocodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query).get('query', [''])[0]
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        # 주소 해시로 결정적인 좌표 생성
+        digest = hashlib.md5(query.encode('utf-8')).digest()
+        lat = 33.0 + digest[0] / 255 * 5.5
+        lng = 126.0 + digest[1] / 255 * 3.5
+        body = json.dumps({
+            'meta': {'total_count': 1},
+            'documents': [{'address_name': query, 'y': f"{lat:.8f}", 'x': f"{lng:.8f}"}],
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.hits += 1
+
+
+class GeocodeStub:
+    """
+    Kakao 주소 검색 API 스텁 서버
+
+    사용법:
+        with GeocodeStub(latency=0.001) as stub:
+            os.environ['KAKAO_GEOCODE_URL'] = stub.url
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _GeocodeHandler)
+        self.server.daemon_threads = True
+        self.server.latency = latency
+        self.server.hits = 0
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/v2/local/search/address.json"
+
+    @property
+    def hits(self) -> int:
+        return self.server.hits
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
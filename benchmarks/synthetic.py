@@ -0,0 +1,203 @@
+"""
+Synthetic Data - 벤치마크용 가상 장기요양기관 데이터 생성
+
+같은 seed 면 항상 같은 데이터를 생성하므로 버전 간 결과 비교에 사용할 수 있습니다.
+
+- generate_institutions: 크롤러 레코드 형식
+  {'code', 'name', 'type', 'capacity', 'current', 'address', 'hours', 'lat', 'lng'}
+- generate_history: institution_history 행 (월 단위, 변경이 있었던 달만)
+- generate_region_boundaries: 격자 모양 가상 행정구역 경계 (GeoJSON FeatureCollection)
+"""
+import math
+import random
+from datetime import date
+
+# 시/도 → (대표 좌표, 시/군/구 목록)
+REGIONS = {
+    '서울특별시': ((37.5665, 126.9780), [
+        '강남구', '강동구', '강북구', '강서구', '관악구', '광진구', '구로구', '노원구',
+        '마포구', '서초구', '성북구', '송파구', '양천구', '영등포구', '은평구', '중랑구',
+    ]),
+    '부산광역시': ((35.1796, 129.0756), ['해운대구', '부산진구', '동래구', '남구', '사하구', '북구']),
+    '대구광역시': ((35.8714, 128.6014), ['수성구', '달서구', '북구', '동구']),
+    '인천광역시': ((37.4563, 126.7052), ['남동구', '부평구', '연수구', '서구', '계양구']),
+    '광주광역시': ((35.1595, 126.8526), ['북구', '광산구', '서구']),
+    '대전광역시': ((36.3504, 127.3845), ['유성구', '서구', '중구', '대덕구']),
+    '울산광역시': ((35.5384, 129.3114), ['남구', '중구', '울주군']),
+    '세종특별자치시': ((36.4800, 127.2890), ['']),
+    '경기도': ((37.4138, 127.5183), [
+        '수원시 영통구', '성남시 분당구', '용인시 수지구', '고양시 일산동구', '부천시',
+        '안산시 단원구', '화성시', '남양주시', '평택시', '의정부시', '파주시', '김포시',
+    ]),
+    '강원특별자치도': ((37.8228, 128.1555), ['춘천시', '원주시', '강릉시', '홍천군']),
+    '충청북도': ((36.6357, 127.4917), ['청주시 흥덕구', '충주시', '제천시']),
+    '충청남도': ((36.5184, 126.8000), ['천안시 서북구', '아산시', '공주시', '논산시']),
+    '전북특별자치도': ((35.8203, 127.1088), ['전주시 완산구', '익산시', '군산시']),
+    '전라남도': ((34.8161, 126.4629), ['목포시', '여수시', '순천시', '나주시']),
+    '경상북도': ((36.4919, 128.8889), ['포항시 북구', '구미시', '경산시', '안동시']),
+    '경상남도': ((35.4606, 128.2132), ['창원시 성산구', '김해시', '진주시', '양산시']),
+    '제주특별자치도': ((33.4890, 126.4983), ['제주시', '서귀포시']),
+}
+# 인구 비율을 대략 반영한 시/도 가중치
+REGION_WEIGHTS = [19, 6, 5, 6, 3, 3, 2, 1, 26, 3, 3, 4, 3, 3, 5, 6, 2]
+
+ROAD_NAMES = [
+    '중앙로', '대학로', '시청로', '역전로', '문화로', '평화로', '희망로', '한마음로',
+    '새마을로', '공원로', '행복로', '푸른길', '은행나무길', '산업로', '번영로', '충효로',
+]
+
+NAME_PREFIXES = [
+    '행복', '사랑', '평화', '온누리', '효도', '햇살', '늘푸른', '은빛', '하늘', '소망',
+    '새봄', '한빛', '다솜', '미소', '청춘', '푸른솔', '참좋은', '든든', '해맑은', '정다운',
+]
+NAME_SUFFIXES = ['요양원', '실버센터', '재가복지센터', '주야간보호센터', '방문요양센터', '요양센터']
+
+# 급여종류 → (정원 후보, 운영시간)
+SERVICE_TYPES = {
+    '노인요양시설': ([29, 30, 49, 50, 70, 100, 150], '24시간'),
+    '노인요양공동생활가정': ([5, 9], '24시간'),
+    '주야간보호': ([20, 25, 30, 40, 50], '08:00-20:00'),
+    '단기보호': ([9, 10, 15, 20], '24시간'),
+    '방문요양': ([30, 50, 80, 100, 150], '09:00-18:00'),
+    '방문목욕': ([10, 20, 30], '09:00-18:00'),
+    '방문간호': ([10, 20], '09:00-18:00'),
+}
+SERVICE_WEIGHTS = [15, 8, 20, 3, 40, 9, 5]
+
+
+def generate_institutions(n: int, seed: int = 0) -> list:
+    """
+    가상 기관 데이터 생성
+
+    Args:
+        n: 기관 수
+        seed: 난수 seed
+
+    Returns:
+        크롤러 레코드 형식 딕셔너리 리스트
+    """
+    rng = random.Random(seed)
+    regions = list(REGIONS)
+    service_types = list(SERVICE_TYPES)
+    institutions = []
+
+    for i in range(n):
+        sido = rng.choices(regions, REGION_WEIGHTS)[0]
+        (base_lat, base_lng), sigungu_list = REGIONS[sido]
+        sigungu = rng.choice(sigungu_list)
+        road = rng.choice(ROAD_NAMES)
+        address = ' '.join(part for part in (
+            sido, sigungu, f"{road} {rng.randint(1, 999)}"
+        ) if part)
+        if rng.random() < 0.2:
+            address += f", {rng.randint(2, 8)}층"
+
+        service_type = rng.choices(service_types, SERVICE_WEIGHTS)[0]
+        capacities, hours = SERVICE_TYPES[service_type]
+        capacity = rng.choice(capacities)
+
+        institutions.append({
+            'code': f"{rng.randint(1, 5)}{i:010d}",
+            'name': f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)}",
+            'type': service_type,
+            'capacity': capacity,
+            'current': rng.randint(int(capacity * 0.4), capacity),
+            'address': address,
+            'hours': hours,
+            'lat': round(base_lat + rng.uniform(-0.15, 0.15), 8),
+            'lng': round(base_lng + rng.uniform(-0.15, 0.15), 8),
+        })
+
+    return institutions
+
+
+def generate_history(institutions: list, years: int = 3, seed: int = 0, today: date = None):
+    """
+    가상 변경 이력 생성
+
+    대부분의 기관은 드물게, 일부 기관은 매달 현원이 바뀝니다.
+
+    Args:
+        institutions: generate_institutions 결과
+        years: 이력 기간 (년)
+        seed: 난수 seed
+        today: 기준일 (기본: 오늘)
+
+    Yields:
+        (기관 인덱스, recorded_date, name, address, capacity, current_headcount)
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    months = years * 12
+
+    for index, inst in enumerate(institutions):
+        change_rate = 0.8 if rng.random() < 0.15 else 0.05
+        current = inst['current']
+        for offset in range(months, 0, -1):
+            if rng.random() >= change_rate:
+                continue
+            month_index = today.year * 12 + today.month - 1 - offset
+            recorded = date(month_index // 12, month_index % 12 + 1, 1)
+            current = max(0, min(inst['capacity'], current + rng.randint(-3, 3)))
+            yield (index, recorded, inst['name'], inst['address'], inst['capacity'], current)
+
+
+def mutate(institutions: list, ratio: float = 0.1, seed: int = 1) -> list:
+    """
+    일부 기관의 현원을 바꾼 복사본 생성 (재동기화 벤치마크용)
+
+    Args:
+        institutions: generate_institutions 결과
+        ratio: 변경할 기관 비율
+        seed: 난수 seed
+    """
+    rng = random.Random(seed)
+    mutated = []
+    for inst in institutions:
+        inst = dict(inst)
+        if rng.random() < ratio:
+            inst['current'] = max(0, min(inst['capacity'], inst['current'] + rng.choice((-2, -1, 1, 2))))
+        mutated.append(inst)
+    return mutated
+
+
+def generate_region_boundaries(rows: int = 16, cols: int = 16, points_per_side: int = 200) -> dict:
+    """
+    가상 행정구역 경계 생성 (국토 범위를 rows x cols 격자로 나누고 경계선을 구불구불하게)
+
+    이웃한 구역은 같은 경계선을 공유하므로 (모서리 근처 제외) 구역끼리 겹치지 않습니다.
+
+    Args:
+        rows, cols: 격자 크기 (시/도 코드는 행마다 11부터 증가)
+        points_per_side: 변마다 정점 수 (실제 해안선/경계의 정점 수를 흉내)
+
+    Returns:
+        GeoJSON FeatureCollection (properties: SIG_CD, SIG_KOR_NM)
+    """
+    min_lat, max_lat, min_lng, max_lng = 33.0, 38.7, 124.5, 131.0
+    lat_step, lng_step = (max_lat - min_lat) / rows, (max_lng - min_lng) / cols
+    amplitude = min(lat_step, lng_step) * 0.1
+
+    def horizontal(y, x0, x1):
+        xs = [x0 + (x1 - x0) * k / points_per_side for k in range(points_per_side + 1)]
+        return [[x, y + amplitude * math.sin(x * 40 + y)] for x in xs]
+
+    def vertical(x, y0, y1):
+        ys = [y0 + (y1 - y0) * k / points_per_side for k in range(points_per_side + 1)]
+        return [[x + amplitude * math.sin(y * 40 + x), y] for y in ys]
+
+    features = []
+    for i in range(rows):
+        for j in range(cols):
+            y0, y1 = min_lat + i * lat_step, min_lat + (i + 1) * lat_step
+            x0, x1 = min_lng + j * lng_step, min_lng + (j + 1) * lng_step
+            ring = (horizontal(y0, x0, x1) + vertical(x1, y0, y1)
+                    + horizontal(y1, x0, x1)[::-1] + vertical(x0, y0, y1)[::-1])
+            ring.append(ring[0])
+            code = (11 + i) * 1000 + (j + 1) * 10
+            features.append({
+                'type': 'Feature',
+                'properties': {'SIG_CD': str(code), 'SIG_KOR_NM': f'가상구역 {i}-{j}'},
+                'geometry': {'type': 'Polygon', 'coordinates': [ring]},
+            })
+    return {'type': 'FeatureCollection', 'features': features}
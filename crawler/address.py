@@ -0,0 +1,150 @@
+"""
+Address Normalizer - 주소 표기 정규화
+
+같은 주소가 "서울특별시"/"서울", "123번지"/"123", 띄어쓰기, 건물명/층 표기 등으로
+다르게 들어오므로 Geocoding 캐시와 중복 기관 탐지에 쓸 표준 키를 만듭니다.
+
+    서울 강남구 테헤란로123, 3층 (역삼동, 행복빌딩)  → 서울특별시 강남구 테헤란로 123
+    경기 수원시 영통구 매탄동 12-03번지               → 경기도 수원시 영통구 매탄동 12-3
+    경기도 고양시 일산동구 중앙로 1275번길 38         → 경기도 고양시 일산동구 중앙로1275번길 38
+
+표준 키는 시/도, 시/군/구, 도로명(또는 읍/면/동/리), 건물번호(또는 지번)까지만 포함하고
+괄호 안 참고항목, 쉼표 뒤 상세주소, 번호 뒤 건물명/층은 상세(detail)로 분리합니다.
+"""
+import re
+import unicodedata
+
+# 시/도 약칭 → 공식 명칭 (개편 전 명칭 포함)
+SIDO_ALIASES = {}
+for _official, _aliases in {
+    '서울특별시': ('서울', '서울시'),
+    '부산광역시': ('부산', '부산시'),
+    '대구광역시': ('대구', '대구시'),
+    '인천광역시': ('인천', '인천시'),
+    '광주광역시': ('광주', '광주시'),
+    '대전광역시': ('대전', '대전시'),
+    '울산광역시': ('울산', '울산시'),
+    '세종특별자치시': ('세종', '세종시'),
+    '경기도': ('경기',),
+    '강원특별자치도': ('강원', '강원도'),
+    '충청북도': ('충북',),
+    '충청남도': ('충남',),
+    '전북특별자치도': ('전북', '전라북도'),
+    '전라남도': ('전남',),
+    '경상북도': ('경북',),
+    '경상남도': ('경남',),
+    '제주특별자치도': ('제주', '제주도'),
+}.items():
+    SIDO_ALIASES[_official] = _official
+    for _alias in _aliases:
+        SIDO_ALIASES[_alias] = _official
+
+# 도로명 (+ 붙여 쓴 건물번호): 테헤란로, 테헤란로123, 중앙로12번길, 세종대로23길 4
+ROAD_PATTERN = re.compile(r'^(?P<road>[가-힣A-Za-z\d.·]+?(?:로|길))(?P<number>\d+(?:-\d+)?)?$')
+# 도로명 뒤에 띄어 쓴 N번길/N길 (+ 붙여 쓴 건물번호): 중앙로 1275번길 38, 세종대로 23길4
+BRANCH_ROAD_PATTERN = re.compile(r'^(?P<road>\d+(?:번길|길))(?P<number>\d+(?:-\d+)?)?$')
+# 읍/면/동/리/가 (지번 주소)
+LOCALITY_PATTERN = re.compile(r'^[가-힣\d.·]+(?:읍|면|동|리|가)$')
+# 건물번호/지번: 123, 123-4, 산12, 123번지, 123-4번
+NUMBER_PATTERN = re.compile(r'^(?P<mountain>산)?(?P<main>\d+)(?:-(?P<sub>\d+))?(?:번지|번)?$')
+SIGUNGU_SUFFIXES = ('시', '군', '구')
+DASHES = re.compile(r'[‐-―−－]')
+PARENTHESES = re.compile(r'\(([^)]*)\)')
+
+
+def _normalize_number(match) -> str:
+    number = str(int(match.group('main')))
+    sub = match.group('sub')
+    if sub and int(sub):
+        number += f"-{int(sub)}"
+    return ('산' if match.group('mountain') else '') + number
+
+
+def parse_address(address: str) -> dict:
+    """
+    주소 분해
+
+    Args:
+        address: 주소 문자열
+
+    Returns:
+        {'sido', 'sigungu', 'locality', 'number', 'detail', 'key'}
+        (도로명/지번과 번호를 찾지 못하면 locality, number 는 None 이고
+         key 는 괄호와 쉼표 뒤를 제외한 공백 정규화 주소)
+    """
+    text = unicodedata.normalize('NFKC', address or '')
+    text = DASHES.sub('-', text)
+    extras = [part.strip() for part in PARENTHESES.findall(text) if part.strip()]
+    text = PARENTHESES.sub(' ', text)
+    main, _, detail = text.partition(',')
+    # "123 - 4", "123 번지" 처럼 띄어 쓴 번호를 붙임
+    main = re.sub(r'(\d)\s*-\s*(\d)', r'\1-\2', main)
+    main = re.sub(r'(\d)\s+(번지|번)(?=\s|$)', r'\1\2', main)
+    main = re.sub(r'(^|\s)산\s+(\d)', r'\1산\2', main)
+    tokens = main.split()
+
+    result = {'sido': None, 'sigungu': None, 'locality': None, 'number': None, 'detail': None}
+    i = 0
+    if tokens and tokens[0] in SIDO_ALIASES:
+        result['sido'] = SIDO_ALIASES[tokens[0]]
+        i = 1
+
+    sigungu = []
+    while (i < len(tokens) and len(sigungu) < 2 and tokens[i].endswith(SIGUNGU_SUFFIXES)
+           and not ROAD_PATTERN.match(tokens[i])):
+        sigungu.append(tokens[i])
+        i += 1
+    result['sigungu'] = ' '.join(sigungu) or None
+
+    locality = []
+    while i < len(tokens):
+        token = tokens[i]
+        road = ROAD_PATTERN.match(token)
+        if road:
+            name, number = road.group('road'), road.group('number')
+            i += 1
+            branch = BRANCH_ROAD_PATTERN.match(tokens[i]) if not number and i < len(tokens) else None
+            if branch:
+                name, number = name + branch.group('road'), branch.group('number')
+                i += 1
+            # 도로명이 나오면 앞의 읍/면/동은 참고항목
+            locality = [name]
+            if number:
+                result['number'] = _normalize_number(NUMBER_PATTERN.match(number))
+                break
+        elif LOCALITY_PATTERN.match(token):
+            locality.append(token)
+            i += 1
+        elif locality and NUMBER_PATTERN.match(token):
+            result['number'] = _normalize_number(NUMBER_PATTERN.match(token))
+            i += 1
+            break
+        else:
+            break
+    if tokens[i:i + 1] == ['번지']:
+        i += 1
+
+    detail_parts = tokens[i:] + ([detail.strip()] if detail.strip() else []) + extras
+    result['detail'] = ' '.join(' '.join(detail_parts).split()) or None
+
+    if locality and result['number']:
+        result['locality'] = ' '.join(locality)
+        parts = (result['sido'], result['sigungu'], result['locality'], result['number'])
+        result['key'] = ' '.join(part for part in parts if part)
+    else:
+        parts = [result['sido'], *tokens[1 if result['sido'] else 0:]]
+        result['key'] = ' '.join(part for part in parts if part)
+    return result
+
+
+def normalize_address(address: str) -> str:
+    """
+    주소 표준 키 (Geocoding 캐시 키, 중복 탐지용)
+
+    Args:
+        address: 주소 문자열
+
+    Returns:
+        표준 키 문자열 (빈 주소면 '')
+    """
+    return parse_address(address)['key']
@@ -0,0 +1,146 @@
+"""
+Bulk Import - 공공 포털 기관 목록 파일(CSV/Excel) 일괄 적재
+
+파일을 한 행씩 스트리밍으로 읽어 sync_institutions 와 같은 딕셔너리로 변환합니다.
+전체 파일을 메모리에 올리지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+import csv
+import logging
+import os
+
+from openpyxl import load_workbook
+
+from page_parser import parse_int
+
+logger = logging.getLogger(__name__)
+
+# 파일 열 이름 → 레코드 키 (포털/연도별 표기 차이 포함)
+COLUMN_ALIASES = {
+    'code': ('장기요양기관기호', '기관기호', '기관코드', '요양기관기호'),
+    'name': ('장기요양기관명', '기관명', '요양기관명'),
+    'type': ('급여종류', '서비스종류', '기관유형'),
+    'capacity': ('정원', '정원수', '입소정원'),
+    'current': ('현원', '현원수', '입소현원'),
+    'address': ('도로명주소', '소재지주소', '주소', '기관주소'),
+    'hours': ('운영시간',),
+}
+INT_FIELDS = ('capacity', 'current')
+CSV_ENCODINGS = ('utf-8-sig', 'cp949')
+
+
+def resolve_columns(header: list) -> dict:
+    """
+    헤더 행에서 레코드 키별 열 위치 결정
+
+    Args:
+        header: 헤더 셀 값 리스트
+
+    Returns:
+        {레코드 키: 열 인덱스}
+    """
+    labels = [str(cell).strip() if cell is not None else '' for cell in header]
+    columns = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in labels:
+                columns[key] = labels.index(alias)
+                break
+
+    missing = {'code', 'name'} - columns.keys()
+    if missing:
+        raise ValueError(f"Required columns not found in header: {sorted(missing)}")
+    return columns
+
+
+def map_row(row, columns: dict) -> dict:
+    """행 값 → 기관 데이터 딕셔너리"""
+    record = {}
+    for key, index in columns.items():
+        value = row[index] if index < len(row) else None
+        if isinstance(value, str):
+            value = value.strip() or None
+        if key in INT_FIELDS and value is not None and not isinstance(value, int):
+            value = parse_int(str(value))
+        elif key == 'code' and value is not None:
+            value = str(value)
+        record[key] = value
+    return record
+
+
+def _detect_encoding(path: str) -> str:
+    """CSV 인코딩 판별 (UTF-8 → CP949 순으로 앞부분 디코딩 시도)"""
+    with open(path, 'rb') as f:
+        head = f.read(64 * 1024)
+    for encoding in CSV_ENCODINGS:
+        try:
+            head.decode(encoding)
+            return encoding
+        except UnicodeDecodeError as e:
+            # 버퍼 끝에서 잘린 멀티바이트 문자는 무시
+            if e.start >= len(head) - 4:
+                return encoding
+    return CSV_ENCODINGS[-1]
+
+
+def iter_csv_rows(path: str):
+    """CSV 파일 행 스트리밍 (첫 행은 헤더)"""
+    with open(path, newline='', encoding=_detect_encoding(path)) as f:
+        yield from csv.reader(f)
+
+
+def iter_excel_rows(path: str):
+    """Excel(.xlsx) 첫 시트 행 스트리밍 (read-only 모드, 첫 행은 헤더)"""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_records(path: str):
+    """
+    기관 목록 파일을 기관 데이터 딕셔너리로 스트리밍
+
+    Args:
+        path: .csv 또는 .xlsx 파일 경로
+
+    Yields:
+        {'code', 'name', 'type', 'capacity', 'current', 'address', 'hours'} 딕셔너리
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        rows = iter_csv_rows(path)
+    elif extension in ('.xlsx', '.xlsm'):
+        rows = iter_excel_rows(path)
+    else:
+        raise ValueError(f"Unsupported file type: {extension}")
+
+    header = next(rows, None)
+    if header is None:
+        logger.warning(f"Empty import file: {path}")
+        return
+    columns = resolve_columns(header)
+
+    for row in rows:
+        if not any(cell not in (None, '') for cell in row):
+            continue
+        yield map_row(row, columns)
+
+
+def import_file(db, path: str, batch_size: int, shadow: bool = False) -> dict:
+    """
+    기관 목록 파일을 배치 단위로 데이터베이스에 적재
+
+    Args:
+        db: 연결된 DatabaseManager (begin_run 호출 후)
+        path: .csv 또는 .xlsx 파일 경로
+        batch_size: 배치 크기
+        shadow: True 이면 그림자 테이블에 적재 후 교체 (sync_institutions_shadow, 전체 목록 파일)
+
+    Returns:
+        {'success': int, 'failed': int, 'total': int}
+    """
+    logger.info(f"Importing institutions from {path}")
+    if shadow:
+        return db.sync_institutions_shadow(iter_records(path), batch_size=batch_size)
+    return db.sync_institutions_batched(iter_records(path), batch_size=batch_size)
@@ -0,0 +1,141 @@
+"""
+Columnar Store - 백엔드 워커가 mmap 으로 공유하는 기관 바이너리 스냅샷
+
+좌표, 정원/현원은 고정 폭 배열로, 문자열(기관명, 주소, 급여종류)은 중복을 제거한
+문자열 테이블의 번호로 저장합니다. 백엔드(backend/institutions/store.py)는 파일을
+읽기 전용 mmap 으로 열어 배열을 그대로 사용하므로, 워커 수가 늘어도 페이지 캐시를 공유합니다.
+
+파일 형식 (little-endian, 각 구역은 8바이트 정렬):
+    헤더  '<8sIiII10Q'
+          magic(b'CMAPCOL1'), 기관 수, 크롤링 회차(-1: 없음), 문자열 수, 예약(0),
+          구역 오프셋 10개 (SECTIONS 순서)
+    latitude, longitude       float64[n]   (위도 오름차순 정렬)
+    id, capacity, current     int32[n]     (NULL 은 -1)
+    service_type, name, address  uint32[n] (문자열 번호)
+    string_offsets            uint32[m+1]  (UTF-8 blob 내 시작 위치)
+    string_blob               bytes
+
+좌표가 없는 기관과 폐업 기관은 포함하지 않습니다.
+파일은 임시 파일 작성 후 os.replace 로 교체하므로, 이미 mmap 한 워커는 이전 파일을 계속 읽습니다.
+"""
+import logging
+import os
+import struct
+import sys
+from array import array
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'CMAPCOL1'
+HEADER = struct.Struct('<8sIiII10Q')
+SECTIONS = (
+    'latitude', 'longitude', 'id', 'capacity', 'current',
+    'service_type', 'name', 'address', 'string_offsets', 'string_blob',
+)
+TYPECODES = {
+    'latitude': 'd', 'longitude': 'd',
+    'id': 'i', 'capacity': 'i', 'current': 'i',
+    'service_type': 'I', 'name': 'I', 'address': 'I', 'string_offsets': 'I',
+}
+
+
+class StringTable:
+    """문자열 → 번호 (중복 제거)"""
+
+    def __init__(self):
+        self.index = {}
+        self.offsets = array('I', [0])
+        self.blob = bytearray()
+
+    def intern(self, value: str) -> int:
+        value = value or ''
+        number = self.index.get(value)
+        if number is None:
+            number = self.index[value] = len(self.index)
+            self.blob += value.encode('utf-8')
+            self.offsets.append(len(self.blob))
+        return number
+
+
+def build_columns(rows: list) -> tuple:
+    """
+    운영 중 기관 목록 → (열 배열 dict, 문자열 테이블)
+
+    Args:
+        rows: id, name, service_type, address, capacity, current_headcount, latitude, longitude
+
+    Returns:
+        tuple: ({열 이름: array}, StringTable)
+    """
+    located = sorted(
+        (row for row in rows if row['latitude'] is not None and row['longitude'] is not None),
+        key=lambda row: float(row['latitude'])
+    )
+    strings = StringTable()
+    columns = {name: array(code) for name, code in TYPECODES.items() if name != 'string_offsets'}
+
+    for row in located:
+        columns['latitude'].append(float(row['latitude']))
+        columns['longitude'].append(float(row['longitude']))
+        columns['id'].append(row['id'])
+        columns['capacity'].append(row['capacity'] if row['capacity'] is not None else -1)
+        columns['current'].append(
+            row['current_headcount'] if row['current_headcount'] is not None else -1
+        )
+        columns['service_type'].append(strings.intern(row['service_type']))
+        columns['name'].append(strings.intern(row['name']))
+        columns['address'].append(strings.intern(row['address']))
+    return columns, strings
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def write_columnar_store(rows: list, path: str, generation: int = None) -> dict:
+    """
+    기관 바이너리 스냅샷 작성 (원자적 교체)
+
+    Args:
+        rows: 운영 중 기관 목록
+        path: 저장 경로
+        generation: 크롤링 회차
+
+    Returns:
+        dict: {'count': 기관 수, 'strings': 문자열 수, 'bytes': 파일 크기}
+    """
+    columns, strings = build_columns(rows)
+    count = len(columns['id'])
+    sections = dict(columns, string_offsets=strings.offsets, string_blob=bytes(strings.blob))
+
+    offsets = []
+    position = _align(HEADER.size)
+    for name in SECTIONS:
+        offsets.append(position)
+        data = sections[name]
+        position = _align(position + (len(data) * data.itemsize if isinstance(data, array) else len(data)))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, count, generation if generation is not None else -1, len(strings.index), 0, *offsets
+        ))
+        for name, offset in zip(SECTIONS, offsets):
+            f.write(b'\0' * (offset - f.tell()))
+            data = sections[name]
+            if isinstance(data, array) and sys.byteorder == 'big':
+                data = array(data.typecode, data)
+                data.byteswap()
+            f.write(data.tobytes() if isinstance(data, array) else data)
+        f.write(b'\0' * (position - f.tell()))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    logger.info(
+        f"Columnar store written to {path}: {count} institutions, "
+        f"{len(strings.index)} strings, {position:,} bytes"
+    )
+    return {'count': count, 'strings': len(strings.index), 'bytes': position}
@@ -18,15 +18,103 @@ DB_CONFIG = {
 
 # Kakao API
 KAKAO_REST_API_KEY = os.getenv('KAKAO_REST_API_KEY', '')
+KAKAO_GEOCODE_URL = os.getenv(
+    'KAKAO_GEOCODE_URL',
+    'https://dapi.kakao.com/v2/local/search/address.json'
+)
+# 일일 Geocoding 호출 예산 (geocode_quota 테이블에 날짜별 사용량 기록, 0 이면 무제한)
+GEOCODE_DAILY_QUOTA = int(os.getenv('GEOCODE_DAILY_QUOTA', '100000'))
+GEOCODE_QUOTA_TIMEZONE = os.getenv('GEOCODE_QUOTA_TIMEZONE', 'Asia/Seoul')  # 쿼터 초기화 기준 시간대
+GEOCODE_QUOTA_CHUNK = int(os.getenv('GEOCODE_QUOTA_CHUNK', '50'))  # 한 번에 예약할 호출 수
+# 실패 주소 재시도 (geocode_failures: 재시도 대기 시간, 시도마다 2배, 넘으면 포기)
+GEOCODE_RETRY_BACKOFF_HOURS = float(os.getenv('GEOCODE_RETRY_BACKOFF_HOURS', '6'))
+GEOCODE_MAX_ATTEMPTS = int(os.getenv('GEOCODE_MAX_ATTEMPTS', '5'))
 
 # Crawling Settings
 CRAWL_TARGET_URL = os.getenv(
     'CRAWL_TARGET_URL',
     'https://www.longtermcare.or.kr/npbs/index.jsp'
 )
+# 기관 상세 페이지 (ltcAdminSym=기관기호)
+CRAWL_DETAIL_URL = os.getenv(
+    'CRAWL_DETAIL_URL',
+    'https://www.longtermcare.or.kr/npbs/r/a/201/selectLtcoSrchDetail.web'
+)
 REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
 RETRY_LIMIT = int(os.getenv('RETRY_LIMIT', '3'))
 
-# Logging
-LOG_FILE = 'logs/crawler.log'
-LOG_LEVEL = 'INFO'
+# HTTP Fetch Layer
+FETCH_CACHE_DIR = os.getenv('FETCH_CACHE_DIR', 'cache/http')
+FETCH_MAX_PER_HOST = int(os.getenv('FETCH_MAX_PER_HOST', '4'))
+
+# Logging (logsetup.py: 큐 기반 비동기 로깅)
+LOG_FILE = os.getenv('LOG_FILE', 'logs/crawler.log')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')  # 모듈별 레벨 (예: geocoding=DEBUG,fetcher=WARNING)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')  # 로그 파일 형식: json (JSON lines) / text
+LOG_CONSOLE_FORMAT = os.getenv('LOG_CONSOLE_FORMAT', 'text')  # 콘솔 형식 (백엔드 작업 실행기는 json)
+LOG_PROGRESS_SECONDS = float(os.getenv('LOG_PROGRESS_SECONDS', '10'))  # 진행 상황 요약 간격
+
+# Run Report (실행 리포트 디렉토리, Prometheus textfile collector 파일 경로)
+REPORT_DIR = os.getenv('REPORT_DIR', 'reports')
+METRICS_TEXTFILE = os.getenv('METRICS_TEXTFILE', '')
+
+# Bulk Import (CSV/Excel 일괄 적재 배치 크기)
+BULK_BATCH_SIZE = int(os.getenv('BULK_BATCH_SIZE', '1000'))
+
+# Full Refresh (--full-refresh: 그림자 테이블에 적재 후 이름 교체)
+# 교체 트랜잭션의 잠금 대기 한도 (넘으면 롤백 후 재시도, 백엔드 조회가 잠금 뒤에 줄 서지 않도록)
+SHADOW_LOCK_TIMEOUT_MS = int(os.getenv('SHADOW_LOCK_TIMEOUT_MS', '2000'))
+SHADOW_SWAP_RETRIES = int(os.getenv('SHADOW_SWAP_RETRIES', '5'))
+
+# Reconciliation (폐업 기관 감지)
+# 한 번의 실행에서 폐업 처리할 수 있는 운영 중 기관 비율 상한.
+# 이 비율을 넘으면 부분 크롤링으로 간주하고 폐업 처리를 건너뜁니다.
+CLOSE_SAFETY_RATIO = float(os.getenv('CLOSE_SAFETY_RATIO', '0.05'))
+
+# Region Assignment (행정구역 경계 GeoJSON, 파일이 없으면 단계 생략)
+REGION_BOUNDARY_FILE = os.getenv('REGION_BOUNDARY_FILE', 'data/regions.geojson')
+REGION_CODE_PROPERTY = os.getenv('REGION_CODE_PROPERTY', 'SIG_CD')
+REGION_NAME_PROPERTY = os.getenv('REGION_NAME_PROPERTY', 'SIG_KOR_NM')
+
+# Refresh Scheduling (--refresh: 변경 이력 기반으로 일부 기관만 상세 페이지 재수집)
+REFRESH_BUDGET = int(os.getenv('REFRESH_BUDGET', '5000'))  # 회차당 상세 페이지 요청 수
+REFRESH_RUN_INTERVAL_DAYS = float(os.getenv('REFRESH_RUN_INTERVAL_DAYS', '1'))  # 회차 간격 (최소 주기)
+REFRESH_MAX_INTERVAL_DAYS = float(os.getenv('REFRESH_MAX_INTERVAL_DAYS', '90'))
+REFRESH_HISTORY_DAYS = int(os.getenv('REFRESH_HISTORY_DAYS', '365'))  # 변경 횟수를 셀 이력 기간
+# 이력이 없는 기관의 사전 변경률 (REFRESH_PRIOR_CHANGES 회 / REFRESH_PRIOR_DAYS 일)
+REFRESH_PRIOR_CHANGES = float(os.getenv('REFRESH_PRIOR_CHANGES', '1'))
+REFRESH_PRIOR_DAYS = float(os.getenv('REFRESH_PRIOR_DAYS', '180'))
+
+# Vacancy Forecast (변경 이력으로 기관별 향후 월별 예상 여석 계산, vacancy_forecasts 테이블)
+FORECAST_MONTHS = int(os.getenv('FORECAST_MONTHS', '6'))  # 예측 개월 수 (1~12)
+FORECAST_HISTORY_MONTHS = int(os.getenv('FORECAST_HISTORY_MONTHS', '36'))  # 사용할 이력 개월 수
+FORECAST_BACKTEST_MONTHS = int(os.getenv('FORECAST_BACKTEST_MONTHS', '6'))  # 모델 선택용 최근 개월 수
+FORECAST_TREND_MONTHS = int(os.getenv('FORECAST_TREND_MONTHS', '12'))  # 추세 기울기 계산 개월 수
+FORECAST_TREND_DAMPING = float(os.getenv('FORECAST_TREND_DAMPING', '0.9'))  # 추세 감쇠 (월마다 곱함)
+
+# Job Queue (worker.py: 여러 노드가 crawl_jobs 작업을 나눠 처리)
+JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '60'))  # heartbeat 없이 지나면 다른 워커가 회수
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '5'))  # 넘으면 dead
+JOB_BACKOFF_SECONDS = int(os.getenv('JOB_BACKOFF_SECONDS', '30'))  # 재시도 대기 (시도마다 2배)
+JOB_POLL_SECONDS = float(os.getenv('JOB_POLL_SECONDS', '2'))
+JOB_DETAIL_BATCH = int(os.getenv('JOB_DETAIL_BATCH', '50'))  # 상세 페이지 작업 1개당 기관 수
+JOB_GEOCODE_BATCH = int(os.getenv('JOB_GEOCODE_BATCH', '100'))  # Geocoding 작업 1개당 주소 수
+
+# Duplicate Detection (다른 기관 코드로 중복 등록된 기관, 기관명 유사도 기준 0~1)
+DEDUP_THRESHOLD = float(os.getenv('DEDUP_THRESHOLD', '0.85'))
+
+# Map Snapshot (동기화 후 지도 데이터셋 스냅샷 파일, 백엔드 MAP_SNAPSHOT_DIR 과 같은 경로)
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'snapshots')
+SNAPSHOT_KEEP = int(os.getenv('SNAPSHOT_KEEP', '3'))
+SNAPSHOT_BROTLI_QUALITY = int(os.getenv('SNAPSHOT_BROTLI_QUALITY', '11'))
+# 백엔드 워커가 mmap 으로 공유하는 기관 바이너리 스냅샷 (백엔드 INSTITUTION_STORE_PATH)
+COLUMNAR_STORE_PATH = os.getenv('COLUMNAR_STORE_PATH', 'snapshots/institutions.cmap')
+
+# Catchment Heatmap (전국 격자 공급/여석 밀도, 백엔드 HEATMAP_PATH 와 같은 파일)
+HEATMAP_PATH = os.getenv('HEATMAP_PATH', 'snapshots/heatmap.cgrid')
+HEATMAP_CELL_KM = float(os.getenv('HEATMAP_CELL_KM', '1.0'))
+HEATMAP_RADIUS_KM = float(os.getenv('HEATMAP_RADIUS_KM', '5.0'))
+HEATMAP_KERNEL = os.getenv('HEATMAP_KERNEL', 'linear')  # linear / uniform
+# 바뀐 기관 비율이 이 값을 넘으면 증분 대신 전체 계산
+HEATMAP_FULL_RATIO = float(os.getenv('HEATMAP_FULL_RATIO', '0.3'))
@@ -2,26 +2,44 @@
 Database Manager - PostgreSQL 연동
 """
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.errors
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from datetime import date
 import logging
-from config import DB_CONFIG
+import re
+import time
+from config import DB_CONFIG, CLOSE_SAFETY_RATIO, SHADOW_LOCK_TIMEOUT_MS, SHADOW_SWAP_RETRIES
+from logsetup import ProgressLog
 
 logger = logging.getLogger(__name__)
 
 
+class CountingCursor(RealDictCursor):
+    """실행한 SQL 수와 처리 행 수를 세는 커서 (실행 리포트용)"""
+
+    statements = 0
+    rows = 0
+
+    def execute(self, query, vars=None):
+        super().execute(query, vars)
+        self.statements += 1
+        if self.rowcount > 0:
+            self.rows += self.rowcount
+
+
 class DatabaseManager:
     """PostgreSQL 데이터베이스 관리 클래스"""
 
     def __init__(self):
         self.conn = None
         self.cursor = None
+        self.generation = None
 
     def connect(self):
         """데이터베이스 연결"""
         try:
             self.conn = psycopg2.connect(**DB_CONFIG)
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+            self.cursor = self.conn.cursor(cursor_factory=CountingCursor)
             logger.info("Database connected successfully")
             return True
         except psycopg2.Error as e:
@@ -52,10 +70,30 @@ class DatabaseManager:
                     operating_hours TEXT,
                     latitude DECIMAL(10, 8),
                     longitude DECIMAL(11, 8),
-                    last_updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                    last_updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    crawl_generation INT,
+                    closed_at TIMESTAMP WITH TIME ZONE,
+                    region_code INT,
+                    first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
+            # 기존 테이블에 reconciliation 컬럼 추가
+            self.cursor.execute("""
+                ALTER TABLE institutions
+                ADD COLUMN IF NOT EXISTS crawl_generation INT,
+                ADD COLUMN IF NOT EXISTS closed_at TIMESTAMP WITH TIME ZONE
+            """)
+            # 기존 테이블에 행정구역 코드 컬럼 추가 (regions.py 가 좌표로 계산)
+            self.cursor.execute("""
+                ALTER TABLE institutions ADD COLUMN IF NOT EXISTS region_code INT
+            """)
+            # 기존 테이블에 최초 수집 시각 추가 (재수집 주기 계산 시 변경률 관측 기간)
+            self.cursor.execute("""
+                ALTER TABLE institutions
+                ADD COLUMN IF NOT EXISTS first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+            """)
+
             # 인덱스 생성
             self.cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_institution_code
@@ -69,6 +107,65 @@ class DatabaseManager:
                 CREATE INDEX IF NOT EXISTS idx_service_type
                 ON institutions(service_type)
             """)
+            # 지도 조회용: 운영 중인 기관만 포함하는 부분 인덱스
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_open_location
+                ON institutions(latitude, longitude)
+                WHERE closed_at IS NULL
+            """)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_open_generation
+                ON institutions(crawl_generation)
+                WHERE closed_at IS NULL
+            """)
+            # 기관 목록 keyset 페이지네이션 정렬 키 (최종 업데이트 역순)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_open_updated
+                ON institutions(last_updated_at DESC, id DESC)
+                WHERE closed_at IS NULL
+            """)
+
+            # 지역 필터용: 행정구역 코드 정수 비교
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_open_region
+                ON institutions(region_code)
+                WHERE closed_at IS NULL
+            """)
+
+            # regions 테이블: 행정구역 코드 → 이름 (경계 파일에서 적재)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS regions (
+                    code INT PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL,
+                    sido_code INT NOT NULL
+                )
+            """)
+
+            # crawl_runs 테이블: 실행 회차(generation) 기록
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_runs (
+                    id SERIAL PRIMARY KEY,
+                    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    finished_at TIMESTAMP WITH TIME ZONE,
+                    status VARCHAR(20) NOT NULL DEFAULT 'running',
+                    seen_count INT,
+                    closed_count INT
+                )
+            """)
+            self.cursor.execute("""
+                ALTER TABLE crawl_runs ADD COLUMN IF NOT EXISTS report JSONB
+            """)
+
+            # crawl_run_stages 테이블: 회차별 단계 소요 시간 (추세 비교용)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_run_stages (
+                    run_id INT REFERENCES crawl_runs(id) ON DELETE CASCADE,
+                    stage VARCHAR(50) NOT NULL,
+                    seconds DOUBLE PRECISION NOT NULL,
+                    records INT,
+                    PRIMARY KEY (run_id, stage)
+                )
+            """)
 
             # institution_history 테이블
             self.cursor.execute("""
@@ -93,6 +190,119 @@ class DatabaseManager:
                 ON institution_history(recorded_date)
             """)
 
+            # refresh_schedule 테이블: 기관별 변경률/재수집 주기 (scheduler.py 가 회차마다 갱신)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS refresh_schedule (
+                    institution_id INT PRIMARY KEY REFERENCES institutions(id) ON DELETE CASCADE,
+                    change_rate DOUBLE PRECISION NOT NULL,
+                    interval_days DOUBLE PRECISION NOT NULL,
+                    priority DOUBLE PRECISION NOT NULL,
+                    next_due_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                    planned_generation INT
+                )
+            """)
+
+            # vacancy_forecasts 테이블: 기관별 향후 월별 예상 여석 (forecast.py 가 회차마다 교체)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS vacancy_forecasts (
+                    id BIGSERIAL PRIMARY KEY,
+                    institution_id INT NOT NULL REFERENCES institutions(id) ON DELETE CASCADE,
+                    forecast_month DATE NOT NULL,
+                    expected_vacancy DOUBLE PRECISION NOT NULL,
+                    model VARCHAR(20) NOT NULL,
+                    backtest_mae DOUBLE PRECISION,
+                    generation INT,
+                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (institution_id, forecast_month)
+                )
+            """)
+
+            # geocode_quota 테이블: 날짜별 Geocoding API 호출 수 (일일 쿼터 관리, 여러 프로세스 공유)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS geocode_quota (
+                    day DATE PRIMARY KEY,
+                    used INT NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # geocode_failures 테이블: Geocoding 실패 기관 dead-letter (사유, 재시도 시각)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS geocode_failures (
+                    institution_id INT PRIMARY KEY REFERENCES institutions(id) ON DELETE CASCADE,
+                    address TEXT NOT NULL,
+                    reason VARCHAR(30) NOT NULL,
+                    last_error TEXT,
+                    attempts INT NOT NULL DEFAULT 1,
+                    first_failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    last_failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    next_retry_at TIMESTAMP WITH TIME ZONE
+                )
+            """)
+            # 재시도 대상 조회 (포기한 기관은 next_retry_at 이 NULL)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_geocode_failures_retry
+                ON geocode_failures(next_retry_at)
+                WHERE next_retry_at IS NOT NULL
+            """)
+
+            # crawl_jobs 테이블: 여러 노드가 나눠 처리하는 크롤링/Geocoding 작업 큐 (jobqueue.py)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_jobs (
+                    id BIGSERIAL PRIMARY KEY,
+                    kind VARCHAR(20) NOT NULL,
+                    job_key VARCHAR(100),
+                    payload JSONB NOT NULL,
+                    generation INT,
+                    priority INT NOT NULL DEFAULT 0,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    attempts INT NOT NULL DEFAULT 0,
+                    max_attempts INT NOT NULL DEFAULT 5,
+                    run_after TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    locked_by VARCHAR(100),
+                    lease_expires_at TIMESTAMP WITH TIME ZONE,
+                    last_error TEXT,
+                    items INT,
+                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    started_at TIMESTAMP WITH TIME ZONE,
+                    finished_at TIMESTAMP WITH TIME ZONE
+                )
+            """)
+            # 대기 작업 조회 (우선순위, 등록 순)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_crawl_jobs_pending
+                ON crawl_jobs(priority DESC, id)
+                WHERE status = 'pending'
+            """)
+            # 임대 만료 작업 조회
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_crawl_jobs_lease
+                ON crawl_jobs(lease_expires_at)
+                WHERE status = 'running'
+            """)
+            # 같은 작업(kind, job_key)은 대기/처리 중에 한 번만 등록
+            self.cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_jobs_active_key
+                ON crawl_jobs(kind, job_key)
+                WHERE status IN ('pending', 'running')
+            """)
+
+            # crawl_workers 테이블: 워커별 heartbeat 와 처리량
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_workers (
+                    worker_id VARCHAR(100) PRIMARY KEY,
+                    hostname VARCHAR(255),
+                    pid INT,
+                    status VARCHAR(20) NOT NULL DEFAULT 'running',
+                    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    heartbeat_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    jobs_done INT NOT NULL DEFAULT 0,
+                    jobs_failed INT NOT NULL DEFAULT 0,
+                    items INT NOT NULL DEFAULT 0,
+                    busy_seconds DOUBLE PRECISION NOT NULL DEFAULT 0
+                )
+            """)
+
             self.conn.commit()
             logger.info("Tables created successfully")
             return True
@@ -147,15 +357,16 @@ class DatabaseManager:
                             existing['current_headcount']
                         )
                     )
-                    logger.info(f"History recorded for: {data['code']}")
+                    logger.debug("History recorded for: %s", data['code'])
 
             # UPSERT
             self.cursor.execute(
                 """
                 INSERT INTO institutions
                 (institution_code, name, service_type, capacity, current_headcount,
-                 address, operating_hours, latitude, longitude, last_updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                 address, operating_hours, latitude, longitude, last_updated_at,
+                 crawl_generation, closed_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s, NULL)
                 ON CONFLICT (institution_code)
                 DO UPDATE SET
                     name = EXCLUDED.name,
@@ -166,7 +377,9 @@ class DatabaseManager:
                     operating_hours = EXCLUDED.operating_hours,
                     latitude = EXCLUDED.latitude,
                     longitude = EXCLUDED.longitude,
-                    last_updated_at = CURRENT_TIMESTAMP
+                    last_updated_at = CURRENT_TIMESTAMP,
+                    crawl_generation = EXCLUDED.crawl_generation,
+                    closed_at = NULL
                 """,
                 (
                     data['code'],
@@ -177,7 +390,8 @@ class DatabaseManager:
                     data.get('address'),
                     data.get('hours'),
                     data.get('lat'),
-                    data.get('lng')
+                    data.get('lng'),
+                    self.generation
                 )
             )
 
@@ -199,13 +413,16 @@ class DatabaseManager:
         """
         success_count = 0
         failed_count = 0
+        progress = ProgressLog(logger, 'sync', total=len(institutions_data))
 
         try:
             for data in institutions_data:
                 if self.upsert_institution(data):
                     success_count += 1
+                    progress.update(success=1)
                 else:
                     failed_count += 1
+                    progress.update(failed=1)
 
             self.conn.commit()
             logger.info(
@@ -228,6 +445,1178 @@ class DatabaseManager:
                 'total': len(institutions_data)
             }
 
+    def upsert_institutions_batch(self, batch: list) -> int:
+        """
+        기관 데이터 배치 UPSERT (집합 단위 SQL 2회)
+
+        upsert_institution 과 같은 규칙으로 변경 이력을 기록하지만, 행마다 조회하지 않고
+        배치 전체를 한 번에 비교/저장합니다. 좌표가 없는 데이터는 주소가 바뀌지 않은 경우
+        기존 좌표를 유지합니다. 커밋은 호출자가 합니다.
+
+        Args:
+            batch: 기관 데이터 딕셔너리 리스트
+
+        Returns:
+            저장된 기관 수
+        """
+        # 같은 배치 안의 중복 기관 코드는 마지막 값 사용 (ON CONFLICT 는 한 행을 두 번 갱신할 수 없음)
+        rows = {}
+        for data in batch:
+            rows[data['code']] = (
+                data['code'],
+                data.get('name'),
+                data.get('type'),
+                data.get('capacity'),
+                data.get('current'),
+                data.get('address'),
+                data.get('hours'),
+                data.get('lat'),
+                data.get('lng'),
+                self.generation
+            )
+        rows = list(rows.values())
+        if not rows:
+            return 0
+
+        # 변경된 기관의 기존 값을 이력으로 기록
+        execute_values(
+            self.cursor,
+            """
+            INSERT INTO institution_history
+            (institution_id, recorded_date, name, address, capacity, current_headcount)
+            SELECT i.id, CURRENT_DATE, i.name, i.address, i.capacity, i.current_headcount
+            FROM institutions i
+            JOIN (VALUES %s) AS n (code, name, address, capacity, current)
+              ON i.institution_code = n.code
+            WHERE (i.name, i.address, i.capacity, i.current_headcount)
+                  IS DISTINCT FROM (n.name, n.address, n.capacity, n.current)
+            """,
+            [(r[0], r[1], r[5], r[3], r[4]) for r in rows],
+            template="(%s, %s, %s, %s::int, %s::int)",
+            page_size=len(rows)
+        )
+
+        execute_values(
+            self.cursor,
+            """
+            INSERT INTO institutions
+            (institution_code, name, service_type, capacity, current_headcount,
+             address, operating_hours, latitude, longitude, last_updated_at,
+             crawl_generation, closed_at)
+            VALUES %s
+            ON CONFLICT (institution_code)
+            DO UPDATE SET
+                name = EXCLUDED.name,
+                service_type = EXCLUDED.service_type,
+                capacity = EXCLUDED.capacity,
+                current_headcount = EXCLUDED.current_headcount,
+                address = EXCLUDED.address,
+                operating_hours = EXCLUDED.operating_hours,
+                latitude = COALESCE(
+                    EXCLUDED.latitude,
+                    CASE WHEN institutions.address = EXCLUDED.address
+                         THEN institutions.latitude END
+                ),
+                longitude = COALESCE(
+                    EXCLUDED.longitude,
+                    CASE WHEN institutions.address = EXCLUDED.address
+                         THEN institutions.longitude END
+                ),
+                last_updated_at = CURRENT_TIMESTAMP,
+                crawl_generation = EXCLUDED.crawl_generation,
+                closed_at = NULL
+            """,
+            rows,
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s, NULL)",
+            page_size=len(rows)
+        )
+        return len(rows)
+
+    def sync_institutions_batched(self, records, batch_size: int = 1000) -> dict:
+        """
+        기관 데이터 스트림을 배치 단위로 동기화 (배치마다 커밋)
+
+        Args:
+            records: 기관 데이터 딕셔너리 iterable (제너레이터 가능)
+            batch_size: 배치 크기
+
+        Returns:
+            {'success': int, 'failed': int, 'total': int}
+        """
+        result = {'success': 0, 'failed': 0, 'total': 0}
+        batch = []
+        progress = ProgressLog(logger, 'sync')
+
+        def flush():
+            try:
+                result['success'] += self.upsert_institutions_batch(batch)
+                self.conn.commit()
+            except psycopg2.Error as e:
+                self.conn.rollback()
+                result['failed'] += len(batch)
+                logger.error(f"Batch upsert failed ({len(batch)} rows): {e}")
+            batch.clear()
+
+        for data in records:
+            result['total'] += 1
+            if not data.get('code'):
+                result['failed'] += 1
+                continue
+            batch.append(data)
+            if len(batch) >= batch_size:
+                flush()
+                progress.update(result['total'] - progress.done)
+        if batch:
+            flush()
+
+        logger.info(
+            f"Batched sync completed: {result['success']} success, "
+            f"{result['failed']} failed, {result['total']} total"
+        )
+        return result
+
+    def sync_institutions_shadow(self, records, batch_size: int = 1000,
+                                 lock_timeout_ms: int = SHADOW_LOCK_TIMEOUT_MS,
+                                 swap_retries: int = SHADOW_SWAP_RETRIES) -> dict:
+        """
+        전체 동기화 (그림자 테이블 적재 후 이름 교체)
+
+        운영 중인 institutions 는 건드리지 않고, 수집 데이터를 합친 전체 기관을
+        institutions_shadow 에 적재하고 인덱스/통계까지 만든 뒤 짧은 트랜잭션 안에서 이름을 바꿉니다.
+        백엔드 조회는 적재 중에는 기존 테이블을 그대로 읽고, 교체 순간에만 잠깐 기다립니다.
+
+        - 기존 기관은 id 를 유지하고(이력/예측 FK 대상), 새 기관은 같은 시퀀스에서 id 를 받습니다.
+        - 이번 데이터에 없는 기관도 그대로 복사합니다. (폐업 처리는 finish_run)
+        - 변경 이력, 좌표 유지 규칙은 upsert_institutions_batch 와 같습니다.
+        - institutions 를 참조하는 FK 는 교체 트랜잭션에서 새 테이블로 다시 만들고(NOT VALID),
+          커밋 후 VALIDATE 합니다. (검증은 조회/쓰기를 막지 않음)
+        - 교체 중 잠금을 lock_timeout_ms 안에 얻지 못하면 롤백 후 swap_retries 회까지 재시도합니다.
+        - 적재 중 다른 연결이 추가/수정/삭제한 기관(행 버전 xmin 이 적재 시점과 다른 행)은
+          교체 잠금 안에서 현재 값으로 다시 합쳐 반영합니다. (좌표 갱신 등이 교체로 사라지지 않음)
+
+        Args:
+            records: 기관 데이터 딕셔너리 iterable (제너레이터 가능)
+            batch_size: 임시 테이블 적재 배치 크기
+            lock_timeout_ms: 교체 트랜잭션 잠금 대기 한도
+            swap_retries: 잠금 대기 초과 시 재시도 횟수
+
+        Returns:
+            {'success': int, 'failed': int, 'total': int, 'swap_ms': float} (교체 실패 시 success 0)
+        """
+        result = {'success': 0, 'failed': 0, 'total': 0, 'swap_ms': None}
+        # 중단된 이전 실행이 남긴 테이블
+        self._drop_shadow_tables()
+        try:
+            staged = self._stage_records(records, batch_size, result)
+            self.conn.commit()
+            # 그림자 테이블과 원본 행 버전 목록(shadow_source)을 같은 스냅샷에서 만듦
+            self.cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            merge = self._build_shadow_table()
+            self.conn.commit()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Shadow table build failed: {e}")
+            self._drop_shadow_tables()
+            result['failed'] = result['total']
+            return result
+
+        swap_ms = self._swap_shadow_table(merge, lock_timeout_ms, swap_retries)
+        if swap_ms is None:
+            self._drop_shadow_tables()
+            result['failed'] = result['total']
+            return result
+        result['success'] = staged
+        result['swap_ms'] = swap_ms
+
+        self._validate_institution_references()
+        self._drop_shadow_tables()
+        logger.info(
+            f"Shadow sync completed: {result['success']} success, {result['failed']} failed, "
+            f"{result['total']} total, swap {swap_ms:.1f} ms"
+        )
+        return result
+
+    def _stage_records(self, records, batch_size: int, result: dict) -> int:
+        """수집 데이터를 임시 테이블 sync_staging 에 적재 (같은 기관 코드는 마지막 값), 기관 수 반환"""
+        self.cursor.execute("DROP TABLE IF EXISTS sync_staging")
+        self.cursor.execute(
+            """
+            CREATE TEMP TABLE sync_staging (
+                seq BIGSERIAL,
+                code VARCHAR(20) NOT NULL,
+                name VARCHAR(255),
+                service_type VARCHAR(100),
+                capacity INT,
+                current_headcount INT,
+                address VARCHAR(255),
+                operating_hours TEXT,
+                latitude DECIMAL(10, 8),
+                longitude DECIMAL(11, 8)
+            )
+            """
+        )
+        progress = ProgressLog(logger, 'stage')
+        batch = []
+
+        def flush():
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO sync_staging
+                (code, name, service_type, capacity, current_headcount, address, operating_hours,
+                 latitude, longitude)
+                VALUES %s
+                """,
+                batch,
+                page_size=len(batch)
+            )
+            progress.update(len(batch))
+            batch.clear()
+
+        for data in records:
+            result['total'] += 1
+            if not data.get('code'):
+                result['failed'] += 1
+                continue
+            batch.append((
+                data['code'], data.get('name'), data.get('type'), data.get('capacity'),
+                data.get('current'), data.get('address'), data.get('hours'),
+                data.get('lat'), data.get('lng')
+            ))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        progress.finish()
+
+        # 같은 기관 코드는 마지막 행만 남김
+        self.cursor.execute(
+            """
+            DELETE FROM sync_staging s
+            USING sync_staging later
+            WHERE later.code = s.code AND later.seq > s.seq
+            """
+        )
+        self.cursor.execute("CREATE UNIQUE INDEX ON sync_staging(code)")
+        self.cursor.execute("ANALYZE sync_staging")
+        self.cursor.execute("SELECT COUNT(*) AS count FROM sync_staging")
+        return self.cursor.fetchone()['count']
+
+    def _build_shadow_table(self) -> str:
+        """
+        institutions + sync_staging → institutions_shadow (전체 기관, 인덱스/제약 조건/권한/통계 포함)
+
+        Returns:
+            기존 행과 수집 데이터를 합치는 SELECT 문 (교체 시 적재 후 바뀐 행에 다시 사용)
+        """
+        self.cursor.execute("DROP TABLE IF EXISTS institutions_shadow")
+        # 인덱스 없이 만들어 적재한 뒤 한 번에 생성
+        self.cursor.execute(
+            """
+            CREATE TABLE institutions_shadow
+            (LIKE institutions INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)
+            """
+        )
+        self.cursor.execute("SELECT pg_get_serial_sequence('institutions', 'id') AS sequence")
+        sequence = self.cursor.fetchone()['sequence']
+
+        # 수집 데이터가 있는 기관은 새 값, 없는 기관은 기존 행 그대로 (모르는 컬럼도 기존 값 유지)
+        crawled = {
+            'name': 's.name',
+            'service_type': 's.service_type',
+            'capacity': 's.capacity',
+            'current_headcount': 's.current_headcount',
+            'address': 's.address',
+            'operating_hours': 's.operating_hours',
+            'latitude': "COALESCE(s.latitude, CASE WHEN l.address = s.address THEN l.latitude END)",
+            'longitude': "COALESCE(s.longitude, CASE WHEN l.address = s.address THEN l.longitude END)",
+            'last_updated_at': 'CURRENT_TIMESTAMP',
+            'crawl_generation': '%(generation)s',
+            'closed_at': 'NULL',
+        }
+        self.cursor.execute(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'institutions'
+            ORDER BY ordinal_position
+            """
+        )
+        columns = [row['column_name'] for row in self.cursor.fetchall()]
+        expressions = []
+        for column in columns:
+            if column == 'id':
+                expressions.append(f"COALESCE(l.id, nextval('{sequence}'))")
+            elif column == 'institution_code':
+                expressions.append("COALESCE(s.code, l.institution_code)")
+            elif column == 'first_seen_at':
+                expressions.append("CASE WHEN l.id IS NULL THEN CURRENT_TIMESTAMP ELSE l.first_seen_at END")
+            elif column in crawled:
+                expressions.append(f"CASE WHEN s.code IS NULL THEN l.{column} ELSE {crawled[column]} END")
+            else:
+                expressions.append(f"l.{column}")
+        merge = self.cursor.mogrify(
+            f"""
+            INSERT INTO institutions_shadow ({', '.join(columns)})
+            SELECT {', '.join(expressions)}
+            FROM institutions l
+            FULL OUTER JOIN sync_staging s ON s.code = l.institution_code
+            """,
+            {'generation': self.generation}
+        ).decode()
+        self.cursor.execute(merge)
+        # 적재한 원본 행 버전 (교체 시 xmin 이 달라진 행 = 적재 후 다른 연결이 바꾼 행)
+        self.cursor.execute("DROP TABLE IF EXISTS shadow_source")
+        self.cursor.execute("CREATE TEMP TABLE shadow_source AS SELECT id, xmin AS row_xmin FROM institutions")
+        self.cursor.execute("CREATE UNIQUE INDEX ON shadow_source(id)")
+        self.cursor.execute("ANALYZE shadow_source")
+
+        # 기존 테이블과 같은 인덱스/제약 조건 (이름 뒤에 _shadow, 교체 시 원래 이름으로 변경)
+        self.cursor.execute(
+            """
+            SELECT c.relname AS name, pg_get_indexdef(x.indexrelid) AS definition, k.contype
+            FROM pg_index x
+            JOIN pg_class c ON c.oid = x.indexrelid
+            LEFT JOIN pg_constraint k ON k.conindid = x.indexrelid AND k.conrelid = x.indrelid
+            WHERE x.indrelid = 'institutions'::regclass
+            """
+        )
+        for index in self.cursor.fetchall():
+            definition = re.sub(
+                r'^(CREATE (?:UNIQUE )?INDEX )(\S+)( ON (?:ONLY )?)(\S+)',
+                lambda m: f"{m.group(1)}{m.group(2)}_shadow{m.group(3)}{m.group(4)}_shadow",
+                index['definition']
+            )
+            self.cursor.execute(definition)
+            if index['contype'] in ('p', 'u'):
+                kind = 'PRIMARY KEY' if index['contype'] == 'p' else 'UNIQUE'
+                self.cursor.execute(
+                    f"ALTER TABLE institutions_shadow ADD CONSTRAINT {index['name']}_shadow "
+                    f"{kind} USING INDEX {index['name']}_shadow"
+                )
+
+        # 백엔드 계정 등의 권한 복사
+        self.cursor.execute(
+            """
+            SELECT grantee, privilege_type FROM information_schema.role_table_grants
+            WHERE table_schema = current_schema() AND table_name = 'institutions'
+              AND grantee <> current_user
+            """
+        )
+        for grant in self.cursor.fetchall():
+            self.cursor.execute(
+                f'GRANT {grant["privilege_type"]} ON institutions_shadow TO "{grant["grantee"]}"'
+            )
+        self.cursor.execute("ANALYZE institutions_shadow")
+        return merge
+
+    def _swap_shadow_table(self, merge: str, lock_timeout_ms: int, retries: int) -> float:
+        """
+        institutions_shadow 를 institutions 로 교체 (한 트랜잭션), 잠금을 잡고 있던 시간(ms) 반환
+
+        Args:
+            merge: _build_shadow_table 의 합치기 INSERT ... SELECT 문
+            lock_timeout_ms: 잠금 대기 한도
+            retries: 잠금 대기 초과 시 재시도 횟수
+
+        Returns:
+            교체 트랜잭션 시간 ms (실패 시 None)
+        """
+        for attempt in range(retries + 1):
+            start = time.perf_counter()
+            try:
+                self.cursor.execute("SET LOCAL lock_timeout = %s", (f"{int(lock_timeout_ms)}ms",))
+                # 변경된 기관의 기존 값을 이력으로 기록 (교체와 함께 커밋)
+                self.cursor.execute(
+                    """
+                    INSERT INTO institution_history
+                    (institution_id, recorded_date, name, address, capacity, current_headcount)
+                    SELECT i.id, CURRENT_DATE, i.name, i.address, i.capacity, i.current_headcount
+                    FROM institutions i
+                    JOIN sync_staging s ON s.code = i.institution_code
+                    WHERE (i.name, i.address, i.capacity, i.current_headcount)
+                          IS DISTINCT FROM (s.name, s.address, s.capacity, s.current_headcount)
+                    """
+                )
+                locked = time.perf_counter()
+                self.cursor.execute("LOCK TABLE institutions IN ACCESS EXCLUSIVE MODE")
+                # 그림자 테이블을 만드는 동안 다른 연결이 추가/수정/삭제한 기관을 현재 값으로 다시 합침
+                # (잠금 뒤에는 더 바뀌지 않으므로 교체로 사라지는 쓰기가 없음)
+                self.cursor.execute(
+                    """
+                    SELECT src.id AS source_id, l.id, l.institution_code
+                    FROM institutions l
+                    FULL OUTER JOIN shadow_source src ON src.id = l.id
+                    WHERE src.row_xmin IS DISTINCT FROM l.xmin
+                    """
+                )
+                changed = self.cursor.fetchall()
+                if changed:
+                    ids = [row['id'] for row in changed if row['id'] is not None]
+                    self.cursor.execute(
+                        """
+                        DELETE FROM institutions_shadow
+                        WHERE id = ANY(%s) OR institution_code = ANY(%s)
+                        """,
+                        ([row['source_id'] or row['id'] for row in changed],
+                         [row['institution_code'] for row in changed if row['institution_code']])
+                    )
+                    if ids:
+                        self.cursor.execute(merge.replace('%', '%%') + " WHERE l.id = ANY(%s)", (ids,))
+                    logger.info(
+                        f"Re-applied {len(ids)} institutions changed during shadow build "
+                        f"({len(changed) - len(ids)} removed)"
+                    )
+
+                self.cursor.execute(
+                    """
+                    SELECT conname, conrelid::regclass::text AS child, pg_get_constraintdef(oid) AS definition
+                    FROM pg_constraint
+                    WHERE confrelid = 'institutions'::regclass AND contype = 'f'
+                    """
+                )
+                references = self.cursor.fetchall()
+                for ref in references:
+                    self.cursor.execute(f"ALTER TABLE {ref['child']} DROP CONSTRAINT {ref['conname']}")
+
+                self.cursor.execute(
+                    "SELECT indexrelid::regclass::text AS name FROM pg_index WHERE indrelid = 'institutions'::regclass"
+                )
+                indexes = [row['name'] for row in self.cursor.fetchall()]
+                for name in indexes:
+                    self.cursor.execute(f"ALTER INDEX {name} RENAME TO {name}_old")
+                    self.cursor.execute(f"ALTER INDEX {name}_shadow RENAME TO {name}")
+                self.cursor.execute("ALTER TABLE institutions RENAME TO institutions_old")
+                self.cursor.execute("ALTER TABLE institutions_shadow RENAME TO institutions")
+                # 기존 테이블 삭제 시 시퀀스가 함께 삭제되지 않도록 소유 컬럼 변경
+                self.cursor.execute("SELECT pg_get_serial_sequence('institutions_old', 'id') AS sequence")
+                sequence = self.cursor.fetchone()['sequence']
+                self.cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY institutions.id")
+
+                # 같은 정의(REFERENCES institutions)로 새 테이블을 가리키는 FK 생성, 검증은 커밋 후
+                for ref in references:
+                    self.cursor.execute(
+                        f"ALTER TABLE {ref['child']} ADD CONSTRAINT {ref['conname']} "
+                        f"{ref['definition']} NOT VALID"
+                    )
+                self.conn.commit()
+                swap_ms = (time.perf_counter() - locked) * 1000
+                logger.info(
+                    f"Institutions table swapped (lock held {swap_ms:.1f} ms, "
+                    f"transaction {(time.perf_counter() - start) * 1000:.1f} ms)"
+                )
+                return swap_ms
+            except psycopg2.errors.LockNotAvailable:
+                self.conn.rollback()
+                logger.warning(f"Table swap lock timeout (attempt {attempt + 1}/{retries + 1})")
+                time.sleep(min(2 ** attempt, 10) * 0.5)
+            except psycopg2.Error as e:
+                self.conn.rollback()
+                logger.error(f"Table swap failed: {e}")
+                return None
+        logger.error("Table swap failed: lock not acquired")
+        return None
+
+    def _validate_institution_references(self):
+        """교체 후 NOT VALID 로 만든 FK 검증 (SHARE UPDATE EXCLUSIVE 잠금, 조회/쓰기는 막지 않음)"""
+        self.cursor.execute(
+            """
+            SELECT conname, conrelid::regclass::text AS child FROM pg_constraint
+            WHERE confrelid = 'institutions'::regclass AND contype = 'f' AND NOT convalidated
+            """
+        )
+        for ref in self.cursor.fetchall():
+            try:
+                self.cursor.execute(f"ALTER TABLE {ref['child']} VALIDATE CONSTRAINT {ref['conname']}")
+                self.conn.commit()
+            except psycopg2.Error as e:
+                self.conn.rollback()
+                logger.error(f"Foreign key validation failed ({ref['child']}.{ref['conname']}): {e}")
+        self.conn.commit()
+
+    def _drop_shadow_tables(self):
+        """교체된 기존 테이블/남은 그림자 테이블/임시 테이블 삭제"""
+        try:
+            self.cursor.execute("DROP TABLE IF EXISTS institutions_old, institutions_shadow, sync_staging, shadow_source")
+            self.conn.commit()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Shadow table cleanup failed: {e}")
+
+    def get_institutions_without_coordinates(self, limit: int = None) -> list:
+        """
+        좌표가 없는 운영 중 기관 조회 ({'id', 'address'} 리스트, 새로 등록된 기관 먼저)
+
+        Geocoding 에 실패해 geocode_failures 에 있는 기관은 재시도 대상(get_geocode_retries)이므로
+        제외합니다. 실패 후 주소가 바뀐 기관은 새 주소로 다시 조회합니다.
+        """
+        try:
+            self.cursor.execute(
+                """
+                SELECT i.id, i.address FROM institutions i
+                LEFT JOIN geocode_failures f ON f.institution_id = i.id
+                WHERE i.closed_at IS NULL AND i.latitude IS NULL AND i.address IS NOT NULL
+                  AND (f.institution_id IS NULL OR f.address <> i.address)
+                ORDER BY i.first_seen_at DESC NULLS LAST, i.id DESC
+                LIMIT %s
+                """,
+                (limit,)
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Query failed: {e}")
+            return []
+
+    def update_coordinates(self, coordinates: list) -> int:
+        """
+        기관 좌표 일괄 갱신
+
+        Args:
+            coordinates: (institution_id, lat, lng) 튜플 리스트
+
+        Returns:
+            갱신된 기관 수
+        """
+        if not coordinates:
+            return 0
+        try:
+            execute_values(
+                self.cursor,
+                """
+                UPDATE institutions AS i
+                SET latitude = c.lat, longitude = c.lng
+                FROM (VALUES %s) AS c (id, lat, lng)
+                WHERE i.id = c.id
+                """,
+                coordinates,
+                template="(%s, %s::numeric, %s::numeric)",
+                page_size=1000
+            )
+            # 좌표를 얻은 기관은 dead-letter 에서 제거
+            self.cursor.execute(
+                "DELETE FROM geocode_failures WHERE institution_id = ANY(%s)",
+                ([row[0] for row in coordinates],)
+            )
+            self.conn.commit()
+            return len(coordinates)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Coordinate update failed: {e}")
+            return 0
+
+    def get_geocode_retries(self, limit: int = None) -> list:
+        """
+        재시도 시각이 지난 Geocoding 실패 기관 조회 (오래 기다린 순)
+
+        Returns:
+            {'id', 'address', 'reason', 'attempts'} 리스트
+        """
+        try:
+            self.cursor.execute(
+                """
+                SELECT i.id, i.address, f.reason, f.attempts
+                FROM geocode_failures f
+                JOIN institutions i ON i.id = f.institution_id
+                WHERE f.next_retry_at <= CURRENT_TIMESTAMP
+                  AND i.closed_at IS NULL AND i.latitude IS NULL AND i.address = f.address
+                ORDER BY f.next_retry_at, f.institution_id
+                LIMIT %s
+                """,
+                (limit,)
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Query failed: {e}")
+            return []
+
+    def record_geocode_failures(self, failures: list, backoff_hours: float, max_attempts: int) -> int:
+        """
+        Geocoding 실패 기록 (dead-letter)
+
+        같은 주소로 다시 실패하면 시도 횟수를 늘리고 재시도 대기 시간을 2배로 늘립니다.
+        시도 횟수가 max_attempts 에 이르면 next_retry_at 을 비워 더 이상 재시도하지 않습니다.
+        주소가 바뀌었으면 첫 실패로 봅니다.
+
+        Args:
+            failures: (institution_id, address, reason, last_error) 튜플 리스트
+            backoff_hours: 첫 재시도 대기 시간
+            max_attempts: 최대 시도 횟수
+
+        Returns:
+            기록된 기관 수
+        """
+        if not failures:
+            return 0
+        try:
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO geocode_failures AS f
+                (institution_id, address, reason, last_error, next_retry_at)
+                SELECT v.id, v.address, v.reason, v.last_error,
+                       CASE WHEN %(max_attempts)s > 1
+                            THEN CURRENT_TIMESTAMP + %(backoff)s * INTERVAL '1 hour' END
+                FROM (VALUES %%s) AS v (id, address, reason, last_error)
+                ON CONFLICT (institution_id) DO UPDATE SET
+                    address = EXCLUDED.address,
+                    reason = EXCLUDED.reason,
+                    last_error = EXCLUDED.last_error,
+                    attempts = CASE WHEN f.address = EXCLUDED.address THEN f.attempts + 1 ELSE 1 END,
+                    first_failed_at = CASE WHEN f.address = EXCLUDED.address
+                                           THEN f.first_failed_at ELSE CURRENT_TIMESTAMP END,
+                    last_failed_at = CURRENT_TIMESTAMP,
+                    next_retry_at = CASE
+                        WHEN f.address <> EXCLUDED.address THEN EXCLUDED.next_retry_at
+                        WHEN f.attempts + 1 >= %(max_attempts)s THEN NULL
+                        ELSE CURRENT_TIMESTAMP + %(backoff)s * power(2, f.attempts) * INTERVAL '1 hour'
+                    END
+                """ % {'max_attempts': int(max_attempts), 'backoff': float(backoff_hours)},
+                failures,
+                page_size=1000
+            )
+            self.conn.commit()
+            return len(failures)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Geocode failure record failed: {e}")
+            return 0
+
+    def reserve_geocode_quota(self, count: int, daily_quota: int, timezone: str = 'Asia/Seoul') -> int:
+        """
+        오늘 Geocoding 호출 예산 예약 (행 잠금으로 여러 프로세스가 나눠 써도 합계가 쿼터를 넘지 않음)
+
+        Args:
+            count: 예약할 호출 수
+            daily_quota: 일일 쿼터 (0 이하면 무제한, 사용량만 기록)
+            timezone: 날짜 기준 시간대
+
+        Returns:
+            예약된 호출 수 (쿼터 소진 시 0, 실패 시 0)
+        """
+        try:
+            day = "(CURRENT_TIMESTAMP AT TIME ZONE %s)::date"
+            self.cursor.execute(
+                f"INSERT INTO geocode_quota (day) VALUES ({day}) ON CONFLICT (day) DO NOTHING",
+                (timezone,)
+            )
+            self.cursor.execute(
+                f"SELECT used FROM geocode_quota WHERE day = {day} FOR UPDATE",
+                (timezone,)
+            )
+            used = self.cursor.fetchone()['used']
+            granted = count if daily_quota <= 0 else max(0, min(count, daily_quota - used))
+            if granted:
+                self.cursor.execute(
+                    f"""
+                    UPDATE geocode_quota SET used = used + %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE day = {day}
+                    """,
+                    (granted, timezone)
+                )
+            self.conn.commit()
+            return granted
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Geocode quota reservation failed: {e}")
+            return 0
+
+    def release_geocode_quota(self, count: int, timezone: str = 'Asia/Seoul') -> bool:
+        """예약했지만 쓰지 않은 오늘 호출 예산 반환"""
+        if count <= 0:
+            return True
+        try:
+            self.cursor.execute(
+                """
+                UPDATE geocode_quota SET used = GREATEST(used - %s, 0), updated_at = CURRENT_TIMESTAMP
+                WHERE day = (CURRENT_TIMESTAMP AT TIME ZONE %s)::date
+                """,
+                (count, timezone)
+            )
+            self.conn.commit()
+            return True
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Geocode quota release failed: {e}")
+            return False
+
+    def get_geocode_status(self, timezone: str = 'Asia/Seoul') -> dict:
+        """
+        오늘 호출 수와 dead-letter 현황
+
+        Returns:
+            dict: {'quota_used', 'failures': {사유: 기관 수}, 'due', 'waiting', 'abandoned'} (실패 시 None)
+        """
+        try:
+            self.cursor.execute(
+                "SELECT used FROM geocode_quota WHERE day = (CURRENT_TIMESTAMP AT TIME ZONE %s)::date",
+                (timezone,)
+            )
+            row = self.cursor.fetchone()
+            self.cursor.execute(
+                """
+                SELECT reason, COUNT(*) AS count,
+                       COUNT(*) FILTER (WHERE next_retry_at <= CURRENT_TIMESTAMP) AS due,
+                       COUNT(*) FILTER (WHERE next_retry_at > CURRENT_TIMESTAMP) AS waiting,
+                       COUNT(*) FILTER (WHERE next_retry_at IS NULL) AS abandoned
+                FROM geocode_failures
+                GROUP BY reason
+                """
+            )
+            rows = self.cursor.fetchall()
+            return {
+                'quota_used': row['used'] if row else 0,
+                'failures': {r['reason']: r['count'] for r in rows},
+                'due': sum(r['due'] for r in rows),
+                'waiting': sum(r['waiting'] for r in rows),
+                'abandoned': sum(r['abandoned'] for r in rows),
+            }
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Query failed: {e}")
+            return None
+
+    def begin_run(self) -> int:
+        """
+        크롤링 실행 회차(generation) 시작
+
+        이후 upsert_institution 으로 저장되는 모든 기관에 이 회차 번호가 기록됩니다.
+
+        Returns:
+            회차 번호 (실패 시 None)
+        """
+        try:
+            self.cursor.execute(
+                "INSERT INTO crawl_runs (started_at) VALUES (CURRENT_TIMESTAMP) RETURNING id"
+            )
+            self.generation = self.cursor.fetchone()['id']
+            self.conn.commit()
+            logger.info(f"Crawl run started: generation {self.generation}")
+            return self.generation
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to start crawl run: {e}")
+            return None
+
+    def finish_run(self, max_close_ratio: float = CLOSE_SAFETY_RATIO, close: bool = True,
+                   status: str = 'refresh') -> dict:
+        """
+        크롤링 실행 회차 종료 및 폐업 기관 일괄 처리
+
+        이번 회차에 수집되지 않은 운영 중 기관을 하나의 UPDATE 로 폐업 처리합니다.
+        미수집 기관 비율이 max_close_ratio 를 넘으면 부분 크롤링으로 판단하고
+        폐업 처리를 건너뜁니다. (회차 상태 partial)
+
+        Args:
+            max_close_ratio: 한 번에 폐업 처리할 수 있는 운영 중 기관 비율 상한
+            close: False 면 폐업 처리 없이 종료 (일부 기관만 수집하는 재수집 회차 등)
+            status: close 가 False 일 때 기록할 회차 상태 (재수집 refresh, 수집 실패가 남은 회차 partial)
+
+        Returns:
+            {'generation': int, 'seen': int, 'closed': int, 'skipped': bool}
+        """
+        result = {'generation': self.generation, 'seen': 0, 'closed': 0, 'skipped': True}
+        if self.generation is None:
+            logger.error("No crawl run in progress")
+            return result
+
+        try:
+            self.cursor.execute(
+                """
+                SELECT COUNT(*) AS open_total,
+                       COUNT(*) FILTER (WHERE crawl_generation = %s) AS seen
+                FROM institutions
+                WHERE closed_at IS NULL
+                """,
+                (self.generation,)
+            )
+            counts = self.cursor.fetchone()
+            unseen = counts['open_total'] - counts['seen']
+            result['seen'] = counts['seen']
+
+            if close and counts['open_total'] and unseen / counts['open_total'] > max_close_ratio:
+                logger.warning(
+                    f"Skipping closure: {unseen}/{counts['open_total']} institutions unseen "
+                    f"(limit {max_close_ratio:.0%}), treating run as partial"
+                )
+                status = 'partial'
+            elif close:
+                self.cursor.execute(
+                    """
+                    UPDATE institutions
+                    SET closed_at = CURRENT_TIMESTAMP
+                    WHERE closed_at IS NULL
+                      AND crawl_generation IS DISTINCT FROM %s
+                    """,
+                    (self.generation,)
+                )
+                result['closed'] = self.cursor.rowcount
+                result['skipped'] = False
+                status = 'completed'
+
+            self.cursor.execute(
+                """
+                UPDATE crawl_runs
+                SET finished_at = CURRENT_TIMESTAMP, status = %s,
+                    seen_count = %s, closed_count = %s
+                WHERE id = %s
+                """,
+                (status, result['seen'], result['closed'], self.generation)
+            )
+            self.conn.commit()
+            logger.info(
+                f"Crawl run {self.generation} finished: {result['seen']} seen, "
+                f"{result['closed']} closed"
+            )
+            return result
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to finish crawl run: {e}")
+            return result
+
+    def save_run_metrics(self, report: dict) -> bool:
+        """
+        실행 리포트 저장 (crawl_runs.report, crawl_run_stages)
+
+        Args:
+            report: metrics.RunMetrics.report() 결과
+
+        Returns:
+            성공 여부
+        """
+        if self.generation is None:
+            return False
+        try:
+            self.cursor.execute(
+                "UPDATE crawl_runs SET report = %s WHERE id = %s",
+                (Json(report), self.generation)
+            )
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO crawl_run_stages (run_id, stage, seconds, records)
+                VALUES %s
+                ON CONFLICT (run_id, stage)
+                DO UPDATE SET seconds = EXCLUDED.seconds, records = EXCLUDED.records
+                """,
+                [
+                    (self.generation, stage, entry['seconds'], entry['records'])
+                    for stage, entry in report['stages'].items()
+                ]
+            )
+            self.conn.commit()
+            return True
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to save run metrics: {e}")
+            return False
+
+    def get_stage_trends(self, limit: int = 10) -> dict:
+        """
+        최근 실행의 단계별 평균 소요 시간 (현재 회차 제외)
+
+        Args:
+            limit: 비교할 최근 실행 수
+
+        Returns:
+            {stage: {'avg_seconds': float, 'avg_records': float, 'runs': int}}
+        """
+        try:
+            self.cursor.execute(
+                """
+                SELECT s.stage,
+                       AVG(s.seconds) AS avg_seconds,
+                       AVG(s.records) AS avg_records,
+                       COUNT(*) AS runs
+                FROM crawl_run_stages s
+                JOIN (
+                    SELECT id FROM crawl_runs
+                    WHERE id IS DISTINCT FROM %s AND status <> 'running'
+                    ORDER BY id DESC
+                    LIMIT %s
+                ) r ON r.id = s.run_id
+                GROUP BY s.stage
+                """,
+                (self.generation, limit)
+            )
+            return {
+                row['stage']: {
+                    'avg_seconds': float(row['avg_seconds']),
+                    'avg_records': float(row['avg_records'] or 0),
+                    'runs': row['runs'],
+                }
+                for row in self.cursor.fetchall()
+            }
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Stage trend query failed: {e}")
+            return {}
+
+    def get_map_rows(self) -> list:
+        """지도 스냅샷용 운영 중 기관 목록 (id 순)"""
+        try:
+            self.cursor.execute(
+                """
+                SELECT id, name, service_type, address, capacity, current_headcount,
+                       latitude, longitude
+                FROM institutions
+                WHERE closed_at IS NULL
+                ORDER BY id
+                """
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Map rows query failed: {e}")
+            return None
+
+    def upsert_regions(self, regions: list) -> int:
+        """
+        행정구역 목록 저장
+
+        Args:
+            regions: (code, name, sido_code) 튜플 리스트
+
+        Returns:
+            저장된 행정구역 수
+        """
+        if not regions:
+            return 0
+        try:
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO regions (code, name, sido_code) VALUES %s
+                ON CONFLICT (code) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    sido_code = EXCLUDED.sido_code
+                """,
+                regions,
+                page_size=1000
+            )
+            self.conn.commit()
+            return len(regions)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Region upsert failed: {e}")
+            return 0
+
+    def get_region_rows(self) -> list:
+        """행정구역 계산 대상 운영 중 기관 ({'id', 'latitude', 'longitude', 'region_code'} 리스트)"""
+        try:
+            self.cursor.execute(
+                """
+                SELECT id, latitude, longitude, region_code FROM institutions
+                WHERE closed_at IS NULL
+                  AND (latitude IS NOT NULL OR region_code IS NOT NULL)
+                ORDER BY id
+                """
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Region rows query failed: {e}")
+            return None
+
+    def update_region_codes(self, assignments: list) -> int:
+        """
+        기관 행정구역 코드 일괄 갱신
+
+        Args:
+            assignments: (institution_id, region_code) 튜플 리스트
+
+        Returns:
+            갱신된 기관 수
+        """
+        if not assignments:
+            return 0
+        try:
+            execute_values(
+                self.cursor,
+                """
+                UPDATE institutions AS i
+                SET region_code = r.code
+                FROM (VALUES %s) AS r (id, code)
+                WHERE i.id = r.id
+                """,
+                assignments,
+                template="(%s, %s::int)",
+                page_size=1000
+            )
+            self.conn.commit()
+            return len(assignments)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Region code update failed: {e}")
+            return 0
+
+    def get_dedup_rows(self) -> list:
+        """중복 탐지용 운영 중 기관 목록 (id 순)"""
+        try:
+            self.cursor.execute(
+                """
+                SELECT id, institution_code, name, service_type, address
+                FROM institutions
+                WHERE closed_at IS NULL
+                ORDER BY id
+                """
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Dedup rows query failed: {e}")
+            return None
+
+    def get_refresh_rows(self, history_days: int = 365) -> list:
+        """
+        재수집 계획용 운영 중 기관 목록 (id 순)
+
+        Args:
+            history_days: 변경 횟수를 셀 최근 이력 기간 (일)
+
+        Returns:
+            list: id, institution_code, name, address, capacity, current_headcount,
+                  changes (기간 내 변경 횟수), observed_days (관측 일수),
+                  age_days (마지막 수집 후 경과 일수) 를 가진 행 리스트 (실패 시 None)
+        """
+        try:
+            self.cursor.execute(
+                """
+                SELECT i.id, i.institution_code, i.name, i.address, i.capacity,
+                       i.current_headcount,
+                       COALESCE(h.changes, 0) AS changes,
+                       LEAST(
+                           %(days)s,
+                           EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - LEAST(
+                               COALESCE(i.first_seen_at, i.last_updated_at), h.first_change
+                           )) / 86400
+                       )::float8 AS observed_days,
+                       (EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - i.last_updated_at) / 86400)::float8
+                           AS age_days
+                FROM institutions i
+                LEFT JOIN (
+                    SELECT institution_id, COUNT(*) AS changes, MIN(recorded_date) AS first_change
+                    FROM institution_history
+                    WHERE recorded_date >= CURRENT_DATE - %(days)s
+                    GROUP BY institution_id
+                ) h ON h.institution_id = i.id
+                WHERE i.closed_at IS NULL
+                ORDER BY i.id
+                """,
+                {'days': history_days}
+            )
+            return self.cursor.fetchall()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Refresh rows query failed: {e}")
+            return None
+
+    def save_refresh_schedule(self, schedule: list) -> int:
+        """
+        기관별 재수집 주기 저장
+
+        Args:
+            schedule: (institution_id, change_rate, interval_days, priority, next_due_days) 튜플 리스트
+
+        Returns:
+            저장된 기관 수
+        """
+        if not schedule:
+            return 0
+        try:
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO refresh_schedule
+                (institution_id, change_rate, interval_days, priority, next_due_at, planned_generation)
+                VALUES %s
+                ON CONFLICT (institution_id) DO UPDATE SET
+                    change_rate = EXCLUDED.change_rate,
+                    interval_days = EXCLUDED.interval_days,
+                    priority = EXCLUDED.priority,
+                    next_due_at = EXCLUDED.next_due_at,
+                    planned_generation = EXCLUDED.planned_generation
+                """,
+                [row + (self.generation,) for row in schedule],
+                template="(%s, %s, %s, %s, CURRENT_TIMESTAMP + %s * INTERVAL '1 day', %s)",
+                page_size=5000
+            )
+            self.conn.commit()
+            return len(schedule)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Refresh schedule save failed: {e}")
+            return 0
+
+    def get_forecast_inputs(self, history_months: int = 36) -> dict:
+        """
+        예상 여석 계산용 운영 중 기관과 기간 내 변경 이력
+
+        Args:
+            history_months: 이력 개월 수 (이번 달 포함)
+
+        Returns:
+            dict: {'institutions': id, capacity, current_headcount 행 리스트,
+                   'history': institution_id, recorded_date, capacity, current_headcount 행 리스트}
+                  (실패 시 None)
+        """
+        try:
+            self.cursor.execute(
+                """
+                SELECT id, capacity, current_headcount
+                FROM institutions
+                WHERE closed_at IS NULL
+                ORDER BY id
+                """
+            )
+            institutions = self.cursor.fetchall()
+            # 기간 시작 전에 기록된 이력은 기간 내 어느 월말 값도 아니므로 제외
+            self.cursor.execute(
+                """
+                SELECT h.institution_id, h.recorded_date, h.capacity, h.current_headcount
+                FROM institution_history h
+                JOIN institutions i ON i.id = h.institution_id AND i.closed_at IS NULL
+                WHERE h.recorded_date >= date_trunc('month', CURRENT_DATE)
+                                         - (%s - 1) * INTERVAL '1 month'
+                """,
+                (history_months,)
+            )
+            return {'institutions': institutions, 'history': self.cursor.fetchall()}
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Forecast inputs query failed: {e}")
+            return None
+
+    def save_vacancy_forecasts(self, rows: list) -> int:
+        """
+        기관별 예상 여석 저장 (기존 예측을 한 트랜잭션 안에서 교체)
+
+        Args:
+            rows: (institution_id, forecast_month, expected_vacancy, model, backtest_mae) 튜플 리스트
+
+        Returns:
+            저장된 행 수
+        """
+        try:
+            self.cursor.execute("DELETE FROM vacancy_forecasts")
+            execute_values(
+                self.cursor,
+                """
+                INSERT INTO vacancy_forecasts
+                (institution_id, forecast_month, expected_vacancy, model, backtest_mae, generation)
+                VALUES %s
+                """,
+                [row + (self.generation,) for row in rows],
+                page_size=5000
+            )
+            self.conn.commit()
+            return len(rows)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Vacancy forecast save failed: {e}")
+            return 0
+
     def get_all_institutions(self) -> list:
         """모든 기관 조회"""
         try:
@@ -240,22 +1629,30 @@ class DatabaseManager:
     def get_statistics(self) -> dict:
         """통계 조회"""
         try:
-            self.cursor.execute("SELECT COUNT(*) as total FROM institutions")
-            total = self.cursor.fetchone()['total']
+            self.cursor.execute(
+                """
+                SELECT COUNT(*) FILTER (WHERE closed_at IS NULL) as total,
+                       COUNT(*) FILTER (WHERE closed_at IS NOT NULL) as closed
+                FROM institutions
+                """
+            )
+            row = self.cursor.fetchone()
 
             self.cursor.execute(
                 """
                 SELECT service_type, COUNT(*) as count
                 FROM institutions
+                WHERE closed_at IS NULL
                 GROUP BY service_type
                 """
             )
             by_type = {row['service_type']: row['count'] for row in self.cursor.fetchall()}
 
             return {
-                'total': total,
+                'total': row['total'],
+                'closed': row['closed'],
                 'by_service_type': by_type
             }
         except psycopg2.Error as e:
             logger.error(f"Statistics query failed: {e}")
-            return {'total': 0, 'by_service_type': {}}
+            return {'total': 0, 'closed': 0, 'by_service_type': {}}
@@ -0,0 +1,135 @@
+"""
+Duplicate Detector - 다른 기관 코드로 중복 등록된 기관 탐지
+
+전체 쌍을 비교하지 않도록 주소를 (시/도, 시/군/구, 도로명 또는 읍/면/동) 블록으로 나누고,
+블록 안에서도 건물번호가 같거나 정규화한 기관명이 같은 기관끼리만 비교합니다.
+비교 쌍마다 기관명 유사도(difflib)로 점수를 매겨 기준 이상인 쌍을 묶어 그룹으로 반환합니다.
+
+급여종류가 다르면 같은 건물의 같은 운영자라도 별도 기관이므로 비교하지 않습니다.
+탐지 결과는 리포트로만 남기고 자동으로 병합하지 않습니다.
+"""
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from address import parse_address
+from metrics import write_report
+
+logger = logging.getLogger(__name__)
+
+# 기관명 비교 시 제외하는 법인 표기/괄호/기호
+NAME_NOISE = re.compile(r'\([^)]*\)|주식회사|유한회사|사회복지법인|의료법인|[^가-힣A-Za-z\d]')
+# 건물번호가 다르면 같은 도로의 다른 건물일 가능성이 높으므로 감점 (기본 기준으로는 중복 아님)
+OTHER_NUMBER_PENALTY = 0.8
+
+
+def name_key(name: str) -> str:
+    """기관명 비교 키 (법인 표기, 괄호, 공백, 기호 제거)"""
+    return NAME_NOISE.sub('', unicodedata.normalize('NFKC', name or '')).lower()
+
+
+def _candidate_pairs(members: list):
+    """블록 안에서 건물번호 또는 기관명 키가 같은 (i, j) 쌍"""
+    pairs = set()
+    for field in ('number', 'name_key'):
+        buckets = defaultdict(list)
+        for i, member in enumerate(members):
+            if member[field]:
+                buckets[(member['service_type'], member[field])].append(i)
+        for indexes in buckets.values():
+            pairs.update(combinations(indexes, 2))
+    return pairs
+
+
+def _score(a: dict, b: dict) -> float:
+    if a['name_key'] == b['name_key']:
+        similarity = 1.0
+    else:
+        matcher = SequenceMatcher(None, a['name_key'], b['name_key'])
+        if matcher.real_quick_ratio() < 0.5:
+            return 0.0
+        similarity = matcher.ratio()
+    return similarity if a['number'] == b['number'] else similarity * OTHER_NUMBER_PENALTY
+
+
+def find_duplicates(rows: list, threshold: float = 0.85) -> list:
+    """
+    중복 의심 기관 그룹 탐지
+
+    Args:
+        rows: id, institution_code, name, service_type, address 를 가진 기관 목록
+        threshold: 중복으로 볼 최소 점수 (0~1, 기관명 유사도)
+
+    Returns:
+        list: [{'ids', 'codes', 'names', 'address_key', 'score'}] (score 는 그룹 내 최저 쌍 점수)
+    """
+    blocks = defaultdict(list)
+    for row in rows:
+        parsed = parse_address(row['address'])
+        member = {
+            'id': row['id'],
+            'code': row['institution_code'],
+            'name': row['name'],
+            'name_key': name_key(row['name']),
+            'service_type': row['service_type'],
+            'number': parsed['number'],
+            'address_key': parsed['key'],
+        }
+        if parsed['locality']:
+            blocks[(parsed['sido'], parsed['sigungu'], parsed['locality'])].append(member)
+        elif parsed['key']:
+            # 도로명/지번을 찾지 못한 주소는 표준 키가 같은 기관끼리만 비교
+            blocks[(parsed['key'],)].append(member)
+
+    parent = {}
+
+    def find(x):
+        while parent.get(x, x) != x:
+            parent[x] = parent.get(parent[x], parent[x])
+            x = parent[x]
+        return x
+
+    edges = []
+    compared = 0
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        for i, j in _candidate_pairs(members):
+            compared += 1
+            score = _score(members[i], members[j])
+            if score >= threshold:
+                a, b = members[i], members[j]
+                edges.append((a, b, score))
+                parent[find(a['id'])] = find(b['id'])
+
+    groups = {}
+    for a, b, score in edges:
+        group = groups.setdefault(find(a['id']), {'members': {}, 'score': 1.0})
+        group['members'].update({a['id']: a, b['id']: b})
+        group['score'] = min(group['score'], score)
+
+    results = []
+    for group in groups.values():
+        members = sorted(group['members'].values(), key=lambda m: m['id'])
+        results.append({
+            'ids': [m['id'] for m in members],
+            'codes': [m['code'] for m in members],
+            'names': [m['name'] for m in members],
+            'address_key': members[0]['address_key'],
+            'score': round(group['score'], 3),
+        })
+    results.sort(key=lambda g: (-g['score'], g['ids'][0]))
+
+    logger.info(
+        f"Duplicate detection: {len(rows)} institutions, {len(blocks)} blocks, "
+        f"{compared} pairs compared, {len(results)} groups"
+    )
+    return results
+
+
+def write_duplicate_report(groups: list, report_dir: str, generation: int = None) -> str:
+    """중복 의심 그룹 JSON 리포트 저장, 저장 경로 반환"""
+    return write_report('duplicates', groups, report_dir, generation)
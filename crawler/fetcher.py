@@ -0,0 +1,308 @@
+"""
+Fetch Layer - 크롤링용 공유 HTTP 조회 계층
+
+- keep-alive 세션 풀 재사용
+- 호스트별 동시 요청 수 제한
+- 조건부 GET (ETag / Last-Modified)
+- 디스크 응답 캐시 + 본문 해시, 페이지별 파싱 결과 캐시 (변경 없는 페이지는 파싱 생략)
+- REQUEST_TIMEOUT / RETRY_LIMIT 기반 재시도
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    REQUEST_TIMEOUT,
+    RETRY_LIMIT,
+    FETCH_CACHE_DIR,
+    FETCH_MAX_PER_HOST,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+USER_AGENT = 'CareMapCrawler/1.0'
+# Retry-After 헤더 대기 시간 상한 (초)
+MAX_RETRY_AFTER = 60
+
+
+class ResponseCache:
+    """URL 단위 디스크 응답 캐시 (메타데이터 JSON + 본문 파일)"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+
+    def get(self, url: str) -> dict:
+        """
+        캐시 항목 조회
+
+        Returns:
+            {'etag', 'last_modified', 'content_hash', 'encoding'} 또는 None
+        """
+        try:
+            with open(self._path(url, 'json'), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def read_body(self, url: str) -> bytes:
+        """캐시된 본문 조회 (없으면 None)"""
+        try:
+            with open(self._path(url, 'body'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, url: str, meta: dict, body: bytes):
+        """캐시 항목 저장 (임시 파일 작성 후 교체)"""
+        for suffix, data in (('body', body), ('json', json.dumps(meta).encode('utf-8'))):
+            self._write(self._path(url, suffix), data)
+
+    def get_records(self, url: str, kind: str, content_hash: str) -> list:
+        """본문 해시가 같을 때 저장해 둔 파싱 결과 (없거나 본문이 바뀌었으면 None)"""
+        try:
+            with open(self._path(url, f'{kind}.records'), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('content_hash') != content_hash:
+            return None
+        return entry['records']
+
+    def put_records(self, url: str, kind: str, content_hash: str, records: list):
+        """페이지 파싱 결과 저장 (본문 해시와 함께)"""
+        data = json.dumps({'content_hash': content_hash, 'records': records}, ensure_ascii=False)
+        self._write(self._path(url, f'{kind}.records'), data.encode('utf-8'))
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class Fetcher:
+    """
+    크롤러 공유 HTTP 조회 클래스
+
+    get() 결과:
+        {'url', 'status', 'text', 'content_hash', 'changed', 'from_cache'}
+        - changed: 직전 캐시 대비 본문이 바뀌었는지 (False 이면 파싱 생략 가능)
+        - from_cache: 304 Not Modified 로 캐시 본문을 사용했는지
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = FETCH_CACHE_DIR,
+        max_per_host: int = FETCH_MAX_PER_HOST,
+        timeout: float = REQUEST_TIMEOUT,
+        retry_limit: int = RETRY_LIMIT,
+        backoff: float = 0.5,
+        session: requests.Session = None
+    ):
+        self.timeout = timeout
+        self.retry_limit = retry_limit
+        self.backoff = backoff
+        self.max_per_host = max_per_host
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+
+        self.session = session or requests.Session()
+        self.session.headers.setdefault('User-Agent', USER_AGENT)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max_per_host, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'unchanged': 0,
+            'changed': 0,
+            'retries': 0,
+            'errors': 0,
+            'parse_skipped': 0,
+        }
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 요청 제한 세마포어"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _request(self, url: str, headers: dict) -> requests.Response:
+        """재시도 포함 GET 요청 (실패 시 None)"""
+        for attempt in range(self.retry_limit + 1):
+            if attempt:
+                self._count('retries')
+            try:
+                with self._slot(url):
+                    self._count('requests')
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                logger.warning(f"Fetch attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < self.retry_limit:
+                    time.sleep(self.backoff * (2 ** attempt))
+                continue
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Fetch request failed for {url}: {e}")
+                return None
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+            logger.warning(
+                f"Fetch attempt {attempt + 1} got HTTP {response.status_code} for {url}"
+            )
+            if attempt < self.retry_limit:
+                retry_after = response.headers.get('Retry-After', '')
+                delay = (
+                    min(float(retry_after), MAX_RETRY_AFTER) if retry_after.isdigit()
+                    else self.backoff * (2 ** attempt)
+                )
+                time.sleep(delay)
+
+        logger.error(f"Fetch gave up after {self.retry_limit + 1} attempts: {url}")
+        return None
+
+    def get(self, url: str, params: dict = None) -> dict:
+        """
+        조건부 GET 으로 페이지 조회
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+
+        Returns:
+            조회 결과 딕셔너리 또는 None
+        """
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+
+        cached = self.cache.get(url) if self.cache else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self._request(url, headers)
+        if response is None:
+            self._count('errors')
+            return None
+
+        if response.status_code == 304 and cached:
+            body = self.cache.read_body(url)
+            if body is not None:
+                self._count('not_modified')
+                return {
+                    'url': url,
+                    'status': 304,
+                    'text': body.decode(cached.get('encoding') or 'utf-8', errors='replace'),
+                    'content_hash': cached['content_hash'],
+                    'changed': False,
+                    'from_cache': True,
+                }
+            # 본문 파일이 없으면 무조건 조회로 재시도
+            response = self._request(url, {})
+            if response is None:
+                self._count('errors')
+                return None
+
+        if response.status_code >= 400:
+            logger.error(f"Fetch failed for {url}: HTTP {response.status_code}")
+            self._count('errors')
+            return None
+
+        body = response.content
+        content_hash = hashlib.sha256(body).hexdigest()
+        encoding = response.encoding or response.apparent_encoding or 'utf-8'
+        changed = not cached or cached.get('content_hash') != content_hash
+        self._count('changed' if changed else 'unchanged')
+
+        if self.cache:
+            self.cache.put(url, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'encoding': encoding,
+                'fetched_at': time.time(),
+            }, body)
+
+        return {
+            'url': url,
+            'status': response.status_code,
+            'text': body.decode(encoding, errors='replace'),
+            'content_hash': content_hash,
+            'changed': changed,
+            'from_cache': False,
+        }
+
+    def get_many(self, urls: list, workers: int = None):
+        """
+        여러 URL 병렬 조회 (호스트별 동시 요청 제한 적용)
+
+        Args:
+            urls: URL 리스트
+            workers: 스레드 수 (기본: max_per_host)
+
+        Yields:
+            (url, 조회 결과 또는 None) - 요청 순서대로
+        """
+        with ThreadPoolExecutor(max_workers=workers or self.max_per_host) as executor:
+            for url, result in zip(urls, executor.map(self.get, urls)):
+                yield url, result
+
+    def cached_records(self, page: dict, kind: str) -> list:
+        """
+        본문이 바뀌지 않은 페이지(changed=False)의 저장된 파싱 결과
+
+        Args:
+            page: get() 결과
+            kind: 'list' 또는 'detail'
+
+        Returns:
+            list: 기관 데이터 딕셔너리 리스트 또는 None (본문이 바뀌었거나 저장된 결과 없음)
+        """
+        if page['changed'] or not self.cache:
+            return None
+        records = self.cache.get_records(page['url'], kind, page['content_hash'])
+        if records is not None:
+            self._count('parse_skipped')
+        return records
+
+    def store_records(self, page: dict, kind: str, records: list):
+        """페이지 파싱 결과 저장 (다음 조회에서 본문이 같으면 파싱 생략)"""
+        if self.cache:
+            self.cache.put_records(page['url'], kind, page['content_hash'], records)
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
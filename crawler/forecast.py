@@ -0,0 +1,262 @@
+"""
+Vacancy Forecast - 기관별 향후 N개월 예상 여석 (전 기관 일괄, numpy 벡터 연산)
+
+institution_history 는 값이 바뀐 날(recorded_date)에 바뀌기 전 값을 기록하므로,
+월말 시점의 정원/현원은 그 날짜 이후 첫 이력 행의 값(없으면 현재 값)입니다.
+이렇게 만든 기관 x 월 여석(정원 - 현원) 행렬 하나로 모든 기관을 한 번에 계산합니다.
+
+후보 모델 (모두 행렬 연산, 기관별 반복 없음):
+- naive: 이번 달 여석 유지
+- seasonal: 작년 같은 달 여석 (계절 naive)
+- trend: 이번 달 여석 + 최근 추세(최소제곱 기울기), 감쇠 φ^h
+- seasonal_trend: 작년 같은 달 여석 + 1년 치 추세
+
+기관마다 최근 backtest 개월을 가려 두고 예측해 본 MAE 가 가장 작은 모델을 고르고
+(같으면 앞의 단순한 모델), 전체 이력으로 다시 예측합니다.
+선택 효과를 빼고 보기 위해 그 앞 구간으로 고른 모델의 최근 구간 MAE 를 naive 와 비교하고,
+naive 보다 나쁘면(변화가 무작위에 가까운 경우) 모든 기관에 naive 를 사용합니다.
+"""
+import logging
+from datetime import date
+
+import numpy as np
+
+from metrics import write_report
+
+logger = logging.getLogger(__name__)
+
+MODELS = ('naive', 'seasonal', 'trend', 'seasonal_trend')
+SEASON = 12
+
+
+def month_index(day: date) -> int:
+    """날짜 → 월 번호 (year * 12 + month - 1)"""
+    return day.year * 12 + day.month - 1
+
+
+def month_start(index: int) -> date:
+    """월 번호 → 그 달 1일"""
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def monthly_vacancy(institutions: list, history: list, today: date, months: int) -> np.ndarray:
+    """
+    기관 x 월 여석 행렬 (마지막 열이 이번 달, 값은 월말 또는 오늘 시점)
+
+    Args:
+        institutions: {'id', 'capacity', 'current_headcount'} 목록
+        history: {'institution_id', 'recorded_date', 'capacity', 'current_headcount'} 목록
+        today: 기준일
+        months: 월 수
+
+    Returns:
+        np.ndarray: (기관 수, months) float64, 정원/현원이 없으면 NaN
+    """
+    ids = np.array([row['id'] for row in institutions], dtype=np.int64)
+    order = np.argsort(ids, kind='stable')
+    ids = ids[order]
+    current = np.array(
+        [_vacancy(row['capacity'], row['current_headcount']) for row in institutions], dtype=np.float64
+    )[order]
+
+    # 각 월의 시점 (월말, 이번 달은 오늘)
+    last = month_index(today)
+    moments = np.array([
+        min(month_start(index + 1).toordinal() - 1, today.toordinal())
+        for index in range(last - months + 1, last + 1)
+    ], dtype=np.int64)
+
+    values = np.tile(current[:, None], (1, months))
+    if history:
+        h_ids = np.array([row['institution_id'] for row in history], dtype=np.int64)
+        h_days = np.array([row['recorded_date'].toordinal() for row in history], dtype=np.int64)
+        h_vacancy = np.array(
+            [_vacancy(row['capacity'], row['current_headcount']) for row in history], dtype=np.float64
+        )
+        h_pos = np.searchsorted(ids, h_ids)
+        known = (h_pos < len(ids)) & (ids[np.minimum(h_pos, len(ids) - 1)] == h_ids)
+        keys = h_pos[known] * (1 << 24) + h_days[known]
+        h_order = np.argsort(keys, kind='stable')
+        keys, h_vacancy, h_pos = keys[h_order], h_vacancy[known][h_order], h_pos[known][h_order]
+
+        # 시점 이후 첫 이력 행 (같은 기관이면 그 값, 아니면 현재 값)
+        queries = np.arange(len(ids))[:, None] * (1 << 24) + moments[None, :]
+        found = np.searchsorted(keys, queries, side='right')
+        inside = found < len(keys)
+        found = np.minimum(found, len(keys) - 1)
+        same = inside & (h_pos[found] == np.arange(len(ids))[:, None])
+        values = np.where(same, h_vacancy[found], values)
+
+    result = np.empty_like(values)
+    result[order] = values
+    return result
+
+
+def _vacancy(capacity, current) -> float:
+    if capacity is None or current is None:
+        return np.nan
+    return float(capacity - current)
+
+
+def _slope(series: np.ndarray) -> np.ndarray:
+    """행별 최소제곱 기울기 (NaN 제외, 점이 3개 미만이면 0)"""
+    mask = ~np.isnan(series)
+    count = mask.sum(axis=1)
+    x = np.broadcast_to(np.arange(series.shape[1], dtype=np.float64), series.shape)
+    safe = np.maximum(count, 1)
+    x_mean = np.where(mask, x, 0.0).sum(axis=1) / safe
+    y_mean = np.nansum(series, axis=1) / safe
+    dx = np.where(mask, x - x_mean[:, None], 0.0)
+    dy = np.where(mask, series - y_mean[:, None], 0.0)
+    denominator = (dx * dx).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (dx * dy).sum(axis=1) / denominator
+    return np.where((count >= 3) & (denominator > 0), slope, 0.0)
+
+
+def predict(series: np.ndarray, origin: int, horizon: int, trend_months: int = 12,
+            damping: float = 0.9) -> np.ndarray:
+    """
+    series[:, :origin] 로 다음 horizon 개월 예측 (모델별)
+
+    Returns:
+        np.ndarray: (모델 수, 기관 수, horizon), 계산할 수 없는 값은 naive 값
+    """
+    steps = np.arange(1, horizon + 1)
+    last = series[:, origin - 1]
+    naive = np.repeat(last[:, None], horizon, axis=1)
+
+    season_index = origin - 1 + steps - SEASON
+    if season_index[0] >= 0:
+        seasonal = series[:, season_index]
+    else:
+        seasonal = np.full_like(naive, np.nan)
+
+    slope = _slope(series[:, max(0, origin - trend_months):origin])
+    trend = last[:, None] + slope[:, None] * np.cumsum(damping ** steps)[None, :]
+    seasonal_trend = seasonal + slope[:, None] * SEASON
+
+    forecasts = np.stack([naive, seasonal, trend, seasonal_trend])
+    return np.where(np.isnan(forecasts), naive[None], forecasts)
+
+
+def _errors(series: np.ndarray, origin: int, horizon: int, **options) -> np.ndarray:
+    """origin 부터 horizon 개월을 가리고 예측한 모델별 기관별 MAE (모델 수, 기관 수)"""
+    actual = series[:, origin:origin + horizon]
+    deviations = np.abs(predict(series, origin, horizon, **options) - actual[None])
+    count = np.sum(~np.isnan(actual), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        errors = np.nansum(deviations, axis=2) / count
+    return np.where(count > 0, errors, np.inf)
+
+
+def forecast_vacancy(series: np.ndarray, horizon: int, backtest: int = 6, trend_months: int = 12,
+                     damping: float = 0.9) -> dict:
+    """
+    기관별 모델 선택 및 향후 horizon 개월 예측
+
+    Args:
+        series: monthly_vacancy 결과 (기관 수, 월 수)
+        horizon: 예측 개월 수 (1~12)
+        backtest: 모델 선택에 쓸 최근 개월 수
+        trend_months: 추세 기울기 계산 개월 수
+        damping: 추세 감쇠 계수 (0~1)
+
+    Returns:
+        dict: {
+            'forecast': (기관 수, horizon) 예상 여석,
+            'model': 기관별 모델 번호 (MODELS 인덱스),
+            'mae': 기관별 선택 모델의 최근 backtest MAE,
+            'holdout': 선택 편향 없이 잰 MAE {'selected', 'naive', 'fallback'} (이력이 부족하면 None)
+        }
+    """
+    if not 1 <= horizon <= SEASON:
+        raise ValueError(f"Forecast horizon must be 1-{SEASON} months: {horizon}")
+    months = series.shape[1]
+    options = {'trend_months': trend_months, 'damping': damping}
+
+    errors = _errors(series, months - backtest, backtest, **options)
+    model = np.argmin(errors, axis=0)
+    rows = np.arange(series.shape[0])
+
+    holdout = None
+    if months - 2 * backtest >= SEASON:
+        earlier = np.argmin(_errors(series, months - 2 * backtest, backtest, **options), axis=0)
+        valid = np.isfinite(errors[0])
+        if valid.any():
+            holdout = {
+                'selected': round(float(errors[earlier, rows][valid].mean()), 4),
+                'naive': round(float(errors[0][valid].mean()), 4),
+            }
+            # 기관별 선택이 naive 보다 나빴으면 (변화가 무작위에 가까움) 모두 naive
+            holdout['fallback'] = holdout['selected'] >= holdout['naive']
+            if holdout['fallback']:
+                model = np.zeros_like(model)
+
+    forecast = predict(series, months, horizon, **options)[model, rows]
+    return {'forecast': forecast, 'model': model, 'mae': errors[model, rows], 'holdout': holdout}
+
+
+def build_vacancy_forecast(institutions: list, history: list, today: date = None, horizon: int = 6,
+                           history_months: int = 36, backtest: int = 6, trend_months: int = 12,
+                           damping: float = 0.9) -> dict:
+    """
+    전 기관 향후 horizon 개월 예상 여석
+
+    Args:
+        institutions: 운영 중 기관 {'id', 'capacity', 'current_headcount'} 목록
+        history: 기간 내 이력 {'institution_id', 'recorded_date', 'capacity', 'current_headcount'} 목록
+        today: 기준일 (기본: 오늘)
+        horizon: 예측 개월 수
+        history_months: 사용할 이력 개월 수 (이번 달 포함)
+        backtest: 모델 선택에 쓸 최근 개월 수
+        trend_months: 추세 기울기 계산 개월 수
+        damping: 추세 감쇠 계수
+
+    Returns:
+        dict: {
+            'rows': (institution_id, 예측 월 1일, 예상 여석, 모델, backtest MAE) 리스트,
+            'summary': 기관 수/모델별 기관 수/MAE 요약
+        }
+    """
+    today = today or date.today()
+    summary = {'institutions': len(institutions), 'horizon': horizon, 'history_months': history_months}
+    if not institutions:
+        return {'rows': [], 'summary': summary}
+
+    series = monthly_vacancy(institutions, history, today, history_months)
+    result = forecast_vacancy(series, horizon, backtest=backtest, trend_months=trend_months, damping=damping)
+
+    # 여석은 0 ~ 정원
+    capacity = np.array([row['capacity'] or 0 for row in institutions], dtype=np.float64)
+    expected = np.clip(result['forecast'], 0.0, capacity[:, None])
+    valid = ~np.isnan(series[:, -1])
+
+    current = month_index(today)
+    months = [month_start(current + step) for step in range(1, horizon + 1)]
+    rows = [
+        (institutions[i]['id'], month, round(float(expected[i, step]), 2),
+         MODELS[result['model'][i]], _finite(result['mae'][i]))
+        for i in np.flatnonzero(valid)
+        for step, month in enumerate(months)
+    ]
+
+    chosen = result['model'][valid]
+    measured = valid & np.isfinite(result['mae'])
+    summary.update({
+        'forecast_institutions': int(valid.sum()),
+        'models': {name: int(np.sum(chosen == index)) for index, name in enumerate(MODELS)},
+        'backtest_mae': _finite(result['mae'][measured].mean()) if measured.any() else None,
+        'holdout_mae': result['holdout'],
+    })
+    return {'rows': rows, 'summary': summary}
+
+
+def _finite(value):
+    value = float(value)
+    return round(value, 4) if np.isfinite(value) else None
+
+
+def write_forecast_report(summary: dict, report_dir: str, generation: int = None) -> str:
+    """예상 여석 계산 요약 JSON 리포트 저장, 저장 경로 반환"""
+    return write_report('forecast', summary, report_dir, generation)
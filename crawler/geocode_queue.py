@@ -0,0 +1,141 @@
+"""
+Geocode Queue - 일일 쿼터 안에서 좌표 없는 기관 Geocoding, 실패 주소 dead-letter 재시도
+
+- 쿼터: geocode_quota 테이블에 날짜별 호출 수를 기록하고, API 호출 전에 GEOCODE_QUOTA_CHUNK 개씩
+  예약합니다. 여러 프로세스(worker.py)가 같이 써도 하루 합계가 GEOCODE_DAILY_QUOTA 를 넘지 않고,
+  예산이 떨어지면 남은 기관은 건드리지 않은 채 다음 실행으로 넘깁니다.
+- 우선순위: 새로 등록된 기관(첫 수집 역순) → 재시도 시각이 지난 실패 기관
+- 실패: geocode_failures 에 사유와 다음 재시도 시각을 기록 (대기 시간은 시도마다 2배,
+  GEOCODE_MAX_ATTEMPTS 회 실패하면 포기). 호출 한도 초과(HTTP 429)/API 키 없음은 주소 문제가
+  아니므로 기록하지 않고 중단합니다.
+"""
+import logging
+
+from config import (
+    GEOCODE_DAILY_QUOTA, GEOCODE_QUOTA_TIMEZONE, GEOCODE_QUOTA_CHUNK,
+    GEOCODE_RETRY_BACKOFF_HOURS, GEOCODE_MAX_ATTEMPTS
+)
+from geocoding import geocode_batch
+
+logger = logging.getLogger(__name__)
+
+
+class GeocodeBudget:
+    """
+    일일 Geocoding 호출 예산 (geocode_quota 테이블에서 묶음 단위로 예약)
+
+    사용법:
+        budget = GeocodeBudget(db)
+        geocode_batch(addresses, budget=budget)
+        budget.release()  # 쓰지 않은 예약분 반환
+    """
+
+    def __init__(self, db, daily_quota: int = GEOCODE_DAILY_QUOTA, chunk: int = GEOCODE_QUOTA_CHUNK,
+                 timezone: str = GEOCODE_QUOTA_TIMEZONE):
+        self.db = db
+        self.daily_quota = daily_quota
+        self.chunk = max(1, chunk)
+        self.timezone = timezone
+        self.reserved = 0
+        self.used = 0
+        self.exhausted = False
+
+    def take(self) -> bool:
+        """호출 1회 예산 사용 (예약분이 없으면 DB 에서 예약, 쿼터 소진 시 False)"""
+        if self.exhausted:
+            return False
+        if self.reserved == 0:
+            self.reserved = self.db.reserve_geocode_quota(self.chunk, self.daily_quota, self.timezone)
+            if self.reserved == 0:
+                self.exhausted = True
+                return False
+        self.reserved -= 1
+        self.used += 1
+        return True
+
+    def exhaust(self):
+        """API 가 호출 한도 초과를 알려 온 경우 (남은 예약분 반환 후 더 이상 호출하지 않음)"""
+        self.release()
+        self.exhausted = True
+
+    def release(self):
+        """쓰지 않은 예약분 반환"""
+        if self.reserved and self.db.release_geocode_quota(self.reserved, self.timezone):
+            self.reserved = 0
+
+
+def geocode_institutions(db, rows: list, budget: GeocodeBudget, metrics=None) -> dict:
+    """
+    기관 주소 Geocoding → 좌표 저장, 실패 기관은 dead-letter 기록
+
+    Args:
+        db: DatabaseManager
+        rows: {'id', 'address'} 리스트
+        budget: GeocodeBudget
+        metrics: metrics.RunMetrics
+
+    Returns:
+        dict: {'attempted', 'geocoded', 'failed', 'deferred'} (deferred: 예산 소진으로 미처리)
+    """
+    if not rows:
+        return {'attempted': 0, 'geocoded': 0, 'failed': 0, 'deferred': 0}
+
+    failures = {}
+    results = geocode_batch([row['address'] for row in rows], metrics=metrics, budget=budget,
+                            failures=failures)
+    coordinates = [
+        (row['id'], coords['lat'], coords['lng'])
+        for row in rows
+        if (coords := results.get(row['address']))
+    ]
+    failed = [
+        (row['id'], row['address'], *failures[row['address']])
+        for row in rows
+        if row['address'] in failures
+    ]
+    geocoded = db.update_coordinates(coordinates)
+    db.record_geocode_failures(failed, GEOCODE_RETRY_BACKOFF_HOURS, GEOCODE_MAX_ATTEMPTS)
+
+    attempted = sum(1 for row in rows if row['address'] in results)
+    return {
+        'attempted': attempted,
+        'geocoded': geocoded,
+        'failed': len(failed),
+        'deferred': len(rows) - attempted,
+    }
+
+
+def geocode_pending(db, metrics=None, retry_only: bool = False, limit: int = None) -> dict:
+    """
+    오늘 예산 안에서 좌표 없는 새 기관 → 재시도 시각이 지난 실패 기관 순서로 Geocoding
+
+    Args:
+        db: DatabaseManager
+        metrics: metrics.RunMetrics
+        retry_only: True 이면 dead-letter 재시도만 (전체 파이프라인 없이 실행)
+        limit: 단계별 최대 기관 수
+
+    Returns:
+        dict: {'new': geocode_institutions 결과, 'retry': geocode_institutions 결과,
+               'quota_exhausted': 예산 소진 여부}
+    """
+    budget = GeocodeBudget(db)
+    summary = {}
+    try:
+        if not retry_only:
+            rows = db.get_institutions_without_coordinates(limit)
+            summary['new'] = geocode_institutions(db, rows, budget, metrics=metrics)
+        # 새 기관을 모두 처리하고 예산이 남았을 때만 재시도
+        rows = [] if budget.exhausted else db.get_geocode_retries(limit)
+        summary['retry'] = geocode_institutions(db, rows, budget, metrics=metrics)
+    finally:
+        budget.release()
+    summary['quota_exhausted'] = budget.exhausted
+    summary['calls'] = budget.used
+
+    if budget.exhausted:
+        logger.warning(
+            f"Geocoding budget exhausted after {budget.used} calls "
+            f"(GEOCODE_DAILY_QUOTA={GEOCODE_DAILY_QUOTA}), remaining institutions deferred"
+        )
+    return summary
@@ -4,11 +4,25 @@ Geocoding Module - 주소를 위도/경도로 변환
 import requests
 import time
 import logging
-from config import KAKAO_REST_API_KEY, REQUEST_TIMEOUT
+from address import normalize_address
+from config import KAKAO_REST_API_KEY, KAKAO_GEOCODE_URL, REQUEST_TIMEOUT
+from logsetup import ProgressLog
 
 logger = logging.getLogger(__name__)
 
 
+# 실패 사유 (geocode_failures.reason)
+EMPTY_ADDRESS = 'empty_address'
+NOT_FOUND = 'not_found'
+TIMEOUT = 'timeout'
+REQUEST_ERROR = 'request_error'
+PARSE_ERROR = 'parse_error'
+# 주소와 무관한 실패 (dead-letter 에 기록하지 않고 배치 중단)
+NO_API_KEY = 'no_api_key'
+RATE_LIMITED = 'rate_limited'
+BATCH_ABORT_REASONS = (NO_API_KEY, RATE_LIMITED)
+
+
 def geocode_address(address: str) -> dict:
     """
     Kakao Geocoding API를 사용하여 주소를 위도/경도로 변환
@@ -19,15 +33,28 @@ def geocode_address(address: str) -> dict:
     Returns:
         {'lat': float, 'lng': float} 또는 None
     """
+    return geocode_address_with_reason(address)[0]
+
+
+def geocode_address_with_reason(address: str) -> tuple:
+    """
+    geocode_address 와 같으나 실패 사유를 함께 반환
+
+    Args:
+        address: 주소 문자열
+
+    Returns:
+        (결과, None) 또는 (None, (사유, 오류 메시지))
+    """
     if not address or not address.strip():
-        logger.warning("Empty address provided")
-        return None
+        logger.debug("Empty address provided")
+        return None, (EMPTY_ADDRESS, 'empty address')
 
     if not KAKAO_REST_API_KEY:
         logger.error("Kakao REST API Key not configured")
-        return None
+        return None, (NO_API_KEY, 'Kakao REST API Key not configured')
 
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
+    url = KAKAO_GEOCODE_URL
     headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
     params = {"query": address.strip()}
 
@@ -38,6 +65,10 @@ def geocode_address(address: str) -> dict:
             params=params,
             timeout=REQUEST_TIMEOUT
         )
+        # 호출 한도 초과 (앱 일일 쿼터 소진 포함)
+        if response.status_code == 429:
+            logger.error(f"Geocoding rate limited: {response.text[:200]}")
+            return None, (RATE_LIMITED, f"HTTP 429: {response.text[:200]}")
         response.raise_for_status()
         data = response.json()
 
@@ -47,53 +78,100 @@ def geocode_address(address: str) -> dict:
                 'lat': float(doc['y']),
                 'lng': float(doc['x'])
             }
-            logger.info(f"Geocoded: {address} -> ({result['lat']}, {result['lng']})")
-            return result
+            logger.debug("Geocoded: %s -> (%s, %s)", address, result['lat'], result['lng'])
+            return result, None
         else:
-            logger.warning(f"No geocoding result for address: {address}")
-            return None
+            logger.debug("No geocoding result for address: %s", address)
+            return None, (NOT_FOUND, 'no documents')
 
     except requests.exceptions.Timeout:
-        logger.error(f"Geocoding timeout for address: {address}")
-        return None
+        logger.debug("Geocoding timeout for address: %s", address)
+        return None, (TIMEOUT, f"timeout after {REQUEST_TIMEOUT}s")
     except requests.exceptions.RequestException as e:
-        logger.error(f"Geocoding request failed: {e}")
-        return None
+        logger.debug("Geocoding request failed for address %s: %s", address, e)
+        return None, (REQUEST_ERROR, str(e)[:500])
     except (KeyError, ValueError, IndexError) as e:
-        logger.error(f"Geocoding response parsing error: {e}")
-        return None
+        logger.debug("Geocoding response parsing error for address %s: %s", address, e)
+        return None, (PARSE_ERROR, str(e)[:500])
 
 
-def geocode_batch(addresses: list, delay: float = 0.1) -> dict:
+def geocode_batch(addresses: list, delay: float = 0.1, metrics=None, budget=None,
+                  failures: dict = None) -> dict:
     """
     여러 주소를 배치로 Geocoding
 
+    표기만 다른 주소(시/도 약칭, 번지, 건물명/층 등)는 표준 키(address.normalize_address)가
+    같으므로 한 번만 조회하며, 조회에도 표준 키를 사용합니다.
+
     Args:
         addresses: 주소 리스트
         delay: API 호출 간 딜레이 (초)
+        metrics: metrics.RunMetrics (지연 시간 히스토그램, 캐시 적중률 기록)
+        budget: geocode_queue.GeocodeBudget (API 호출 전 take(), 소진되면 중단)
+        failures: 전달하면 실패한 주소의 {address: (사유, 오류 메시지)} 를 채움
 
     Returns:
-        {address: {lat, lng}} 딕셔너리
+        {address: {lat, lng}} 딕셔너리 (입력 주소 기준, 쿼터 소진/호출 한도 초과로
+        조회하지 못한 주소는 포함하지 않음)
     """
     results = {}
+    by_key = {}
+    reasons = {}
+    # 주소마다 로그를 남기지 않고 LOG_PROGRESS_SECONDS 마다 진행 상황 요약
+    progress = ProgressLog(logger, 'geocode', total=len(addresses))
 
     for i, address in enumerate(addresses):
         if address in results:
+            if metrics:
+                metrics.increment('geocode_cache_hits')
+            progress.update(cached=1)
+            continue
+        key = normalize_address(address)
+        if key in by_key:
+            results[address] = by_key[key]
+            if failures is not None and key in reasons:
+                failures[address] = reasons[key]
+            if metrics:
+                metrics.increment('geocode_cache_hits')
+            progress.update(cached=1)
             continue
 
-        logger.info(f"Geocoding {i+1}/{len(addresses)}: {address}")
-        result = geocode_address(address)
-
-        if result:
-            results[address] = result
+        if budget is not None and not budget.take():
+            logger.warning(
+                f"Geocoding quota exhausted: {len(addresses) - i} addresses deferred"
+            )
+            break
+
+        logger.debug("Geocoding %d/%d: %s", i + 1, len(addresses), key)
+        start = time.perf_counter()
+        result, failure = geocode_address_with_reason(key)
+        if metrics:
+            metrics.observe('geocode_latency', time.perf_counter() - start)
+            metrics.increment('geocode_cache_misses')
+            if result is None:
+                metrics.increment('geocode_failures')
+
+        if failure and failure[0] in BATCH_ABORT_REASONS:
+            # 주소 문제가 아니므로 나머지 주소도 실패함 (쿼터 소진으로 처리)
+            if budget is not None:
+                budget.exhaust()
+            logger.error(f"Geocoding stopped ({failure[0]}): {len(addresses) - i} addresses deferred")
+            break
+
+        results[address] = by_key[key] = result
+        if failure:
+            reasons[key] = failure
+            if failures is not None:
+                failures[address] = failure
+            progress.update(**{failure[0]: 1})
         else:
-            results[address] = None
+            progress.update(geocoded=1)
 
         # Rate limiting
         if i < len(addresses) - 1:
             time.sleep(delay)
 
     success_count = sum(1 for v in results.values() if v is not None)
-    logger.info(f"Geocoding complete: {success_count}/{len(addresses)} successful")
+    progress.finish(successful=success_count, distinct=len(by_key))
 
     return results
@@ -0,0 +1,281 @@
+"""
+Catchment Heatmap - 전국 격자 단위 공급(정원)/여석 밀도
+
+운영 중 기관의 정원과 여석(정원 - 현원)을 고정된 전국 격자(cell_km 간격)의 칸에 모은 뒤,
+반경(radius_km) 안의 칸에 거리 가중 커널(linear: 1 - 거리/반경, uniform: 반경 내 1)로 퍼뜨립니다.
+각 칸의 값은 "이 위치에서 반경 안에 있는 정원/여석의 가중 합" 입니다.
+
+커널 합성은 선형이므로, 이전 결과 파일에 저장해 둔 기관별 입력과 비교하여 바뀐 기관이
+있는 칸 주변(반경 내)만 차이만큼 다시 계산합니다. 바뀐 기관 비율이 full_ratio 를 넘거나
+격자/커널 설정이 바뀌면 전체를 다시 계산합니다.
+
+파일 형식 (little-endian, 각 구역은 8바이트 정렬, 백엔드 institutions/heatmap.py 가 mmap):
+    헤더  '<8sIIiII6d6Q'
+          magic(b'CMAPGRD1'), 행 수, 열 수, 크롤링 회차(-1: 없음), 기관 수, 커널(0 uniform, 1 linear),
+          cell_km, radius_km, 남서쪽 위도, 남서쪽 경도, 위도 간격, 경도 간격,
+          구역 오프셋 6개 (SECTIONS 순서)
+    capacity, vacancy                       float32[행 x 열]  (남쪽 행부터)
+    inst_id, inst_cell, inst_capacity, inst_vacancy  int32[기관 수]  (증분 계산용 입력)
+"""
+import logging
+import math
+import os
+import struct
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'CMAPGRD1'
+HEADER = struct.Struct('<8sIIiII6d6Q')
+SECTIONS = ('capacity', 'vacancy', 'inst_id', 'inst_cell', 'inst_capacity', 'inst_vacancy')
+DTYPES = {
+    'capacity': '<f4', 'vacancy': '<f4',
+    'inst_id': '<i4', 'inst_cell': '<i4', 'inst_capacity': '<i4', 'inst_vacancy': '<i4',
+}
+KERNELS = {'uniform': 0, 'linear': 1}
+# 격자 범위 (제주 ~ 강원 북부, 서해 도서 ~ 울릉도)
+GRID_BOUNDS = {'min_lat': 33.0, 'max_lat': 38.7, 'min_lng': 124.5, 'max_lng': 131.0}
+KM_PER_DEGREE = 111.32
+# 경도 간격 계산 기준 위도 (격자 범위 중간)
+REFERENCE_LAT = 36.0
+
+
+def grid_spec(cell_km: float) -> dict:
+    """격자 크기/간격"""
+    lat_step = cell_km / KM_PER_DEGREE
+    lng_step = cell_km / (KM_PER_DEGREE * math.cos(math.radians(REFERENCE_LAT)))
+    return {
+        'rows': math.ceil((GRID_BOUNDS['max_lat'] - GRID_BOUNDS['min_lat']) / lat_step),
+        'cols': math.ceil((GRID_BOUNDS['max_lng'] - GRID_BOUNDS['min_lng']) / lng_step),
+        'min_lat': GRID_BOUNDS['min_lat'],
+        'min_lng': GRID_BOUNDS['min_lng'],
+        'lat_step': lat_step,
+        'lng_step': lng_step,
+    }
+
+
+def kernel_weights(cell_km: float, radius_km: float, kernel: str) -> np.ndarray:
+    """(2r+1) x (2r+1) 거리 가중치 (칸 중심 간 거리 기준)"""
+    reach = math.ceil(radius_km / cell_km)
+    offsets = np.arange(-reach, reach + 1) * cell_km
+    distance = np.hypot(offsets[:, None], offsets[None, :])
+    if kernel == 'uniform':
+        return (distance <= radius_km).astype(np.float64)
+    return np.clip(1.0 - distance / radius_km, 0.0, None)
+
+
+def institution_inputs(rows: list, spec: dict) -> dict:
+    """
+    기관 목록 → 격자 입력 배열 (격자 밖/좌표 없는 기관 제외)
+
+    Returns:
+        dict: inst_id, inst_cell, inst_capacity, inst_vacancy (int32 배열, id 순)
+    """
+    located = [
+        row for row in rows
+        if row['latitude'] is not None and row['longitude'] is not None
+    ]
+    located.sort(key=lambda row: row['id'])
+    lat = np.array([float(row['latitude']) for row in located], dtype=np.float64)
+    lng = np.array([float(row['longitude']) for row in located], dtype=np.float64)
+    capacity = np.array([row['capacity'] or 0 for row in located], dtype=np.int64)
+    current = np.array([row['current_headcount'] or 0 for row in located], dtype=np.int64)
+
+    row_index = np.floor((lat - spec['min_lat']) / spec['lat_step']).astype(np.int64)
+    col_index = np.floor((lng - spec['min_lng']) / spec['lng_step']).astype(np.int64)
+    inside = (
+        (row_index >= 0) & (row_index < spec['rows'])
+        & (col_index >= 0) & (col_index < spec['cols'])
+    )
+    return {
+        'inst_id': np.array([row['id'] for row in located], dtype=np.int32)[inside],
+        'inst_cell': (row_index * spec['cols'] + col_index)[inside].astype(np.int32),
+        'inst_capacity': np.maximum(capacity, 0)[inside].astype(np.int32),
+        'inst_vacancy': np.maximum(capacity - current, 0)[inside].astype(np.int32),
+    }
+
+
+def _spread(cells: np.ndarray, values: np.ndarray, weights: np.ndarray, spec: dict) -> np.ndarray:
+    """칸별 값을 커널로 퍼뜨린 격자 (전체 계산: 커널 칸마다 격자 전체를 한 번씩 더함)"""
+    rows, cols = spec['rows'], spec['cols']
+    reach = weights.shape[0] // 2
+    binned = np.zeros(rows * cols, dtype=np.float64)
+    np.add.at(binned, cells, values)
+    binned = binned.reshape(rows, cols)
+
+    padded = np.zeros((rows + 2 * reach, cols + 2 * reach), dtype=np.float64)
+    for dy, dx in zip(*np.nonzero(weights)):
+        padded[dy:dy + rows, dx:dx + cols] += weights[dy, dx] * binned
+    return padded[reach:reach + rows, reach:reach + cols]
+
+
+def _apply_deltas(grid: np.ndarray, cells: np.ndarray, deltas: np.ndarray, weights: np.ndarray):
+    """바뀐 칸 주변(반경 내)에만 차이를 더함"""
+    rows, cols = grid.shape
+    reach = weights.shape[0] // 2
+    for cell, delta in zip(cells.tolist(), deltas.tolist()):
+        y, x = divmod(cell, cols)
+        top, bottom = max(0, y - reach), min(rows, y + reach + 1)
+        left, right = max(0, x - reach), min(cols, x + reach + 1)
+        grid[top:bottom, left:right] += delta * weights[
+            top - (y - reach):bottom - (y - reach), left - (x - reach):right - (x - reach)
+        ]
+
+
+def read_heatmap(path: str) -> dict:
+    """
+    이전 결과 파일 읽기
+
+    Returns:
+        dict: 헤더 값 + 구역 배열 (파일이 없거나 형식이 다르면 None)
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, rows, cols, generation, count, kernel, *values = HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC:
+        return None
+
+    cell_km, radius_km, min_lat, min_lng, lat_step, lng_step, *offsets = values
+    sizes = {'capacity': rows * cols, 'vacancy': rows * cols}
+    result = {
+        'rows': rows, 'cols': cols, 'generation': generation, 'kernel': kernel,
+        'cell_km': cell_km, 'radius_km': radius_km, 'min_lat': min_lat, 'min_lng': min_lng,
+        'lat_step': lat_step, 'lng_step': lng_step,
+    }
+    for name, offset in zip(SECTIONS, offsets):
+        result[name] = np.frombuffer(data, dtype=DTYPES[name], count=sizes.get(name, count), offset=offset)
+    return result
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def write_heatmap(path: str, spec: dict, params: dict, grids: dict, inputs: dict, generation: int = None) -> int:
+    """결과 파일 작성 (원자적 교체), 파일 크기 반환"""
+    sections = {
+        'capacity': grids['capacity'].astype(DTYPES['capacity']).ravel(),
+        'vacancy': grids['vacancy'].astype(DTYPES['vacancy']).ravel(),
+        **{name: inputs[name].astype(DTYPES[name]) for name in SECTIONS[2:]},
+    }
+    offsets = []
+    position = _align(HEADER.size)
+    for name in SECTIONS:
+        offsets.append(position)
+        position = _align(position + sections[name].nbytes)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, spec['rows'], spec['cols'], generation if generation is not None else -1,
+            len(inputs['inst_id']), KERNELS[params['kernel']],
+            params['cell_km'], params['radius_km'], spec['min_lat'], spec['min_lng'],
+            spec['lat_step'], spec['lng_step'], *offsets
+        ))
+        for name, offset in zip(SECTIONS, offsets):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(sections[name].tobytes())
+        f.write(b'\0' * (position - f.tell()))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return position
+
+
+def _changed_contributions(previous: dict, inputs: dict) -> tuple:
+    """
+    이전/현재 기관 입력 비교 → (바뀐 기관 수, 칸 목록, 칸별 정원 차이, 칸별 여석 차이)
+
+    사라진 기관과 바뀐 기관의 이전 값은 빼고, 새 기관과 바뀐 기관의 현재 값은 더합니다.
+    """
+    old_keys = np.stack([previous['inst_cell'], previous['inst_capacity'], previous['inst_vacancy']], axis=1)
+    new_keys = np.stack([inputs['inst_cell'], inputs['inst_capacity'], inputs['inst_vacancy']], axis=1)
+    _, old_common, new_common = np.intersect1d(
+        previous['inst_id'], inputs['inst_id'], assume_unique=True, return_indices=True
+    )
+    same = np.all(old_keys[old_common] == new_keys[new_common], axis=1)
+
+    old_changed = np.ones(len(old_keys), dtype=bool)
+    old_changed[old_common[same]] = False
+    new_changed = np.ones(len(new_keys), dtype=bool)
+    new_changed[new_common[same]] = False
+
+    cells = np.concatenate([old_keys[old_changed, 0], new_keys[new_changed, 0]])
+    capacity = np.concatenate([-old_keys[old_changed, 1], new_keys[new_changed, 1]]).astype(np.float64)
+    vacancy = np.concatenate([-old_keys[old_changed, 2], new_keys[new_changed, 2]]).astype(np.float64)
+
+    unique_cells, inverse = np.unique(cells, return_inverse=True)
+    capacity_delta = np.zeros(len(unique_cells))
+    vacancy_delta = np.zeros(len(unique_cells))
+    np.add.at(capacity_delta, inverse, capacity)
+    np.add.at(vacancy_delta, inverse, vacancy)
+    nonzero = (capacity_delta != 0) | (vacancy_delta != 0)
+    changed = int(old_changed.sum() + new_changed.sum() - (~same).sum())
+    return changed, unique_cells[nonzero], capacity_delta[nonzero], vacancy_delta[nonzero]
+
+
+def build_heatmap(rows: list, path: str, generation: int = None, cell_km: float = 1.0,
+                  radius_km: float = 5.0, kernel: str = 'linear', full_ratio: float = 0.3) -> dict:
+    """
+    공급/여석 히트맵 계산 및 저장
+
+    Args:
+        rows: 운영 중 기관 목록 (id, capacity, current_headcount, latitude, longitude)
+        path: 결과 파일 경로
+        generation: 크롤링 회차
+        cell_km: 격자 간격 (km)
+        radius_km: 반경 (km)
+        kernel: 'linear' (거리에 따라 감소) 또는 'uniform' (반경 내 합)
+        full_ratio: 바뀐 기관 비율이 이 값을 넘으면 전체 계산
+
+    Returns:
+        dict: {'mode': 'full'/'incremental'/'unchanged', 'changed', 'cells', 'bytes'}
+    """
+    if kernel not in KERNELS:
+        raise ValueError(f"Unknown heatmap kernel: {kernel}")
+    spec = grid_spec(cell_km)
+    params = {'cell_km': cell_km, 'radius_km': radius_km, 'kernel': kernel}
+    weights = kernel_weights(cell_km, radius_km, kernel)
+    inputs = institution_inputs(rows, spec)
+    previous = read_heatmap(path)
+
+    compatible = previous is not None and all((
+        previous['rows'] == spec['rows'], previous['cols'] == spec['cols'],
+        previous['cell_km'] == cell_km, previous['radius_km'] == radius_km,
+        previous['kernel'] == KERNELS[kernel],
+    ))
+    mode, changed = 'full', len(inputs['inst_id'])
+    if compatible:
+        changed, cells, capacity_delta, vacancy_delta = _changed_contributions(previous, inputs)
+        if changed == 0:
+            logger.info(f"Heatmap unchanged: {path}")
+            return {'mode': 'unchanged', 'changed': 0, 'cells': 0, 'bytes': os.path.getsize(path)}
+        if changed <= full_ratio * max(len(inputs['inst_id']), 1):
+            mode = 'incremental'
+
+    if mode == 'incremental':
+        grids = {}
+        for name, delta in (('capacity', capacity_delta), ('vacancy', vacancy_delta)):
+            grid = previous[name].astype(np.float64).reshape(spec['rows'], spec['cols'])
+            _apply_deltas(grid, cells, delta, weights)
+            # float32 저장으로 생긴 잔차가 음수가 되지 않도록
+            grids[name] = np.maximum(grid, 0.0)
+        touched = len(cells)
+    else:
+        grids = {
+            'capacity': _spread(inputs['inst_cell'], inputs['inst_capacity'], weights, spec),
+            'vacancy': _spread(inputs['inst_cell'], inputs['inst_vacancy'], weights, spec),
+        }
+        touched = spec['rows'] * spec['cols']
+
+    size = write_heatmap(path, spec, params, grids, inputs, generation=generation)
+    logger.info(
+        f"Heatmap written to {path} ({mode}): {changed} institutions changed, "
+        f"{touched} source cells, {spec['rows']}x{spec['cols']} grid, {size:,} bytes"
+    )
+    return {'mode': mode, 'changed': changed, 'cells': touched, 'bytes': size}
@@ -0,0 +1,323 @@
+"""
+Job Queue - PostgreSQL 작업 큐 (여러 노드가 크롤링/Geocoding 작업을 나눠 처리)
+
+작업은 crawl_jobs 테이블의 행이며, 워커는 SELECT ... FOR UPDATE SKIP LOCKED 로 대기 작업을
+가져가므로 여러 워커가 같은 작업을 잡지 않고, 다른 워커가 잠근 행을 기다리지도 않습니다.
+
+- 상태: pending → running → done
+  실패하면 지수 백오프 후 다시 pending, max_attempts 번 실패하면 dead (dead-letter)
+- 임대(lease): 작업을 가져간 워커는 lease_expires_at 까지 작업을 소유하고 heartbeat 로 연장합니다.
+  워커가 죽어 임대가 만료되면 다른 워커의 정리(requeue_expired)로 다시 pending 이 됩니다.
+- 같은 작업 키(kind, job_key)는 대기/처리 중에 한 번만 등록됩니다.
+- crawl_workers 테이블에 워커별 heartbeat 와 처리 건수/소요 시간을 기록합니다.
+
+모든 메서드는 호출마다 커밋합니다. (작업 행 잠금을 바로 풀어 다른 워커가 기다리지 않도록)
+"""
+import logging
+
+import psycopg2
+from psycopg2.extras import Json, execute_values
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+DEAD = 'dead'
+
+
+class JobQueue:
+    """crawl_jobs 작업 큐 (DatabaseManager 연결 사용)"""
+
+    def __init__(self, db, lease_seconds: int = 60, max_attempts: int = 5, backoff_seconds: int = 30):
+        """
+        Args:
+            db: 연결된 DatabaseManager
+            lease_seconds: 작업 임대 시간 (heartbeat 없이 이 시간이 지나면 다른 워커가 회수)
+            max_attempts: 최대 시도 횟수 (넘으면 dead)
+            backoff_seconds: 재시도 대기 시간 기준 (시도마다 2배)
+        """
+        self.db = db
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+    def _execute(self, query: str, vars=None, fetch: bool = False):
+        try:
+            self.db.cursor.execute(query, vars)
+            rows = self.db.cursor.fetchall() if fetch else self.db.cursor.rowcount
+            self.db.conn.commit()
+            return rows
+        except psycopg2.Error as e:
+            self.db.conn.rollback()
+            logger.error(f"Job queue query failed: {e}")
+            return [] if fetch else 0
+
+    def enqueue(self, kind: str, payloads: list, keys: list = None, generation: int = None,
+                priority: int = 0) -> int:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 ('list_page', 'detail', 'geocode')
+            payloads: 작업별 payload 딕셔너리 리스트
+            keys: 작업별 키 리스트 (같은 키의 대기/처리 중 작업이 있으면 등록하지 않음)
+            generation: 크롤링 회차
+            priority: 우선순위 (클수록 먼저)
+
+        Returns:
+            등록된 작업 수
+        """
+        if not payloads:
+            return 0
+        keys = keys or [None] * len(payloads)
+        try:
+            rows = execute_values(
+                self.db.cursor,
+                """
+                INSERT INTO crawl_jobs (kind, job_key, payload, generation, priority, max_attempts)
+                VALUES %s
+                ON CONFLICT (kind, job_key) WHERE status IN ('pending', 'running') DO NOTHING
+                RETURNING id
+                """,
+                [
+                    (kind, key, Json(payload), generation, priority, self.max_attempts)
+                    for key, payload in zip(keys, payloads)
+                ],
+                page_size=1000,
+                fetch=True
+            )
+            self.db.conn.commit()
+            logger.info(f"Enqueued {len(rows)}/{len(payloads)} {kind} jobs")
+            return len(rows)
+        except psycopg2.Error as e:
+            self.db.conn.rollback()
+            logger.error(f"Job enqueue failed: {e}")
+            return 0
+
+    def claim(self, worker_id: str, limit: int = 1, kinds: list = None) -> list:
+        """
+        대기 작업 가져오기 (우선순위, 등록 순)
+
+        Args:
+            worker_id: 워커 ID
+            limit: 가져올 최대 작업 수
+            kinds: 처리할 작업 종류 (없으면 전체)
+
+        Returns:
+            list: {'id', 'kind', 'payload', 'generation', 'attempts'} 리스트
+        """
+        return self._execute(
+            """
+            UPDATE crawl_jobs
+            SET status = 'running', locked_by = %(worker)s, attempts = attempts + 1,
+                started_at = CURRENT_TIMESTAMP,
+                lease_expires_at = CURRENT_TIMESTAMP + %(lease)s * INTERVAL '1 second'
+            WHERE id IN (
+                SELECT id FROM crawl_jobs
+                WHERE status = 'pending' AND run_after <= CURRENT_TIMESTAMP
+                  AND (%(kinds)s::text[] IS NULL OR kind = ANY(%(kinds)s))
+                ORDER BY priority DESC, id
+                LIMIT %(limit)s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING id, kind, payload, generation, attempts
+            """,
+            {'worker': worker_id, 'lease': self.lease_seconds, 'limit': limit, 'kinds': kinds},
+            fetch=True
+        )
+
+    def heartbeat(self, worker_id: str) -> int:
+        """워커 heartbeat 기록 및 처리 중인 작업 임대 연장, 연장한 작업 수 반환"""
+        self._execute(
+            "UPDATE crawl_workers SET heartbeat_at = CURRENT_TIMESTAMP WHERE worker_id = %s",
+            (worker_id,)
+        )
+        return self._execute(
+            """
+            UPDATE crawl_jobs
+            SET lease_expires_at = CURRENT_TIMESTAMP + %s * INTERVAL '1 second'
+            WHERE status = 'running' AND locked_by = %s
+            """,
+            (self.lease_seconds, worker_id)
+        )
+
+    def complete(self, job: dict, worker_id: str, items: int = None) -> bool:
+        """
+        작업 완료 처리
+
+        Returns:
+            성공 여부 (임대가 만료되어 다른 워커에게 넘어간 작업이면 False)
+        """
+        updated = self._execute(
+            """
+            UPDATE crawl_jobs
+            SET status = 'done', items = %s, finished_at = CURRENT_TIMESTAMP,
+                lease_expires_at = NULL, last_error = NULL
+            WHERE id = %s AND status = 'running' AND locked_by = %s
+            """,
+            (items, job['id'], worker_id)
+        )
+        if not updated:
+            logger.warning(f"Job {job['id']} lease lost before completion")
+        return bool(updated)
+
+    def fail(self, job: dict, worker_id: str, error: str) -> str:
+        """
+        작업 실패 처리 (재시도 가능하면 백오프 후 pending, 아니면 dead)
+
+        Returns:
+            바뀐 상태 ('pending' / 'dead', 임대를 잃었으면 None)
+        """
+        rows = self._execute(
+            """
+            UPDATE crawl_jobs
+            SET status = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'pending' END,
+                run_after = CURRENT_TIMESTAMP
+                    + %s * POWER(2, GREATEST(attempts - 1, 0)) * INTERVAL '1 second',
+                last_error = %s, locked_by = NULL, lease_expires_at = NULL,
+                finished_at = CASE WHEN attempts >= max_attempts THEN CURRENT_TIMESTAMP END
+            WHERE id = %s AND status = 'running' AND locked_by = %s
+            RETURNING status
+            """,
+            (self.backoff_seconds, str(error)[:2000], job['id'], worker_id),
+            fetch=True
+        )
+        if not rows:
+            return None
+        if rows[0]['status'] == DEAD:
+            logger.error(f"Job {job['id']} ({job['kind']}) moved to dead-letter: {error}")
+        return rows[0]['status']
+
+    def requeue_expired(self) -> dict:
+        """
+        임대가 만료된 작업 회수 (워커 비정상 종료 등)
+
+        Returns:
+            {'retried': 다시 대기 상태가 된 작업 수, 'dead': dead 처리된 작업 수}
+        """
+        rows = self._execute(
+            """
+            UPDATE crawl_jobs
+            SET status = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'pending' END,
+                last_error = 'lease expired (worker ' || COALESCE(locked_by, '?') || ')',
+                locked_by = NULL, lease_expires_at = NULL,
+                finished_at = CASE WHEN attempts >= max_attempts THEN CURRENT_TIMESTAMP END
+            WHERE id IN (
+                SELECT id FROM crawl_jobs
+                WHERE status = 'running' AND lease_expires_at < CURRENT_TIMESTAMP
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING status
+            """,
+            fetch=True
+        )
+        result = {
+            'retried': sum(1 for row in rows if row['status'] == PENDING),
+            'dead': sum(1 for row in rows if row['status'] == DEAD),
+        }
+        if rows:
+            logger.warning(f"Expired leases requeued: {result['retried']} retried, {result['dead']} dead")
+        return result
+
+    def requeue_dead(self, kind: str = None) -> int:
+        """dead 작업을 시도 횟수를 초기화해 다시 대기 상태로, 옮긴 작업 수 반환"""
+        return self._execute(
+            """
+            UPDATE crawl_jobs
+            SET status = 'pending', attempts = 0, run_after = CURRENT_TIMESTAMP, finished_at = NULL
+            WHERE status = 'dead' AND (%(kind)s::text IS NULL OR kind = %(kind)s)
+            """,
+            {'kind': kind}
+        )
+
+    def active_count(self, generation: int = None, kinds: list = None) -> int:
+        """대기/처리 중 작업 수 (generation 을 주면 해당 회차만, kinds 를 주면 해당 종류만)"""
+        rows = self._execute(
+            """
+            SELECT COUNT(*) AS count FROM crawl_jobs
+            WHERE status IN ('pending', 'running')
+              AND (%(generation)s::int IS NULL OR generation = %(generation)s)
+              AND (%(kinds)s::text[] IS NULL OR kind = ANY(%(kinds)s))
+            """,
+            {'generation': generation, 'kinds': kinds},
+            fetch=True
+        )
+        return rows[0]['count'] if rows else 0
+
+    def dead_count(self, generation: int = None, kinds: list = None) -> int:
+        """dead 작업 수 (generation 을 주면 해당 회차만, kinds 를 주면 해당 종류만)"""
+        rows = self._execute(
+            """
+            SELECT COUNT(*) AS count FROM crawl_jobs
+            WHERE status = 'dead'
+              AND (%(generation)s::int IS NULL OR generation = %(generation)s)
+              AND (%(kinds)s::text[] IS NULL OR kind = ANY(%(kinds)s))
+            """,
+            {'generation': generation, 'kinds': kinds},
+            fetch=True
+        )
+        return rows[0]['count'] if rows else 0
+
+    def register_worker(self, worker_id: str, hostname: str, pid: int) -> bool:
+        """워커 등록 (같은 ID 로 다시 시작하면 통계 초기화)"""
+        return bool(self._execute(
+            """
+            INSERT INTO crawl_workers (worker_id, hostname, pid) VALUES (%s, %s, %s)
+            ON CONFLICT (worker_id) DO UPDATE SET
+                hostname = EXCLUDED.hostname, pid = EXCLUDED.pid, status = 'running',
+                started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP,
+                jobs_done = 0, jobs_failed = 0, items = 0, busy_seconds = 0
+            """,
+            (worker_id, hostname, pid)
+        ))
+
+    def record_worker(self, worker_id: str, done: int = 0, failed: int = 0, items: int = 0,
+                      busy_seconds: float = 0.0, status: str = None) -> bool:
+        """워커 처리 건수/소요 시간 누적"""
+        return bool(self._execute(
+            """
+            UPDATE crawl_workers
+            SET jobs_done = jobs_done + %s, jobs_failed = jobs_failed + %s,
+                items = items + %s, busy_seconds = busy_seconds + %s,
+                status = COALESCE(%s, status), heartbeat_at = CURRENT_TIMESTAMP
+            WHERE worker_id = %s
+            """,
+            (done, failed, items, busy_seconds, status, worker_id)
+        ))
+
+    def stats(self) -> dict:
+        """
+        큐/워커 현황
+
+        Returns:
+            {'jobs': {kind: {status: count}},
+             'workers': [{'worker_id', 'status', 'jobs_done', 'jobs_failed', 'items',
+                          'busy_seconds', 'uptime_seconds', 'jobs_per_sec', 'items_per_sec'}]}
+        """
+        jobs = {}
+        for row in self._execute(
+            "SELECT kind, status, COUNT(*) AS count FROM crawl_jobs GROUP BY kind, status ORDER BY kind",
+            fetch=True
+        ):
+            jobs.setdefault(row['kind'], {})[row['status']] = row['count']
+
+        workers = []
+        for row in self._execute(
+            """
+            SELECT worker_id, hostname, pid, status, jobs_done, jobs_failed, items, busy_seconds,
+                   EXTRACT(EPOCH FROM heartbeat_at - started_at)::float8 AS uptime_seconds,
+                   EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - heartbeat_at)::float8 AS heartbeat_age
+            FROM crawl_workers
+            ORDER BY worker_id
+            """,
+            fetch=True
+        ):
+            row = dict(row)
+            uptime = row['uptime_seconds']
+            row['jobs_per_sec'] = round(row['jobs_done'] / uptime, 2) if uptime else None
+            row['items_per_sec'] = (
+                round(row['items'] / row['busy_seconds'], 1) if row['busy_seconds'] else None
+            )
+            workers.append(row)
+        return {'jobs': jobs, 'workers': workers}
@@ -0,0 +1,178 @@
+"""
+Logging Setup - 큐 기반 비동기 로깅 (JSON lines 파일 + 콘솔)
+
+로그를 남기는 코드는 레코드를 큐에 넣기만 하고, 파일/콘솔 출력은 백그라운드 스레드
+(logging.handlers.QueueListener)가 합니다. 수집/Geocoding/동기화 반복문이 디스크 쓰기를 기다리지 않습니다.
+
+- 파일: 한 줄에 JSON 객체 하나 (ts, level, logger, process, msg, exc + extra 필드)
+- 콘솔: 기존과 같은 텍스트 형식 (LOG_CONSOLE_FORMAT=json 이면 파일과 같은 JSON lines, 백엔드 작업 실행기가 읽음)
+- 모듈별 레벨: LOG_LEVELS="geocoding=DEBUG,fetcher=WARNING"
+- 기관/주소마다 남기던 INFO 로그는 DEBUG 로 내리고, ProgressLog 로 LOG_PROGRESS_SECONDS 마다
+  처리 건수/속도/결과별 건수를 한 줄로 요약합니다.
+
+사용법:
+    setup_logging('logs/crawler.log')
+
+    progress = ProgressLog(logger, 'geocode', total=len(addresses))
+    for address in addresses:
+        ...
+        progress.update(geocoded=1)
+    progress.finish()
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+
+from config import LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_CONSOLE_FORMAT, LOG_PROGRESS_SECONDS
+
+# extra 로 넘긴 필드만 JSON 에 추가하기 위한 기본 LogRecord 속성
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+TEXT_FORMAT = '%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """LogRecord → JSON 한 줄"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'process': record.processName,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지만 만들어 큐에 넣는 핸들러
+
+    기본 QueueHandler.prepare 는 예외 traceback 까지 msg 에 붙이므로,
+    traceback 은 exc_text 로 따로 넘겨 출력 핸들러의 형식(JSON/텍스트)을 따르게 합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def setup_logging(path: str, multiprocess: bool = False) -> logging.handlers.QueueListener:
+    """
+    루트 로거를 큐 핸들러로 설정하고 백그라운드 출력 스레드 시작 (프로세스 종료 시 남은 로그 기록)
+
+    Args:
+        path: 로그 파일 경로 (LOG_FORMAT=json 이면 JSON lines)
+        multiprocess: True 이면 multiprocessing.Queue 사용 (fork 한 워커 프로세스 로그도 이 프로세스가 기록)
+
+    Returns:
+        QueueListener
+    """
+    log_queue = multiprocessing.Queue(-1) if multiprocess else queue.SimpleQueue()
+
+    file_handler = logging.FileHandler(path, encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(
+        JsonFormatter() if LOG_CONSOLE_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT)
+    )
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+    for name, level in parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def parse_levels(text: str) -> dict:
+    """'geocoding=DEBUG,fetcher=WARNING' → {'geocoding': 'DEBUG', 'fetcher': 'WARNING'}"""
+    levels = {}
+    for item in text.split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+class ProgressLog:
+    """
+    반복 작업 진행 상황을 interval 초마다 한 줄로 요약 (처리 건수, 속도, 남은 시간, 결과별 건수)
+
+    Args:
+        logger: 기록할 로거
+        task: 작업 이름 (예: 'geocode', 'sync')
+        total: 전체 건수 (모르면 None)
+        interval: 요약 간격 (초)
+    """
+
+    def __init__(self, logger: logging.Logger, task: str, total: int = None,
+                 interval: float = LOG_PROGRESS_SECONDS):
+        self.logger = logger
+        self.task = task
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.counts = {}
+        self.start = self.last = time.monotonic()
+
+    def update(self, count: int = 1, **counters):
+        """count 건 처리 (counters: 결과별 건수, 예: geocoded=1)"""
+        self.done += count
+        for key, value in counters.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+        if self.interval is not None and time.monotonic() - self.last >= self.interval:
+            self._emit('progress')
+
+    def finish(self, **fields) -> dict:
+        """완료 요약 기록, 요약 필드 반환"""
+        return self._emit('done', **fields)
+
+    def _emit(self, event: str, **fields) -> dict:
+        now = self.last = time.monotonic()
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        summary = {
+            'event': event, 'task': self.task, 'done': self.done, 'total': self.total,
+            'seconds': round(elapsed, 2), 'rate': round(rate, 1), 'counts': dict(self.counts), **fields,
+        }
+        position = f"{self.done}/{self.total}" if self.total is not None else f"{self.done}"
+        eta = ''
+        if event == 'progress' and self.total and rate > 0:
+            summary['eta_seconds'] = round((self.total - self.done) / rate, 1)
+            eta = f", eta {summary['eta_seconds']:.0f}s"
+        counts = ', '.join(f"{key} {value}" for key, value in self.counts.items())
+        extra = ', '.join(f"{key} {value}" for key, value in fields.items())
+        self.logger.info(
+            f"{self.task} {event}: {position} in {elapsed:.1f}s ({rate:.1f}/s{eta})"
+            + (f" - {counts}" if counts else '') + (f" - {extra}" if extra else ''),
+            extra=summary
+        )
+        return summary
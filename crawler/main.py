@@ -2,23 +2,35 @@
 """
 CareMap Crawler - 장기요양기관 데이터 수집
 """
+import argparse
 import logging
 import sys
 import os
 from datetime import datetime
 from db_manager import DatabaseManager
-from geocoding import geocode_batch
+from geocode_queue import geocode_pending
+from bulk_import import import_file
+from config import (
+    BULK_BATCH_SIZE, REPORT_DIR, METRICS_TEXTFILE, DEDUP_THRESHOLD,
+    REGION_BOUNDARY_FILE, REGION_CODE_PROPERTY, REGION_NAME_PROPERTY,
+    SNAPSHOT_DIR, SNAPSHOT_KEEP, SNAPSHOT_BROTLI_QUALITY, COLUMNAR_STORE_PATH,
+    HEATMAP_PATH, HEATMAP_CELL_KM, HEATMAP_RADIUS_KM, HEATMAP_KERNEL, HEATMAP_FULL_RATIO,
+    REFRESH_BUDGET, REFRESH_RUN_INTERVAL_DAYS, REFRESH_MAX_INTERVAL_DAYS, REFRESH_HISTORY_DAYS,
+    REFRESH_PRIOR_CHANGES, REFRESH_PRIOR_DAYS, FORECAST_MONTHS, FORECAST_HISTORY_MONTHS,
+    FORECAST_BACKTEST_MONTHS, FORECAST_TREND_MONTHS, FORECAST_TREND_DAMPING, GEOCODE_QUOTA_TIMEZONE, LOG_FILE
+)
+from logsetup import setup_logging
+from metrics import RunMetrics, write_json_report, write_prometheus_textfile
+from snapshot import publish_map_snapshot
+from columnar import write_columnar_store
+from heatmap import build_heatmap
+from dedup import find_duplicates, write_duplicate_report
+from regions import load_region_index, assign_regions, sido_code
+from scheduler import plan_refresh, measure_refresh, write_refresh_report
+from updater import crawl_institution_details
+from forecast import build_vacancy_forecast, write_forecast_report
 import json
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/crawler.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -103,12 +115,251 @@ def load_sample_data():
     ]
 
 
-def main():
-    """메인 실행 함수"""
+def sync_sample_data(db: DatabaseManager, metrics: RunMetrics, geocode: bool = True,
+                     full_refresh: bool = False) -> dict:
+    """샘플 데이터 로드 → 동기화 → 좌표 없는 기관 Geocoding"""
+    # 3. 샘플 데이터 로드
+    logger.info("\n[Step 3] Loading sample data...")
+    with metrics.stage('collect') as stage:
+        institutions_data = load_sample_data()
+        stage['records'] = len(institutions_data)
+    logger.info(f"Loaded {len(institutions_data)} institutions")
+
+    # 4. 데이터베이스 동기화 (주소가 바뀌지 않은 기관은 기존 좌표 유지)
+    logger.info("\n[Step 4] Syncing to database...")
+    with metrics.stage('sync') as stage:
+        if full_refresh:
+            result = db.sync_institutions_shadow(institutions_data, batch_size=BULK_BATCH_SIZE)
+        else:
+            result = db.sync_institutions_batched(institutions_data, batch_size=BULK_BATCH_SIZE)
+        stage['records'] = result['success']
+
+    # 5. 좌표 없는 기관 Geocoding (일일 예산, 실패 기관은 geocode_failures)
+    logger.info("\n[Step 5] Geocoding institutions without coordinates...")
+    if not geocode:
+        logger.info("Skipped (--skip-geocode)")
+        return result
+    geocode_missing_coordinates(db, metrics)
+    return result
+
+
+def sync_bulk_file(db: DatabaseManager, metrics: RunMetrics, path: str, geocode: bool = True,
+                   full_refresh: bool = False) -> dict:
+    """기관 목록 파일(CSV/Excel) 스트리밍 적재 → 좌표 없는 기관 Geocoding"""
+    # 3. 파일 적재 (행 단위 스트리밍, 배치 UPSERT)
+    logger.info(f"\n[Step 3] Importing {path}...")
+    with metrics.stage('sync') as stage:
+        result = import_file(db, path, batch_size=BULK_BATCH_SIZE, shadow=full_refresh)
+        stage['records'] = result['success']
+
+    # 4. 좌표 없는 기관 Geocoding
+    logger.info("\n[Step 4] Geocoding institutions without coordinates...")
+    if not geocode:
+        logger.info("Skipped (--skip-geocode)")
+        return result
+    geocode_missing_coordinates(db, metrics)
+
+    # 5. (파일 적재 시 Step 3 에서 동기화 완료)
+    return result
+
+
+def refresh_institutions(db: DatabaseManager, metrics: RunMetrics, geocode: bool = True) -> dict:
+    """변경 이력 기반 재수집 계획 → 대상 기관 상세 페이지 수집 → 동기화 → 좌표 없는 기관 Geocoding"""
+    result = {'success': 0, 'failed': 0, 'total': 0}
+
+    # 3. 재수집 계획 (기관별 변경률 → 주기/우선순위, 회차 예산만큼 작업 목록)
+    logger.info("\n[Step 3] Planning refresh...")
+    with metrics.stage('schedule') as stage:
+        rows = db.get_refresh_rows(REFRESH_HISTORY_DAYS)
+        if rows is None:
+            return result
+        plan = plan_refresh(
+            rows, REFRESH_BUDGET, run_interval=REFRESH_RUN_INTERVAL_DAYS,
+            max_interval=REFRESH_MAX_INTERVAL_DAYS,
+            prior_changes=REFRESH_PRIOR_CHANGES, prior_days=REFRESH_PRIOR_DAYS
+        )
+        db.save_refresh_schedule(plan['schedule'])
+        stage['records'] = len(plan['work'])
+    summary = plan['summary']
+    logger.info(
+        f"  - Due: {summary['due']}, requests: {summary['requests']}/{summary['budget']}, "
+        f"expected freshness {summary['expected_freshness']:.1%} "
+        f"(uniform {summary['uniform_freshness']:.1%})"
+    )
+
+    # 4. 대상 기관 상세 페이지 수집
+    logger.info("\n[Step 4] Crawling institution details...")
+    with metrics.stage('collect') as stage:
+        records = crawl_institution_details([row['institution_code'] for row in plan['work']])
+        stage['records'] = len(records)
+    outcome = measure_refresh(plan['work'], records)
+    metrics.increment('refresh_requests', outcome['requested'])
+    metrics.increment('refresh_changed', outcome['changed'])
+
+    # 5. 동기화 (변경된 기관은 이력 기록, 주소가 바뀐 기관은 좌표 초기화)
+    logger.info("\n[Step 5] Syncing to database...")
+    with metrics.stage('sync') as stage:
+        result = db.sync_institutions_batched(records, batch_size=BULK_BATCH_SIZE)
+        stage['records'] = result['success']
+    if geocode:
+        geocode_missing_coordinates(db, metrics)
+
+    logger.info(
+        f"  - Refreshed: {outcome['fetched']}/{outcome['requested']} fetched, "
+        f"{outcome['changed']} changed, freshness "
+        f"{summary['freshness_before']:.1%} -> {summary['freshness_after']:.1%}"
+    )
+    write_refresh_report({**summary, **outcome}, REPORT_DIR, generation=db.generation)
+    return result
+
+
+def geocode_missing_coordinates(db: DatabaseManager, metrics: RunMetrics, retry_only: bool = False):
+    """좌표 없는 기관 Geocoding → 좌표 저장 (일일 예산 안에서 새 기관 먼저, 실패 기관은 dead-letter)"""
+    with metrics.stage('geocode') as stage:
+        summary = geocode_pending(db, metrics=metrics, retry_only=retry_only)
+        stage['records'] = sum(summary[part]['attempted'] for part in ('new', 'retry') if part in summary)
+    for part in ('new', 'retry'):
+        if part in summary:
+            result = summary[part]
+            logger.info(
+                f"  - Geocode {part}: {result['geocoded']} geocoded, {result['failed']} failed, "
+                f"{result['deferred']} deferred"
+            )
+    status = db.get_geocode_status(GEOCODE_QUOTA_TIMEZONE)
+    if status:
+        logger.info(
+            f"  - Geocode quota used today: {status['quota_used']}, dead-letter: {status['waiting']} waiting, "
+            f"{status['due']} due, {status['abandoned']} abandoned {status['failures']}"
+        )
+
+
+def assign_institution_regions(db: DatabaseManager, metrics: RunMetrics):
+    """좌표 → 행정구역 코드 (경계 파일이 없으면 생략)"""
+    if not os.path.exists(REGION_BOUNDARY_FILE):
+        logger.warning(f"Region boundary file not found: {REGION_BOUNDARY_FILE} (skipped)")
+        return
+
+    with metrics.stage('region') as stage:
+        index = load_region_index(REGION_BOUNDARY_FILE, REGION_CODE_PROPERTY, REGION_NAME_PROPERTY)
+        db.upsert_regions([(code, name, sido_code(code)) for code, name in index.regions.items()])
+        rows = db.get_region_rows()
+        if rows is None:
+            return
+        changed = assign_regions(index, rows)
+        stage['records'] = db.update_region_codes(changed)
+    logger.info(f"  - Region codes updated: {len(changed)} of {len(rows)} institutions")
+
+
+def forecast_vacancies(db: DatabaseManager, metrics: RunMetrics):
+    """기관별 향후 월별 예상 여석 계산 및 vacancy_forecasts 교체"""
+    with metrics.stage('forecast') as stage:
+        inputs = db.get_forecast_inputs(FORECAST_HISTORY_MONTHS)
+        if inputs is None:
+            return
+        result = build_vacancy_forecast(
+            inputs['institutions'], inputs['history'], horizon=FORECAST_MONTHS,
+            history_months=FORECAST_HISTORY_MONTHS, backtest=FORECAST_BACKTEST_MONTHS,
+            trend_months=FORECAST_TREND_MONTHS, damping=FORECAST_TREND_DAMPING
+        )
+        stage['records'] = db.save_vacancy_forecasts(result['rows'])
+    summary = result['summary']
+    write_forecast_report(summary, REPORT_DIR, generation=db.generation)
+    logger.info(
+        f"  - Vacancy forecast: {summary.get('forecast_institutions', 0)} institutions x "
+        f"{FORECAST_MONTHS} months, models {summary.get('models', {})}"
+    )
+    if summary.get('holdout_mae'):
+        logger.info(
+            f"  - Forecast holdout MAE: {summary['holdout_mae']['selected']} "
+            f"(naive {summary['holdout_mae']['naive']})"
+        )
+
+
+def publish_outputs(db: DatabaseManager, metrics: RunMetrics):
+    """
+    회차 반영 후 산출물 갱신 (행정구역 코드 → 중복 리포트 → 지도 스냅샷/컬럼 저장소 → 히트맵 → 예상 여석)
+
+    main 실행, 작업 큐 회차 종료(worker.py finish), Geocoding 작업 소진, --geocode-retry 후 공통으로 실행합니다.
+    """
+    # 행정구역 코드 (지역 필터는 region_code 정수 비교)
+    assign_institution_regions(db, metrics)
+
+    # 중복 의심 기관 탐지 (다른 기관 코드, 같은 주소/유사 기관명) - 리포트만 작성
+    with metrics.stage('dedup') as stage:
+        rows = db.get_dedup_rows()
+        if rows is not None:
+            groups = find_duplicates(rows, threshold=DEDUP_THRESHOLD)
+            stage['records'] = len(groups)
+            write_duplicate_report(groups, REPORT_DIR, generation=db.generation)
+            logger.info(f"  - Duplicate groups: {len(groups)}")
+
+    # 지도 데이터셋 스냅샷 (백엔드가 DB 조회 없이 응답)
+    with metrics.stage('snapshot') as stage:
+        rows = db.get_map_rows()
+        if rows is not None:
+            manifest = publish_map_snapshot(
+                rows, SNAPSHOT_DIR, generation=db.generation,
+                keep=SNAPSHOT_KEEP, brotli_quality=SNAPSHOT_BROTLI_QUALITY
+            )
+            stage['records'] = manifest['count']
+            logger.info(f"  - Map snapshot: {manifest['version']}")
+            store = write_columnar_store(rows, COLUMNAR_STORE_PATH, generation=db.generation)
+            logger.info(f"  - Columnar store: {store['count']} institutions, {store['bytes']:,} bytes")
+
+    # 공급/여석 히트맵 (이전 결과 대비 바뀐 기관 주변 칸만 다시 계산)
+    if rows is not None:
+        with metrics.stage('heatmap') as stage:
+            grid = build_heatmap(
+                rows, HEATMAP_PATH, generation=db.generation, cell_km=HEATMAP_CELL_KM,
+                radius_km=HEATMAP_RADIUS_KM, kernel=HEATMAP_KERNEL, full_ratio=HEATMAP_FULL_RATIO
+            )
+            stage['records'] = grid['changed']
+        logger.info(f"  - Heatmap: {grid['mode']}, {grid['changed']} institutions changed")
+
+    # 향후 월별 예상 여석 (변경 이력 기반, 전 기관 일괄 계산)
+    forecast_vacancies(db, metrics)
+
+
+def publish_run_report(db: DatabaseManager, metrics: RunMetrics):
+    """실행 리포트 저장 (JSON, Prometheus textfile, crawl_runs) 및 최근 실행과 비교"""
+    metrics.increment('db_statements', db.cursor.statements)
+    metrics.increment('db_rows', db.cursor.rows)
+    report = metrics.report(run_id=db.generation)
+
+    trends = db.get_stage_trends()
+    db.save_run_metrics(report)
+    write_json_report(report, REPORT_DIR)
+    if METRICS_TEXTFILE:
+        # textfile collector 경로 권한/디렉토리 문제로 실행 전체를 실패시키지 않음
+        try:
+            write_prometheus_textfile(report, METRICS_TEXTFILE)
+        except OSError as e:
+            logger.warning(f"Could not write Prometheus textfile {METRICS_TEXTFILE}: {e}")
+
+    logger.info("\nStage Timings (vs. recent average):")
+    for stage, entry in report['stages'].items():
+        trend = trends.get(stage)
+        baseline = f"{trend['avg_seconds']:.2f}s over {trend['runs']} runs" if trend else "n/a"
+        logger.info(
+            f"  - {stage}: {entry['seconds']:.2f}s, {entry['records']} records "
+            f"({baseline})"
+        )
+    for cache, ratio in report['cache_hit_ratio'].items():
+        if ratio is not None:
+            logger.info(f"  - {cache} cache hit ratio: {ratio:.1%}")
+    logger.info(
+        f"  - DB: {report['database']['statements']} statements, "
+        f"{report['database']['rows']} rows"
+    )
+
+
+def main(import_path: str = None, geocode: bool = True, refresh: bool = False, full_refresh: bool = False) -> bool:
+    """메인 실행 함수 (DB 연결/테이블 준비 실패 시 False)"""
     logger.info("=" * 60)
     logger.info("CareMap Crawler Started")
     logger.info(f"Start Time: {datetime.now()}")
     logger.info("=" * 60)
+    metrics = RunMetrics()
 
     # 1. 데이터베이스 연결
     logger.info("\n[Step 1] Connecting to database...")
@@ -116,71 +367,152 @@ def main():
 
     if not db.connect():
         logger.error("Database connection failed. Exiting...")
-        return
+        return False
 
     # 2. 테이블 생성
     logger.info("\n[Step 2] Creating tables...")
     if not db.create_tables():
         logger.error("Table creation failed. Exiting...")
         db.disconnect()
-        return
+        return False
 
-    # 3. 샘플 데이터 로드
-    logger.info("\n[Step 3] Loading sample data...")
-    institutions_data = load_sample_data()
-    logger.info(f"Loaded {len(institutions_data)} institutions")
-
-    # 4. 주소 Geocoding
-    logger.info("\n[Step 4] Geocoding addresses...")
-    addresses = [inst['address'] for inst in institutions_data]
-    geocode_results = geocode_batch(addresses)
-
-    # Geocoding 결과를 데이터에 추가
-    for inst in institutions_data:
-        coords = geocode_results.get(inst['address'])
-        if coords:
-            inst['lat'] = coords['lat']
-            inst['lng'] = coords['lng']
-        else:
-            inst['lat'] = None
-            inst['lng'] = None
-            logger.warning(f"Geocoding failed for: {inst['name']}")
+    if db.begin_run() is None:
+        logger.error("Crawl run registration failed. Exiting...")
+        db.disconnect()
+        return False
 
-    # 5. 데이터베이스 동기화
-    logger.info("\n[Step 5] Syncing to database...")
-    result = db.sync_institutions(institutions_data)
+    # 3-5. 데이터 수집 및 동기화
+    if import_path:
+        result = sync_bulk_file(db, metrics, import_path, geocode=geocode, full_refresh=full_refresh)
+    elif refresh:
+        result = refresh_institutions(db, metrics, geocode=geocode)
+    else:
+        result = sync_sample_data(db, metrics, geocode=geocode, full_refresh=full_refresh)
 
     logger.info(f"\nSync Result:")
     logger.info(f"  - Total: {result['total']}")
     logger.info(f"  - Success: {result['success']}")
     logger.info(f"  - Failed: {result['failed']}")
 
+    # 폐업 기관 처리 (이번 회차에 수집되지 않은 기관)
+    # 재수집 회차는 일부 기관만 수집하므로 폐업 처리하지 않음
+    with metrics.stage('reconcile') as stage:
+        run_result = db.finish_run(close=not refresh)
+        stage['records'] = run_result['closed']
+    if refresh:
+        logger.info("  - Closure not applied (refresh run)")
+    elif run_result['skipped']:
+        logger.warning("  - Closure skipped (partial crawl suspected)")
+    else:
+        logger.info(f"  - Closed: {run_result['closed']}")
+
+    # 행정구역 코드, 중복 리포트, 지도 스냅샷/컬럼 저장소, 히트맵, 예상 여석
+    publish_outputs(db, metrics)
+
     # 6. 통계 출력
     logger.info("\n[Step 6] Database Statistics:")
     stats = db.get_statistics()
     logger.info(f"  - Total Institutions: {stats['total']}")
+    logger.info(f"  - Closed Institutions: {stats['closed']}")
     logger.info(f"  - By Service Type:")
     for service_type, count in stats['by_service_type'].items():
         logger.info(f"    * {service_type}: {count}")
 
-    # 7. 연결 종료
+    # 7. 실행 리포트
+    publish_run_report(db, metrics)
+
+    # 8. 연결 종료
     db.disconnect()
 
     logger.info("\n" + "=" * 60)
     logger.info("CareMap Crawler Completed")
     logger.info(f"End Time: {datetime.now()}")
     logger.info("=" * 60)
+    return True
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='CareMap Crawler')
+    parser.add_argument(
+        '--import', dest='import_path', metavar='FILE',
+        help='공공 포털 기관 목록 파일(.csv/.xlsx)을 일괄 적재'
+    )
+    parser.add_argument(
+        '--skip-geocode', action='store_true',
+        help='동기화 후 좌표 없는 기관의 Geocoding 생략'
+    )
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help='변경 이력 기반 우선순위로 회차 예산(REFRESH_BUDGET)만큼 기관 상세 페이지만 재수집'
+    )
+    parser.add_argument(
+        '--full-refresh', action='store_true',
+        help='전체 동기화를 그림자 테이블에 적재한 뒤 테이블 이름 교체로 반영 (백엔드 조회 잠금 최소화)'
+    )
+    parser.add_argument(
+        '--forecast-only', action='store_true',
+        help='수집 없이 예상 여석(vacancy_forecasts)만 다시 계산 (야간 배치)'
+    )
+    parser.add_argument(
+        '--geocode-retry', action='store_true',
+        help='수집 없이 재시도 시각이 지난 Geocoding 실패 기관(geocode_failures)만 다시 조회'
+    )
+    args = parser.parse_args()
+    if args.full_refresh and args.refresh:
+        parser.error('--full-refresh cannot be combined with --refresh (partial crawl)')
+    return args
+
+
+def run_geocode_retry() -> bool:
+    """수집 없이 Geocoding dead-letter 만 재시도 → 새 좌표로 산출물 갱신"""
+    metrics = RunMetrics()
+    db = DatabaseManager()
+    if not db.connect():
+        logger.error("Database connection failed. Exiting...")
+        return False
+    ready = db.create_tables()
+    if ready:
+        geocode_missing_coordinates(db, metrics, retry_only=True)
+        publish_outputs(db, metrics)
+    db.disconnect()
+    return ready
+
+
+def run_forecast_only() -> bool:
+    """수집 없이 예상 여석만 계산"""
+    metrics = RunMetrics()
+    db = DatabaseManager()
+    if not db.connect():
+        logger.error("Database connection failed. Exiting...")
+        return False
+    ready = db.create_tables()
+    if ready:
+        forecast_vacancies(db, metrics)
+    db.disconnect()
+    return ready
 
 
 if __name__ == '__main__':
-    # logs 디렉토리 생성
-    os.makedirs('logs', exist_ok=True)
+    # logs 디렉토리 생성 후 로깅 설정 (큐 기반, 파일은 JSON lines)
+    os.makedirs(os.path.dirname(LOG_FILE) or '.', exist_ok=True)
+    setup_logging(LOG_FILE)
 
+    args = parse_args()
     try:
-        main()
+        if args.forecast_only:
+            completed = run_forecast_only()
+        elif args.geocode_retry:
+            completed = run_geocode_retry()
+        else:
+            completed = main(import_path=args.import_path, geocode=not args.skip_geocode, refresh=args.refresh,
+                             full_refresh=args.full_refresh)
     except KeyboardInterrupt:
         logger.info("\nCrawler interrupted by user")
         sys.exit(0)
     except Exception as e:
         logger.error(f"\nUnexpected error: {e}", exc_info=True)
         sys.exit(1)
+    # 실패 종료 코드 (백엔드 작업 실행기/cron 이 실패로 판단)
+    if not completed:
+        sys.exit(1)
@@ -0,0 +1,237 @@
+"""
+Run Metrics - 크롤러 실행 단계별 시간/처리량 측정 및 리포트
+
+- 단계(stage)별 소요 시간, 처리 건수, 초당 처리량
+- Geocoding 지연 시간 히스토그램, 캐시 적중률
+- DB 실행 SQL 수, 처리 행 수
+- JSON 실행 리포트 + Prometheus textfile collector 파일 출력
+"""
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Geocoding 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = 'caremap_crawler'
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 형식)"""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> dict:
+        """{상한: 누적 건수} (마지막은 '+Inf')"""
+        result = {}
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            result[str(bound)] = total
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'buckets': self.cumulative(),
+        }
+
+
+class RunMetrics:
+    """크롤러 실행 1회의 측정값 모음"""
+
+    def __init__(self):
+        self.started_at = datetime.now().astimezone()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.histograms = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        단계 소요 시간 측정
+
+        사용법:
+            with metrics.stage('geocode') as stage:
+                ...
+                stage['records'] = len(addresses)
+        """
+        entry = {'seconds': 0.0, 'records': 0}
+        logger.info(f"Stage '{name}' started", extra={'event': 'stage_start', 'stage': name})
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry['seconds'] = time.perf_counter() - start
+            self.stages[name] = entry
+            logger.info(
+                f"Stage '{name}': {entry['seconds']:.2f}s, {entry['records']} records",
+                extra={
+                    'event': 'stage_done', 'stage': name,
+                    'seconds': round(entry['seconds'], 2), 'records': entry['records'],
+                }
+            )
+
+    def observe(self, name: str, value: float):
+        """히스토그램에 값 기록"""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].observe(value)
+
+    def increment(self, name: str, amount: int = 1):
+        """카운터 증가"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def hit_ratio(self, cache: str) -> float:
+        """캐시 적중률 ('{cache}_cache_hits' / '{cache}_cache_misses' 카운터 기준)"""
+        hits = self.counters.get(f'{cache}_cache_hits', 0)
+        misses = self.counters.get(f'{cache}_cache_misses', 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    def report(self, run_id: int = None) -> dict:
+        """JSON 실행 리포트 생성"""
+        total_seconds = time.perf_counter() - self._start
+        stages = {
+            name: {
+                'seconds': round(entry['seconds'], 4),
+                'records': entry['records'],
+                'records_per_sec': (
+                    round(entry['records'] / entry['seconds'], 1) if entry['seconds'] else None
+                ),
+            }
+            for name, entry in self.stages.items()
+        }
+        caches = sorted({
+            key[:-len('_cache_hits')] for key in self.counters if key.endswith('_cache_hits')
+        } | {
+            key[:-len('_cache_misses')] for key in self.counters if key.endswith('_cache_misses')
+        })
+        db_seconds = self.stages.get('sync', {}).get('seconds')
+        db_rows = self.counters.get('db_rows', 0)
+
+        return {
+            'run_id': run_id,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().astimezone().isoformat(timespec='seconds'),
+            'total_seconds': round(total_seconds, 4),
+            'stages': stages,
+            'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+            'cache_hit_ratio': {cache: self.hit_ratio(cache) for cache in caches},
+            'database': {
+                'statements': self.counters.get('db_statements', 0),
+                'rows': db_rows,
+                'rows_per_sec': round(db_rows / db_seconds, 1) if db_seconds else None,
+            },
+            'counters': dict(self.counters),
+        }
+
+
+def _atomic_write(path: str, content: str):
+    """임시 파일 작성 후 교체 (수집기가 쓰는 도중의 파일을 읽지 않도록)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_report(name: str, data, report_dir: str, generation=None) -> str:
+    """
+    JSON 리포트 저장 (report_dir/<name>-<회차>.json, 회차가 없으면 latest)
+
+    Args:
+        name: 리포트 종류 (run, duplicates, refresh, forecast)
+        data: JSON 으로 저장할 값
+        report_dir: 리포트 디렉토리
+        generation: 크롤링 회차
+
+    Returns:
+        저장 경로
+    """
+    path = os.path.join(report_dir, f"{name}-{generation or 'latest'}.json")
+    _atomic_write(path, json.dumps(data, ensure_ascii=False, indent=2))
+    logger.info(f"Report written to {path}")
+    return path
+
+
+def write_json_report(report: dict, report_dir: str) -> str:
+    """실행 리포트 저장, 저장 경로 반환"""
+    return write_report('run', report, report_dir, report['run_id'] or datetime.now().strftime('%Y%m%d%H%M%S'))
+
+
+def format_prometheus(report: dict) -> str:
+    """Prometheus textfile collector 형식으로 변환"""
+    p = METRIC_PREFIX
+    lines = [
+        f"# HELP {p}_stage_seconds Wall time of each crawler stage in the last run.",
+        f"# TYPE {p}_stage_seconds gauge",
+    ]
+    for stage, entry in report['stages'].items():
+        lines.append(f'{p}_stage_seconds{{stage="{stage}"}} {entry["seconds"]}')
+
+    lines += [
+        f"# HELP {p}_stage_records Records processed by each crawler stage in the last run.",
+        f"# TYPE {p}_stage_records gauge",
+    ]
+    for stage, entry in report['stages'].items():
+        lines.append(f'{p}_stage_records{{stage="{stage}"}} {entry["records"]}')
+
+    for name, hist in report['histograms'].items():
+        metric = f"{p}_{name}_seconds"
+        lines += [
+            f"# HELP {metric} Latency histogram of {name} in the last run.",
+            f"# TYPE {metric} histogram",
+        ]
+        for bound, count in hist['buckets'].items():
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+        lines.append(f"{metric}_sum {hist['sum']}")
+        lines.append(f"{metric}_count {hist['count']}")
+
+    lines += [
+        f"# HELP {p}_cache_hit_ratio Cache hit ratio in the last run.",
+        f"# TYPE {p}_cache_hit_ratio gauge",
+    ]
+    for cache, ratio in report['cache_hit_ratio'].items():
+        if ratio is not None:
+            lines.append(f'{p}_cache_hit_ratio{{cache="{cache}"}} {ratio:.4f}')
+
+    db = report['database']
+    lines += [
+        f"# HELP {p}_db_statements Database statements executed in the last run.",
+        f"# TYPE {p}_db_statements gauge",
+        f"{p}_db_statements {db['statements']}",
+        f"# HELP {p}_db_rows Database rows affected in the last run.",
+        f"# TYPE {p}_db_rows gauge",
+        f"{p}_db_rows {db['rows']}",
+        f"# HELP {p}_run_seconds Total wall time of the last run.",
+        f"# TYPE {p}_run_seconds gauge",
+        f"{p}_run_seconds {report['total_seconds']}",
+        f"# HELP {p}_last_run_timestamp_seconds Unix time the last run finished.",
+        f"# TYPE {p}_last_run_timestamp_seconds gauge",
+        f"{p}_last_run_timestamp_seconds {int(time.time())}",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus_textfile(report: dict, path: str):
+    """Prometheus textfile collector 파일 저장"""
+    _atomic_write(path, format_prometheus(report))
+    logger.info(f"Prometheus metrics written to {path}")
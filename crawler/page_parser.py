@@ -0,0 +1,193 @@
+"""
+Page Parser - 장기요양기관 목록/상세 페이지 HTML 파싱
+
+selectolax(Lexbor) 기반. 필요한 테이블만 CSS 선택자로 직접 찾고
+문서 전체를 순회하지 않습니다.
+
+파싱 결과는 DatabaseManager.sync_institutions 가 받는 딕셔너리 형태입니다:
+    {'code', 'name', 'type', 'capacity', 'current', 'address', 'hours'}
+"""
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from selectolax.lexbor import LexborHTMLParser
+
+logger = logging.getLogger(__name__)
+
+# 목록 페이지
+LIST_HEADER_SELECTOR = 'table.tbl_list thead th'
+LIST_ROW_SELECTOR = 'table.tbl_list tbody tr'
+PAGING_LAST_SELECTOR = 'div.paging a.last'
+
+# 상세 페이지
+DETAIL_HEADER_SELECTOR = 'table.tbl_view th'
+
+# 표 제목 → 레코드 키
+FIELD_LABELS = {
+    '기관기호': 'code',
+    '기관명': 'name',
+    '급여종류': 'type',
+    '정원': 'capacity',
+    '현원': 'current',
+    '주소': 'address',
+    '운영시간': 'hours',
+}
+INT_FIELDS = ('capacity', 'current')
+RECORD_KEYS = ('code', 'name', 'type', 'capacity', 'current', 'address', 'hours')
+
+CODE_PATTERN = re.compile(r'ltcAdminSym=(\w+)')
+DIGITS_PATTERN = re.compile(r'\d+')
+SPACES_PATTERN = re.compile(r'\s+')
+
+
+def _text(node) -> str:
+    """노드 텍스트 (공백 정규화)"""
+    if node is None:
+        return None
+    text = SPACES_PATTERN.sub(' ', node.text(deep=True, separator=' ')).strip()
+    return text or None
+
+
+def parse_int(value: str) -> int:
+    """'1,234명' → 1234 (숫자가 없으면 None)"""
+    if not value:
+        return None
+    digits = DIGITS_PATTERN.findall(value)
+    return int(''.join(digits)) if digits else None
+
+
+def _finalize(record: dict) -> dict:
+    for key in INT_FIELDS:
+        record[key] = parse_int(record.get(key))
+    for key in RECORD_KEYS:
+        record.setdefault(key, None)
+    return record
+
+
+def parse_list_page(html: str) -> list:
+    """
+    기관 목록 페이지 파싱
+
+    Args:
+        html: 목록 페이지 HTML
+
+    Returns:
+        기관 데이터 딕셔너리 리스트 (목록에 없는 항목은 None)
+    """
+    tree = LexborHTMLParser(html)
+
+    # 표 제목으로 열 위치 결정 (사이트의 열 순서 변경에 대비)
+    columns = {}
+    for index, th in enumerate(tree.css(LIST_HEADER_SELECTOR)):
+        key = FIELD_LABELS.get(_text(th))
+        if key:
+            columns[index] = key
+
+    if 'name' not in columns.values():
+        logger.warning("Institution list table not found")
+        return []
+
+    records = []
+    for tr in tree.css(LIST_ROW_SELECTOR):
+        cells = tr.css('td')
+        record = {}
+        for index, key in columns.items():
+            if index < len(cells):
+                record[key] = _text(cells[index])
+
+        link = tr.css_first('a[href*="ltcAdminSym="]')
+        if link is not None:
+            match = CODE_PATTERN.search(link.attributes.get('href') or '')
+            if match:
+                record['code'] = match.group(1)
+
+        if not record.get('code'):
+            logger.warning(f"Skipping row without institution code: {record.get('name')}")
+            continue
+        records.append(_finalize(record))
+
+    return records
+
+
+def parse_page_count(html: str) -> int:
+    """목록 페이지의 전체 페이지 수 (페이지 이동 링크가 없으면 1)"""
+    node = LexborHTMLParser(html).css_first(PAGING_LAST_SELECTOR)
+    if node is None:
+        return 1
+    # fn_goPage('list', 948, 10) 처럼 인자가 여러 개일 수 있으므로 첫 번째 정수만 사용
+    match = re.search(r'\d+', node.attributes.get('onclick') or '')
+    return max(int(match.group()), 1) if match else 1
+
+
+def parse_detail_page(html: str) -> dict:
+    """
+    기관 상세 페이지 파싱
+
+    Args:
+        html: 상세 페이지 HTML
+
+    Returns:
+        기관 데이터 딕셔너리 또는 None (기관기호가 없는 경우)
+    """
+    tree = LexborHTMLParser(html)
+
+    record = {}
+    for th in tree.css(DETAIL_HEADER_SELECTOR):
+        key = FIELD_LABELS.get(_text(th))
+        if key and key not in record:
+            td = th.next
+            while td is not None and td.tag != 'td':
+                td = td.next
+            record[key] = _text(td)
+
+    if not record.get('code'):
+        logger.warning("Institution detail page without institution code")
+        return None
+    return _finalize(record)
+
+
+PARSERS = {
+    'list': parse_list_page,
+    'detail': parse_detail_page,
+}
+
+
+def parse_each(pages: list, kind: str = 'list', processes: int = None, chunksize: int = 16) -> list:
+    """
+    여러 페이지를 페이지별로 파싱 (프로세스 풀 사용 가능)
+
+    Args:
+        pages: HTML 문자열 리스트
+        kind: 'list' 또는 'detail'
+        processes: 프로세스 수 (1 이면 현재 프로세스에서 처리, None 이면 CPU 수)
+        chunksize: 프로세스당 한 번에 넘길 페이지 수
+
+    Returns:
+        list: 페이지 순서대로 기관 데이터 딕셔너리 리스트 (상세 페이지는 0~1개)
+    """
+    parse = PARSERS[kind]
+
+    if processes == 1 or len(pages) <= 1:
+        results = [parse(html) for html in pages]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(parse, pages, chunksize=chunksize))
+
+    if kind == 'list':
+        return results
+    return [[record] if record else [] for record in results]
+
+
+def parse_pages(pages: list, kind: str = 'list', processes: int = None, chunksize: int = 16) -> list:
+    """
+    여러 페이지를 파싱 (parse_each 결과를 하나로 합침)
+
+    Returns:
+        list: 기관 데이터 딕셔너리 리스트
+    """
+    return [
+        record
+        for records in parse_each(pages, kind, processes=processes, chunksize=chunksize)
+        for record in records
+    ]
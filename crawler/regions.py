@@ -0,0 +1,219 @@
+"""
+Region Assignment - 좌표 → 행정구역(시/군/구) 코드
+
+로컬 GeoJSON 행정구역 경계 파일(예: 시군구 SIG_CD / SIG_KOR_NM)을 읽어
+폴리곤 경계 상자로 STR-tree(Sort-Tile-Recursive) 색인을 만들고,
+좌표가 속한 경계 상자의 폴리곤만 point-in-polygon 으로 확인합니다.
+
+각 외곽선(ring)은 변(edge)을 위도 구간(strip)별로 나누어 두므로 점 하나를 확인할 때
+해당 구간의 변만 검사합니다. (정점 수천 개의 해안선 경계도 수십 개 변만 비교)
+
+행정구역 코드는 정수로 저장하며 앞 2자리가 시/도 코드입니다. (11680 → 서울특별시 11)
+"""
+import json
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# STR-tree 노드당 자식 수
+NODE_CAPACITY = 10
+# 외곽선 위도 구간당 평균 변 개수
+EDGES_PER_STRIP = 8
+
+
+class Ring:
+    """폴리곤 외곽선 (GeoJSON 좌표 [경도, 위도] 목록)"""
+
+    def __init__(self, coordinates: list):
+        points = [(float(x), float(y)) for x, y, *_ in coordinates]
+        if points and points[0] != points[-1]:
+            points.append(points[0])
+        edges = [
+            (x1, y1, x2, y2)
+            for (x1, y1), (x2, y2) in zip(points, points[1:])
+            if y1 != y2
+        ]
+        ys = [y for _, y in points] or [0.0]
+        self.min_y, self.max_y = min(ys), max(ys)
+        self.strip_count = max(1, len(edges) // EDGES_PER_STRIP)
+        self.strip_height = (self.max_y - self.min_y) / self.strip_count or 1.0
+        self.strips = [[] for _ in range(self.strip_count)]
+        for edge in edges:
+            low, high = sorted((edge[1], edge[3]))
+            for strip in range(self._strip(low), self._strip(high) + 1):
+                self.strips[strip].append(edge)
+
+    def _strip(self, y: float) -> int:
+        return min(self.strip_count - 1, max(0, int((y - self.min_y) / self.strip_height)))
+
+    def crossings(self, x: float, y: float) -> int:
+        """점에서 +x 방향 반직선이 외곽선과 만나는 횟수"""
+        if not self.min_y <= y <= self.max_y:
+            return 0
+        count = 0
+        for x1, y1, x2, y2 in self.strips[self._strip(y)]:
+            if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+                count += 1
+        return count
+
+
+class PolygonPart:
+    """외곽선 1개 + 구멍(holes) 로 이루어진 폴리곤 (MultiPolygon 의 각 부분)"""
+
+    def __init__(self, code: int, rings: list):
+        self.code = code
+        self.rings = [Ring(ring) for ring in rings if ring]
+        xs = [x for ring in rings for x, *_ in ring]
+        ys = [y for ring in rings for _, y, *_ in ring]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    def contains(self, x: float, y: float) -> bool:
+        # 외곽선과 구멍의 교차 횟수 합이 홀수면 내부 (even-odd)
+        return sum(ring.crossings(x, y) for ring in self.rings) % 2 == 1
+
+
+class STRTree:
+    """경계 상자 색인 (Sort-Tile-Recursive 일괄 적재, 읽기 전용)"""
+
+    def __init__(self, items: list, node_capacity: int = NODE_CAPACITY):
+        """
+        Args:
+            items: (bbox, payload) 목록, bbox = (min_x, min_y, max_x, max_y)
+            node_capacity: 노드당 자식 수
+        """
+        # 노드: (bbox, children, is_leaf) / 항목: (bbox, payload, True)
+        level = [(bbox, payload, True) for bbox, payload in items]
+        while len(level) > node_capacity:
+            level = self._pack(level, node_capacity)
+        self.root = (self._union(level), level, False) if level else None
+
+    @staticmethod
+    def _union(nodes: list) -> tuple:
+        return (
+            min(n[0][0] for n in nodes), min(n[0][1] for n in nodes),
+            max(n[0][2] for n in nodes), max(n[0][3] for n in nodes),
+        )
+
+    def _pack(self, nodes: list, capacity: int) -> list:
+        # x 중심으로 정렬해 세로 조각(slice)으로 나누고, 조각마다 y 중심으로 정렬해 capacity 개씩 묶음
+        node_count = math.ceil(len(nodes) / capacity)
+        slice_size = math.ceil(math.sqrt(node_count)) * capacity
+        nodes = sorted(nodes, key=lambda n: n[0][0] + n[0][2])
+        packed = []
+        for start in range(0, len(nodes), slice_size):
+            vertical = sorted(nodes[start:start + slice_size], key=lambda n: n[0][1] + n[0][3])
+            for i in range(0, len(vertical), capacity):
+                children = vertical[i:i + capacity]
+                packed.append((self._union(children), children, False))
+        return packed
+
+    def query(self, x: float, y: float) -> list:
+        """경계 상자가 점을 포함하는 항목의 payload 목록"""
+        if self.root is None:
+            return []
+        found, stack = [], [self.root]
+        while stack:
+            (min_x, min_y, max_x, max_y), content, is_item = stack.pop()
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            if is_item:
+                found.append(content)
+            else:
+                stack.extend(content)
+        return found
+
+
+class RegionIndex:
+    """행정구역 경계 색인"""
+
+    def __init__(self, features: list, code_property: str, name_property: str):
+        """
+        Args:
+            features: GeoJSON Feature 목록 (Polygon / MultiPolygon)
+            code_property: 행정구역 코드 속성 이름 (예: SIG_CD)
+            name_property: 행정구역 이름 속성 이름 (예: SIG_KOR_NM)
+        """
+        self.regions = {}
+        parts = []
+        for feature in features:
+            geometry = feature.get('geometry') or {}
+            properties = feature.get('properties') or {}
+            try:
+                code = int(properties[code_property])
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Region feature without {code_property}: {properties}")
+                continue
+            if geometry.get('type') == 'Polygon':
+                polygons = [geometry['coordinates']]
+            elif geometry.get('type') == 'MultiPolygon':
+                polygons = geometry['coordinates']
+            else:
+                continue
+            self.regions[code] = properties.get(name_property) or str(code)
+            parts += [PolygonPart(code, rings) for rings in polygons if rings]
+
+        self.part_count = len(parts)
+        self.tree = STRTree([(part.bbox, part) for part in parts])
+
+    def locate(self, lat: float, lng: float) -> int:
+        """
+        좌표가 속한 행정구역 코드
+
+        Returns:
+            행정구역 코드 (어느 경계에도 속하지 않으면 None)
+        """
+        x, y = float(lng), float(lat)
+        for part in self.tree.query(x, y):
+            if part.contains(x, y):
+                return part.code
+        return None
+
+
+def load_region_index(path: str, code_property: str, name_property: str) -> RegionIndex:
+    """
+    GeoJSON 행정구역 경계 파일 → RegionIndex
+
+    Args:
+        path: GeoJSON FeatureCollection 파일 경로
+        code_property: 행정구역 코드 속성 이름
+        name_property: 행정구역 이름 속성 이름
+
+    Returns:
+        RegionIndex
+    """
+    with open(path, encoding='utf-8') as f:
+        collection = json.load(f)
+    index = RegionIndex(collection.get('features', []), code_property, name_property)
+    logger.info(
+        f"Region boundaries loaded from {path}: {len(index.regions)} regions, "
+        f"{index.part_count} polygons"
+    )
+    return index
+
+
+def sido_code(region_code: int) -> int:
+    """행정구역 코드의 시/도 코드 (앞 2자리)"""
+    return int(str(region_code)[:2])
+
+
+def assign_regions(index: RegionIndex, rows: list) -> list:
+    """
+    기관별 행정구역 코드 계산, 기존 값과 다른 기관만 반환
+
+    Args:
+        index: RegionIndex
+        rows: {'id', 'latitude', 'longitude', 'region_code'} 목록 (좌표 없으면 코드 None)
+
+    Returns:
+        list: (institution_id, region_code) 튜플 리스트
+    """
+    changed = []
+    for row in rows:
+        if row['latitude'] is None or row['longitude'] is None:
+            code = None
+        else:
+            code = index.locate(row['latitude'], row['longitude'])
+        if code != row['region_code']:
+            changed.append((row['id'], code))
+    return changed
@@ -0,0 +1,197 @@
+"""
+Refresh Scheduler - 변경 이력 기반 기관별 재수집 주기/우선순위
+
+모든 기관을 매 회차 다시 수집하지 않고, institution_history 의 기관별 변경 횟수로
+변경률(하루당 변경 횟수)을 추정해 회차당 요청 예산 안에서 자주 바뀌는 기관은 자주,
+거의 바뀌지 않는 기관은 가끔 상세 페이지를 다시 수집합니다.
+
+- 변경률: (관측 기간 변경 횟수 + 사전 변경 횟수) / (관측 일수 + 사전 일수)
+  (이력이 없는 신규 기관은 사전값을 따르고, 이력이 쌓일수록 관측값에 가까워짐)
+- 변경을 포아송 과정으로 보면 주기 I 로 재수집할 때 기대 신선도(수집본이 최신일 확률)는
+  (1 - e^(-λI)) / (λI)
+- 요청 1회당 신선도 증가분이 모든 기관에서 같아지도록 주기를 정하고 (라그랑주 승수),
+  회차당 기대 요청 수가 예산과 같아지도록 승수를 이분 탐색합니다.
+- 회차마다 주기가 지난 기관을 변경 확률(1 - e^(-λ·경과일)) 순으로 예산만큼 선택합니다.
+
+예산으로 따라갈 수 없을 만큼 자주 바뀌는 기관은 다시 수집해도 신선도가 거의 오르지 않으므로
+최대 주기로 밀려납니다.
+"""
+import logging
+
+import numpy as np
+
+from metrics import write_report
+
+logger = logging.getLogger(__name__)
+
+# 최적 조건 h(x) = μλ 의 해 x = λI 를 찾기 위한 표 (h 는 단조 증가, 0 → 1)
+_X = np.geomspace(1e-6, 60.0, 4000)
+_H = -np.expm1(-_X) - _X * np.exp(-_X)
+
+
+def change_rates(rows: list, prior_changes: float = 1.0, prior_days: float = 180.0) -> np.ndarray:
+    """
+    기관별 변경률 추정 (하루당 변경 횟수)
+
+    Args:
+        rows: {'changes', 'observed_days'} 목록
+        prior_changes: 사전 변경 횟수
+        prior_days: 사전 관측 일수
+
+    Returns:
+        np.ndarray: 변경률
+    """
+    changes = np.array([row['changes'] for row in rows], dtype=np.float64)
+    observed = np.array([max(row['observed_days'] or 0.0, 0.0) for row in rows], dtype=np.float64)
+    return (changes + prior_changes) / (observed + prior_days)
+
+
+def expected_freshness(rates: np.ndarray, intervals: np.ndarray) -> np.ndarray:
+    """주기 intervals 로 재수집할 때 기관별 기대 신선도 (0~1)"""
+    x = rates * intervals
+    return np.where(x > 1e-12, -np.expm1(-x) / np.maximum(x, 1e-12), 1.0)
+
+
+def _intervals_for(multiplier: float, rates: np.ndarray, run_interval: float, max_interval: float):
+    x = np.interp(multiplier * rates, _H, _X, right=np.inf)
+    return np.clip(x / rates, run_interval, max_interval)
+
+
+def plan_intervals(rates: np.ndarray, budget: int, run_interval: float = 1.0,
+                   max_interval: float = 90.0) -> np.ndarray:
+    """
+    회차당 요청 예산 안에서 평균 기대 신선도가 최대가 되는 기관별 재수집 주기
+
+    Args:
+        rates: 기관별 변경률 (하루당)
+        budget: 회차당 요청 수
+        run_interval: 회차 간격 (일, 최소 주기)
+        max_interval: 최대 주기 (일)
+
+    Returns:
+        np.ndarray: 기관별 주기 (일)
+    """
+    count = len(rates)
+    if count == 0 or budget >= count:
+        return np.full(count, run_interval)
+    if budget <= count * run_interval / max_interval:
+        return np.full(count, max_interval)
+
+    def requests(multiplier):
+        return float(np.sum(run_interval / _intervals_for(multiplier, rates, run_interval, max_interval)))
+
+    # 승수가 클수록 주기가 길어지고 요청 수가 줄어듦 (로그 구간 이분 탐색)
+    low, high = np.log(_H[0] / rates.max()), np.log(_H[-1] / rates.min())
+    for _ in range(60):
+        middle = (low + high) / 2
+        if requests(np.exp(middle)) > budget:
+            low = middle
+        else:
+            high = middle
+    return _intervals_for(np.exp(high), rates, run_interval, max_interval)
+
+
+def plan_refresh(rows: list, budget: int, run_interval: float = 1.0, max_interval: float = 90.0,
+                 prior_changes: float = 1.0, prior_days: float = 180.0) -> dict:
+    """
+    이번 회차 재수집 목록과 기관별 주기/우선순위
+
+    Args:
+        rows: {'id', 'institution_code', 'changes', 'observed_days', 'age_days'} 목록
+              (age_days: 마지막 수집 후 경과 일수)
+        budget: 회차당 요청 수
+        run_interval: 회차 간격 (일)
+        max_interval: 최대 주기 (일)
+        prior_changes: 사전 변경 횟수
+        prior_days: 사전 관측 일수
+
+    Returns:
+        dict: {
+            'work': 이번 회차에 수집할 rows (우선순위 순),
+            'schedule': (institution_id, 변경률, 주기, 우선순위, 다음 수집까지 일수) 리스트,
+            'summary': 예산/요청 수/기대 신선도 요약
+        }
+    """
+    count = len(rows)
+    if count == 0:
+        return {'work': [], 'schedule': [], 'summary': {'institutions': 0, 'budget': budget, 'requests': 0}}
+
+    rates = change_rates(rows, prior_changes, prior_days)
+    intervals = plan_intervals(rates, budget, run_interval, max_interval)
+    ages = np.array([max(row['age_days'] or 0.0, 0.0) for row in rows], dtype=np.float64)
+
+    # 우선순위: 마지막 수집 후 한 번 이상 바뀌었을 확률
+    priorities = -np.expm1(-rates * ages)
+    due = np.flatnonzero(ages + run_interval / 2 >= intervals)
+    selected = due[np.argsort(-priorities[due], kind='stable')][:budget]
+    if len(selected) < budget:
+        # 남는 예산은 주기가 가장 많이 지난(경과 일수 / 주기) 기관을 앞당겨 수집
+        rest = np.setdiff1d(np.arange(count), due, assume_unique=True)
+        early = rest[np.argsort(-(ages[rest] / intervals[rest]), kind='stable')][:budget - len(selected)]
+        selected = np.concatenate([selected, early])
+
+    next_due = np.maximum(intervals - ages, 0.0)
+    next_due[selected] = intervals[selected]
+    refreshed_ages = ages.copy()
+    refreshed_ages[selected] = 0.0
+    planned_requests = float(np.sum(run_interval / intervals))
+    uniform_interval = count * run_interval / planned_requests
+
+    summary = {
+        'institutions': count,
+        'budget': budget,
+        'due': int(len(due)),
+        'requests': int(len(selected)),
+        'deferred': max(0, int(len(due)) - budget),
+        'planned_requests_per_run': round(planned_requests, 1),
+        'interval_days': {
+            f'p{q}': round(float(np.percentile(intervals, q)), 1) for q in (10, 50, 90)
+        },
+        # 계획한 주기로 계속 수집할 때의 평균 기대 신선도 vs 같은 요청 수로 모든 기관을 같은 주기로 수집
+        'expected_freshness': round(float(np.mean(expected_freshness(rates, intervals))), 4),
+        'uniform_freshness': round(
+            float(np.mean(expected_freshness(rates, np.full(count, uniform_interval)))), 4
+        ),
+        # 지금 수집본이 최신일 확률의 평균 (이번 회차 수집 전 / 후)
+        'freshness_before': round(float(np.mean(np.exp(-rates * ages))), 4),
+        'freshness_after': round(float(np.mean(np.exp(-rates * refreshed_ages))), 4),
+    }
+    schedule = [
+        (row['id'], float(rates[i]), float(intervals[i]), float(priorities[i]), float(next_due[i]))
+        for i, row in enumerate(rows)
+    ]
+    return {'work': [rows[i] for i in selected], 'schedule': schedule, 'summary': summary}
+
+
+def measure_refresh(work: list, records: list) -> dict:
+    """
+    재수집 결과 (요청 대비 실제로 바뀐 기관 수)
+
+    Args:
+        work: plan_refresh 의 work (수집 전 값 name/address/capacity/current_headcount 포함)
+        records: 수집한 기관 데이터 딕셔너리 리스트
+
+    Returns:
+        {'requested', 'fetched', 'changed', 'missing', 'change_yield'}
+    """
+    fetched = {record['code']: record for record in records}
+    changed = 0
+    for row in work:
+        record = fetched.get(row['institution_code'])
+        if record and (row['name'], row['address'], row['capacity'], row['current_headcount']) != (
+            record['name'], record['address'], record['capacity'], record['current']
+        ):
+            changed += 1
+    found = sum(1 for row in work if row['institution_code'] in fetched)
+    return {
+        'requested': len(work),
+        'fetched': found,
+        'changed': changed,
+        'missing': len(work) - found,
+        'change_yield': round(changed / found, 4) if found else None,
+    }
+
+
+def write_refresh_report(report: dict, report_dir: str, generation: int = None) -> str:
+    """재수집 계획/결과 JSON 리포트 저장, 저장 경로 반환"""
+    return write_report('refresh', report, report_dir, generation)
@@ -0,0 +1,150 @@
+"""
+Map Snapshot - 지도 데이터셋 스냅샷 파일 생성
+
+동기화가 끝난 뒤 운영 중 기관 목록(/api/v1/institutions/ 응답과 같은 형식)을
+내용 해시로 버전을 붙인 JSON 파일로 저장하고 gzip, brotli 로 미리 압축합니다.
+백엔드는 DB 조회 없이 이 파일을 그대로 응답합니다.
+
+    snapshots/
+    ├── map-<version>.json
+    ├── map-<version>.json.gz
+    ├── map-<version>.json.br
+    └── map-manifest.json      # 현재 버전 (파일을 모두 쓴 뒤 마지막에 교체)
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip 만 생성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'map-manifest.json'
+# 백엔드 get_institutions_for_map 응답 필드와 같은 순서
+MAP_FIELDS = (
+    'id', 'name', 'service_type', 'address',
+    'capacity', 'current_headcount', 'latitude', 'longitude',
+)
+
+
+def _atomic_write_bytes(path: str, content: bytes):
+    """임시 파일 작성 후 교체 (백엔드가 쓰는 도중의 파일을 읽지 않도록)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def encode_map_rows(rows: list) -> bytes:
+    """
+    지도 데이터셋 JSON 직렬화
+
+    좌표(NUMERIC)는 백엔드 응답(caremap/renderers.py)과 같이 숫자로 직렬화합니다.
+    """
+    records = [{field: row[field] for field in MAP_FIELDS} for row in rows]
+    return json.dumps(
+        records, ensure_ascii=False, separators=(',', ':'), default=float
+    ).encode('utf-8')
+
+
+def read_manifest(snapshot_dir: str) -> dict:
+    """현재 manifest (없으면 None)"""
+    try:
+        with open(os.path.join(snapshot_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _snapshot_version(name: str) -> str:
+    """스냅샷 파일명의 버전 (스냅샷 파일이 아니면 None)"""
+    if name.startswith('map-') and name != MANIFEST_NAME and not name.endswith('.tmp'):
+        return name[len('map-'):].split('.', 1)[0]
+    return None
+
+
+def prune_snapshots(snapshot_dir: str, keep: int, current: str):
+    """
+    오래된 스냅샷 파일 삭제
+
+    이전 manifest 를 읽은 클라이언트가 받을 수 있도록 최근 keep 개 버전은 남깁니다.
+    """
+    files = {}
+    for name in os.listdir(snapshot_dir):
+        version = _snapshot_version(name)
+        if version:
+            files.setdefault(version, []).append(os.path.join(snapshot_dir, name))
+
+    by_age = sorted(
+        files, key=lambda v: max(os.path.getmtime(p) for p in files[v]), reverse=True
+    )
+    stale = [version for version in by_age[keep:] if version != current]
+    for version in stale:
+        for path in files[version]:
+            os.unlink(path)
+    if stale:
+        logger.info(f"Pruned {len(stale)} old snapshot versions")
+
+
+def publish_map_snapshot(rows: list, snapshot_dir: str, generation: int = None,
+                         keep: int = 3, brotli_quality: int = 11) -> dict:
+    """
+    지도 데이터셋 스냅샷 생성 및 manifest 교체
+
+    Args:
+        rows: 운영 중 기관 목록 (MAP_FIELDS 포함, id 순)
+        snapshot_dir: 스냅샷 디렉토리
+        generation: 크롤링 회차
+        keep: 보관할 버전 수
+        brotli_quality: brotli 압축 수준 (0-11, 11 은 느리지만 실행당 1회만 압축)
+
+    Returns:
+        dict: manifest
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    body = encode_map_rows(rows)
+    version = hashlib.sha256(body).hexdigest()[:16]
+
+    current = read_manifest(snapshot_dir)
+    if current and current['version'] == version:
+        logger.info(f"Map snapshot unchanged (version {version})")
+        return current
+
+    variants = {'identity': ('', body)}
+    variants['gzip'] = ('.gz', gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        variants['br'] = ('.br', brotli.compress(body, quality=brotli_quality))
+    else:
+        logger.warning("brotli not installed; skipping .br snapshot")
+
+    files = {}
+    for encoding, (suffix, content) in variants.items():
+        name = f"map-{version}.json{suffix}"
+        _atomic_write_bytes(os.path.join(snapshot_dir, name), content)
+        files[encoding] = {'name': name, 'bytes': len(content)}
+
+    manifest = {
+        'version': version,
+        'generation': generation,
+        'created_at': datetime.now().astimezone().isoformat(timespec='seconds'),
+        'count': len(rows),
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'files': files,
+    }
+    _atomic_write_bytes(
+        os.path.join(snapshot_dir, MANIFEST_NAME),
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    )
+    logger.info(
+        f"Map snapshot {version}: {len(rows)} institutions, "
+        + ", ".join(f"{enc} {info['bytes']:,} bytes" for enc, info in files.items())
+    )
+
+    prune_snapshots(snapshot_dir, keep, version)
+    return manifest
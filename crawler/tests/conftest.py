@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 크롤러 모듈은 crawler/ 디렉토리 기준 flat import (from config import ...)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -0,0 +1,45 @@
+import unittest
+
+from address import normalize_address, parse_address
+
+
+class NormalizeAddressTests(unittest.TestCase):
+    def test_docstring_examples(self):
+        self.assertEqual(
+            normalize_address('서울 강남구 테헤란로123, 3층 (역삼동, 행복빌딩)'), '서울특별시 강남구 테헤란로 123'
+        )
+        self.assertEqual(
+            normalize_address('경기 수원시 영통구 매탄동 12-03번지'), '경기도 수원시 영통구 매탄동 12-3'
+        )
+
+    def test_spaced_branch_road_keeps_road_name(self):
+        parsed = parse_address('경기도 고양시 일산동구 중앙로 1275번길 38')
+
+        self.assertEqual(parsed['locality'], '중앙로1275번길')
+        self.assertEqual(parsed['number'], '38')
+        self.assertEqual(parsed['key'], '경기도 고양시 일산동구 중앙로1275번길 38')
+
+    def test_branch_road_spellings_share_key(self):
+        expected = '경기도 고양시 일산동구 중앙로1275번길 38'
+
+        self.assertEqual(normalize_address('경기 고양시 일산동구 중앙로1275번길 38'), expected)
+        self.assertEqual(normalize_address('경기도 고양시 일산동구 중앙로 1275번길38 2층'), expected)
+
+    def test_spaced_gil_with_attached_number(self):
+        parsed = parse_address('서울 중구 세종대로 23길4 2층')
+
+        self.assertEqual(parsed['key'], '서울특별시 중구 세종대로23길 4')
+        self.assertEqual(parsed['detail'], '2층')
+
+    def test_detail_is_split_off(self):
+        parsed = parse_address('서울 강남구 테헤란로123, 3층 (역삼동, 행복빌딩)')
+
+        self.assertEqual(parsed['detail'], '3층 역삼동, 행복빌딩')
+
+    def test_unparseable_address_keeps_normalized_text(self):
+        self.assertEqual(normalize_address('  서울   어딘가 '), '서울특별시 어딘가')
+        self.assertEqual(normalize_address(None), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
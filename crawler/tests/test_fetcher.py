@@ -0,0 +1,148 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import updater
+from fetcher import MAX_RETRY_AFTER, Fetcher
+from updater import parse_fetched
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures')
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """경로별 응답 스크립트를 따르는 스텁 (남은 응답이 없으면 200 + ETag)"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            script = server.scripts.get(self.path.split('?')[0], [])
+            status, headers = script.pop(0) if script else (200, {})
+        try:
+            if server.latency:
+                time.sleep(server.latency)
+            body = server.body if status == 200 else b''
+            if status == 200 and self.headers.get('If-None-Match') == server.etag:
+                status, body = 304, b''
+            self.send_response(status)
+            self.send_header('ETag', server.etag)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class FetcherStubServerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        self.server.scripts = {}
+        self.server.in_flight = self.server.max_in_flight = 0
+        self.server.latency = 0.0
+        self.server.etag = '"v1"'
+        with open(os.path.join(FIXTURE_DIR, 'list_page.html'), 'rb') as f:
+            self.server.body = f.read()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.fetcher = Fetcher(cache_dir=cache_dir.name, max_per_host=2, timeout=5, retry_limit=2, backoff=0.01)
+        self.addCleanup(self.fetcher.close)
+
+    def test_etag_revalidation_reuses_cached_body(self):
+        first = self.fetcher.get(f"{self.base}/list")
+        second = self.fetcher.get(f"{self.base}/list")
+
+        self.assertEqual(first['status'], 200)
+        self.assertTrue(first['changed'])
+        self.assertEqual(second['status'], 304)
+        self.assertTrue(second['from_cache'])
+        self.assertFalse(second['changed'])
+        self.assertEqual(second['text'], first['text'])
+        self.assertEqual(self.fetcher.stats['not_modified'], 1)
+
+    def test_unchanged_page_skips_parsing(self):
+        first = parse_fetched(self.fetcher, [self.fetcher.get(f"{self.base}/list")])
+        page = self.fetcher.get(f"{self.base}/list")
+
+        with mock.patch('updater.parse_each', side_effect=AssertionError('parsed again')):
+            second = parse_fetched(self.fetcher, [page])
+
+        self.assertTrue(first)
+        self.assertEqual(second, first)
+        self.assertEqual(self.fetcher.stats['parse_skipped'], 1)
+
+    def test_changed_page_is_parsed_again(self):
+        parse_fetched(self.fetcher, [self.fetcher.get(f"{self.base}/list")])
+        self.server.etag = '"v2"'
+        self.server.body = self.server.body.replace('기관'.encode('utf-8'), '센터'.encode('utf-8'), 1)
+
+        page = self.fetcher.get(f"{self.base}/list")
+        with mock.patch('updater.parse_each', wraps=updater.parse_each) as parse:
+            parse_fetched(self.fetcher, [page])
+
+        self.assertTrue(page['changed'])
+        parse.assert_called_once()
+
+    def test_429_waits_for_retry_after(self):
+        self.server.scripts['/list'] = [(429, {'Retry-After': '1'})]
+
+        with mock.patch('fetcher.time.sleep') as sleep:
+            page = self.fetcher.get(f"{self.base}/list")
+
+        self.assertEqual(page['status'], 200)
+        sleep.assert_called_once_with(1.0)
+        self.assertEqual(self.fetcher.stats['retries'], 1)
+
+    def test_large_retry_after_is_capped(self):
+        self.server.scripts['/list'] = [(503, {'Retry-After': '86400'})]
+
+        with mock.patch('fetcher.time.sleep') as sleep:
+            self.fetcher.get(f"{self.base}/list")
+
+        sleep.assert_called_once_with(MAX_RETRY_AFTER)
+
+    def test_5xx_retries_then_gives_up_without_final_sleep(self):
+        self.server.scripts['/list'] = [(503, {})] * 3
+
+        with mock.patch('fetcher.time.sleep') as sleep:
+            page = self.fetcher.get(f"{self.base}/list")
+
+        self.assertIsNone(page)
+        self.assertEqual(self.server.hits['/list'], 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(self.fetcher.stats['errors'], 1)
+
+    def test_concurrent_requests_respect_per_host_limit(self):
+        self.server.latency = 0.05
+        urls = [f"{self.base}/list?pageIndex={i}" for i in range(8)]
+
+        results = list(self.fetcher.get_many(urls, workers=8))
+
+        self.assertTrue(all(page is not None for _, page in results))
+        self.assertEqual(self.server.max_in_flight, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import unittest
+
+from page_parser import parse_detail_page, parse_list_page, parse_page_count
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures')
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _paging(onclick):
+    return f'<div class="paging"><a class="last" href="#" onclick="{onclick}">끝</a></div>'
+
+
+class PageCountTests(unittest.TestCase):
+    def test_list_fixture(self):
+        self.assertEqual(parse_page_count(_fixture('list_page.html')), 948)
+
+    def test_multi_argument_handler_uses_first_integer(self):
+        html = _fixture('list_page.html').replace(
+            'onclick="fnSearch(948); return false;"', "onclick=\"fn_goPage('list', 948, 10); return false;\""
+        )
+
+        self.assertEqual(parse_page_count(html), 948)
+
+    def test_missing_or_unparseable_link_is_one_page(self):
+        self.assertEqual(parse_page_count('<div class="paging"></div>'), 1)
+        self.assertEqual(parse_page_count(_paging('fnLast(); return false;')), 1)
+
+
+class RecordTests(unittest.TestCase):
+    def test_list_fixture_rows_have_sync_fields(self):
+        records = parse_list_page(_fixture('list_page.html'))
+
+        self.assertTrue(records)
+        self.assertEqual(
+            set(records[0]), {'code', 'name', 'type', 'capacity', 'current', 'address', 'hours'}
+        )
+
+    def test_detail_fixture(self):
+        record = parse_detail_page(_fixture('detail_page.html'))
+
+        self.assertIsNotNone(record)
+        self.assertTrue(record['code'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,61 @@
 # crawler/updater.py
 # (필요 라이브러리: selenium, beautifulsoup4, requests, psycopg2)
+from config import CRAWL_TARGET_URL, CRAWL_DETAIL_URL
+from fetcher import Fetcher
+from page_parser import parse_each, parse_page_count
 
-def crawl_data_from_site():
-    # 1. Selenium을 사용하여 웹사이트에 접속하고, 검색 조건(전체) 설정 후 데이터 로드
-    # ... 크롤링 로직 ...
-    # 결과는 아래와 같은 딕셔너리 리스트 형태로 반환
-    crawled_data = [
-        {'code': 'A1234', 'name': '행복요양원', 'type': '방문요양', 'capacity': 100, 'current': 85, 'address': '...', 'hours': '...'},
-        # ...
-    ]
+
+def parse_fetched(fetcher, pages, kind='list'):
+    # fetcher.get() 결과 페이지 파싱
+    # 본문이 바뀌지 않은 페이지(304 / 같은 content_hash)는 저장해 둔 파싱 결과를 재사용하고,
+    # 나머지만 프로세스 풀에서 파싱한 뒤 결과를 페이지별로 저장
+    results = [fetcher.cached_records(page, kind) for page in pages]
+    stale = [i for i, records in enumerate(results) if records is None]
+    if stale:
+        for i, records in zip(stale, parse_each([pages[i]['text'] for i in stale], kind=kind)):
+            fetcher.store_records(pages[i], kind, records)
+            results[i] = records
+    return [record for records in results for record in records]
+
+
+def crawl_data_from_site(fetcher=None):
+    # 1. 공유 fetch 계층(fetcher.py)으로 목록/상세 페이지 조회
+    #    keep-alive 세션 재사용, 호스트별 동시 요청 제한, 조건부 GET, 디스크 캐시
+    if fetcher is None:
+        with Fetcher() as fetcher:
+            return crawl_data_from_site(fetcher)
+    first_page = fetcher.get(CRAWL_TARGET_URL)
+    if first_page is None:
+        return []
+
+    # 2. 나머지 목록 페이지 조회 후 파싱 (page_parser.py, 바뀐 페이지만)
+    #    결과는 {'code','name','type','capacity','current','address','hours'} 딕셔너리 리스트
+    page_count = parse_page_count(first_page['text'])
+    pages = [first_page]
+    for _, page in fetcher.get_many(
+        [f"{CRAWL_TARGET_URL}?pageIndex={i}" for i in range(2, page_count + 1)]
+    ):
+        if page is not None:
+            pages.append(page)
+
+    crawled_data = parse_fetched(fetcher, pages)
     return crawled_data
 
+
+def crawl_institution_details(codes, fetcher=None):
+    # 재수집 대상 기관(scheduler.py 작업 목록)의 상세 페이지만 조회
+    # 결과는 목록 페이지와 같은 딕셔너리 리스트 (조회 실패/폐업 기관은 빠짐)
+    if fetcher is None:
+        with Fetcher() as fetcher:
+            return crawl_institution_details(codes, fetcher)
+    pages = [
+        page
+        for _, page in fetcher.get_many([f"{CRAWL_DETAIL_URL}?ltcAdminSym={code}" for code in codes])
+        if page is not None
+    ]
+    return parse_fetched(fetcher, pages, kind='detail')
+
+
 def geocode_address(address):
     # 2. 주소를 위도/경도로 변환하는 함수 (카카오 API 등 활용)
     # ... 지오코딩 로직 ...
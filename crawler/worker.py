@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+CareMap Crawl Worker - 작업 큐(crawl_jobs) 워커 및 작업 등록
+
+여러 노드에서 같은 PostgreSQL 을 바라보고 워커를 실행하면 목록 페이지/상세 페이지/Geocoding 작업을
+나눠 처리합니다. (jobqueue.py)
+
+    # 작업 등록 (한 노드에서)
+    python worker.py enqueue pages          # 새 회차 시작, 목록 페이지마다 작업 1개
+    python worker.py enqueue refresh        # 재수집 계획(scheduler.py) 대상 상세 페이지
+    python worker.py enqueue geocode        # 좌표 없는 기관, 재시도할 Geocoding 실패 기관
+
+    # 워커 실행 (노드마다, --processes 로 프로세스 여러 개)
+    python worker.py run --processes 4
+
+    # 회차 마무리 (작업이 모두 끝나면 폐업 처리), 현황, dead 작업 재등록
+    python worker.py finish --generation 42
+    python worker.py stats
+    python worker.py requeue-dead
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+
+from config import (
+    CRAWL_TARGET_URL, BULK_BATCH_SIZE, JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS, JOB_BACKOFF_SECONDS,
+    JOB_POLL_SECONDS, JOB_DETAIL_BATCH, JOB_GEOCODE_BATCH,
+    REFRESH_BUDGET, REFRESH_RUN_INTERVAL_DAYS, REFRESH_MAX_INTERVAL_DAYS, REFRESH_HISTORY_DAYS,
+    REFRESH_PRIOR_CHANGES, REFRESH_PRIOR_DAYS
+)
+from db_manager import DatabaseManager
+from fetcher import Fetcher
+from geocode_queue import GeocodeBudget, geocode_institutions
+from jobqueue import JobQueue
+from logsetup import setup_logging
+from main import publish_outputs
+from metrics import RunMetrics
+from page_parser import parse_page_count
+from scheduler import plan_refresh
+from updater import crawl_institution_details, parse_fetched
+
+logger = logging.getLogger(__name__)
+
+
+def handle_list_page(db: DatabaseManager, payload: dict, fetcher: Fetcher) -> int:
+    """목록 페이지 1개 수집 → 동기화"""
+    page = fetcher.get(CRAWL_TARGET_URL, params={'pageIndex': payload['page']})
+    if page is None:
+        raise RuntimeError(f"List page {payload['page']} fetch failed")
+    return _sync(db, parse_fetched(fetcher, [page]))
+
+
+def handle_detail(db: DatabaseManager, payload: dict, fetcher: Fetcher) -> int:
+    """기관 상세 페이지 묶음 수집 → 동기화"""
+    records = crawl_institution_details(payload['codes'], fetcher=fetcher)
+    if payload['codes'] and not records:
+        raise RuntimeError(f"No detail pages fetched for {len(payload['codes'])} institutions")
+    return _sync(db, records)
+
+
+def handle_geocode(db: DatabaseManager, payload: dict, fetcher: Fetcher) -> int:
+    """
+    주소 묶음 Geocoding → 좌표 저장 ({'items': [[institution_id, address], ...]})
+
+    일일 예산(geocode_quota)은 모든 워커가 나눠 쓰며, 예산이 떨어져 조회하지 못한 기관은
+    좌표 없는 기관으로 남아 다음 enqueue geocode 때 다시 등록됩니다.
+    실패한 기관은 geocode_failures 에 기록됩니다.
+    """
+    budget = GeocodeBudget(db)
+    try:
+        result = geocode_institutions(
+            db, [{'id': institution_id, 'address': address} for institution_id, address in payload['items']],
+            budget
+        )
+    finally:
+        budget.release()
+    return result['attempted']
+
+
+def _sync(db: DatabaseManager, records: list) -> int:
+    if not records:
+        return 0
+    result = db.sync_institutions_batched(records, batch_size=BULK_BATCH_SIZE)
+    if not result['success']:
+        raise RuntimeError(f"Sync failed for {result['total']} records")
+    return result['success']
+
+
+HANDLERS = {
+    'list_page': handle_list_page,
+    'detail': handle_detail,
+    'geocode': handle_geocode,
+}
+
+
+class Worker:
+    """작업 큐 워커 (작업 처리 연결 + heartbeat 스레드 연결)"""
+
+    def __init__(self, worker_id: str = None, batch: int = 1, kinds: list = None, handlers: dict = None,
+                 lease_seconds: int = JOB_LEASE_SECONDS, poll_seconds: float = JOB_POLL_SECONDS):
+        """
+        Args:
+            worker_id: 워커 ID (기본: 호스트명-pid)
+            batch: 한 번에 가져올 작업 수
+            kinds: 처리할 작업 종류 (없으면 handlers 전체)
+            handlers: {kind: handler(db, payload, fetcher) -> 처리 건수}
+            lease_seconds: 작업 임대 시간 (heartbeat 는 1/3 주기)
+            poll_seconds: 대기 작업이 없을 때 다시 조회할 간격
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch = batch
+        self.handlers = handlers or HANDLERS
+        self.kinds = kinds or sorted(self.handlers)
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+
+    def _queue(self, db: DatabaseManager) -> JobQueue:
+        return JobQueue(db, lease_seconds=self.lease_seconds, max_attempts=JOB_MAX_ATTEMPTS,
+                        backoff_seconds=JOB_BACKOFF_SECONDS)
+
+    def _heartbeat(self):
+        # 처리 중인 작업 임대 연장 + 다른 워커의 만료된 임대 회수 (별도 연결)
+        db = DatabaseManager()
+        if not db.connect():
+            return
+        queue = self._queue(db)
+        try:
+            while not self._stop.wait(self.lease_seconds / 3):
+                queue.heartbeat(self.worker_id)
+                queue.requeue_expired()
+        finally:
+            db.disconnect()
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self, max_jobs: int = None, exit_when_idle: bool = False) -> dict:
+        """
+        작업 처리 루프
+
+        Args:
+            max_jobs: 처리할 최대 작업 수 (없으면 무제한)
+            exit_when_idle: 대기/처리 중 작업이 모두 없으면 종료
+
+        Returns:
+            {'done', 'failed', 'items', 'busy_seconds'}
+        """
+        totals = {'done': 0, 'failed': 0, 'items': 0, 'busy_seconds': 0.0}
+        db = DatabaseManager()
+        if not db.connect():
+            return totals
+        queue = self._queue(db)
+        queue.register_worker(self.worker_id, socket.gethostname(), os.getpid())
+        heartbeat = threading.Thread(target=self._heartbeat, name='heartbeat', daemon=True)
+        heartbeat.start()
+        logger.info(f"Worker {self.worker_id} started (kinds: {', '.join(self.kinds)})")
+
+        try:
+            with Fetcher() as fetcher:
+                while not self._stop.is_set():
+                    if max_jobs is not None and totals['done'] + totals['failed'] >= max_jobs:
+                        break
+                    jobs = queue.claim(self.worker_id, limit=self.batch, kinds=self.kinds)
+                    if not jobs:
+                        queue.requeue_expired()
+                        if exit_when_idle and not queue.active_count():
+                            break
+                        self._stop.wait(self.poll_seconds)
+                        continue
+
+                    for job in jobs:
+                        self._process(db, queue, fetcher, job, totals)
+                    if any(job['kind'] == 'geocode' for job in jobs):
+                        self._publish_if_geocode_drained(db, queue)
+        finally:
+            self._stop.set()
+            heartbeat.join()
+            queue.record_worker(self.worker_id, status='stopped')
+            db.disconnect()
+            logger.info(
+                f"Worker {self.worker_id} stopped: {totals['done']} done, {totals['failed']} failed, "
+                f"{totals['items']} items in {totals['busy_seconds']:.1f}s"
+            )
+        return totals
+
+    def _process(self, db: DatabaseManager, queue: JobQueue, fetcher: Fetcher, job: dict, totals: dict):
+        start = time.perf_counter()
+        db.generation = job['generation']
+        try:
+            items = self.handlers[job['kind']](db, job['payload'], fetcher)
+        except Exception as e:
+            seconds = time.perf_counter() - start
+            status = queue.fail(job, self.worker_id, f"{type(e).__name__}: {e}")
+            logger.warning(f"Job {job['id']} ({job['kind']}) attempt {job['attempts']} failed: {e} -> {status}")
+            totals['failed'] += 1
+            totals['busy_seconds'] += seconds
+            queue.record_worker(self.worker_id, failed=1, busy_seconds=seconds)
+            return
+
+        seconds = time.perf_counter() - start
+        queue.complete(job, self.worker_id, items=items)
+        totals['done'] += 1
+        totals['items'] += items
+        totals['busy_seconds'] += seconds
+        queue.record_worker(self.worker_id, done=1, items=items, busy_seconds=seconds)
+
+
+    def _publish_if_geocode_drained(self, db: DatabaseManager, queue: JobQueue):
+        # 남은 Geocoding 작업이 없으면 새 좌표를 지도 산출물에 반영
+        # (마지막 작업들을 동시에 끝낸 워커가 함께 갱신할 수 있으나 결과는 같음)
+        if queue.active_count(kinds=['geocode']):
+            return
+        logger.info(f"Worker {self.worker_id}: geocode jobs drained, publishing outputs")
+        db.generation = None
+        publish_outputs(db, RunMetrics())
+
+
+def run_worker(batch: int = 1, kinds: list = None, max_jobs: int = None, exit_when_idle: bool = False,
+               handlers: dict = None) -> dict:
+    """워커 1개 실행 (프로세스 진입점)"""
+    return Worker(batch=batch, kinds=kinds, handlers=handlers).run(
+        max_jobs=max_jobs, exit_when_idle=exit_when_idle
+    )
+
+
+def run_workers(processes: int, **kwargs):
+    """워커 프로세스 여러 개 실행 (모두 끝날 때까지 대기)"""
+    if processes <= 1:
+        run_worker(**kwargs)
+        return
+    workers = [
+        multiprocessing.Process(target=run_worker, kwargs=kwargs, name=f"worker-{i}")
+        for i in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    try:
+        for process in workers:
+            process.join()
+    except KeyboardInterrupt:
+        for process in workers:
+            process.terminate()
+        raise
+
+
+def enqueue_pages(db: DatabaseManager, queue: JobQueue) -> int:
+    """새 회차 시작 후 목록 페이지마다 작업 등록, 회차 번호 반환"""
+    with Fetcher() as fetcher:
+        first_page = fetcher.get(CRAWL_TARGET_URL)
+    if first_page is None or db.begin_run() is None:
+        return None
+    page_count = parse_page_count(first_page['text'])
+    queue.enqueue(
+        'list_page',
+        [{'page': page} for page in range(1, page_count + 1)],
+        keys=[f"{db.generation}:{page}" for page in range(1, page_count + 1)],
+        generation=db.generation
+    )
+    return db.generation
+
+
+def enqueue_refresh(db: DatabaseManager, queue: JobQueue) -> int:
+    """재수집 계획 대상 기관 상세 페이지를 JOB_DETAIL_BATCH 개씩 작업 등록 (새 회차)"""
+    rows = db.get_refresh_rows(REFRESH_HISTORY_DAYS)
+    if rows is None or db.begin_run() is None:
+        return None
+    plan = plan_refresh(
+        rows, REFRESH_BUDGET, run_interval=REFRESH_RUN_INTERVAL_DAYS, max_interval=REFRESH_MAX_INTERVAL_DAYS,
+        prior_changes=REFRESH_PRIOR_CHANGES, prior_days=REFRESH_PRIOR_DAYS
+    )
+    db.save_refresh_schedule(plan['schedule'])
+    codes = [row['institution_code'] for row in plan['work']]
+    chunks = [codes[i:i + JOB_DETAIL_BATCH] for i in range(0, len(codes), JOB_DETAIL_BATCH)]
+    queue.enqueue('detail', [{'codes': chunk} for chunk in chunks], generation=db.generation)
+    return db.generation
+
+
+def enqueue_geocode(db: DatabaseManager, queue: JobQueue) -> int:
+    """좌표 없는 새 기관 → 재시도 시각이 지난 실패 기관 순으로 JOB_GEOCODE_BATCH 개씩 작업 등록, 등록한 작업 수 반환"""
+    pending = db.get_institutions_without_coordinates() + db.get_geocode_retries()
+    chunks = [pending[i:i + JOB_GEOCODE_BATCH] for i in range(0, len(pending), JOB_GEOCODE_BATCH)]
+    return queue.enqueue(
+        'geocode',
+        [{'items': [[row['id'], row['address']] for row in chunk]} for chunk in chunks],
+        keys=[f"{chunk[0]['id']}-{chunk[-1]['id']}" for chunk in chunks]
+    )
+
+
+def finish_generation(db: DatabaseManager, queue: JobQueue, generation: int, refresh: bool,
+                      wait_seconds: float = JOB_POLL_SECONDS) -> dict:
+    """
+    회차 작업이 모두 끝날 때까지 기다린 뒤 회차 종료 (refresh 면 폐업 처리 없이 종료)
+
+    목록/상세 페이지 dead 작업이 남아 있으면 그 페이지의 기관이 수집되지 않았으므로 폐업 처리하지 않고
+    회차를 partial 로 기록합니다. (requeue-dead 후 다시 finish 하면 폐업 처리)
+    회차 종료 후 지도 스냅샷 등 산출물을 갱신합니다. (main.publish_outputs)
+    """
+    while (active := queue.active_count(generation)):
+        logger.info(f"Waiting for {active} jobs of generation {generation}")
+        time.sleep(wait_seconds)
+    db.generation = generation
+    # 수집 작업(목록/상세 페이지)만 확인 (Geocoding 실패는 수집 누락이 아님)
+    dead = queue.dead_count(generation, kinds=['list_page', 'detail'])
+    if dead and not refresh:
+        logger.warning(
+            f"Generation {generation} has {dead} dead crawl jobs: skipping closure and recording run as partial "
+            f"(run 'worker.py requeue-dead' and finish again to close unseen institutions)"
+        )
+        result = db.finish_run(close=False, status='partial')
+    else:
+        result = db.finish_run(close=not refresh)
+    publish_outputs(db, RunMetrics())
+    return result
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='CareMap crawl job queue worker')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='워커 실행')
+    run.add_argument('--processes', type=int, default=1, help='워커 프로세스 수')
+    run.add_argument('--batch', type=int, default=1, help='한 번에 가져올 작업 수')
+    run.add_argument('--kinds', help='처리할 작업 종류 (쉼표 구분, 기본 전체)')
+    run.add_argument('--max-jobs', type=int, help='프로세스당 처리할 최대 작업 수')
+    run.add_argument('--exit-when-idle', action='store_true', help='대기 작업이 없으면 종료')
+
+    enqueue = commands.add_parser('enqueue', help='작업 등록')
+    enqueue.add_argument('kind', choices=('pages', 'refresh', 'geocode'))
+
+    finish = commands.add_parser('finish', help='회차 작업 완료 대기 후 회차 종료')
+    finish.add_argument('--generation', type=int, required=True)
+    finish.add_argument('--refresh', action='store_true', help='폐업 처리 없이 종료 (재수집 회차)')
+
+    commands.add_parser('stats', help='큐/워커 현황 (JSON)')
+
+    requeue = commands.add_parser('requeue-dead', help='dead 작업 재등록')
+    requeue.add_argument('--kind')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == 'run':
+        run_workers(
+            args.processes, batch=args.batch, kinds=args.kinds.split(',') if args.kinds else None,
+            max_jobs=args.max_jobs, exit_when_idle=args.exit_when_idle
+        )
+        return 0
+
+    db = DatabaseManager()
+    if not db.connect():
+        return 1
+    # 조회 명령은 테이블 생성(ALTER TABLE 잠금) 없이 실행
+    if args.command in ('enqueue', 'finish') and not db.create_tables():
+        db.disconnect()
+        return 1
+    queue = JobQueue(db, lease_seconds=JOB_LEASE_SECONDS, max_attempts=JOB_MAX_ATTEMPTS,
+                     backoff_seconds=JOB_BACKOFF_SECONDS)
+    try:
+        if args.command == 'enqueue':
+            enqueue = {'pages': enqueue_pages, 'refresh': enqueue_refresh, 'geocode': enqueue_geocode}
+            result = enqueue[args.kind](db, queue)
+            logger.info(f"Enqueue {args.kind}: {result}")
+        elif args.command == 'finish':
+            logger.info(f"Finished: {finish_generation(db, queue, args.generation, args.refresh)}")
+        elif args.command == 'stats':
+            print(json.dumps(queue.stats(), ensure_ascii=False, indent=2, default=str))
+        elif args.command == 'requeue-dead':
+            logger.info(f"Requeued dead jobs: {queue.requeue_dead(args.kind)}")
+    finally:
+        db.disconnect()
+    return 0
+
+
+if __name__ == '__main__':
+    os.makedirs('logs', exist_ok=True)
+    # 워커 프로세스(fork)의 로그도 부모 프로세스의 백그라운드 스레드가 기록
+    setup_logging('logs/worker.log', multiprocess=True)
+    sys.exit(main())
@@ -10,7 +10,46 @@ CREATE TABLE institutions (
     operating_hours TEXT,                           -- 운영시간
     latitude DECIMAL(10, 8),                        -- 위도
     longitude DECIMAL(11, 8),                       -- 경도
-    last_updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP -- 최종 업데이트 일시
+    last_updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, -- 최종 업데이트 일시
+    crawl_generation INT,                           -- 마지막으로 수집된 크롤링 회차 (crawl_runs.id)
+    closed_at TIMESTAMP WITH TIME ZONE,             -- 폐업 감지 일시 (운영 중이면 NULL)
+    region_code INT,                                -- 행정구역(시군구) 코드, 좌표로 계산 (regions.code)
+    first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP -- 최초 수집 일시
+);
+
+-- 지도 조회용 부분 인덱스: 운영 중인 기관만 포함합니다.
+CREATE INDEX idx_open_location ON institutions(latitude, longitude) WHERE closed_at IS NULL;
+CREATE INDEX idx_open_generation ON institutions(crawl_generation) WHERE closed_at IS NULL;
+-- 기관 목록 keyset 페이지네이션용 (last_updated_at, id) 역순 인덱스
+CREATE INDEX idx_open_updated ON institutions(last_updated_at DESC, id DESC) WHERE closed_at IS NULL;
+-- 지역 필터용: 주소 문자열 대신 행정구역 코드 정수 비교
+CREATE INDEX idx_open_region ON institutions(region_code) WHERE closed_at IS NULL;
+
+-- regions 테이블: 행정구역 경계 파일(GeoJSON)에서 적재한 시군구 코드와 이름입니다.
+CREATE TABLE regions (
+    code INT PRIMARY KEY,                           -- 시군구 코드 (예: 11680)
+    name VARCHAR(100) NOT NULL,                     -- 시군구 이름
+    sido_code INT NOT NULL                          -- 시/도 코드 (코드 앞 2자리, 예: 11)
+);
+
+-- crawl_runs 테이블: 크롤링 실행 회차(generation)를 기록합니다. 폐업 기관 감지에 사용됩니다.
+CREATE TABLE crawl_runs (
+    id SERIAL PRIMARY KEY,                          -- 회차 번호 (generation)
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',  -- running / completed / partial / refresh
+    seen_count INT,                                 -- 이번 회차에 수집된 기관 수
+    closed_count INT,                               -- 이번 회차에 폐업 처리된 기관 수
+    report JSONB                                    -- 실행 리포트 (단계별 시간, 히스토그램, 캐시 적중률)
+);
+
+-- crawl_run_stages 테이블: 회차별 단계 소요 시간. 실행 간 추세 비교에 사용됩니다.
+CREATE TABLE crawl_run_stages (
+    run_id INT REFERENCES crawl_runs(id) ON DELETE CASCADE,
+    stage VARCHAR(50) NOT NULL,                     -- collect / geocode / sync / reconcile
+    seconds DOUBLE PRECISION NOT NULL,              -- 소요 시간
+    records INT,                                    -- 처리 건수
+    PRIMARY KEY (run_id, stage)
 );
 
 -- institution_history 테이블: 데이터 '변경 이력'을 월 단위로 기록합니다. 시계열 분석에 사용됩니다.
@@ -22,4 +61,86 @@ CREATE TABLE institution_history (
     address VARCHAR(255),                           -- 변경 당시 주소
     capacity INT,                                   -- 변경 당시 정원
     current_headcount INT                           -- 변경 당시 현원
-);
\ No newline at end of file
+);
+
+-- refresh_schedule 테이블: 변경 이력으로 추정한 기관별 변경률과 재수집 주기입니다. (crawler/scheduler.py)
+CREATE TABLE refresh_schedule (
+    institution_id INT PRIMARY KEY REFERENCES institutions(id) ON DELETE CASCADE,
+    change_rate DOUBLE PRECISION NOT NULL,          -- 하루당 추정 변경 횟수
+    interval_days DOUBLE PRECISION NOT NULL,        -- 재수집 주기 (일)
+    priority DOUBLE PRECISION NOT NULL,             -- 마지막 수집 후 변경되었을 확률
+    next_due_at TIMESTAMP WITH TIME ZONE NOT NULL,  -- 다음 재수집 예정 일시
+    planned_generation INT                          -- 계획한 크롤링 회차
+);
+
+-- vacancy_forecasts 테이블: 기관별 향후 월별 예상 여석입니다. (crawler/forecast.py, 회차마다 전체 교체)
+CREATE TABLE vacancy_forecasts (
+    id BIGSERIAL PRIMARY KEY,
+    institution_id INT NOT NULL REFERENCES institutions(id) ON DELETE CASCADE,
+    forecast_month DATE NOT NULL,                   -- 예측 월 (1일)
+    expected_vacancy DOUBLE PRECISION NOT NULL,     -- 예상 여석 (정원 - 현원, 0 ~ 정원)
+    model VARCHAR(20) NOT NULL,                     -- naive / seasonal / trend / seasonal_trend
+    backtest_mae DOUBLE PRECISION,                  -- 최근 구간 예측 오차 (여석 수)
+    generation INT,                                 -- 계산한 크롤링 회차
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (institution_id, forecast_month)
+);
+
+-- geocode_quota 테이블: 날짜별 Geocoding API 호출 수입니다. (crawler/geocode_queue.py, 일일 쿼터 관리)
+CREATE TABLE geocode_quota (
+    day DATE PRIMARY KEY,                           -- GEOCODE_QUOTA_TIMEZONE 기준 날짜
+    used INT NOT NULL DEFAULT 0,                    -- 호출(예약) 수
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- geocode_failures 테이블: Geocoding 에 실패한 기관 dead-letter 입니다. (python main.py --geocode-retry 로 재시도)
+CREATE TABLE geocode_failures (
+    institution_id INT PRIMARY KEY REFERENCES institutions(id) ON DELETE CASCADE,
+    address TEXT NOT NULL,                          -- 실패한 주소 (주소가 바뀌면 새 기관처럼 다시 조회)
+    reason VARCHAR(30) NOT NULL,                    -- not_found / timeout / request_error / parse_error / empty_address
+    last_error TEXT,
+    attempts INT NOT NULL DEFAULT 1,
+    first_failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    last_failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    next_retry_at TIMESTAMP WITH TIME ZONE          -- 다음 재시도 시각 (시도마다 2배, 포기하면 NULL)
+);
+
+CREATE INDEX idx_geocode_failures_retry ON geocode_failures(next_retry_at) WHERE next_retry_at IS NOT NULL;
+
+-- crawl_jobs 테이블: 여러 노드의 워커가 나눠 처리하는 크롤링/Geocoding 작업 큐입니다. (crawler/jobqueue.py)
+CREATE TABLE crawl_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    kind VARCHAR(20) NOT NULL,                      -- list_page / detail / geocode
+    job_key VARCHAR(100),                           -- 중복 등록 방지 키 (대기/처리 중 작업 기준)
+    payload JSONB NOT NULL,                         -- 작업 내용 (페이지 번호, 기관 코드, 주소 목록)
+    generation INT,                                 -- 크롤링 회차 (crawl_runs.id)
+    priority INT NOT NULL DEFAULT 0,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending / running / done / dead
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL DEFAULT 5,
+    run_after TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP, -- 재시도 대기 (지수 백오프)
+    locked_by VARCHAR(100),                         -- 처리 중인 워커 ID
+    lease_expires_at TIMESTAMP WITH TIME ZONE,      -- 임대 만료 (heartbeat 로 연장)
+    last_error TEXT,
+    items INT,                                      -- 처리 건수
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+CREATE INDEX idx_crawl_jobs_pending ON crawl_jobs(priority DESC, id) WHERE status = 'pending';
+CREATE INDEX idx_crawl_jobs_lease ON crawl_jobs(lease_expires_at) WHERE status = 'running';
+CREATE UNIQUE INDEX idx_crawl_jobs_active_key ON crawl_jobs(kind, job_key) WHERE status IN ('pending', 'running');
+
+-- crawl_workers 테이블: 워커별 heartbeat 와 처리량입니다.
+CREATE TABLE crawl_workers (
+    worker_id VARCHAR(100) PRIMARY KEY,             -- 호스트명-pid
+    hostname VARCHAR(255),
+    pid INT,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',  -- running / stopped
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    heartbeat_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    jobs_done INT NOT NULL DEFAULT 0,
+    jobs_failed INT NOT NULL DEFAULT 0,
+    items INT NOT NULL DEFAULT 0,                   -- 처리한 기관/주소 수
+    busy_seconds DOUBLE PRECISION NOT NULL DEFAULT 0 -- 작업 처리에 쓴 시간
+);
@@ -1,6 +1,13 @@
 import { NextRequest, NextResponse } from "next/server"
 import { auth } from "@/lib/auth"
-import { prisma } from "@/lib/prisma"
+
+// Django 백엔드 (크롤링 작업 API: backend/crawls)
+const DJANGO_API_URL = process.env.DJANGO_API_URL || "http://localhost:8000"
+// 시스템 관리자(user_type=admin) 서비스 계정의 DRF 토큰
+// (Django CRAWLER_SERVICE_USERNAME 으로 지정한 계정이어야 X-Acting-User-Id 를 요청자로 기록)
+const CRAWLER_API_TOKEN = process.env.CRAWLER_API_TOKEN || ""
+
+const MODES = ["crawl", "refresh", "full_refresh", "geocode_retry", "forecast"]
 
 export async function POST(request: NextRequest) {
   try {
@@ -21,60 +28,32 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // For demo purposes, simulate crawler execution
-    // In production, you would actually call the Python crawler here
-
-    // Simulate updating institution data
-    const institutions = await prisma.institution.findMany()
-
-    let updated = 0
-    let failed = 0
-
-    for (const inst of institutions) {
-      try {
-        // Simulate random headcount change
-        const change = Math.floor(Math.random() * 5) - 2
-        const newHeadcount = Math.max(
-          0,
-          Math.min(inst.capacity || 0, (inst.currentHeadcount || 0) + change)
-        )
-
-        await prisma.institution.update({
-          where: { id: inst.id },
-          data: {
-            currentHeadcount: newHeadcount,
-            lastUpdatedAt: new Date()
-          },
-        })
+    const body = await request.json().catch(() => ({}))
+    const mode = MODES.includes(body.mode) ? body.mode : "crawl"
 
-        // Add history record
-        await prisma.institutionHistory.create({
-          data: {
-            institutionId: inst.id,
-            recordedDate: new Date(),
-            name: inst.name,
-            address: inst.address,
-            capacity: inst.capacity,
-            currentHeadcount: newHeadcount,
-          },
-        })
+    // 작업 등록만 하고 바로 응답 (실행은 Django 작업 실행기, 진행 상황은 events_url SSE 스트림)
+    // 이미 실행 중인 작업이 있으면 Django 가 그 작업을 돌려줌 (created: false)
+    const response = await fetch(`${DJANGO_API_URL}/api/v1/crawler/jobs/`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Token ${CRAWLER_API_TOKEN}`,
+        // 작업 요청자 = 로그인한 관리자 (Django 와 같은 users 테이블의 id)
+        "X-Acting-User-Id": session.user.id,
+      },
+      body: JSON.stringify({ mode }),
+      cache: "no-store",
+    })
+    const data = await response.json()
 
-        updated++
-      } catch (err) {
-        console.error(`Failed to update institution ${inst.id}:`, err)
-        failed++
-      }
+    if (!response.ok) {
+      return NextResponse.json(
+        { error: data.error || data.detail || "크롤링 작업을 등록하지 못했습니다" },
+        { status: response.status }
+      )
     }
 
-    return NextResponse.json({
-      message: "크롤링이 완료되었습니다",
-      status: "completed",
-      stats: {
-        total: institutions.length,
-        updated,
-        failed,
-      },
-    })
+    return NextResponse.json(data, { status: response.status })
   } catch (error) {
     console.error("Error in crawler:", error)
     return NextResponse.json(
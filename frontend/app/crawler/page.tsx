@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useRouter } from 'next/navigation';
 import { useSession } from 'next-auth/react';
 
@@ -10,17 +10,33 @@ interface CrawlerLog {
   message: string;
 }
 
+// events_url 이 상대 경로이면 Django 주소 기준으로 해석 (브라우저가 백엔드에 직접 SSE 연결)
+const DJANGO_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
+// Django 크롤링 작업 상태 (backend/crawls, SSE progress/done 이벤트 data)
+interface CrawlJob {
+  id: number;
+  mode: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  stage: string;
+  records: number;
+  total: number | null;
+  rate: number | null;
+  stages: Record<string, { seconds: number; records: number }>;
+  exit_code: number | null;
+  error: string;
+}
+
 export default function CrawlerPage() {
   const router = useRouter();
   const { data: session, status } = useSession();
+  const user = session?.user;
+  const isAuthenticated = !!user;
+  const isAdmin = user?.userType === 'ADMIN';
   const [isRunning, setIsRunning] = useState(false);
   const [logs, setLogs] = useState<CrawlerLog[]>([]);
-  const [stats, setStats] = useState({
-    total: 0,
-    success: 0,
-    failed: 0,
-    updated: 0,
-  });
+  const [job, setJob] = useState<CrawlJob | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
 
   // 관리자 권한 체크
   useEffect(() => {
@@ -34,6 +50,9 @@ export default function CrawlerPage() {
     }
   }, [session, status, router]);
 
+  // 페이지를 떠나면 진행 상황 스트림 종료
+  useEffect(() => () => eventSourceRef.current?.close(), []);
+
   const addLog = (level: CrawlerLog['level'], message: string) => {
     const newLog: CrawlerLog = {
       timestamp: new Date().toLocaleTimeString('ko-KR'),
@@ -43,10 +62,50 @@ export default function CrawlerPage() {
     setLogs((prev) => [...prev, newLog]);
   };
 
+  // 진행 상황 스트림 구독 (폴링 없이 서버가 단계/처리 건수/속도 변경 시 전송)
+  const followJob = (eventsUrl: string) => {
+    eventSourceRef.current?.close();
+    const source = new EventSource(new URL(eventsUrl, DJANGO_BASE_URL).toString());
+    eventSourceRef.current = source;
+    let lastStage = '';
+
+    const update = (event: MessageEvent) => {
+      const data: CrawlJob = JSON.parse(event.data);
+      if (data.stage && data.stage !== lastStage) {
+        if (lastStage && data.stages[lastStage]) {
+          const done = data.stages[lastStage];
+          addLog('success', `${lastStage} 단계 완료: ${done.records}건, ${done.seconds}초`);
+        }
+        addLog('info', `${data.stage} 단계 진행 중...`);
+        lastStage = data.stage;
+      }
+      setJob(data);
+      return data;
+    };
+
+    source.addEventListener('progress', (event) => update(event as MessageEvent));
+    source.addEventListener('done', (event) => {
+      const data = update(event as MessageEvent);
+      source.close();
+      setIsRunning(false);
+      if (data.status === 'succeeded') {
+        addLog('success', `크롤링이 완료되었습니다 (${Object.keys(data.stages).length}개 단계)`);
+      } else {
+        addLog('error', `크롤링 실패: ${data.error || `종료 코드 ${data.exit_code}`}`);
+      }
+    });
+    // 연결이 끊기면 EventSource 가 자동으로 다시 연결 (Last-Event-ID)
+    source.onerror = () => {
+      if (source.readyState === EventSource.CONNECTING) {
+        addLog('warning', '진행 상황 연결이 끊겨 다시 연결합니다...');
+      }
+    };
+  };
+
   const handleStartCrawler = async () => {
     setIsRunning(true);
     setLogs([]);
-    setStats({ total: 0, success: 0, failed: 0, updated: 0 });
+    setJob(null);
 
     addLog('info', '크롤러를 시작합니다...');
 
@@ -56,6 +115,7 @@ export default function CrawlerPage() {
         headers: {
           'Content-Type': 'application/json',
         },
+        body: JSON.stringify({ mode: 'crawl' }),
       });
 
       const data = await response.json();
@@ -64,35 +124,19 @@ export default function CrawlerPage() {
         throw new Error(data.error || '크롤링 실행 실패');
       }
 
-      addLog('info', '기관 데이터 수집 중...');
-      addLog('success', `총 ${data.stats.total}개 기관 처리`);
-      addLog('success', `${data.stats.updated}개 기관 업데이트 완료`);
-
-      if (data.stats.failed > 0) {
-        addLog('warning', `${data.stats.failed}개 기관 업데이트 실패`);
+      if (data.created) {
+        addLog('info', `크롤링 작업 #${data.id}이 등록되었습니다`);
+      } else {
+        addLog('warning', `이미 실행 중인 크롤링 작업 #${data.id}의 진행 상황을 표시합니다`);
       }
-
-      setStats({
-        total: data.stats.total,
-        success: data.stats.updated,
-        failed: data.stats.failed,
-        updated: data.stats.updated,
-      });
-
-      addLog('success', data.message);
-
-      // Refresh the page data
-      setTimeout(() => {
-        addLog('info', '페이지 데이터를 새로고침합니다...');
-      }, 1000);
+      setJob(data);
+      followJob(data.events_url);
     } catch (error) {
       addLog('error', `크롤링 중 오류 발생: ${error instanceof Error ? error.message : '알 수 없는 오류'}`);
-    } finally {
       setIsRunning(false);
     }
   };
 
-
   const getLogColor = (level: CrawlerLog['level']) => {
     switch (level) {
       case 'info':
@@ -137,28 +181,35 @@ export default function CrawlerPage() {
           <h1 className="text-2xl font-bold text-gray-800">데이터 크롤링 관리</h1>
         </div>
         <div className="text-sm text-gray-600">
-          관리자: <span className="font-semibold text-blue-600">{user?.username}</span>
+          관리자: <span className="font-semibold text-blue-600">{user?.name}</span>
         </div>
       </div>
 
       <div className="max-w-7xl mx-auto px-6 py-8">
-        {/* 통계 카드 */}
+        {/* 진행 상황 카드 */}
         <div className="grid grid-cols-1 md:grid-cols-4 gap-4 mb-8">
           <div className="bg-white rounded-lg shadow p-6">
-            <div className="text-sm text-gray-600 mb-1">총 처리</div>
-            <div className="text-3xl font-bold text-gray-800">{stats.total}</div>
+            <div className="text-sm text-gray-600 mb-1">현재 단계</div>
+            <div className="text-3xl font-bold text-gray-800">{job?.stage || '-'}</div>
           </div>
           <div className="bg-white rounded-lg shadow p-6">
-            <div className="text-sm text-gray-600 mb-1">성공</div>
-            <div className="text-3xl font-bold text-green-600">{stats.success}</div>
+            <div className="text-sm text-gray-600 mb-1">처리 건수</div>
+            <div className="text-3xl font-bold text-green-600">
+              {job ? job.records.toLocaleString() : 0}
+              {job?.total != null && (
+                <span className="text-lg text-gray-400"> / {job.total.toLocaleString()}</span>
+              )}
+            </div>
           </div>
           <div className="bg-white rounded-lg shadow p-6">
-            <div className="text-sm text-gray-600 mb-1">업데이트</div>
-            <div className="text-3xl font-bold text-blue-600">{stats.updated}</div>
+            <div className="text-sm text-gray-600 mb-1">처리 속도</div>
+            <div className="text-3xl font-bold text-blue-600">
+              {job?.rate != null ? `${job.rate.toLocaleString()}/s` : '-'}
+            </div>
           </div>
           <div className="bg-white rounded-lg shadow p-6">
-            <div className="text-sm text-gray-600 mb-1">실패</div>
-            <div className="text-3xl font-bold text-red-600">{stats.failed}</div>
+            <div className="text-sm text-gray-600 mb-1">완료 단계</div>
+            <div className="text-3xl font-bold text-gray-700">{job ? Object.keys(job.stages).length : 0}</div>
           </div>
         </div>
 